@@ -2,5 +2,6 @@ from app import create_app
 
 app = create_app()
 
+# The development server. In production, run gunicorn with gunicorn.conf.py, which preloads and warms the app.
 if __name__ == '__main__':
     app.run(host='127.0.0.1', port=5000, debug=True)
@@ -1,7 +1,10 @@
+import os
+
 from flask import Flask
 from flask_migrate import Migrate
 from injector import Injector, singleton
 
+from app.data.async_sqla import async_sqla
 from app.data.sqla import sqla
 
 
@@ -20,18 +23,38 @@ def create_app():
         # SQLALCHEMY_DATABASE_URI='mssql+pyodbc://<username>:<password>@<server>:<port>/<database>?driver=ODBC+Driver+17+for+SQL+Server',
         # SQLALCHEMY_DATABASE_URI='mssql+pyodbc://<server>:<port>/<database>?driver=ODBC+Driver+17+for+SQL+Server?trusted_connection=yes',
         SQLALCHEMY_DATABASE_URI=f"mssql+pyodbc:///?odbc_connect={conn_str}",
+        # Read-only repository methods are sent to the 'read' bind when one is configured, e.g. a replica:
+        # SQLALCHEMY_BINDS={'read': f"mssql+pyodbc:///?odbc_connect={read_replica_conn_str}"},
+        # or, locally, two SQLite files that the app keeps in sync after every write:
+        # SQLALCHEMY_DATABASE_URI='sqlite:///primary.sqlite3',
+        # SQLALCHEMY_BINDS={'read': 'sqlite:///read.sqlite3'},
+        # SQLALCHEMY_SYNC_SQLITE_READ_REPLICA=True,
+        SQLALCHEMY_READ_YOUR_WRITES_SECONDS=5,
+        # The read-heavy async views run their independent queries concurrently on an async engine when one is
+        # configured; without one they run them one after another on the synchronous session:
+        # SQLALCHEMY_ASYNC_DATABASE_URI=f"mssql+aioodbc:///?odbc_connect={conn_str}",
+        # SQLALCHEMY_ASYNC_READ_DATABASE_URI=f"mssql+aioodbc:///?odbc_connect={read_replica_conn_str}",
         SQLALCHEMY_TRACK_MODIFICATIONS=False,
+        # 'decimal' calculates rankings in Decimal; 'float' calculates them in floating point and rounds each result
+        # to its column's scale. Run `flask verify-numeric-mode` to measure the difference before switching.
+        RANKINGS_NUMERIC_MODE='decimal',
+        # Under several worker processes, each writes its metrics to this directory so that /metrics reports them
+        # all; gunicorn.conf.py sets it. Without it, /metrics reports the serving process only.
+        METRICS_MULTIPROCESS_DIR=os.environ.get('METRICS_MULTIPROCESS_DIR'),
         DEBUG=True
     )
 
     sqla.init_app(app)
+    async_sqla.init_app(app)
 
     # Flask-Migrate
     Migrate(app, sqla, render_as_batch=True)
 
     from app.flask import (home_controller, season_controller, league_controller, conference_controller,
                            division_controller, team_controller, game_controller, team_season_controller,
-                           season_standings_controller, season_rankings_controller, game_predictor_controller)
+                           season_standings_controller, season_rankings_controller, game_predictor_controller,
+                           head_to_head_controller, forecast_controller, export_controller,
+                           leaderboard_controller, metrics_controller, search_controller)
 
     app.register_blueprint(home_controller.blueprint, url_prefix='/')
     app.register_blueprint(season_controller.blueprint, url_prefix='/seasons')
@@ -44,9 +67,42 @@ def create_app():
     app.register_blueprint(season_standings_controller.blueprint, url_prefix='/season_standings')
     app.register_blueprint(season_rankings_controller.blueprint, url_prefix='/season_rankings')
     app.register_blueprint(game_predictor_controller.blueprint, url_prefix='/game_predictor')
+    app.register_blueprint(head_to_head_controller.blueprint, url_prefix='/head_to_head')
+    app.register_blueprint(forecast_controller.blueprint, url_prefix='/forecast')
+    app.register_blueprint(export_controller.blueprint, url_prefix='/export')
+    app.register_blueprint(leaderboard_controller.blueprint, url_prefix='/leaderboards')
+    app.register_blueprint(search_controller.blueprint, url_prefix='/search')
+    app.register_blueprint(metrics_controller.blueprint, url_prefix='/metrics')
 
     app.add_url_rule('/', endpoint='index')
 
+    # Event subscribers must exist before the first game is written.
+    from app.services.forecast_service.forecast_service import ForecastService
+    from app.services.franchise_summary_service.franchise_summary_service import FranchiseSummaryService
+    from app.services.head_to_head_service.head_to_head_service import HeadToHeadService
+
+    injector.get(ForecastService)
+    injector.get(FranchiseSummaryService)
+    injector.get(HeadToHeadService)
+
+    from app.flask.commands import (benchmark_commands, elo_rating_commands, export_commands,
+                                    franchise_summary_commands, head_to_head_commands, numeric_mode_commands,
+                                    reference_data_commands, schedule_commands, season_archive_commands,
+                                    weekly_update_commands)
+
+    app.cli.add_command(weekly_update_commands.weekly_update_command)
+    app.cli.add_command(season_archive_commands.export_season_command)
+    app.cli.add_command(season_archive_commands.import_season_command)
+    app.cli.add_command(elo_rating_commands.replay_elo_command)
+    app.cli.add_command(benchmark_commands.benchmark_list_views_command)
+    app.cli.add_command(benchmark_commands.benchmark_read_views_command)
+    app.cli.add_command(franchise_summary_commands.rebuild_franchise_summaries_command)
+    app.cli.add_command(head_to_head_commands.rebuild_head_to_head_summaries_command)
+    app.cli.add_command(numeric_mode_commands.verify_numeric_mode_command)
+    app.cli.add_command(schedule_commands.import_schedule_command)
+    app.cli.add_command(export_commands.export_data_command)
+    app.cli.add_command(reference_data_commands.import_reference_data_command)
+
     return app
 
 
@@ -54,36 +110,70 @@ def configure(binder):
     from app.data.repositories.conference_repository import ConferenceRepository
     from app.data.repositories.division_repository import DivisionRepository
     from app.data.repositories.game_repository import GameRepository
+    from app.data.repositories.head_to_head_repository import HeadToHeadRepository
+    from app.data.repositories.job_repository import JobRepository
     from app.data.repositories.league_repository import LeagueRepository
     from app.data.repositories.league_season_repository import LeagueSeasonRepository
     from app.data.repositories.league_season_totals_repository import LeagueSeasonTotalsRepository
+    from app.data.repositories.scheduled_game_repository import ScheduledGameRepository
+    from app.data.repositories.search_repository import SearchRepository
     from app.data.repositories.season_rankings_repository import SeasonRankingsRepository
     from app.data.repositories.season_repository import SeasonRepository
+    from app.data.repositories.season_snapshot_repository import SeasonSnapshotRepository
     from app.data.repositories.season_standings_repository import SeasonStandingsRepository
     from app.data.repositories.team_repository import TeamRepository
     from app.data.repositories.team_season_repository import TeamSeasonRepository
     from app.data.repositories.team_season_schedule_repository import TeamSeasonScheduleRepository
+    from app.services.elo_rating_service.elo_rating_service import EloRatingService
+    from app.services.event_bus.event_bus import EventBus
+    from app.services.export_service.export_service import ExportService
+    from app.services.forecast_service.forecast_service import ForecastService
+    from app.services.franchise_summary_service.franchise_summary_service import FranchiseSummaryService
     from app.services.game_predictor_service.game_predictor_service import GamePredictorService
     from app.services.game_service.game_service import GameService
     from app.services.game_service.process_game_strategy.process_game_strategy_factory import ProcessGameStrategyFactory
+    from app.services.head_to_head_service.head_to_head_service import HeadToHeadService
+    from app.services.job_service.job_service import JobService
+    from app.services.leaderboard_service.leaderboard_service import LeaderboardService
+    from app.services.season_archive_service.season_archive_service import SeasonArchiveService
+    from app.services.season_standings_service.season_standings_service import SeasonStandingsService
+    from app.services.simple_rating_service.simple_rating_service import SimpleRatingService
+    from app.services.weekly_update_service.weekly_update_job_service import WeeklyUpdateJobService
     from app.services.weekly_update_service.weekly_update_service import WeeklyUpdateService
 
     binder.bind(ConferenceRepository, to=ConferenceRepository, scope=singleton)
     binder.bind(DivisionRepository, to=DivisionRepository, scope=singleton)
     binder.bind(GameRepository, to=GameRepository, scope=singleton)
+    binder.bind(HeadToHeadRepository, to=HeadToHeadRepository, scope=singleton)
+    binder.bind(JobRepository, to=JobRepository, scope=singleton)
     binder.bind(LeagueRepository, to=LeagueRepository, scope=singleton)
     binder.bind(LeagueSeasonRepository, to=LeagueSeasonRepository, scope=singleton)
     binder.bind(LeagueSeasonTotalsRepository, to=LeagueSeasonTotalsRepository, scope=singleton)
+    binder.bind(ScheduledGameRepository, to=ScheduledGameRepository, scope=singleton)
+    binder.bind(SearchRepository, to=SearchRepository, scope=singleton)
     binder.bind(SeasonRepository, to=SeasonRepository, scope=singleton)
     binder.bind(SeasonRankingsRepository, to=SeasonRankingsRepository, scope=singleton)
+    binder.bind(SeasonSnapshotRepository, to=SeasonSnapshotRepository, scope=singleton)
     binder.bind(SeasonStandingsRepository, to=SeasonStandingsRepository, scope=singleton)
     binder.bind(TeamRepository, to=TeamRepository, scope=singleton)
     binder.bind(TeamSeasonRepository, to=TeamSeasonRepository, scope=singleton)
     binder.bind(TeamSeasonScheduleRepository, to=TeamSeasonScheduleRepository, scope=singleton)
 
+    binder.bind(EloRatingService, to=EloRatingService, scope=singleton)
+    binder.bind(EventBus, to=EventBus, scope=singleton)
+    binder.bind(ExportService, to=ExportService, scope=singleton)
+    binder.bind(ForecastService, to=ForecastService, scope=singleton)
+    binder.bind(FranchiseSummaryService, to=FranchiseSummaryService, scope=singleton)
     binder.bind(GameService, to=GameService, scope=singleton)
     binder.bind(GamePredictorService, to=GamePredictorService, scope=singleton)
+    binder.bind(HeadToHeadService, to=HeadToHeadService, scope=singleton)
+    binder.bind(JobService, to=JobService, scope=singleton)
+    binder.bind(LeaderboardService, to=LeaderboardService, scope=singleton)
+    binder.bind(SeasonArchiveService, to=SeasonArchiveService, scope=singleton)
+    binder.bind(SeasonStandingsService, to=SeasonStandingsService, scope=singleton)
+    binder.bind(SimpleRatingService, to=SimpleRatingService, scope=singleton)
     binder.bind(WeeklyUpdateService, to=WeeklyUpdateService, scope=singleton)
+    binder.bind(WeeklyUpdateJobService, to=WeeklyUpdateJobService, scope=singleton)
 
     binder.bind(ProcessGameStrategyFactory, to=ProcessGameStrategyFactory, scope=singleton)
 
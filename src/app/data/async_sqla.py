@@ -0,0 +1,113 @@
+import asyncio
+import threading
+from typing import Any, Dict, List, Optional
+
+from flask import Flask, current_app, has_app_context
+from sqlalchemy import Executable, Row
+
+from app.data.session_routing import READ_BIND_KEY, reads_pinned_to_primary
+
+EXTENSION_KEY = 'async_sqla'
+
+
+class AsyncSQLAlchemy:
+    """
+    Holds the async engines that the read-heavy endpoints use to run independent queries concurrently. Writes, and
+    every endpoint that does not await its queries, keep using the synchronous Flask-SQLAlchemy session.
+
+    The primary engine is configured with SQLALCHEMY_ASYNC_DATABASE_URI, e.g. 'mssql+aioodbc:///?odbc_connect=...',
+    and a read replica, if any, with SQLALCHEMY_ASYNC_READ_DATABASE_URI. When neither is configured, the async mode
+    is off and the async repository methods run their queries one after another on the synchronous session.
+
+    The engines pool their connections. An async connection can only be used from the event loop that opened it,
+    and Flask runs each async view in an event loop of its own, so every statement is run on one long-lived event
+    loop in a background thread, and the view awaits its result from its own loop. The pools of that loop are shared
+    by every request. Extra engine options, such as pool_size, are read from SQLALCHEMY_ASYNC_ENGINE_OPTIONS.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the AsyncSQLAlchemy class.
+        """
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Creates the async engines of an app from its configuration.
+
+        :param app: The app.
+
+        :return: None
+        """
+        uri = app.config.get('SQLALCHEMY_ASYNC_DATABASE_URI')
+        if not uri:
+            return
+
+        # Imported here because the asyncio extension requires greenlet, which only the async mode needs.
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        options = app.config.get('SQLALCHEMY_ASYNC_ENGINE_OPTIONS', {})
+        engines = {None: create_async_engine(uri, **options)}
+        read_uri = app.config.get('SQLALCHEMY_ASYNC_READ_DATABASE_URI')
+        if read_uri:
+            engines[READ_BIND_KEY] = create_async_engine(read_uri, **options)
+        app.extensions[EXTENSION_KEY] = engines
+
+    @property
+    def is_enabled(self) -> bool:
+        """
+        Gets whether the current app has async engines.
+        """
+        return has_app_context() and EXTENSION_KEY in current_app.extensions
+
+    async def fetch_all(self, statement: Executable, read_only: bool = True) -> List[Row]:
+        """
+        Runs a statement in an async session of its own, on a pooled connection, so that it can run alongside the
+        statements of other calls.
+
+        :param statement: The statement to run.
+        :param read_only: True to send the statement to the read engine when one is configured and the user has not
+        just written; False to send it to the primary engine.
+
+        :return: All the rows of the statement's result.
+        """
+        future = asyncio.run_coroutine_threadsafe(_fetch_all(self._get_engine(read_only), statement), self._get_loop())
+        return await asyncio.wrap_future(future)
+
+    def dispose(self) -> None:
+        """
+        Closes the pooled connections of the current app's async engines, so that the next statements open new ones.
+
+        :return: None
+        """
+        engines: Dict[Optional[str], Any] = current_app.extensions.get(EXTENSION_KEY, {})
+        for engine in engines.values():
+            asyncio.run_coroutine_threadsafe(engine.dispose(), self._get_loop()).result()
+
+    def _get_engine(self, read_only: bool) -> Any:
+        engines: Dict[Optional[str], Any] = current_app.extensions[EXTENSION_KEY]
+        if read_only and READ_BIND_KEY in engines and not reads_pinned_to_primary():
+            return engines[READ_BIND_KEY]
+        return engines[None]
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name='async-sqla', daemon=True).start()
+            return self._loop
+
+
+async def _fetch_all(engine: Any, statement: Executable) -> List[Row]:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    async with AsyncSession(engine) as session:
+        result = await session.execute(statement)
+        return result.all()
+
+
+async_sqla = AsyncSQLAlchemy()
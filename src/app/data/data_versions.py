@@ -0,0 +1,262 @@
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Any, Callable, Deque, Dict, Iterable, Optional, Set
+
+from sqlalchemy import event, inspect, select
+
+from app.data.session_routing import RoutingSession, use_primary
+
+_CHANGED_SEASON_YEARS_KEY = 'changed_season_years'
+_CHANGED_KINDS_KEY = 'changed_reference_data_kinds'
+_BUMPED_KEY = 'bumped_data_versions'
+
+# Changes committed by other processes, e.g. another web worker or a weekly update run from the command line, are
+# seen once the versions read from the data store are this old.
+DATA_VERSION_MAX_AGE_SECONDS = 1.0
+
+# The number of versions of each season that this process remembers committing.
+LOCAL_VERSION_HISTORY = 256
+
+
+class DataVersions:
+    """
+    Counts the committed changes to the season data and the reference data, so that caches of derived data know when
+    to rebuild.
+
+    The counts are kept in the DataVersion table, which every process shares, and each is incremented in the same
+    transaction as the change it counts. Every committed change to a Game, TeamSeason, LeagueSeason, ScheduledGame or
+    Season bumps the version of the season it belongs to. Every committed change to a Season, League, Conference,
+    Division or Team also bumps the version of its kind of reference data, and the global version. Changes to other
+    rows, e.g. jobs and summaries, are not counted. Changes made with bulk SQL statements, which bypass the ORM
+    session, must be reported with mark_changed() before their transaction is committed.
+
+    This process reads all the counts with one query, and then reuses them until they are older than the maximum
+    age, or until it commits a change of its own. It also remembers which versions it committed itself, so that a
+    cache kept current by this process's own events can tell whether another process changed its season.
+    """
+
+    def __init__(
+            self,
+            max_age: float = DATA_VERSION_MAX_AGE_SECONDS,
+            clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Initializes a new instance of the DataVersions class.
+
+        :param max_age: The number of seconds for which the counts read from the data store are reused.
+        :param clock: The clock by which the age of the counts is measured.
+        """
+        self.max_age = max_age
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._versions: Dict[int, int] = {}
+        self._read_at: Optional[float] = None
+        self._local_versions: Dict[int, Deque[int]] = defaultdict(lambda: deque(maxlen=LOCAL_VERSION_HISTORY))
+
+    def __repr__(self):
+        return f"{type(self).__name__}(max_age={self.max_age})"
+
+    @property
+    def global_version(self) -> int:
+        """
+        Gets the number of committed changes to any kind of reference data.
+        """
+        from app.data.models.data_version import GLOBAL_SEASON_YEAR
+
+        return self._get_versions().get(GLOBAL_SEASON_YEAR, 0)
+
+    def get(self, season_year: int) -> int:
+        """
+        Gets the number of committed changes to the data of the specified season.
+
+        :param season_year: The year of the season.
+
+        :return: The version of the season's data.
+        """
+        return self._get_versions().get(season_year, 0)
+
+    def get_reference_data_version(self, kind: str) -> int:
+        """
+        Gets the number of committed changes to one kind of reference data.
+
+        :param kind: The kind of reference data: 'season', 'league', 'conference', 'division' or 'team'.
+
+        :return: The version of the kind.
+        """
+        from app.data.models.data_version import REFERENCE_DATA_SEASON_YEARS
+
+        return self.get(REFERENCE_DATA_SEASON_YEARS[kind])
+
+    def committed_locally(self, season_year: int, since_version: int, version: int) -> bool:
+        """
+        Checks whether every change to the data of a season between two of its versions was committed by this
+        process.
+
+        :param season_year: The year of the season.
+        :param since_version: The earlier version.
+        :param version: The later version.
+
+        :return: True if this process committed every version after since_version up to version; otherwise false.
+        """
+        with self._lock:
+            local_versions = set(self._local_versions.get(season_year, ()))
+        return all(local_version in local_versions for local_version in range(since_version + 1, version + 1))
+
+    def mark_changed(self, session: Any, season_years: Iterable[int] = (), kinds: Iterable[str] = ()) -> None:
+        """
+        Records that the current transaction of a session changes the data of the specified seasons, or the specified
+        kinds of reference data, so that their versions are bumped when it commits.
+
+        :param session: The session.
+        :param season_years: The years of the changed seasons.
+        :param kinds: The changed kinds of reference data.
+
+        :return: None
+        """
+        session.info.setdefault(_CHANGED_SEASON_YEARS_KEY, set()).update(season_years)
+        session.info.setdefault(_CHANGED_KINDS_KEY, set()).update(kinds)
+
+    def bump(self, session: Any, season_years: Iterable[int] = (), kinds: Iterable[str] = ()) -> Dict[int, int]:
+        """
+        Increments the versions of the specified seasons and kinds of reference data in the current transaction of a
+        session, so that they are committed together with the changes they count. The global version is incremented
+        too when any kind of reference data is changed.
+
+        :param session: The session.
+        :param season_years: The years of the changed seasons.
+        :param kinds: The changed kinds of reference data.
+
+        :return: The incremented versions, by season year, with the reserved season years of the kinds of reference
+        data. They are read back under the row locks that the increments hold, so no other transaction can have
+        committed the same versions.
+        """
+        from app.data.models.data_version import DataVersion, GLOBAL_SEASON_YEAR, REFERENCE_DATA_SEASON_YEARS
+
+        table = DataVersion.__table__
+        kind_season_years = {REFERENCE_DATA_SEASON_YEARS[kind] for kind in kinds}
+        season_years = {*season_years, *kind_season_years}
+        if kind_season_years:
+            season_years.add(GLOBAL_SEASON_YEAR)
+        if not season_years:
+            return {}
+
+        with use_primary():
+            result = session.execute(
+                table.update()
+                .where(table.c.season_year.in_(season_years))
+                .values(version=table.c.version + 1)
+            )
+            if result.rowcount < len(season_years):
+                existing = set(session.scalars(
+                    select(table.c.season_year).where(table.c.season_year.in_(season_years))
+                ))
+                session.execute(
+                    table.insert(),
+                    [{'season_year': season_year, 'version': 1} for season_year in sorted(season_years - existing)]
+                )
+            return dict(session.execute(
+                select(table.c.season_year, table.c.version).where(table.c.season_year.in_(season_years))
+            ).all())
+
+    def record_committed(self, versions: Dict[int, int]) -> None:
+        """
+        Records versions that this process has committed, and discards the counts read before them.
+
+        :param versions: The committed versions, by season year.
+
+        :return: None
+        """
+        with self._lock:
+            for season_year, version in versions.items():
+                self._local_versions[season_year].append(version)
+            self._read_at = None
+
+    def expire(self) -> None:
+        """
+        Discards the counts read by this process, so that they are read again on their next use.
+
+        :return: None
+        """
+        with self._lock:
+            self._read_at = None
+
+    def refresh(self) -> None:
+        """
+        Reads the counts from the data store now, rather than on their next use.
+
+        :return: None
+        """
+        self.expire()
+        self._get_versions()
+
+    def _get_versions(self) -> Dict[int, int]:
+        read_at = self._read_at
+        if read_at is not None and self._clock() - read_at < self.max_age:
+            return self._versions
+
+        from app.data.models.data_version import DataVersion
+        from app.data.sqla import sqla
+
+        read_at = self._clock()
+        with use_primary(), sqla.session.no_autoflush:
+            versions = dict(sqla.session.execute(select(DataVersion.season_year, DataVersion.version)).all())
+        with self._lock:
+            self._versions, self._read_at = versions, read_at
+        return versions
+
+
+data_versions = DataVersions()
+
+
+def _season_years_of(instance: Any) -> Set[int]:
+    from app.data.models.game import Game
+    from app.data.models.league_season import LeagueSeason
+    from app.data.models.scheduled_game import ScheduledGame
+    from app.data.models.season import Season
+    from app.data.models.team_season import TeamSeason
+
+    if not isinstance(instance, (Game, TeamSeason, LeagueSeason, ScheduledGame, Season)):
+        return set()
+
+    attribute = 'year' if isinstance(instance, Season) else 'season_year'
+    state = inspect(instance)
+
+    history = state.attrs[attribute].history
+    values = set(history.added) | set(history.unchanged) | set(history.deleted)
+    return {value for value in values if value is not None}
+
+
+@event.listens_for(RoutingSession, 'before_flush')
+def _collect_changed_season_years(session: RoutingSession, flush_context: Any, instances: Any) -> None:
+    from app.data.reference_data import get_reference_data_kind
+
+    instances = list(session.new) + list(session.dirty) + list(session.deleted)
+    kinds = {get_reference_data_kind(instance) for instance in instances} - {None}
+    season_years = set().union(*map(_season_years_of, instances))
+    if kinds or season_years:
+        data_versions.mark_changed(session, season_years, kinds)
+
+
+@event.listens_for(RoutingSession, 'before_commit')
+def _bump_data_versions(session: RoutingSession) -> None:
+    # The pending changes are flushed only after this listener, so flush them now to version them too.
+    if session.new or session.dirty or session.deleted:
+        session.flush()
+    season_years = session.info.pop(_CHANGED_SEASON_YEARS_KEY, set())
+    kinds = session.info.pop(_CHANGED_KINDS_KEY, set())
+    if season_years or kinds:
+        session.info[_BUMPED_KEY] = data_versions.bump(session, season_years, kinds)
+
+
+@event.listens_for(RoutingSession, 'after_commit')
+def _expire_data_versions(session: RoutingSession) -> None:
+    versions = session.info.pop(_BUMPED_KEY, None)
+    if versions is not None:
+        data_versions.record_committed(versions)
+
+
+@event.listens_for(RoutingSession, 'after_soft_rollback')
+def _discard_changed_season_years(session: RoutingSession, previous_transaction: Any) -> None:
+    for key in (_CHANGED_SEASON_YEARS_KEY, _CHANGED_KINDS_KEY, _BUMPED_KEY):
+        session.info.pop(key, None)
@@ -0,0 +1,120 @@
+from typing import Any, Dict, Iterable, List, Sequence
+
+from app.data.sqla import sqla
+
+# Keeps each IN (...) list well under the parameter limits of the supported databases.
+IN_CLAUSE_CHUNK_SIZE = 1000
+
+
+class BatchValidationError(ValueError):
+    """
+    Error raised when one or more entities in a batch fail validation. Every error in the batch is reported.
+    """
+
+    def __init__(self, errors: Sequence[str]) -> None:
+        """
+        Initializes a new instance of the BatchValidationError class.
+
+        :param errors: The error messages, one per failed check.
+        """
+        super().__init__(' '.join(errors))
+        self.errors = list(errors)
+
+
+def validate_batch(
+        model: Any,
+        entity_name: str,
+        unique_keys: Sequence[str],
+        kwargs_list: Sequence[Dict[str, Any]],
+        required_message: str = "{key} is required."
+) -> None:
+    """
+    Validates the unique keys of a batch of entities to be created, with one query per key for the whole batch.
+
+    :param model: The model class of the entities.
+    :param entity_name: The name of the entity used in error messages, e.g. 'League'.
+    :param unique_keys: The keys whose values must be present and unique.
+    :param kwargs_list: The keyword arguments of each entity to be created.
+    :param required_message: The message for a missing key, formatted with the key.
+
+    :return: None
+
+    :raises BatchValidationError: If any key is missing, repeated within the batch, or already in the data store.
+    """
+    errors = _get_key_errors(model, entity_name, unique_keys, kwargs_list, required_message)
+    if errors:
+        raise BatchValidationError(errors)
+
+
+def create_batch(
+        model: Any,
+        entity_name: str,
+        unique_keys: Sequence[str],
+        kwargs_list: Sequence[Dict[str, Any]],
+        required_message: str = "{key} is required."
+) -> List[Any]:
+    """
+    Validates a batch of entities to be created, with one query per unique key for the whole batch, and creates
+    them. The values rejected by the model's own validators are reported with the other errors of the batch.
+
+    :param model: The model class of the entities.
+    :param entity_name: The name of the entity used in error messages, e.g. 'League'.
+    :param unique_keys: The keys whose values must be present and unique.
+    :param kwargs_list: The keyword arguments of each entity to create.
+    :param required_message: The message for a missing key, formatted with the key.
+
+    :return: The created entities, in the same order as their keyword arguments.
+
+    :raises BatchValidationError: If any key is missing, repeated within the batch, or already in the data store,
+    or the model rejects any value.
+    """
+    errors = _get_key_errors(model, entity_name, unique_keys, kwargs_list, required_message)
+    entities = []
+    for position, kwargs in enumerate(kwargs_list, start=1):
+        try:
+            entities.append(model(**kwargs))
+        except ValueError as err:
+            errors.append(f"Item {position}: {err}")
+
+    if errors:
+        raise BatchValidationError(errors)
+    return entities
+
+
+def _get_key_errors(
+        model: Any,
+        entity_name: str,
+        unique_keys: Sequence[str],
+        kwargs_list: Sequence[Dict[str, Any]],
+        required_message: str
+) -> List[str]:
+    errors = []
+    for key in unique_keys:
+        positions: Dict[Any, List[int]] = {}
+        for position, kwargs in enumerate(kwargs_list, start=1):
+            if key not in kwargs:
+                errors.append(f"Item {position}: {required_message.format(key=key)}")
+            else:
+                positions.setdefault(kwargs[key], []).append(position)
+
+        for value, value_positions in positions.items():
+            if len(value_positions) > 1:
+                errors.append(
+                    f"Items {', '.join(str(position) for position in value_positions)}: "
+                    f"{entity_name} {key}={value} appears more than once in the batch."
+                )
+
+        for value in sorted(_get_existing_values(model, key, positions.keys()), key=str):
+            for position in positions[value]:
+                errors.append(f"Item {position}: {entity_name} already exists with {key}={value}.")
+    return errors
+
+
+def _get_existing_values(model: Any, key: str, values: Iterable[Any]) -> set:
+    values = [value for value in values if value is not None]
+    column = getattr(model, key)
+    existing = set()
+    for start in range(0, len(values), IN_CLAUSE_CHUNK_SIZE):
+        chunk = values[start:start + IN_CLAUSE_CHUNK_SIZE]
+        existing.update(sqla.session.scalars(sqla.select(column).where(column.in_(chunk))))
+    return existing
@@ -1,5 +1,6 @@
-from typing import Any
+from typing import Any, Dict, Iterable, List
 
+from app.data.factories.batch_validation import create_batch
 from app.data.models.season import Season
 from app.data.models.conference import Conference
 from app.data.models.game import Game
@@ -21,6 +22,19 @@ def create_conference(old_conference: Conference=None, **kwargs) -> Conference:
     return Conference(**kwargs)
 
 
+def create_conferences(kwargs_list: Iterable[Dict[str, Any]]) -> List[Conference]:
+    """
+    Creates many conferences at once, validating the unique keys of the whole batch with one query per key.
+
+    :param kwargs_list: The keyword arguments of each conference to create.
+
+    :return: The created conferences, in the same order as their keyword arguments.
+
+    :raises BatchValidationError: If any conference fails validation. Every error in the batch is reported together.
+    """
+    return create_batch(Conference, 'Conference', ['short_name', 'long_name'], list(kwargs_list))
+
+
 def _validate_key_is_in_kwargs(key, **kwargs):
     if key not in kwargs:
         raise ValueError(f"{key} is required.")
@@ -1,3 +1,6 @@
+from typing import Any, Dict, Iterable, List
+
+from app.data.factories.batch_validation import create_batch
 from app.data.models.season import Season
 from app.data.models.division import Division
 from app.data.models.game import Game
@@ -19,6 +22,19 @@ def create_division(old_division: Division=None, **kwargs) -> Division:
     return Division(**kwargs)
 
 
+def create_divisions(kwargs_list: Iterable[Dict[str, Any]]) -> List[Division]:
+    """
+    Creates many divisions at once, validating the unique keys of the whole batch with one query per key.
+
+    :param kwargs_list: The keyword arguments of each division to create.
+
+    :return: The created divisions, in the same order as their keyword arguments.
+
+    :raises BatchValidationError: If any division fails validation. Every error in the batch is reported together.
+    """
+    return create_batch(Division, 'Division', ['name'], list(kwargs_list))
+
+
 def _validate_key_is_in_kwargs(key, **kwargs):
     if key not in kwargs:
         raise ValueError(f"{key} is required.")
@@ -1,3 +1,6 @@
+from typing import Any, Dict, Iterable, List
+
+from app.data.factories.batch_validation import create_batch
 from app.data.models.season import Season
 from app.data.models.league import League
 from app.data.models.game import Game
@@ -19,6 +22,19 @@ def create_league(old_league: League=None, **kwargs) -> League:
     return League(**kwargs)
 
 
+def create_leagues(kwargs_list: Iterable[Dict[str, Any]]) -> List[League]:
+    """
+    Creates many leagues at once, validating the unique keys of the whole batch with one query per key.
+
+    :param kwargs_list: The keyword arguments of each league to create.
+
+    :return: The created leagues, in the same order as their keyword arguments.
+
+    :raises BatchValidationError: If any league fails validation. Every error in the batch is reported together.
+    """
+    return create_batch(League, 'League', ['short_name', 'long_name'], list(kwargs_list))
+
+
 def _validate_key_is_in_kwargs(key, **kwargs):
     if key not in kwargs:
         raise ValueError(f"{key} is required.")
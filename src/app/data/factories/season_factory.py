@@ -1,3 +1,6 @@
+from typing import Any, Dict, Iterable, List
+
+from app.data.factories.batch_validation import create_batch
 from app.data.models.season import Season
 from app.data.models.game import Game
 from app.data.models.league_season import LeagueSeason
@@ -18,6 +21,19 @@ def create_season(old_season: Season=None, **kwargs) -> Season:
     return Season(**kwargs)
 
 
+def create_seasons(kwargs_list: Iterable[Dict[str, Any]]) -> List[Season]:
+    """
+    Creates many seasons at once, validating the unique keys of the whole batch with one query per key.
+
+    :param kwargs_list: The keyword arguments of each season to create.
+
+    :return: The created seasons, in the same order as their keyword arguments.
+
+    :raises BatchValidationError: If any season fails validation. Every error in the batch is reported together.
+    """
+    return create_batch(Season, 'Season', ['year'], list(kwargs_list), required_message="Year is required.")
+
+
 def _validate_key_is_in_kwargs(key, **kwargs):
     if key not in kwargs:
         raise ValueError(f"{str.capitalize(key)} is required.")
@@ -1,3 +1,6 @@
+from typing import Any, Dict, Iterable, List
+
+from app.data.factories.batch_validation import create_batch
 from app.data.models.season import Season
 from app.data.models.team import Team
 from app.data.models.game import Game
@@ -19,6 +22,19 @@ def create_team(old_team: Team=None, **kwargs) -> Team:
     return Team(**kwargs)
 
 
+def create_teams(kwargs_list: Iterable[Dict[str, Any]]) -> List[Team]:
+    """
+    Creates many teams at once, validating the unique keys of the whole batch with one query per key.
+
+    :param kwargs_list: The keyword arguments of each team to create.
+
+    :return: The created teams, in the same order as their keyword arguments.
+
+    :raises BatchValidationError: If any team fails validation. Every error in the batch is reported together.
+    """
+    return create_batch(Team, 'Team', ['name'], list(kwargs_list))
+
+
 def _validate_key_is_in_kwargs(key, **kwargs):
     if key not in kwargs:
         raise ValueError(f"{key} is required.")
@@ -0,0 +1,22 @@
+from app.data.sqla import sqla
+
+# The row of this season_year counts the committed changes to any kind of reference data: seasons, leagues,
+# conferences, divisions and teams.
+GLOBAL_SEASON_YEAR = 0
+
+# The rows of these reserved season_years count the committed changes to each kind of reference data.
+REFERENCE_DATA_SEASON_YEARS = {'season': -1, 'league': -2, 'conference': -3, 'division': -4, 'team': -5}
+
+
+class DataVersion(sqla.Model):
+    """
+    Class to represent the number of committed changes to the data of one season, or to one kind of reference data,
+    shared by every process that reads the data store.
+    """
+    __tablename__ = 'DataVersion'
+
+    season_year = sqla.Column(sqla.SmallInteger, primary_key=True, autoincrement=False, nullable=False)
+    version = sqla.Column(sqla.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(season_year={self.season_year}, version={self.version})"
@@ -10,6 +10,15 @@ class Game(sqla.Model):
     Class to represent a pro football game.
     """
     __tablename__ = 'game'
+    __table_args__ = (
+        # Serves season and week listings.
+        sqla.Index('ix_game_season_year_week', 'season_year', 'week'),
+        # Serves head-to-head lookups, which seek both (guest, host) orders of a pair of teams, and a team's
+        # games as guest.
+        sqla.Index('ix_game_guest_name_host_name_season_year', 'guest_name', 'host_name', 'season_year'),
+        # Serves a team's games as host, e.g. in the team season schedule procedures.
+        sqla.Index('ix_game_host_name_season_year', 'host_name', 'season_year'),
+    )
 
     id = sqla.Column(sqla.Integer, primary_key=True, autoincrement=True, nullable=False)
     season_year = sqla.Column(sqla.SmallInteger, sqla.ForeignKey('Season.year'), nullable=False)
@@ -24,6 +33,7 @@ class Game(sqla.Model):
     loser_score = sqla.Column(sqla.SmallInteger)
     is_playoff = sqla.Column(sqla.Boolean, nullable=False, default=False)
     notes = sqla.Column(sqla.String(256))
+    elo_delta = sqla.Column(sqla.Numeric(precision=18, scale=13))
 
     # guest = sqla.relationship('Team')
     # host = sqla.relationship('Team')
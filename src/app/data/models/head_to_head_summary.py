@@ -0,0 +1,58 @@
+from typing import Any, Tuple
+
+from sqlalchemy import and_, or_
+
+from app.data.models.game import Game
+from app.data.sqla import sqla
+
+# The all-time totals that game writes change by increments.
+HEAD_TO_HEAD_GAME_COLUMNS = ('games', 'team_wins', 'opponent_wins', 'ties', 'team_points', 'opponent_points')
+
+
+class HeadToHeadSummary(sqla.Model):
+    """
+    Class to represent the all-time series between two pro football teams.
+
+    Each pair of teams has one summary, stored with the team whose name sorts first as its team and the other as its
+    opponent.
+    """
+    __tablename__ = 'HeadToHeadSummary'
+
+    team_name = sqla.Column(sqla.String(50), primary_key=True, nullable=False)
+    opponent_name = sqla.Column(sqla.String(50), primary_key=True, nullable=False)
+    games = sqla.Column(sqla.Integer, nullable=False, default=0)
+    team_wins = sqla.Column(sqla.Integer, nullable=False, default=0)
+    opponent_wins = sqla.Column(sqla.Integer, nullable=False, default=0)
+    ties = sqla.Column(sqla.Integer, nullable=False, default=0)
+    team_points = sqla.Column(sqla.Integer, nullable=False, default=0)
+    opponent_points = sqla.Column(sqla.Integer, nullable=False, default=0)
+    first_season_year = sqla.Column(sqla.SmallInteger)
+    last_season_year = sqla.Column(sqla.SmallInteger)
+
+
+def get_team_pair(team_name: str, opponent_name: str) -> Tuple[str, str]:
+    """
+    Gets the key of the summary of two teams, whichever order they are given in.
+
+    :param team_name: The name of one team.
+    :param opponent_name: The name of the other team.
+
+    :return: The two names, in sorted order.
+    """
+    return (team_name, opponent_name) if team_name <= opponent_name else (opponent_name, team_name)
+
+
+def between_teams(team_name: str, opponent_name: str) -> Any:
+    """
+    Gets the condition that selects the games between two teams, whichever team was the host.
+
+    :param team_name: The name of one team.
+    :param opponent_name: The name of the other team.
+
+    :return: The condition, each branch of which is an equality seek on the leading columns of
+    ix_game_guest_name_host_name_season_year.
+    """
+    return or_(
+        and_(Game.guest_name == team_name, Game.host_name == opponent_name),
+        and_(Game.guest_name == opponent_name, Game.host_name == team_name),
+    )
@@ -0,0 +1,70 @@
+from typing import Optional
+
+from sqlalchemy.orm import validates
+
+from app.data.sqla import sqla
+
+
+class Job(sqla.Model):
+    """
+    Class to represent a unit of background work, such as a weekly update, and its progress.
+    """
+    __tablename__ = 'Job'
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+    ACTIVE_STATUSES = (QUEUED, RUNNING)
+
+    id = sqla.Column(sqla.Integer, primary_key=True, autoincrement=True, nullable=False)
+    kind = sqla.Column(sqla.String(50), nullable=False)
+    key = sqla.Column(sqla.String(100), nullable=False)
+    status = sqla.Column(sqla.String(20), nullable=False, default=QUEUED)
+    phase_count = sqla.Column(sqla.SmallInteger, nullable=False, default=0)
+    phases_completed = sqla.Column(sqla.SmallInteger, nullable=False, default=0)
+    phase_durations = sqla.Column(sqla.JSON)
+    result = sqla.Column(sqla.JSON)
+    error = sqla.Column(sqla.String(1024))
+    created_at = sqla.Column(sqla.DateTime, nullable=False)
+    updated_at = sqla.Column(sqla.DateTime, nullable=False)
+    started_at = sqla.Column(sqla.DateTime)
+    finished_at = sqla.Column(sqla.DateTime)
+
+    __table_args__ = (
+        sqla.Index('ix_job_kind_key_status', 'kind', 'key', 'status'),
+        # At most one job of each kind and key may be queued or running, whichever process submits it.
+        sqla.Index(
+            'ux_job_kind_key_active', 'kind', 'key', unique=True,
+            mssql_where=sqla.text("status IN ('queued', 'running')"),
+            postgresql_where=sqla.text("status IN ('queued', 'running')"),
+            sqlite_where=sqla.text("status IN ('queued', 'running')")
+        ),
+    )
+
+    @validates('kind', 'key')
+    def validate_not_empty(self, key, value):
+        if not value and value != 0:
+            raise ValueError(f"{key} is required.")
+
+        return value
+
+    @property
+    def progress(self) -> Optional[float]:
+        """
+        Gets the fraction of the current Job object's phases that have been completed.
+
+        :return: The completed fraction, or None if the job has no phases.
+        """
+        if not self.phase_count:
+            return None
+
+        return self.phases_completed / self.phase_count
+
+    def is_active(self) -> bool:
+        """
+        Checks to see if the current Job object is queued or running.
+
+        :return: True if the current Job object is queued or running; otherwise false.
+        """
+        return self.status in self.ACTIVE_STATUSES
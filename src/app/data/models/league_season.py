@@ -1,4 +1,5 @@
 from decimal import Decimal
+from typing import Optional
 
 from sqlalchemy.orm import validates
 
@@ -10,6 +11,10 @@ class LeagueSeason(sqla.Model):
     Class to represent the association between one pro football league and one pro football season.
     """
     __tablename__ = 'LeagueSeason'
+    __table_args__ = (
+        # A league plays at most one season per year.
+        sqla.Index('uq_league_season_league_name_season_year', 'league_name', 'season_year', unique=True),
+    )
 
     id = sqla.Column(sqla.Integer, primary_key=True, autoincrement=True, nullable=False)
     league_name = sqla.Column(sqla.String(5), sqla.ForeignKey('League.short_name'), nullable=False)
@@ -37,4 +42,16 @@ class LeagueSeason(sqla.Model):
         """
         self.total_games = total_games
         self.total_points = total_points
-        self.average_points = None if total_games == Decimal('0') else Decimal(total_points) / Decimal(total_games)
+        self.average_points = calculate_average_points(total_games, total_points)
+
+
+def calculate_average_points(total_games: int, total_points: int) -> Optional[Decimal]:
+    """
+    Calculates the average points scored per team per game in a league season.
+
+    :param total_games: The total games played by the league season's teams.
+    :param total_points: The total points scored by the league season's teams.
+
+    :return: The average points, or None if no games have been played.
+    """
+    return None if total_games == Decimal('0') else Decimal(total_points) / Decimal(total_games)
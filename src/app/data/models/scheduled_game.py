@@ -0,0 +1,29 @@
+from sqlalchemy.orm import validates
+
+from app.data.sqla import sqla
+
+
+class ScheduledGame(sqla.Model):
+    """
+    Class to represent one game on a pro football season's schedule, whether or not it has been played.
+    """
+    __tablename__ = 'ScheduledGame'
+    __table_args__ = (
+        sqla.Index(
+            'uq_scheduled_game_season_year_week_guest_name_host_name', 'season_year', 'week', 'guest_name',
+            'host_name', unique=True
+        ),
+    )
+
+    id = sqla.Column(sqla.Integer, primary_key=True, autoincrement=True, nullable=False)
+    season_year = sqla.Column(sqla.SmallInteger, sqla.ForeignKey('Season.year'), nullable=False)
+    week = sqla.Column(sqla.SmallInteger, nullable=False)
+    guest_name = sqla.Column(sqla.String(50), nullable=False)
+    host_name = sqla.Column(sqla.String(50), nullable=False)
+
+    @validates('season_year', 'week', 'guest_name', 'host_name')
+    def validate_not_empty(self, key, value):
+        if not value and value != 0:
+            raise ValueError(f"{key} is required.")
+
+        return value
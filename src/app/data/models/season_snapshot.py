@@ -0,0 +1,381 @@
+from array import array
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+# A numeric value is held as an integer scaled by its column's scale, so it converts back to the exact Decimal.
+NULL_NUMERIC = -2 ** 63
+NULL_INDEX = -1
+
+
+class TeamSeasonRecord(NamedTuple):
+    """
+    Class to represent a read-only copy of one TeamSeason row.
+    """
+    id: int
+    team_name: str
+    season_year: int
+    league_name: Optional[str]
+    conference_name: Optional[str]
+    division_name: Optional[str]
+    games: int
+    wins: int
+    losses: int
+    ties: int
+    winning_percentage: Optional[Decimal]
+    points_for: int
+    points_against: int
+    expected_wins: Optional[Decimal]
+    expected_losses: Optional[Decimal]
+    offensive_average: Optional[Decimal]
+    offensive_factor: Optional[Decimal]
+    offensive_index: Optional[Decimal]
+    defensive_average: Optional[Decimal]
+    defensive_factor: Optional[Decimal]
+    defensive_index: Optional[Decimal]
+    final_expected_winning_percentage: Optional[Decimal]
+    simple_rating: Optional[Decimal]
+    elo_rating: Optional[Decimal]
+
+
+class GameRecord(NamedTuple):
+    """
+    Class to represent a read-only copy of one Game row. Its winner and loser are decided from its scores.
+    """
+    id: int
+    season_year: int
+    week: int
+    guest_name: str
+    guest_score: int
+    host_name: str
+    host_score: int
+    is_playoff: bool
+    notes: Optional[str] = None
+    elo_delta: Optional[Decimal] = None
+
+
+# Integer columns map to their array typecode; numeric columns map to their decimal scale.
+TEAM_SEASON_INTEGER_COLUMNS: Dict[str, str] = {
+    'id': 'q',
+    'games': 'h',
+    'wins': 'h',
+    'losses': 'h',
+    'ties': 'h',
+    'points_for': 'h',
+    'points_against': 'h',
+}
+TEAM_SEASON_NUMERIC_COLUMNS: Dict[str, int] = {
+    'winning_percentage': 17,
+    'expected_wins': 16,
+    'expected_losses': 16,
+    'offensive_average': 15,
+    'offensive_factor': 14,
+    'offensive_index': 15,
+    'defensive_average': 15,
+    'defensive_factor': 14,
+    'defensive_index': 15,
+    'final_expected_winning_percentage': 17,
+    'simple_rating': 15,
+    'elo_rating': 13,
+}
+TEAM_SEASON_NAME_COLUMNS = ('league_name', 'conference_name', 'division_name')
+GAME_INTEGER_COLUMNS: Dict[str, str] = {
+    'id': 'q',
+    'week': 'h',
+    'guest_score': 'h',
+    'host_score': 'h',
+    'is_playoff': 'b',
+}
+TEAM_SEASON_COLUMN_TYPECODES: Dict[str, str] = {
+    **TEAM_SEASON_INTEGER_COLUMNS,
+    **{name: 'q' for name in TEAM_SEASON_NUMERIC_COLUMNS},
+    **{name: 'h' for name in TEAM_SEASON_NAME_COLUMNS},
+}
+GAME_NUMERIC_COLUMNS: Dict[str, int] = {
+    'elo_delta': 13,
+}
+GAME_NAME_COLUMNS = ('notes',)
+GAME_COLUMN_TYPECODES: Dict[str, str] = {
+    **GAME_INTEGER_COLUMNS,
+    **{name: 'q' for name in GAME_NUMERIC_COLUMNS},
+    **{name: 'h' for name in GAME_NAME_COLUMNS},
+    'guest_index': 'h',
+    'host_index': 'h',
+}
+
+
+def to_scaled_int(value: Optional[Decimal], scale: int) -> int:
+    """
+    Converts a numeric column value to an integer scaled by the column's scale.
+
+    :param value: The value to convert.
+    :param scale: The number of decimal places of the column.
+
+    :return: The scaled integer, or NULL_NUMERIC if the value is None.
+    """
+    if value is None:
+        return NULL_NUMERIC
+
+    return int(Decimal(value).scaleb(scale).to_integral_value())
+
+
+def from_scaled_int(value: int, scale: int) -> Optional[Decimal]:
+    """
+    Converts an integer scaled by a column's scale back to the column value.
+
+    :param value: The scaled integer.
+    :param scale: The number of decimal places of the column.
+
+    :return: The column value, or None if the scaled integer is NULL_NUMERIC.
+    """
+    if value == NULL_NUMERIC:
+        return None
+
+    return Decimal(value).scaleb(-scale)
+
+
+class SeasonSnapshot:
+    """
+    Class to represent an immutable, compact copy of the TeamSeason and Game rows of one pro football season.
+
+    Each column is held in a typed array rather than as attributes of ORM objects. Team names, league, conference
+    and division names and game notes are dictionary-encoded, and team seasons are found by team name with a
+    dictionary lookup.
+    """
+
+    __slots__ = (
+        '_season_year', '_version', '_team_names', '_team_indices', '_names', '_team_season_columns',
+        '_game_columns', '_game_count'
+    )
+
+    def __init__(
+            self,
+            season_year: int,
+            version: int,
+            team_names: Sequence[str],
+            names: Sequence[str],
+            team_season_columns: Dict[str, array],
+            game_columns: Dict[str, array]
+    ) -> None:
+        """
+        Initializes a new instance of the SeasonSnapshot class. Use build() to create one from database rows.
+
+        :param season_year: The year of the season.
+        :param version: The version of the season's data from which the snapshot was built.
+        :param team_names: The team names, in team season order.
+        :param names: The league, conference and division names and the game notes referred to by index from the
+        name columns.
+        :param team_season_columns: The team season columns, each with one value per team season. Any object that
+        supports the buffer protocol, such as an array or a memoryview of a memory-mapped file, may hold a column.
+        :param game_columns: The game columns, each with one value per game.
+        """
+        self._season_year = season_year
+        self._version = version
+        self._team_names = tuple(team_names)
+        self._team_indices = {team_name: index for index, team_name in enumerate(self._team_names)}
+        self._names = tuple(names)
+        self._team_season_columns = {
+            name: memoryview(column).toreadonly() for name, column in team_season_columns.items()
+        }
+        self._game_columns = {name: memoryview(column).toreadonly() for name, column in game_columns.items()}
+        self._game_count = len(game_columns['id'])
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}("
+            f"season_year={self._season_year}, "
+            f"version={self._version}, "
+            f"team_seasons={len(self._team_names)}, "
+            f"games={self._game_count}"
+            f")"
+        )
+
+    def __setattr__(self, key, value):
+        if hasattr(self, '_game_count'):
+            raise AttributeError(f"{type(self).__name__} is immutable.")
+        super().__setattr__(key, value)
+
+    @classmethod
+    def build(
+            cls,
+            season_year: int,
+            version: int,
+            team_season_rows: Iterable[Any],
+            game_rows: Iterable[Any]
+    ) -> 'SeasonSnapshot':
+        """
+        Builds a snapshot from rows of TeamSeason and Game columns.
+
+        :param season_year: The year of the season.
+        :param version: The version of the season's data that the rows were read at.
+        :param team_season_rows: Rows with attributes named after the TeamSeasonRecord fields.
+        :param game_rows: Rows with attributes named after the GameRecord fields.
+
+        :return: The built snapshot.
+        """
+        team_names = []
+        names: List[str] = []
+        name_indices: Dict[str, int] = {}
+        team_season_columns = {name: array(typecode) for name, typecode in TEAM_SEASON_COLUMN_TYPECODES.items()}
+
+        for row in team_season_rows:
+            team_names.append(row.team_name)
+            for name in TEAM_SEASON_INTEGER_COLUMNS:
+                team_season_columns[name].append(getattr(row, name) or 0)
+            for name, scale in TEAM_SEASON_NUMERIC_COLUMNS.items():
+                team_season_columns[name].append(to_scaled_int(getattr(row, name), scale))
+            for name in TEAM_SEASON_NAME_COLUMNS:
+                team_season_columns[name].append(_encode(getattr(row, name), names, name_indices))
+
+        team_indices = {team_name: index for index, team_name in enumerate(team_names)}
+        game_columns = {name: array(typecode) for name, typecode in GAME_COLUMN_TYPECODES.items()}
+        for row in game_rows:
+            for name in GAME_INTEGER_COLUMNS:
+                game_columns[name].append(int(getattr(row, name) or 0))
+            for name, scale in GAME_NUMERIC_COLUMNS.items():
+                game_columns[name].append(to_scaled_int(getattr(row, name), scale))
+            for name in GAME_NAME_COLUMNS:
+                game_columns[name].append(_encode(getattr(row, name), names, name_indices))
+            game_columns['guest_index'].append(_encode(row.guest_name, team_names, team_indices))
+            game_columns['host_index'].append(_encode(row.host_name, team_names, team_indices))
+
+        # Game teams without a team season of their own were appended to team_names; they have no team season row.
+        return cls(season_year, version, team_names, names, team_season_columns, game_columns)
+
+    @property
+    def season_year(self) -> int:
+        """
+        Gets the year of the season.
+        """
+        return self._season_year
+
+    @property
+    def version(self) -> int:
+        """
+        Gets the version of the season's data from which the snapshot was built.
+        """
+        return self._version
+
+    @property
+    def team_season_count(self) -> int:
+        """
+        Gets the number of team seasons in the snapshot.
+        """
+        return len(self._team_season_columns['id'])
+
+    @property
+    def game_count(self) -> int:
+        """
+        Gets the number of games in the snapshot.
+        """
+        return self._game_count
+
+    @property
+    def team_names(self) -> Tuple[str, ...]:
+        """
+        Gets the names of the teams in the snapshot, in index order.
+        """
+        return self._team_names
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """
+        Gets the league, conference and division names and the game notes referred to by index from the name columns.
+        """
+        return self._names
+
+    def get_team_index(self, team_name: str) -> Optional[int]:
+        """
+        Gets the index of the specified team in the snapshot's columns.
+
+        :param team_name: The name of the team.
+
+        :return: The team's index, or None if the team is not in the snapshot.
+        """
+        return self._team_indices.get(team_name)
+
+    def get_team_season_column(self, name: str) -> memoryview:
+        """
+        Gets a read-only view of one team season column. Numeric columns hold integers scaled by the column's scale.
+
+        :param name: The name of the column.
+
+        :return: The column's values, one per team season.
+        """
+        return self._team_season_columns[name]
+
+    def get_game_column(self, name: str) -> memoryview:
+        """
+        Gets a read-only view of one game column. Teams are held in 'guest_index' and 'host_index'.
+
+        :param name: The name of the column.
+
+        :return: The column's values, one per game.
+        """
+        return self._game_columns[name]
+
+    def get_team_season(self, team_name: str) -> Optional[TeamSeasonRecord]:
+        """
+        Gets the team season of the specified team.
+
+        :param team_name: The name of the team.
+
+        :return: The team season, or None if the team has no team season in the snapshot.
+        """
+        index = self._team_indices.get(team_name)
+        if index is None or index >= self.team_season_count:
+            return None
+
+        return self._get_team_season_record(index)
+
+    def get_team_seasons(self) -> List[TeamSeasonRecord]:
+        """
+        Gets every team season in the snapshot.
+
+        :return: The team seasons, in the order in which they were read.
+        """
+        return [self._get_team_season_record(index) for index in range(self.team_season_count)]
+
+    def get_games(self) -> Iterator[GameRecord]:
+        """
+        Gets every game in the snapshot.
+
+        :return: An iterator over the games, in the order in which they were read.
+        """
+        columns = self._game_columns
+        for index in range(self._game_count):
+            yield GameRecord(
+                id=columns['id'][index],
+                season_year=self._season_year,
+                week=columns['week'][index],
+                guest_name=self._team_names[columns['guest_index'][index]],
+                guest_score=columns['guest_score'][index],
+                host_name=self._team_names[columns['host_index'][index]],
+                host_score=columns['host_score'][index],
+                is_playoff=bool(columns['is_playoff'][index]),
+                notes=_decode(columns['notes'][index], self._names),
+                elo_delta=from_scaled_int(columns['elo_delta'][index], GAME_NUMERIC_COLUMNS['elo_delta']),
+            )
+
+    def _get_team_season_record(self, index: int) -> TeamSeasonRecord:
+        columns = self._team_season_columns
+        values = {name: columns[name][index] for name in TEAM_SEASON_INTEGER_COLUMNS}
+        values.update({
+            name: from_scaled_int(columns[name][index], scale) for name, scale in TEAM_SEASON_NUMERIC_COLUMNS.items()
+        })
+        values.update({name: _decode(columns[name][index], self._names) for name in TEAM_SEASON_NAME_COLUMNS})
+        return TeamSeasonRecord(team_name=self._team_names[index], season_year=self._season_year, **values)
+
+
+def _encode(value: Optional[str], values: List[str], indices: Dict[str, int]) -> int:
+    if value is None:
+        return NULL_INDEX
+
+    index = indices.get(value)
+    if index is None:
+        index = indices[value] = len(values)
+        values.append(value)
+    return index
+
+
+def _decode(index: int, values: Sequence[str]) -> Optional[str]:
+    return None if index == NULL_INDEX else values[index]
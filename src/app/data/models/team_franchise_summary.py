@@ -0,0 +1,45 @@
+from decimal import Decimal
+from typing import Optional
+
+from app.data.models.team_season import divide
+from app.data.sqla import sqla
+
+# The all-time totals that game writes change by increments.
+FRANCHISE_GAME_COLUMNS = (
+    'games', 'wins', 'losses', 'ties', 'points_for', 'points_against',
+    'playoff_games', 'playoff_wins', 'playoff_losses', 'playoff_ties',
+)
+
+
+class TeamFranchiseSummary(sqla.Model):
+    """
+    Class to represent the all-time record of one pro football team across every season it has played.
+
+    Its game totals are maintained from the games in the data store, and its season columns from the team's
+    team seasons.
+    """
+    __tablename__ = 'TeamFranchiseSummary'
+
+    team_name = sqla.Column(sqla.String(50), primary_key=True, nullable=False)
+    seasons = sqla.Column(sqla.SmallInteger, nullable=False, default=0)
+    games = sqla.Column(sqla.Integer, nullable=False, default=0)
+    wins = sqla.Column(sqla.Integer, nullable=False, default=0)
+    losses = sqla.Column(sqla.Integer, nullable=False, default=0)
+    ties = sqla.Column(sqla.Integer, nullable=False, default=0)
+    points_for = sqla.Column(sqla.Integer, nullable=False, default=0)
+    points_against = sqla.Column(sqla.Integer, nullable=False, default=0)
+    playoff_games = sqla.Column(sqla.Integer, nullable=False, default=0)
+    playoff_wins = sqla.Column(sqla.Integer, nullable=False, default=0)
+    playoff_losses = sqla.Column(sqla.Integer, nullable=False, default=0)
+    playoff_ties = sqla.Column(sqla.Integer, nullable=False, default=0)
+    best_season_year = sqla.Column(sqla.SmallInteger)
+    best_winning_percentage = sqla.Column(sqla.Numeric(precision=18, scale=17))
+    worst_season_year = sqla.Column(sqla.SmallInteger)
+    worst_winning_percentage = sqla.Column(sqla.Numeric(precision=18, scale=17))
+
+    @property
+    def winning_percentage(self) -> Optional[Decimal]:
+        """
+        Gets the team's all-time winning percentage, with ties counted as half a win.
+        """
+        return divide(2 * self.wins + self.ties, 2 * self.games)
@@ -1,16 +1,34 @@
 from decimal import Decimal
-from typing import Optional
+from typing import Dict, Optional, Tuple, Union
 
 from app.data.sqla import sqla
 
 EXPONENT = Decimal('2.37')
 
+# Ranking math runs in Decimal by default. In the float mode it runs in binary floating point, and each result is
+# quantized to the scale of its column as it is set on the team season.
+DECIMAL_MODE = 'decimal'
+FLOAT_MODE = 'float'
+NUMERIC_MODES = (DECIMAL_MODE, FLOAT_MODE)
+
+RANKING_COLUMNS = (
+    'offensive_average', 'offensive_factor', 'offensive_index',
+    'defensive_average', 'defensive_factor', 'defensive_index',
+    'final_expected_winning_percentage',
+)
+
 
 class TeamSeason(sqla.Model):
     """
     Class to represent the association between one pro football team and one pro football season.
     """
     __tablename__ = 'TeamSeason'
+    __table_args__ = (
+        # A team plays at most one season per year.
+        sqla.Index('uq_team_season_team_name_season_year', 'team_name', 'season_year', unique=True),
+        # Serves season listings and the league totals of a season.
+        sqla.Index('ix_team_season_season_year_league_name', 'season_year', 'league_name'),
+    )
 
     id = sqla.Column(sqla.Integer, primary_key=True, autoincrement=True, nullable=False)
     team_name = sqla.Column(sqla.String(50), sqla.ForeignKey('Team.name'), nullable=False)
@@ -34,6 +52,8 @@ class TeamSeason(sqla.Model):
     defensive_factor = sqla.Column(sqla.Numeric(precision=18, scale=14))
     defensive_index = sqla.Column(sqla.Numeric(precision=18, scale=15))
     final_expected_winning_percentage = sqla.Column(sqla.Numeric(precision=18, scale=17))
+    simple_rating = sqla.Column(sqla.Numeric(precision=18, scale=15))
+    elo_rating = sqla.Column(sqla.Numeric(precision=18, scale=13))
 
     def calculate_expected_wins_and_losses(self) -> None:
         """
@@ -61,7 +81,8 @@ class TeamSeason(sqla.Model):
             self,
             team_season_schedule_average_points_for: Decimal,
             team_season_schedule_average_points_against: Decimal,
-            league_season_average_points: Decimal
+            league_season_average_points: Decimal,
+            numeric_mode: str = DECIMAL_MODE
     ) -> None:
         """
         Updates the current TeamSeason object's offensive and defensive averages, factors, and indices.
@@ -69,9 +90,22 @@ class TeamSeason(sqla.Model):
         :param team_season_schedule_average_points_for:
         :param team_season_schedule_average_points_against:
         :param league_season_average_points:
+        :param numeric_mode: DECIMAL_MODE to calculate in Decimal, or FLOAT_MODE to calculate in floating point.
 
         :return: None
         """
+        if numeric_mode == FLOAT_MODE:
+            rankings = calculate_rankings_fast(
+                self.points_for, self.points_against, self.games, float(team_season_schedule_average_points_for),
+                float(team_season_schedule_average_points_against), float(league_season_average_points)
+            )
+            for name, value in rankings.items():
+                setattr(self, name, quantize_to_column(name, value))
+            return
+
+        if numeric_mode != DECIMAL_MODE:
+            raise ValueError(f"'{numeric_mode}' is not one of the numeric modes {NUMERIC_MODES}.")
+
         self.offensive_average, self.offensive_factor, self.offensive_index = \
             update_rankings(
                 self.points_for, self.games, team_season_schedule_average_points_against, league_season_average_points
@@ -120,3 +154,68 @@ def update_rankings(
         index = divide(average + factor * league_season_average_points, 2)
 
     return average, factor, index
+
+
+def calculate_rankings_fast(
+        points_for: int,
+        points_against: int,
+        games: int,
+        team_season_schedule_average_points_for: float,
+        team_season_schedule_average_points_against: float,
+        league_season_average_points: float
+) -> Dict[str, Optional[float]]:
+    """
+    Calculates the rankings of a team season in floating point, with the same formulas as TeamSeason.update_rankings.
+
+    :return: The value of each of the RANKING_COLUMNS. The final expected winning percentage is left out when either
+    index is None, as TeamSeason.update_rankings leaves it unchanged.
+    """
+    offensive = _update_rankings_fast(
+        points_for, games, team_season_schedule_average_points_against, league_season_average_points
+    )
+    defensive = _update_rankings_fast(
+        points_against, games, team_season_schedule_average_points_for, league_season_average_points
+    )
+    rankings = dict(zip(RANKING_COLUMNS[:6], offensive + defensive))
+
+    offensive_index, defensive_index = offensive[2], defensive[2]
+    if offensive_index is not None and defensive_index is not None:
+        o = offensive_index ** float(EXPONENT)
+        d = defensive_index ** float(EXPONENT)
+        rankings['final_expected_winning_percentage'] = _divide_fast(o, o + d)
+    return rankings
+
+
+def _update_rankings_fast(
+        points: int, games: int, team_season_schedule_average_points: float, league_season_average_points: float
+) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+    if games == 0:
+        return None, None, None
+
+    average = _divide_fast(points, games)
+    factor = _divide_fast(average, team_season_schedule_average_points)
+    index = None if factor is None else (average + factor * league_season_average_points) / 2
+    return average, factor, index
+
+
+def _divide_fast(numerator: float, denominator: float) -> Optional[float]:
+    if denominator == 0:
+        return None
+
+    return numerator / denominator
+
+
+def quantize_to_column(name: str, value: Optional[Union[float, Decimal]]) -> Optional[Decimal]:
+    """
+    Rounds a value to the scale of a TeamSeason column, as the data store would when the value is persisted.
+
+    :param name: The name of the column.
+    :param value: The value to round.
+
+    :return: The rounded value, or None if the value is None.
+    """
+    if value is None:
+        return None
+
+    scale = TeamSeason.__table__.c[name].type.scale
+    return Decimal(value).quantize(Decimal(1).scaleb(-scale))
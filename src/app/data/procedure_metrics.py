@@ -0,0 +1,49 @@
+import re
+import time
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.metrics import metrics
+
+_STARTED_AT_KEY = 'procedure_started_at'
+
+_PROCEDURE_CALL = re.compile(r'^\s*EXEC(?:UTE)?\s+(?:\w+\.)?\[?(\w+)\]?', re.IGNORECASE)
+
+
+def get_procedure_name(statement: str) -> Optional[str]:
+    """
+    Gets the name of the stored procedure that a SQL statement calls.
+
+    :param statement: The SQL statement.
+
+    :return: The name of the procedure, without its schema, or None if the statement does not call a procedure.
+    """
+    match = _PROCEDURE_CALL.match(statement)
+    return match.group(1) if match else None
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _start_procedure_timer(
+        connection: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    if get_procedure_name(statement) is not None:
+        connection.info[_STARTED_AT_KEY] = time.perf_counter()
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _record_procedure_time(
+        connection: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    started_at = connection.info.pop(_STARTED_AT_KEY, None)
+    if started_at is not None:
+        metrics.observe(
+            'db_procedure_duration_seconds', time.perf_counter() - started_at, procedure=get_procedure_name(statement)
+        )
+
+
+@event.listens_for(Engine, 'handle_error')
+def _discard_procedure_timer(context: Any) -> None:
+    if context.connection is not None:
+        context.connection.info.pop(_STARTED_AT_KEY, None)
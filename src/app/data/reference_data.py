@@ -0,0 +1,207 @@
+import threading
+import time
+from collections import Counter, namedtuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+from sqlalchemy import event, inspect
+
+from app.data.data_versions import DataVersions, data_versions
+from app.data.session_routing import RoutingSession
+
+REFERENCE_DATA_KINDS = ('season', 'league', 'conference', 'division', 'team')
+
+# Cached records are loaded again once they are this old, even if no change to them has been seen.
+REFERENCE_DATA_MAX_AGE_SECONDS = 300.0
+
+_PENDING_KINDS_KEY = 'reference_data_changed_kinds'
+
+
+class ReferenceDataCache:
+    """
+    Holds the seasons, leagues, conferences, divisions and teams of this process, which change only a few times a
+    year but are listed on nearly every page.
+
+    Each kind is loaded in full on first use and kept as immutable records, one per row, with the row's column values
+    as attributes, together with the data version of the kind at which it was loaded. A kind is invalidated whenever
+    this process commits a change to one of its rows, and it is loaded again when its shared data version shows a
+    change that this process did not commit, e.g. one made by another web worker or a weekly update run from the
+    command line. Every kind is also loaded again once it is older than the maximum age. A load that overlaps an
+    invalidation is returned to its caller but not kept, so a stale load never outlives the change that made it
+    stale.
+    """
+
+    def __init__(
+            self,
+            max_age: float = REFERENCE_DATA_MAX_AGE_SECONDS,
+            clock: Callable[[], float] = time.monotonic,
+            versions: Optional[DataVersions] = None
+    ) -> None:
+        """
+        Initializes a new instance of the ReferenceDataCache class.
+
+        :param max_age: The number of seconds for which loaded records are kept.
+        :param clock: The clock by which the age of the records is measured.
+        :param versions: The data versions by which changes made by other processes are seen. Defaults to the data
+        versions of this process.
+        """
+        self.max_age = max_age
+        self._clock = clock
+        self._versions = versions or data_versions
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[float, int, Tuple[Any, ...]]] = {}
+        self._generations: Counter = Counter()
+        self._hits: Counter = Counter()
+        self._misses: Counter = Counter()
+        self._invalidations: Counter = Counter()
+
+    def __repr__(self):
+        return f"{type(self).__name__}(max_age={self.max_age})"
+
+    def get(self, kind: str, load: Callable[[], Iterable[Any]]) -> List[Any]:
+        """
+        Gets the records of one kind of reference data, loading them if they are not cached.
+
+        :param kind: The kind of reference data, one of the REFERENCE_DATA_KINDS.
+        :param load: A function that loads every model instance of the kind from the data store.
+
+        :return: A new list of the records.
+        """
+        from app.data.models.data_version import REFERENCE_DATA_SEASON_YEARS
+
+        version = self._versions.get_reference_data_version(kind)
+        entry = self._entries.get(kind)
+        if entry is not None and self._clock() - entry[0] < self.max_age:
+            loaded_at, loaded_version, records = entry
+            # This process's own changes to the kind have invalidated it, so only another process's change is stale.
+            if self._versions.committed_locally(REFERENCE_DATA_SEASON_YEARS[kind], loaded_version, version):
+                with self._lock:
+                    self._hits[kind] += 1
+                    if version > loaded_version and self._entries.get(kind) is entry:
+                        self._entries[kind] = (loaded_at, version, records)
+                return list(records)
+
+        generation = self._generations[kind]
+        loaded_at = self._clock()
+        records = tuple(to_record(instance) for instance in load())
+        with self._lock:
+            self._misses[kind] += 1
+            if self._generations[kind] == generation:
+                self._entries[kind] = (loaded_at, version, records)
+        return list(records)
+
+    def invalidate(self, *kinds: str) -> None:
+        """
+        Drops the cached records of some kinds of reference data, so that they are loaded again on their next use.
+
+        :param kinds: The kinds to drop, or none to drop every kind.
+
+        :return: None
+        """
+        with self._lock:
+            for kind in kinds or REFERENCE_DATA_KINDS:
+                self._entries.pop(kind, None)
+                self._generations[kind] += 1
+                self._invalidations[kind] += 1
+
+    def clear(self) -> None:
+        """
+        Drops every cached record and resets the metrics.
+
+        :return: None
+        """
+        with self._lock:
+            self._entries.clear()
+            for counter in (self._generations, self._hits, self._misses, self._invalidations):
+                counter.clear()
+
+    def reset_metrics(self) -> None:
+        """
+        Resets the hits, misses and invalidations, but keeps the cached records.
+
+        :return: None
+        """
+        with self._lock:
+            for counter in (self._hits, self._misses, self._invalidations):
+                counter.clear()
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Gets the hits, misses, invalidations and cached record count of each kind of reference data.
+
+        :return: The metrics, by kind.
+        """
+        with self._lock:
+            metrics = {}
+            for kind in REFERENCE_DATA_KINDS:
+                hits, misses = self._hits[kind], self._misses[kind]
+                entry = self._entries.get(kind)
+                metrics[kind] = {
+                    'hits': hits,
+                    'misses': misses,
+                    'hit_rate': hits / (hits + misses) if hits + misses else None,
+                    'invalidations': self._invalidations[kind],
+                    'records': len(entry[2]) if entry is not None else 0,
+                }
+            return metrics
+
+
+reference_data_cache = ReferenceDataCache()
+
+_record_types: Dict[type, Type[tuple]] = {}
+
+
+def to_record(instance: Any) -> Any:
+    """
+    Copies the column values of a model instance into an immutable record that outlives the instance's session.
+
+    :param instance: The model instance.
+
+    :return: A named tuple, named after the model, with one field per column.
+    """
+    mapper = inspect(instance).mapper
+    record_type = _record_types.get(mapper.class_)
+    if record_type is None:
+        record_type = _record_types.setdefault(
+            mapper.class_,
+            namedtuple(f"{mapper.class_.__name__}Record", [attribute.key for attribute in mapper.column_attrs])
+        )
+    return record_type(*(getattr(instance, field) for field in record_type._fields))
+
+
+def get_reference_data_kind(instance: Any) -> Optional[str]:
+    """
+    Gets the kind of reference data of a model instance.
+
+    :param instance: The model instance.
+
+    :return: The kind, one of the REFERENCE_DATA_KINDS, or None if the instance is not reference data.
+    """
+    from app.data.models.conference import Conference
+    from app.data.models.division import Division
+    from app.data.models.league import League
+    from app.data.models.season import Season
+    from app.data.models.team import Team
+
+    kinds = {Season: 'season', League: 'league', Conference: 'conference', Division: 'division', Team: 'team'}
+    return kinds.get(type(instance))
+
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _collect_changed_kinds(session: RoutingSession, flush_context: Any) -> None:
+    kinds = {
+        get_reference_data_kind(instance)
+        for instance in list(session.new) + list(session.dirty) + list(session.deleted)
+    }
+    session.info.setdefault(_PENDING_KINDS_KEY, set()).update(kinds - {None})
+
+
+@event.listens_for(RoutingSession, 'after_commit')
+def _invalidate_changed_kinds(session: RoutingSession) -> None:
+    kinds = session.info.pop(_PENDING_KINDS_KEY, None)
+    if kinds:
+        reference_data_cache.invalidate(*kinds)
+
+
+@event.listens_for(RoutingSession, 'after_soft_rollback')
+def _discard_changed_kinds(session: RoutingSession, previous_transaction: Any) -> None:
+    session.info.pop(_PENDING_KINDS_KEY, None)
@@ -1,9 +1,12 @@
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from app.data.models.conference import Conference
+from app.data.reference_data import reference_data_cache
 from app.data.sqla import sqla, try_commit
+from app.metrics import instrumented
 
 
+@instrumented
 class ConferenceRepository:
     """
     Provides CRUD access to an external data store.
@@ -23,6 +26,14 @@ class ConferenceRepository:
         """
         return Conference.query.all()
 
+    def get_conference_records(self) -> List[Any]:
+        """
+        Gets all the conferences in the data store from the reference data cache, for pages that only list them.
+
+        :return: A list of all fetched conferences, as immutable records with the column values of each conference.
+        """
+        return reference_data_cache.get('conference', lambda: Conference.query.all())
+
     def get_conference(self, id: int) -> Optional[Conference]:
         """
         Gets the conference in the data store with the specified id.
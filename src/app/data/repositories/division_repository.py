@@ -1,11 +1,14 @@
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from sqlalchemy.exc import IntegrityError
 
 from app.data.models.division import Division
+from app.data.reference_data import reference_data_cache
 from app.data.sqla import sqla, try_commit
+from app.metrics import instrumented
 
 
+@instrumented
 class DivisionRepository:
     """
     Provides CRUD access to an external data store.
@@ -25,6 +28,14 @@ class DivisionRepository:
         """
         return Division.query.all()
 
+    def get_division_records(self) -> List[Any]:
+        """
+        Gets all the divisions in the data store from the reference data cache, for pages that only list them.
+
+        :return: A list of all fetched divisions, as immutable records with the column values of each division.
+        """
+        return reference_data_cache.get('division', lambda: Division.query.all())
+
     def get_division(self, id: int) -> Optional[Division]:
         """
         Gets the division in the data store with the specified id.
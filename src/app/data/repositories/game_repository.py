@@ -1,11 +1,22 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
+from sqlalchemy import Row, select
 from sqlalchemy.exc import IntegrityError
 
 from app.data.models.game import Game
-from app.data.sqla import sqla, try_commit
+from app.data.models.head_to_head_summary import between_teams
+from app.data.session_routing import read_only
+from app.data.sqla import STREAM_BATCH_SIZE, sqla, try_commit
+from app.metrics import instrumented
 
+# The columns shown by the games index page.
+GAME_LIST_COLUMNS = (
+    Game.id, Game.season_year, Game.week, Game.guest_name, Game.guest_score, Game.host_name, Game.host_score,
+    Game.is_playoff, Game.notes,
+)
 
+
+@instrumented
 class GameRepository:
     """
     Provides CRUD access to an external data store.
@@ -49,6 +60,92 @@ class GameRepository:
             return []
         return Game.query.filter_by(season_year=season_year, week=week).all()
 
+    @read_only
+    def get_game_rows_by_season_year(self, season_year: Optional[int]) -> List[Row]:
+        """
+        Gets the listed columns of all the games in the data store filtered by season_year, as plain rows rather
+        than Game objects.
+
+        :param season_year: The season_year to filter.
+
+        :return: A list of rows with the GAME_LIST_COLUMNS of each fetched game.
+        """
+        if season_year is None:
+            return []
+        return sqla.session.execute(
+            select(*GAME_LIST_COLUMNS).where(Game.season_year == season_year).order_by(Game.week, Game.id)
+        ).all()
+
+    @read_only
+    def get_game_rows_by_season_year_and_week(self, season_year: Optional[int], week: Optional[int]) -> List[Row]:
+        """
+        Gets the listed columns of all the games in the data store filtered by season_year and week, as plain rows
+        rather than Game objects.
+
+        :param season_year: The season_year to filter.
+        :param week: The week to filter.
+
+        :return: A list of rows with the GAME_LIST_COLUMNS of each fetched game.
+        """
+        if season_year is None or week is None:
+            return []
+        return sqla.session.execute(
+            select(*GAME_LIST_COLUMNS).where(Game.season_year == season_year, Game.week == week).order_by(Game.id)
+        ).all()
+
+    @read_only
+    def get_game_rows_between_teams(
+            self,
+            team_name: str,
+            opponent_name: str,
+            first_season_year: Optional[int] = None,
+            last_season_year: Optional[int] = None
+    ) -> List[Row]:
+        """
+        Gets the listed columns of all the games in the data store between two teams, whichever team was the host,
+        as plain rows rather than Game objects.
+
+        :param team_name: The name of one team.
+        :param opponent_name: The name of the other team.
+        :param first_season_year: The first season_year to include, or None to start with the first game.
+        :param last_season_year: The last season_year to include, or None to end with the last game.
+
+        :return: A list of rows with the GAME_LIST_COLUMNS of each fetched game, in the order they were played.
+        """
+        query = select(*GAME_LIST_COLUMNS).where(between_teams(team_name, opponent_name))
+        if first_season_year is not None:
+            query = query.where(Game.season_year >= first_season_year)
+        if last_season_year is not None:
+            query = query.where(Game.season_year <= last_season_year)
+        return sqla.session.execute(query.order_by(Game.season_year, Game.week, Game.id)).all()
+
+    @read_only
+    def stream_game_rows(
+            self,
+            first_season_year: Optional[int] = None,
+            last_season_year: Optional[int] = None,
+            batch_size: int = STREAM_BATCH_SIZE
+    ) -> Iterator[Row]:
+        """
+        Streams the listed columns of the games in the data store over a range of seasons, fetching batch_size rows
+        at a time through a server-side cursor, so that any number of games can be read in constant memory.
+
+        :param first_season_year: The first season_year to include, or None to start with the first game.
+        :param last_season_year: The last season_year to include, or None to end with the last game.
+        :param batch_size: The number of rows to fetch at a time.
+
+        :return: An iterator over rows with the GAME_LIST_COLUMNS of each game, in the order they were played. It
+        must be consumed while the session is open.
+        """
+        query = select(*GAME_LIST_COLUMNS)
+        if first_season_year is not None:
+            query = query.where(Game.season_year >= first_season_year)
+        if last_season_year is not None:
+            query = query.where(Game.season_year <= last_season_year)
+        return sqla.session.execute(
+            query.order_by(Game.season_year, Game.week, Game.id).execution_options(yield_per=batch_size)
+        )
+
     def get_game(self, id: int) -> Optional[Game]:
         """
         Gets the game in the data store with the specified id.
@@ -57,14 +154,8 @@ class GameRepository:
 
         :return: The fetched game.
         """
-        if self._games_empty():
-            return None
         return Game.query.get(id)
 
-    def _games_empty(self) -> bool:
-        games = self.get_games()
-        return len(games) == 0
-
     def add_game(self, game: Game) -> Game:
         """
         Adds a game to the data store.
@@ -116,6 +207,7 @@ class GameRepository:
         game_in_db.host_score = game.host_score
         game_in_db.is_playoff = game.is_playoff
         game_in_db.notes = game.notes
+        game_in_db.elo_delta = game.elo_delta
         return game_in_db
 
     def delete_game(self, id: int) -> Optional[Game]:
@@ -0,0 +1,138 @@
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import and_, case, delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.data.models.game import Game
+from app.data.models.head_to_head_summary import (HEAD_TO_HEAD_GAME_COLUMNS, HeadToHeadSummary, between_teams,
+                                                  get_team_pair)
+from app.data.session_routing import read_only
+from app.data.sqla import sqla, try_commit
+from app.metrics import instrumented
+
+
+@instrumented
+class HeadToHeadRepository:
+    """
+    Provides access to the all-time series summaries of pairs of teams in an external data store.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the HeadToHeadRepository class.
+        """
+        pass
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+    @read_only
+    def get_head_to_head_summary(self, team_name: str, opponent_name: str) -> Optional[HeadToHeadSummary]:
+        """
+        Gets the summary of the series between two teams with a single primary key read.
+
+        :param team_name: The name of one team.
+        :param opponent_name: The name of the other team.
+
+        :return: The fetched summary, stored with the teams in sorted order, or None if the teams have not played.
+        """
+        return sqla.session.get(HeadToHeadSummary, get_team_pair(team_name, opponent_name))
+
+    def update_head_to_head_summaries(self, changes: Dict[Tuple[str, str], Dict[str, int]]) -> None:
+        """
+        Applies changes in game totals to the summaries of pairs of teams, and refreshes the seasons that their
+        series spans.
+
+        Each total is changed by an increment in the database, so that concurrent writers do not overwrite each
+        other's changes. A summary whose teams no longer have any games is removed. A pair without a summary is given
+        an empty one first; if another writer adds it in the meantime, the changes are applied again to the summary
+        that writer added.
+
+        :param changes: The change in each of the HEAD_TO_HEAD_GAME_COLUMNS, by sorted pair of team names.
+
+        :return: None
+        """
+        if not changes:
+            return
+
+        try:
+            self._apply_head_to_head_changes(changes)
+        except IntegrityError:
+            sqla.session.rollback()
+            self._apply_head_to_head_changes(changes)
+
+    def _apply_head_to_head_changes(self, changes: Dict[Tuple[str, str], Dict[str, int]]) -> None:
+        for (team_name, opponent_name), deltas in changes.items():
+            key = and_(HeadToHeadSummary.team_name == team_name, HeadToHeadSummary.opponent_name == opponent_name)
+            first_season_year, last_season_year = sqla.session.execute(
+                select(func.min(Game.season_year), func.max(Game.season_year))
+                .where(between_teams(team_name, opponent_name))
+            ).one()
+            if first_season_year is None:
+                sqla.session.execute(delete(HeadToHeadSummary).where(key))
+                continue
+
+            if sqla.session.get(HeadToHeadSummary, (team_name, opponent_name)) is None:
+                sqla.session.execute(
+                    insert(HeadToHeadSummary), [{'team_name': team_name, 'opponent_name': opponent_name}]
+                )
+
+            values = {
+                name: getattr(HeadToHeadSummary, name) + delta for name, delta in deltas.items() if delta
+            }
+            sqla.session.execute(
+                update(HeadToHeadSummary)
+                .where(key)
+                .values(first_season_year=first_season_year, last_season_year=last_season_year, **values)
+            )
+        try_commit()
+
+    def rebuild_head_to_head_summaries(self) -> int:
+        """
+        Rebuilds the summary of every pair of teams from the games in the data store.
+
+        :return: The number of summaries written.
+        """
+        def count_if(condition: Any) -> Any:
+            return func.sum(case((condition, 1), else_=0))
+
+        # Games are grouped by (guest, host) and folded into sorted pairs here rather than in SQL, so that pairs are
+        # ordered exactly as get_team_pair() orders them whatever the database's collation.
+        rows = sqla.session.execute(
+            select(
+                Game.guest_name,
+                Game.host_name,
+                func.count().label('games'),
+                count_if(Game.guest_score > Game.host_score).label('guest_wins'),
+                count_if(Game.guest_score < Game.host_score).label('host_wins'),
+                count_if(Game.guest_score == Game.host_score).label('ties'),
+                func.sum(Game.guest_score).label('guest_points'),
+                func.sum(Game.host_score).label('host_points'),
+                func.min(Game.season_year).label('first_season_year'),
+                func.max(Game.season_year).label('last_season_year'),
+            ).group_by(Game.guest_name, Game.host_name)
+        )
+
+        summaries: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for row in rows:
+            pair = get_team_pair(row.guest_name, row.host_name)
+            summary = summaries.setdefault(pair, {
+                'team_name': pair[0], 'opponent_name': pair[1],
+                **{name: 0 for name in HEAD_TO_HEAD_GAME_COLUMNS},
+                'first_season_year': row.first_season_year, 'last_season_year': row.last_season_year,
+            })
+            guest_is_team = row.guest_name == pair[0]
+            summary['games'] += row.games
+            summary['ties'] += row.ties
+            summary['team_wins'] += row.guest_wins if guest_is_team else row.host_wins
+            summary['opponent_wins'] += row.host_wins if guest_is_team else row.guest_wins
+            summary['team_points'] += row.guest_points if guest_is_team else row.host_points
+            summary['opponent_points'] += row.host_points if guest_is_team else row.guest_points
+            summary['first_season_year'] = min(summary['first_season_year'], row.first_season_year)
+            summary['last_season_year'] = max(summary['last_season_year'], row.last_season_year)
+
+        sqla.session.execute(delete(HeadToHeadSummary))
+        if summaries:
+            sqla.session.execute(insert(HeadToHeadSummary), list(summaries.values()))
+        try_commit()
+        return len(summaries)
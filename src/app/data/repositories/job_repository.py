@@ -0,0 +1,68 @@
+from typing import Optional
+
+from app.data.models.job import Job
+from app.data.sqla import sqla, try_commit
+from app.metrics import instrumented
+
+
+@instrumented
+class JobRepository:
+    """
+    Provides CRUD access to an external data store.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the JobRepository class.
+        """
+        pass
+
+    def get_job(self, id: int) -> Optional[Job]:
+        """
+        Gets the job in the data store with the specified id.
+
+        :param id: The id of the job to fetch.
+
+        :return: The fetched job.
+        """
+        return sqla.session.get(Job, id)
+
+    def get_active_job_by_kind_and_key(self, kind: str, key: str) -> Optional[Job]:
+        """
+        Gets the most recent queued or running job in the data store with the specified kind and key.
+
+        :param kind: The kind of the job to fetch.
+        :param key: The key of the job to fetch.
+
+        :return: The fetched job.
+        """
+        return (
+            Job.query
+            .filter(Job.kind == kind, Job.key == key, Job.status.in_(Job.ACTIVE_STATUSES))
+            .order_by(Job.id.desc())
+            .first()
+        )
+
+    def add_job(self, job: Job) -> Job:
+        """
+        Adds a job to the data store.
+
+        :param job: The job to add.
+
+        :return: The added job.
+        """
+        sqla.session.add(job)
+        try_commit()
+        return job
+
+    def update_job(self, job: Job) -> Job:
+        """
+        Saves the changes made to a job that was fetched from the data store.
+
+        :param job: The job to update.
+
+        :return: The updated job.
+        """
+        sqla.session.add(job)
+        try_commit()
+        return job
@@ -1,11 +1,14 @@
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from sqlalchemy.exc import IntegrityError
 
 from app.data.models.league import League
+from app.data.reference_data import reference_data_cache
 from app.data.sqla import sqla, try_commit
+from app.metrics import instrumented
 
 
+@instrumented
 class LeagueRepository:
     """
     Provides CRUD access to an external data store.
@@ -25,6 +28,14 @@ class LeagueRepository:
         """
         return League.query.all()
 
+    def get_league_records(self) -> List[Any]:
+        """
+        Gets all the leagues in the data store from the reference data cache, for pages that only list them.
+
+        :return: A list of all fetched leagues, as immutable records with the column values of each league.
+        """
+        return reference_data_cache.get('league', lambda: League.query.all())
+
     def get_league(self, id: int) -> Optional[League]:
         """
         Gets the league in the data store with the specified id.
@@ -1,11 +1,15 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
+from sqlalchemy import and_, select, update
 from sqlalchemy.exc import IntegrityError
 
-from app.data.models.league_season import LeagueSeason
+from app.data.data_versions import data_versions
+from app.data.models.league_season import LeagueSeason, calculate_average_points
 from app.data.sqla import sqla, try_commit
+from app.metrics import instrumented
 
 
+@instrumented
 class LeagueSeasonRepository:
     """
     Provides CRUD access to an external data store.
@@ -33,8 +37,6 @@ class LeagueSeasonRepository:
 
         :return: The fetched league_season.
         """
-        if self._league_seasons_empty():
-            return None
         return LeagueSeason.query.get(id)
 
     def get_league_season_by_league_name_and_season_year(self, league_name: str, season_year: int) -> Optional[LeagueSeason]:
@@ -46,14 +48,8 @@ class LeagueSeasonRepository:
 
         :return: The fetched league_season.
         """
-        if self._league_seasons_empty():
-            return None
         return LeagueSeason.query.filter_by(league_name=league_name, season_year=season_year).first()
 
-    def _league_seasons_empty(self) -> bool:
-        league_seasons = self.get_league_seasons()
-        return len(league_seasons) == 0
-
     def add_league_season(self, league_season: LeagueSeason) -> LeagueSeason:
         """
         Adds a league_season to the data store.
@@ -94,6 +90,49 @@ class LeagueSeasonRepository:
         try_commit()
         return league_season
 
+    def increment_league_season_totals(self, season_year: int, changes: Dict[str, Tuple[int, int]]) -> int:
+        """
+        Changes the total games and total points of league_seasons by increments, and recalculates their average
+        points.
+
+        Each total is incremented in the database, so that concurrent game writes do not overwrite each other's
+        changes. The average is calculated from the incremented totals read back under the row lock that the
+        increment holds until the transaction commits. The changes are not committed here; the caller's commit,
+        e.g. of the game write that the totals follow, persists them in the same transaction.
+
+        :param season_year: The season_year of the league_seasons to change.
+        :param changes: The change in total games and total points, by league_name.
+
+        :return: The number of league_seasons changed.
+        """
+        rows_touched = 0
+        for league_name, (games, points) in changes.items():
+            if not games and not points:
+                continue
+
+            condition = and_(LeagueSeason.league_name == league_name, LeagueSeason.season_year == season_year)
+            result = sqla.session.execute(
+                update(LeagueSeason)
+                .where(condition)
+                .values(total_games=LeagueSeason.total_games + games, total_points=LeagueSeason.total_points + points)
+            )
+            if result.rowcount == 0:
+                continue
+
+            total_games, total_points = sqla.session.execute(
+                select(LeagueSeason.total_games, LeagueSeason.total_points).where(condition)
+            ).one()
+            sqla.session.execute(
+                update(LeagueSeason)
+                .where(condition)
+                .values(average_points=calculate_average_points(total_games, total_points))
+            )
+            rows_touched += 1
+
+        if rows_touched:
+            data_versions.mark_changed(sqla.session, [season_year])
+        return rows_touched
+
     def _set_values_of_league_season_in_db(self, league_season: LeagueSeason) -> LeagueSeason:
         league_season_in_db = self.get_league_season(league_season.id)
         league_season_in_db.league_name = league_season.league_name
@@ -5,8 +5,10 @@ from sqlalchemy.sql import text as SQLQuery
 
 from app.data.models.league_season_totals import LeagueSeasonTotals
 from app.data.sqla import sqla
+from app.metrics import instrumented
 
 
+@instrumented
 class LeagueSeasonTotalsRepository:
     """
     Provides CRUD access to an external data store.
@@ -0,0 +1,81 @@
+from typing import Any, Dict, Iterable, List, Sequence
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.engine import Row
+
+from app.data.data_versions import data_versions
+from app.data.models.scheduled_game import ScheduledGame
+from app.data.session_routing import read_only
+from app.data.sqla import sqla, try_commit
+from app.metrics import instrumented
+
+SCHEDULED_GAME_COLUMNS = (
+    ScheduledGame.id, ScheduledGame.season_year, ScheduledGame.week, ScheduledGame.guest_name,
+    ScheduledGame.host_name,
+)
+
+
+@instrumented
+class ScheduledGameRepository:
+    """
+    Provides access to the season schedules in an external data store.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the ScheduledGameRepository class.
+        """
+        pass
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+    @read_only
+    def get_scheduled_game_rows_by_season_year(self, season_year: int) -> List[Row]:
+        """
+        Gets the schedule of one season as lightweight rows.
+
+        :param season_year: The season_year to filter.
+
+        :return: A list of rows with the SCHEDULED_GAME_COLUMNS of each scheduled game, in week order.
+        """
+        return sqla.session.execute(
+            select(*SCHEDULED_GAME_COLUMNS)
+            .where(ScheduledGame.season_year == season_year)
+            .order_by(ScheduledGame.week, ScheduledGame.id)
+        ).all()
+
+    @read_only
+    def get_scheduled_game_rows_by_season_year_and_weeks(self, season_year: int, weeks: Iterable[int]) -> List[Row]:
+        """
+        Gets the scheduled games of some weeks of one season as lightweight rows.
+
+        :param season_year: The season_year to filter.
+        :param weeks: The weeks to filter.
+
+        :return: A list of rows with the SCHEDULED_GAME_COLUMNS of each scheduled game, in week order.
+        """
+        return sqla.session.execute(
+            select(*SCHEDULED_GAME_COLUMNS)
+            .where(ScheduledGame.season_year == season_year, ScheduledGame.week.in_(list(weeks)))
+            .order_by(ScheduledGame.week, ScheduledGame.id)
+        ).all()
+
+    def import_scheduled_games(self, scheduled_games: Sequence[Dict[str, Any]]) -> int:
+        """
+        Replaces the schedule of every season in a list of scheduled games with the games listed for it, in one
+        transaction.
+
+        :param scheduled_games: The scheduled games, as dictionaries of season_year, week, guest_name and host_name.
+
+        :return: The number of scheduled games imported.
+        """
+        if not scheduled_games:
+            return 0
+
+        season_years = sorted({scheduled_game['season_year'] for scheduled_game in scheduled_games})
+        sqla.session.execute(delete(ScheduledGame).where(ScheduledGame.season_year.in_(season_years)))
+        sqla.session.execute(insert(ScheduledGame), list(scheduled_games))
+        data_versions.mark_changed(sqla.session, season_years)
+        try_commit()
+        return len(scheduled_games)
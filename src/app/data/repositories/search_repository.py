@@ -0,0 +1,83 @@
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+
+from app.data.data_versions import data_versions
+from app.data.models.data_version import REFERENCE_DATA_SEASON_YEARS
+from app.data.models.league import League
+from app.data.models.season import Season
+from app.data.models.team import Team
+from app.data.search_index import SEARCH_KINDS, SearchResult, search_index
+from app.data.sqla import sqla
+from app.metrics import instrumented
+
+
+@instrumented
+class SearchRepository:
+    """
+    Provides typeahead search over the names of the teams, seasons and leagues in an external data store.
+
+    Searches are answered from the in-memory prefix index of this process, which is built from the data store on
+    first use and kept current by the commits made through the ORM session. It is built from the primary engine,
+    since the commits that keep it current are made there. The index is built again when the shared data versions
+    of the teams, seasons or leagues show a change that this process did not commit, e.g. one made by another web
+    worker or a command.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the SearchRepository class.
+        """
+        pass
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+    def search(self, text: str, kinds: Optional[Sequence[str]] = None, limit: int = 10) -> List[SearchResult]:
+        """
+        Finds the teams, seasons and leagues with a name, or a word of a name, that starts with some text.
+
+        :param text: The text to search for. Case is ignored.
+        :param kinds: The kinds of result to find, from SEARCH_KINDS, or None for every kind.
+        :param limit: The greatest number of results to return.
+
+        :return: The results, in the order of their matching terms.
+        """
+        version = _get_version()
+        if not search_index.is_built:
+            self.rebuild()
+        elif version != search_index.version:
+            if all(
+                    data_versions.committed_locally(REFERENCE_DATA_SEASON_YEARS[kind], since_version, kind_version)
+                    for kind, since_version, kind_version in zip(SEARCH_KINDS, search_index.version, version)
+            ):
+                search_index.mark_current(version)
+            else:
+                self.rebuild()
+        return search_index.search(text, kinds, limit)
+
+    def rebuild(self) -> None:
+        """
+        Builds the search index again from the data store.
+
+        :return: None
+        """
+        # The version is read first, so a change committed while the rows are read builds the index again later.
+        version = _get_version()
+        results = [
+            SearchResult('team', row.id, row.name, row.name)
+            for row in sqla.session.execute(select(Team.id, Team.name))
+        ]
+        results += [
+            SearchResult('season', row.id, str(row.year), str(row.year))
+            for row in sqla.session.execute(select(Season.id, Season.year))
+        ]
+        results += [
+            SearchResult('league', row.id, f"{row.short_name} {row.long_name}", row.short_name)
+            for row in sqla.session.execute(select(League.id, League.short_name, League.long_name))
+        ]
+        search_index.build(results, version)
+
+
+def _get_version() -> Tuple[int, ...]:
+    return tuple(data_versions.get_reference_data_version(kind) for kind in SEARCH_KINDS)
@@ -5,9 +5,12 @@ from sqlalchemy.sql import text as SQLQuery
 
 from app.data.models.rankings_team_season \
     import OffensiveRankingsTeamSeason, DefensiveRankingsTeamSeason, TotalRankingsTeamSeason
+from app.data.session_routing import read_only
 from app.data.sqla import sqla
+from app.metrics import instrumented
 
 
+@instrumented
 class SeasonRankingsRepository:
     """
     Provides CRUD access to an external data store.
@@ -19,6 +22,7 @@ class SeasonRankingsRepository:
         """
         pass
 
+    @read_only
     def get_offensive_rankings_by_season_year(self, season_year: Optional[int]) -> List[OffensiveRankingsTeamSeason]:
         if season_year is None:
             return []
@@ -39,6 +43,7 @@ class SeasonRankingsRepository:
             rankings_team_seasons.append(rts)
         return rankings_team_seasons
 
+    @read_only
     def get_defensive_rankings_by_season_year(self, season_year: Optional[int]) -> List[DefensiveRankingsTeamSeason]:
         if season_year is None:
             return []
@@ -59,6 +64,7 @@ class SeasonRankingsRepository:
             rankings_team_seasons.append(rts)
         return rankings_team_seasons
 
+    @read_only
     def get_total_rankings_by_season_year(self, season_year: Optional[int]) -> List[TotalRankingsTeamSeason]:
         if season_year is None:
             return []
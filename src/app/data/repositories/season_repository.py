@@ -1,11 +1,14 @@
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from sqlalchemy.exc import IntegrityError
 
 from app.data.models.season import Season
+from app.data.reference_data import reference_data_cache
 from app.data.sqla import sqla, try_commit
+from app.metrics import instrumented
 
 
+@instrumented
 class SeasonRepository:
     """
     Provides CRUD access to an external data store.
@@ -25,6 +28,14 @@ class SeasonRepository:
         """
         return Season.query.all()
 
+    def get_season_records(self) -> List[Any]:
+        """
+        Gets all the seasons in the data store from the reference data cache, for pages that only list them.
+
+        :return: A list of all fetched seasons, as immutable records with the column values of each season.
+        """
+        return reference_data_cache.get('season', lambda: Season.query.all())
+
     def get_season(self, id: int) -> Optional[Season]:
         """
         Gets the season in the data store with the specified id.
@@ -33,8 +44,6 @@ class SeasonRepository:
 
         :return: The fetched season.
         """
-        if self._seasons_empty():
-            return None
         return Season.query.get(id)
 
     def get_season_by_year(self, year: int) -> Optional[Season]:
@@ -45,14 +54,8 @@ class SeasonRepository:
 
         :return: The fetched season.
         """
-        if self._seasons_empty():
-            return None
         return Season.query.filter_by(year=year).first()
 
-    def _seasons_empty(self) -> bool:
-        seasons = self.get_seasons()
-        return len(seasons) == 0
-
     def add_season(self, season: Season) -> Season:
         """
         Adds a season to the data store.
@@ -0,0 +1,117 @@
+import threading
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+
+from app.data.data_versions import data_versions
+from app.data.models.game import Game
+from app.data.models.season_snapshot import GameRecord, SeasonSnapshot, TeamSeasonRecord
+from app.data.models.team_season import TeamSeason
+from app.data.sqla import sqla
+from app.metrics import CacheCounters, instrumented
+
+season_snapshot_cache_counters = CacheCounters('season_snapshot')
+
+
+@instrumented
+class SeasonSnapshotRepository:
+    """
+    Provides read access to immutable in-memory snapshots of the TeamSeason and Game rows of each season.
+
+    A season's snapshot is built on first use and rebuilt on the next use after a committed change to the season's
+    data, made by this or any other process. Snapshots are read from the primary engine, since they are versioned by
+    the commits made to it.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the SeasonSnapshotRepository class.
+        """
+        self._lock = threading.Lock()
+        self._snapshots: Dict[int, SeasonSnapshot] = {}
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+    def get_season_snapshot(self, season_year: int) -> SeasonSnapshot:
+        """
+        Gets the current snapshot of the specified season.
+
+        :param season_year: The year of the season.
+
+        :return: The season's snapshot.
+        """
+        version = data_versions.get(season_year)
+        snapshot = self._snapshots.get(season_year)
+        if snapshot is not None and snapshot.version == version:
+            season_snapshot_cache_counters.hit()
+            return snapshot
+
+        with self._lock:
+            # Another thread may have rebuilt the snapshot while this one waited.
+            version = data_versions.get(season_year)
+            snapshot = self._snapshots.get(season_year)
+            if snapshot is None or snapshot.version != version:
+                season_snapshot_cache_counters.miss()
+                snapshot = self._snapshots[season_year] = self._build_season_snapshot(season_year, version)
+            else:
+                season_snapshot_cache_counters.hit()
+            return snapshot
+
+    def get_team_seasons_by_season_year(self, season_year: Optional[int]) -> List[TeamSeasonRecord]:
+        """
+        Gets all the team_seasons of the specified season.
+
+        :param season_year: The season_year to filter.
+
+        :return: A list of all fetched team_seasons.
+        """
+        if season_year is None:
+            return []
+        return self.get_season_snapshot(season_year).get_team_seasons()
+
+    def get_team_season_by_team_name_and_season_year(
+            self, team_name: str, season_year: int
+    ) -> Optional[TeamSeasonRecord]:
+        """
+        Gets the team_season of the specified team and season.
+
+        :param team_name: The team_name of the team_season to fetch.
+        :param season_year: The season_year of the team_season to fetch.
+
+        :return: The fetched team_season.
+        """
+        return self.get_season_snapshot(season_year).get_team_season(team_name)
+
+    def get_games_by_season_year(self, season_year: int) -> List[GameRecord]:
+        """
+        Gets all the games of the specified season.
+
+        :param season_year: The season_year to filter.
+
+        :return: A list of all fetched games.
+        """
+        return list(self.get_season_snapshot(season_year).get_games())
+
+    def clear(self) -> None:
+        """
+        Discards every snapshot, so that each is rebuilt on its next use.
+
+        :return: None
+        """
+        with self._lock:
+            self._snapshots.clear()
+
+    @staticmethod
+    def _build_season_snapshot(season_year: int, version: int) -> SeasonSnapshot:
+        team_season_rows = sqla.session.execute(
+            select(*(getattr(TeamSeason, name) for name in TeamSeasonRecord._fields))
+            .where(TeamSeason.season_year == season_year)
+            .order_by(TeamSeason.id)
+        )
+        game_rows = sqla.session.execute(
+            select(*(getattr(Game, name) for name in GameRecord._fields))
+            .where(Game.season_year == season_year)
+            .order_by(Game.id)
+        )
+        return SeasonSnapshot.build(season_year, version, team_season_rows, game_rows)
@@ -4,9 +4,12 @@ from sqlalchemy import Result
 from sqlalchemy.sql import text as SQLQuery
 
 from app.data.models.standings_team_season import StandingsTeamSeason
+from app.data.session_routing import read_only
 from app.data.sqla import sqla
+from app.metrics import instrumented
 
 
+@instrumented
 class SeasonStandingsRepository:
     """
     Provides CRUD access to an external data store.
@@ -18,6 +21,7 @@ class SeasonStandingsRepository:
         """
         pass
 
+    @read_only
     def get_season_standings_by_season_year(self, season_year: int, group_by_division: bool=False)\
             -> List[StandingsTeamSeason]:
         querystring = f"EXEC sp_GetSeasonStandings {season_year}, {group_by_division}"
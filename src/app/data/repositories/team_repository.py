@@ -1,11 +1,19 @@
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
+from sqlalchemy import Row, and_, case, delete, func, insert, select, update
 from sqlalchemy.exc import IntegrityError
 
+from app.data.models.game import Game
 from app.data.models.team import Team
+from app.data.models.team_franchise_summary import FRANCHISE_GAME_COLUMNS, TeamFranchiseSummary
+from app.data.models.team_season import TeamSeason
+from app.data.reference_data import reference_data_cache
+from app.data.session_routing import read_only
 from app.data.sqla import sqla, try_commit
+from app.metrics import instrumented
 
 
+@instrumented
 class TeamRepository:
     """
     Provides CRUD access to an external data store.
@@ -25,6 +33,23 @@ class TeamRepository:
         """
         return Team.query.all()
 
+    def get_team_records(self) -> List[Any]:
+        """
+        Gets all the teams in the data store from the reference data cache, for pages that only list them.
+
+        :return: A list of all fetched teams, as immutable records with the column values of each team.
+        """
+        return reference_data_cache.get('team', lambda: Team.query.all())
+
+    @read_only
+    def get_team_rows(self) -> List[Row]:
+        """
+        Gets the id and name of all the teams in the data store, as plain rows rather than Team objects.
+
+        :return: A list of (id, name) rows.
+        """
+        return sqla.session.execute(select(Team.id, Team.name).order_by(Team.id)).all()
+
     def get_team(self, id: int) -> Optional[Team]:
         """
         Gets the team in the data store with the specified id.
@@ -122,3 +147,143 @@ class TeamRepository:
         :return: True if the team with the specified id exists in the data store; otherwise false.
         """
         return self.get_team(id) is not None
+
+    @read_only
+    def get_franchise_summary(self, team_name: str) -> Optional[TeamFranchiseSummary]:
+        """
+        Gets the all-time summary of the specified team with a single primary key read.
+
+        :param team_name: The name of the team.
+
+        :return: The fetched summary, or None if the team has no games or team seasons.
+        """
+        return sqla.session.get(TeamFranchiseSummary, team_name)
+
+    def update_franchise_summaries(self, changes: Dict[str, Dict[str, int]]) -> None:
+        """
+        Applies changes in game totals to the all-time summaries of teams, and refreshes their season columns from
+        their team seasons.
+
+        Each total is changed by an increment in the database, so that concurrent writers do not overwrite each
+        other's changes. A team without a summary is given an empty one first; if another writer adds it in the
+        meantime, the changes are applied again to the summary that writer added.
+
+        :param changes: The change in each of the FRANCHISE_GAME_COLUMNS, by team name.
+
+        :return: None
+        """
+        if not changes:
+            return
+
+        try:
+            self._apply_franchise_changes(changes)
+        except IntegrityError:
+            sqla.session.rollback()
+            self._apply_franchise_changes(changes)
+
+    def _apply_franchise_changes(self, changes: Dict[str, Dict[str, int]]) -> None:
+        existing = set(sqla.session.scalars(
+            select(TeamFranchiseSummary.team_name).where(TeamFranchiseSummary.team_name.in_(changes))
+        ))
+        missing = [team_name for team_name in changes if team_name not in existing]
+        if missing:
+            sqla.session.execute(insert(TeamFranchiseSummary), [{'team_name': team_name} for team_name in missing])
+
+        for team_name, deltas in changes.items():
+            values = {
+                name: getattr(TeamFranchiseSummary, name) + delta for name, delta in deltas.items() if delta
+            }
+            if values:
+                sqla.session.execute(
+                    update(TeamFranchiseSummary).where(TeamFranchiseSummary.team_name == team_name).values(**values)
+                )
+
+        season_values = _get_franchise_season_values(sqla.session.execute(
+            select(TeamSeason.team_name, TeamSeason.season_year, TeamSeason.games, TeamSeason.winning_percentage)
+            .where(TeamSeason.team_name.in_(changes))
+        ))
+        for team_name in changes:
+            sqla.session.execute(
+                update(TeamFranchiseSummary)
+                .where(TeamFranchiseSummary.team_name == team_name)
+                .values(**season_values.get(team_name, _EMPTY_SEASON_VALUES))
+            )
+        try_commit()
+
+    def rebuild_franchise_summaries(self) -> int:
+        """
+        Rebuilds the all-time summary of every team from the games and team seasons in the data store.
+
+        :return: The number of summaries written.
+        """
+        summaries: Dict[str, Dict[str, Any]] = {}
+        for team, team_score, opponent_score in (
+                (Game.guest_name, Game.guest_score, Game.host_score),
+                (Game.host_name, Game.host_score, Game.guest_score),
+        ):
+            for row in sqla.session.execute(_select_franchise_game_totals(team, team_score, opponent_score)):
+                summary = summaries.setdefault(row.team_name, _new_franchise_summary(row.team_name))
+                for name in FRANCHISE_GAME_COLUMNS:
+                    summary[name] += getattr(row, name) or 0
+
+        season_values = _get_franchise_season_values(sqla.session.execute(
+            select(TeamSeason.team_name, TeamSeason.season_year, TeamSeason.games, TeamSeason.winning_percentage)
+        ))
+        for team_name, values in season_values.items():
+            summaries.setdefault(team_name, _new_franchise_summary(team_name)).update(values)
+
+        sqla.session.execute(delete(TeamFranchiseSummary))
+        if summaries:
+            sqla.session.execute(insert(TeamFranchiseSummary), list(summaries.values()))
+        try_commit()
+        return len(summaries)
+
+
+_EMPTY_SEASON_VALUES = {
+    'seasons': 0,
+    'best_season_year': None,
+    'best_winning_percentage': None,
+    'worst_season_year': None,
+    'worst_winning_percentage': None,
+}
+
+
+def _new_franchise_summary(team_name: str) -> Dict[str, Any]:
+    return {'team_name': team_name, **{name: 0 for name in FRANCHISE_GAME_COLUMNS}, **_EMPTY_SEASON_VALUES}
+
+
+def _select_franchise_game_totals(team: Any, team_score: Any, opponent_score: Any) -> Any:
+    def count_if(condition: Any) -> Any:
+        return func.sum(case((condition, 1), else_=0))
+
+    return select(
+        team.label('team_name'),
+        func.count().label('games'),
+        count_if(team_score > opponent_score).label('wins'),
+        count_if(team_score < opponent_score).label('losses'),
+        count_if(team_score == opponent_score).label('ties'),
+        func.sum(team_score).label('points_for'),
+        func.sum(opponent_score).label('points_against'),
+        count_if(Game.is_playoff).label('playoff_games'),
+        count_if(and_(Game.is_playoff, team_score > opponent_score)).label('playoff_wins'),
+        count_if(and_(Game.is_playoff, team_score < opponent_score)).label('playoff_losses'),
+        count_if(and_(Game.is_playoff, team_score == opponent_score)).label('playoff_ties'),
+    ).group_by(team)
+
+
+def _get_franchise_season_values(team_season_rows: Iterable[Any]) -> Dict[str, Dict[str, Any]]:
+    # The best and worst seasons are those with the highest and lowest winning percentages among the seasons in
+    # which the team played; the earlier season wins a tie.
+    season_values: Dict[str, Dict[str, Any]] = {}
+    for row in sorted(team_season_rows, key=lambda row: (row.team_name, row.season_year)):
+        values = season_values.setdefault(row.team_name, dict(_EMPTY_SEASON_VALUES))
+        values['seasons'] += 1
+        if not row.games or row.winning_percentage is None:
+            continue
+        if values['best_season_year'] is None or row.winning_percentage > values['best_winning_percentage']:
+            values['best_season_year'] = row.season_year
+            values['best_winning_percentage'] = row.winning_percentage
+        if values['worst_season_year'] is None or row.winning_percentage < values['worst_winning_percentage']:
+            values['worst_season_year'] = row.season_year
+            values['worst_winning_percentage'] = row.winning_percentage
+    return season_values
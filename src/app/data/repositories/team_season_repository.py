@@ -1,11 +1,27 @@
-from typing import List, Optional
+from decimal import Decimal
+from typing import Dict, Iterable, Iterator, List, Optional
 
+from sqlalchemy import Row, select, update
 from sqlalchemy.exc import IntegrityError
 
+from app.data.data_versions import data_versions
 from app.data.models.team_season import TeamSeason
-from app.data.sqla import sqla, try_commit
-
-
+from app.data.session_routing import read_only, use_primary
+from app.data.sqla import STREAM_BATCH_SIZE, sqla, try_commit
+from app.metrics import instrumented
+
+# The columns shown by the team seasons index page.
+TEAM_SEASON_LIST_COLUMNS = (
+    TeamSeason.id, TeamSeason.team_name, TeamSeason.season_year, TeamSeason.league_name, TeamSeason.conference_name,
+    TeamSeason.division_name, TeamSeason.games, TeamSeason.wins, TeamSeason.losses, TeamSeason.ties,
+    TeamSeason.winning_percentage, TeamSeason.points_for, TeamSeason.points_against, TeamSeason.expected_wins,
+    TeamSeason.expected_losses, TeamSeason.offensive_average, TeamSeason.offensive_factor, TeamSeason.offensive_index,
+    TeamSeason.defensive_average, TeamSeason.defensive_factor, TeamSeason.defensive_index,
+    TeamSeason.final_expected_winning_percentage,
+)
+
+
+@instrumented
 class TeamSeasonRepository:
     """
     Provides CRUD access to an external data store.
@@ -25,6 +41,7 @@ class TeamSeasonRepository:
         """
         return TeamSeason.query.all()
 
+    @read_only
     def get_team_seasons_by_season_year(self, season_year: Optional[int]) -> List[TeamSeason]:
         """
         Gets all the team_seasons in the data store filtered by season_year.
@@ -37,6 +54,73 @@ class TeamSeasonRepository:
             return []
         return TeamSeason.query.filter_by(season_year=season_year).all()
 
+    @read_only
+    def get_team_season_rows_by_season_year(self, season_year: Optional[int]) -> List[Row]:
+        """
+        Gets the listed columns of all the team_seasons in the data store filtered by season_year, as plain rows
+        rather than TeamSeason objects.
+
+        :param season_year: The season_year to filter.
+
+        :return: A list of rows with the TEAM_SEASON_LIST_COLUMNS of each fetched team_season.
+        """
+        if season_year is None:
+            return []
+        return sqla.session.execute(
+            select(*TEAM_SEASON_LIST_COLUMNS).where(TeamSeason.season_year == season_year).order_by(TeamSeason.id)
+        ).all()
+
+    @read_only
+    def stream_team_season_rows(
+            self,
+            first_season_year: Optional[int] = None,
+            last_season_year: Optional[int] = None,
+            batch_size: int = STREAM_BATCH_SIZE
+    ) -> Iterator[Row]:
+        """
+        Streams the listed columns of the team_seasons in the data store over a range of seasons, fetching
+        batch_size rows at a time through a server-side cursor, so that any number of team_seasons can be read in
+        constant memory.
+
+        :param first_season_year: The first season_year to include, or None to start with the first season.
+        :param last_season_year: The last season_year to include, or None to end with the last season.
+        :param batch_size: The number of rows to fetch at a time.
+
+        :return: An iterator over rows with the TEAM_SEASON_LIST_COLUMNS of each team_season, in season order. It
+        must be consumed while the session is open.
+        """
+        query = select(*TEAM_SEASON_LIST_COLUMNS)
+        if first_season_year is not None:
+            query = query.where(TeamSeason.season_year >= first_season_year)
+        if last_season_year is not None:
+            query = query.where(TeamSeason.season_year <= last_season_year)
+        return sqla.session.execute(
+            query.order_by(TeamSeason.season_year, TeamSeason.id).execution_options(yield_per=batch_size)
+        )
+
+    # The rows are cached against the data versions of their seasons, so they must not be read from a stale read
+    # engine.
+    @use_primary()
+    def get_team_season_column_rows(self, season_years: Iterable[int], column_names: Iterable[str]) -> List[Row]:
+        """
+        Gets the team_name, season_year and the specified columns of the team_seasons of several seasons with one
+        query, as plain rows rather than TeamSeason objects.
+
+        :param season_years: The season_years to filter.
+        :param column_names: The names of the other columns to fetch.
+
+        :return: A list of rows with the requested columns of each fetched team_season, in season order.
+        """
+        season_years = list(season_years)
+        if not season_years:
+            return []
+        return sqla.session.execute(
+            select(TeamSeason.team_name, TeamSeason.season_year, *(getattr(TeamSeason, name) for name in column_names))
+            .where(TeamSeason.season_year.in_(season_years))
+            .order_by(TeamSeason.season_year, TeamSeason.id)
+        ).all()
+
+    @read_only
     def get_team_season(self, id: int) -> Optional[TeamSeason]:
         """
         Gets the team_season in the data store with the specified id.
@@ -45,17 +129,14 @@ class TeamSeasonRepository:
 
         :return: The fetched team_season.
         """
-        if self._team_seasons_empty():
-            return None
         return TeamSeason.query.get(id)
 
+    @read_only
     def get_team_season_by_team_name_and_season_year(self, team_name: str, season_year: int) -> Optional[TeamSeason]:
         return TeamSeason.query.filter_by(team_name=team_name, season_year=season_year).first()
 
-    def _team_seasons_empty(self) -> bool:
-        team_seasons = self.get_team_seasons()
-        return len(team_seasons) == 0
-
+    # The team_season is read back to be changed, so it must not be read from a stale read engine.
+    @use_primary()
     def update_team_season(self, team_season: TeamSeason) -> None:
         if not self.team_season_exists(team_season.id):
             return team_season
@@ -64,6 +145,27 @@ class TeamSeasonRepository:
         try_commit()
         return team_season
 
+    def update_simple_ratings(self, season_year: int, simple_ratings: Dict[int, Optional[Decimal]]) -> int:
+        """
+        Saves the simple ratings of many team_seasons of one season with a single bulk UPDATE statement.
+
+        :param season_year: The season_year of the team_seasons to update.
+        :param simple_ratings: The new simple_rating of each team_season, keyed by team_season id.
+
+        :return: The number of team_seasons updated.
+        """
+        if not simple_ratings:
+            return 0
+
+        sqla.session.execute(
+            update(TeamSeason),
+            [{'id': id, 'simple_rating': simple_rating} for id, simple_rating in simple_ratings.items()]
+        )
+        # Bulk statements bypass the session's change tracking.
+        data_versions.mark_changed(sqla.session, [season_year])
+        try_commit()
+        return len(simple_ratings)
+
     def _set_values_of_team_season_in_db(self, team_season: TeamSeason) -> TeamSeason:
         team_season_in_db = self.get_team_season(team_season.id)
         team_season_in_db.team_name = team_season.team_name
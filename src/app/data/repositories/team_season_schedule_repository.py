@@ -1,14 +1,23 @@
-from typing import List, Any
+import asyncio
+from typing import Any, List, Optional, Sequence, Tuple
 
-from sqlalchemy import Result
+from sqlalchemy import Result, TextClause
 from sqlalchemy.sql import text as SQLQuery
 
+from app.data.async_sqla import async_sqla
 from app.data.models.team_season_schedule_averages import TeamSeasonScheduleAverages
 from app.data.models.team_season_schedule_profile import TeamSeasonScheduleProfileRecord
 from app.data.models.team_season_schedule_totals import TeamSeasonScheduleTotals
+from app.data.session_routing import read_only
 from app.data.sqla import sqla
+from app.metrics import instrumented
 
+TeamSeasonSchedule = Tuple[
+    List[TeamSeasonScheduleProfileRecord], TeamSeasonScheduleTotals, TeamSeasonScheduleAverages
+]
 
+
+@instrumented
 class TeamSeasonScheduleRepository:
     """
     Provides CRUD access to a data store.
@@ -22,6 +31,7 @@ class TeamSeasonScheduleRepository:
         """
         pass
 
+    @read_only
     def get_team_season_schedule_profile(self, team_name: str, season_year: int) -> List[TeamSeasonScheduleProfileRecord]:
         """
         Gets the TeamSeasonScheduleTotals in the data store with the specified team_name and season_year.
@@ -31,26 +41,10 @@ class TeamSeasonScheduleRepository:
 
         :return: The fetched TeamSeasonScheduleTotals.
         """
-        result = self._call_procedure(f"EXEC sp_GetTeamSeasonScheduleProfile '{team_name}', {season_year};")
-        profile = result.all()
-
-        opponent_records = []
-        for row in profile:
-            opp = TeamSeasonScheduleProfileRecord(
-                opponent=row[0],
-                game_points_for=row[1],
-                game_points_against=row[2],
-                opponent_wins=row[3],
-                opponent_losses=row[4],
-                opponent_ties=row[5],
-                opponent_winning_percentage=row[6],
-                opponent_weighted_games=row[7],
-                opponent_weighted_points_for=row[8],
-                opponent_weighted_points_against=row[9]
-            )
-            opponent_records.append(opp)
-        return opponent_records
+        result = self._call_procedure(_get_profile_procedure(team_name, season_year))
+        return _get_profile(result.all())
 
+    @read_only
     def get_team_season_schedule_totals(self, team_name: str, season_year: int) -> TeamSeasonScheduleTotals:
         """
         Gets the TeamSeasonScheduleTotals in the data store with the specified team_name and season_year.
@@ -60,25 +54,10 @@ class TeamSeasonScheduleRepository:
 
         :return: The fetched TeamSeasonScheduleTotals.
         """
-        result = self._call_procedure(f"EXEC sp_GetTeamSeasonScheduleTotals '{team_name}', {season_year};")
-        totals = result.first()
-
-        if totals is None:
-            return TeamSeasonScheduleTotals()
-
-        return TeamSeasonScheduleTotals(
-            games=totals[0],
-            points_for=totals[1],
-            points_against=totals[2],
-            schedule_wins=totals[3],
-            schedule_losses=totals[4],
-            schedule_ties=totals[5],
-            schedule_winning_percentage=totals[6],
-            schedule_games=totals[7],
-            schedule_points_for=totals[8],
-            schedule_points_against=totals[9]
-        )
+        result = self._call_procedure(_get_totals_procedure(team_name, season_year))
+        return _get_totals(result.first())
 
+    @read_only
     def get_team_season_schedule_averages(self, team_name: str, season_year: int) -> TeamSeasonScheduleAverages:
         """
         Gets the TeamSeasonScheduleAverages in the data store with the specified team_name and season_year.
@@ -88,20 +67,105 @@ class TeamSeasonScheduleRepository:
 
         :return: The fetched TeamSeasonScheduleAverages.
         """
-        result = self._call_procedure(f"EXEC sp_GetTeamSeasonScheduleAverages '{team_name}', {season_year};")
-        averages = result.first()
+        result = self._call_procedure(_get_averages_procedure(team_name, season_year))
+        return _get_averages(result.first())
+
+    async def get_team_season_schedule(self, team_name: str, season_year: int) -> TeamSeasonSchedule:
+        """
+        Gets the schedule profile, totals and averages of a team season. In the async mode the three procedures run
+        concurrently, each on a connection of its own; otherwise they run one after another on the session.
 
-        if averages is None:
-            return TeamSeasonScheduleAverages()
+        :param team_name: The name of the team.
+        :param season_year: The year of the season.
 
-        return TeamSeasonScheduleAverages(
-            points_for=averages[0],
-            points_against=averages[1],
-            schedule_points_for=averages[2],
-            schedule_points_against=averages[3]
+        :return: The schedule profile, totals and averages.
+        """
+        if not async_sqla.is_enabled:
+            return (
+                self.get_team_season_schedule_profile(team_name, season_year),
+                self.get_team_season_schedule_totals(team_name, season_year),
+                self.get_team_season_schedule_averages(team_name, season_year),
+            )
+
+        profile, totals, averages = await asyncio.gather(
+            async_sqla.fetch_all(_get_profile_procedure(team_name, season_year)),
+            async_sqla.fetch_all(_get_totals_procedure(team_name, season_year)),
+            async_sqla.fetch_all(_get_averages_procedure(team_name, season_year)),
         )
+        return _get_profile(profile), _get_totals(_first(totals)), _get_averages(_first(averages))
 
-    def _call_procedure(self, querystring: str) -> Result[Any]:
-        sql = SQLQuery(querystring)
-        result = sqla.session.execute(sql)
+    def _call_procedure(self, procedure: TextClause) -> Result[Any]:
+        result = sqla.session.execute(procedure)
         return result
+
+
+# The team name and season year are sent as bound parameters, never spliced into the SQL text.
+def _get_profile_procedure(team_name: str, season_year: int) -> TextClause:
+    return SQLQuery("EXEC sp_GetTeamSeasonScheduleProfile :team_name, :season_year;").bindparams(
+        team_name=team_name, season_year=season_year
+    )
+
+
+def _get_totals_procedure(team_name: str, season_year: int) -> TextClause:
+    return SQLQuery("EXEC sp_GetTeamSeasonScheduleTotals :team_name, :season_year;").bindparams(
+        team_name=team_name, season_year=season_year
+    )
+
+
+def _get_averages_procedure(team_name: str, season_year: int) -> TextClause:
+    return SQLQuery("EXEC sp_GetTeamSeasonScheduleAverages :team_name, :season_year;").bindparams(
+        team_name=team_name, season_year=season_year
+    )
+
+
+def _first(rows: Sequence[Any]) -> Optional[Any]:
+    return rows[0] if rows else None
+
+
+def _get_profile(profile: Sequence[Any]) -> List[TeamSeasonScheduleProfileRecord]:
+    opponent_records = []
+    for row in profile:
+        opp = TeamSeasonScheduleProfileRecord(
+            opponent=row[0],
+            game_points_for=row[1],
+            game_points_against=row[2],
+            opponent_wins=row[3],
+            opponent_losses=row[4],
+            opponent_ties=row[5],
+            opponent_winning_percentage=row[6],
+            opponent_weighted_games=row[7],
+            opponent_weighted_points_for=row[8],
+            opponent_weighted_points_against=row[9]
+        )
+        opponent_records.append(opp)
+    return opponent_records
+
+
+def _get_totals(totals: Optional[Any]) -> TeamSeasonScheduleTotals:
+    if totals is None:
+        return TeamSeasonScheduleTotals()
+
+    return TeamSeasonScheduleTotals(
+        games=totals[0],
+        points_for=totals[1],
+        points_against=totals[2],
+        schedule_wins=totals[3],
+        schedule_losses=totals[4],
+        schedule_ties=totals[5],
+        schedule_winning_percentage=totals[6],
+        schedule_games=totals[7],
+        schedule_points_for=totals[8],
+        schedule_points_against=totals[9]
+    )
+
+
+def _get_averages(averages: Optional[Any]) -> TeamSeasonScheduleAverages:
+    if averages is None:
+        return TeamSeasonScheduleAverages()
+
+    return TeamSeasonScheduleAverages(
+        points_for=averages[0],
+        points_against=averages[1],
+        schedule_points_for=averages[2],
+        schedule_points_against=averages[3]
+    )
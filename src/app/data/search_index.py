@@ -0,0 +1,231 @@
+import threading
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+
+from app.data.session_routing import RoutingSession
+
+SEARCH_KINDS = ('team', 'season', 'league')
+
+_PENDING_CHANGES_KEY = 'search_index_changes'
+
+_NO_VERSION = (0,) * len(SEARCH_KINDS)
+
+
+class SearchResult(NamedTuple):
+    """
+    Class to represent one team, season or league found by a search.
+    """
+    kind: str
+    id: int
+    label: str
+    value: str
+
+
+class SearchIndex:
+    """
+    Holds a prefix index over the names of the teams, seasons and leagues of this process, for typeahead searches.
+
+    Every word of each name, and the whole name, is a search term. The terms are kept in one sorted list, so a
+    search is a binary search for the first term with the prefix followed by a short scan. The index is built once
+    from the data store and then kept current from each committed change to a Team, Season or League row: only the
+    changed rows' terms are added or removed. Changes made with bulk SQL statements, which bypass the ORM session,
+    are not seen; call clear() after them so that the index is built again.
+
+    The index also holds the data versions of the teams, seasons and leagues that it is current to, so that its owner
+    can tell when another process has changed them and the index must be built again.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the SearchIndex class.
+        """
+        self._lock = threading.Lock()
+        self._terms: List[Tuple[str, str, int]] = []
+        self._results: Dict[Tuple[str, int], Tuple[SearchResult, Tuple[str, ...]]] = {}
+        self._is_built = False
+        self._version = _NO_VERSION
+
+    def __repr__(self):
+        return f"{type(self).__name__}(entries={len(self._results)}, terms={len(self._terms)})"
+
+    @property
+    def is_built(self) -> bool:
+        """
+        Gets whether the index has been built.
+        """
+        return self._is_built
+
+    @property
+    def version(self) -> Tuple[int, ...]:
+        """
+        Gets the data versions of the SEARCH_KINDS, in order, that the index is current to.
+        """
+        return self._version
+
+    def build(self, results: Iterable[SearchResult], version: Tuple[int, ...] = _NO_VERSION) -> None:
+        """
+        Replaces the contents of the index.
+
+        :param results: Every team, season and league to index.
+        :param version: The data versions of the SEARCH_KINDS, in order, at which the results were read.
+
+        :return: None
+        """
+        entries = {(result.kind, result.id): (result, _get_terms(result.label)) for result in results}
+        terms = sorted((term, kind, id) for (kind, id), (_, result_terms) in entries.items() for term in result_terms)
+        with self._lock:
+            self._results = entries
+            self._terms = terms
+            self._is_built = True
+            self._version = version
+
+    def mark_current(self, version: Tuple[int, ...]) -> None:
+        """
+        Records that the index is current to later data versions, because every change up to them has been applied to
+        the index.
+
+        :param version: The data versions of the SEARCH_KINDS, in order.
+
+        :return: None
+        """
+        with self._lock:
+            if self._is_built and all(new >= old for new, old in zip(version, self._version)):
+                self._version = tuple(version)
+
+    def clear(self) -> None:
+        """
+        Empties the index, so that it is built again on its next use.
+
+        :return: None
+        """
+        with self._lock:
+            self._results = {}
+            self._terms = []
+            self._is_built = False
+            self._version = _NO_VERSION
+
+    def apply(self, changes: Iterable[Tuple[str, int, Optional[SearchResult]]]) -> None:
+        """
+        Applies committed changes to the index, if it has been built. The changed terms are applied to a copy of
+        the term list, which then replaces the original, so searches never see a half-applied change.
+
+        :param changes: The changes, as (kind, id, result) tuples. The result is None when the row was deleted.
+
+        :return: None
+        """
+        with self._lock:
+            if not self._is_built:
+                return
+
+            results, terms = dict(self._results), list(self._terms)
+            for kind, id, result in changes:
+                _remove(results, terms, (kind, id))
+                if result is not None:
+                    result_terms = _get_terms(result.label)
+                    results[kind, id] = (result, result_terms)
+                    for term in result_terms:
+                        insort(terms, (term, kind, id))
+            self._results, self._terms = results, terms
+
+    def search(self, text: str, kinds: Optional[Sequence[str]] = None, limit: int = 10) -> List[SearchResult]:
+        """
+        Finds the teams, seasons and leagues with a name, or a word of a name, that starts with some text.
+
+        :param text: The text to search for. Case is ignored.
+        :param kinds: The kinds of result to find, from SEARCH_KINDS, or None for every kind.
+        :param limit: The greatest number of results to return.
+
+        :return: The results, in the order of their matching terms.
+        """
+        prefix = _normalize(text)
+        if not prefix or limit <= 0:
+            return []
+
+        results, seen = [], set()
+        terms, entries = self._terms, self._results
+        index = bisect_left(terms, (prefix,))
+        while index < len(terms) and len(results) < limit:
+            term, kind, id = terms[index]
+            if not term.startswith(prefix):
+                break
+            index += 1
+            if (kinds is None or kind in kinds) and (kind, id) not in seen:
+                entry = entries.get((kind, id))
+                if entry is not None:
+                    seen.add((kind, id))
+                    results.append(entry[0])
+        return results
+
+
+search_index = SearchIndex()
+
+
+def get_search_result(instance: Any) -> Optional[SearchResult]:
+    """
+    Gets the search result for a Team, Season or League.
+
+    :param instance: The model instance.
+
+    :return: The result, or None if the instance is not of an indexed model.
+    """
+    from app.data.models.league import League
+    from app.data.models.season import Season
+    from app.data.models.team import Team
+
+    if isinstance(instance, Team):
+        return SearchResult('team', instance.id, instance.name, instance.name)
+    if isinstance(instance, Season):
+        return SearchResult('season', instance.id, str(instance.year), str(instance.year))
+    if isinstance(instance, League):
+        return SearchResult('league', instance.id, f"{instance.short_name} {instance.long_name}", instance.short_name)
+    return None
+
+
+def _remove(
+        results: Dict[Tuple[str, int], Tuple[SearchResult, Tuple[str, ...]]],
+        terms: List[Tuple[str, str, int]],
+        key: Tuple[str, int]
+) -> None:
+    entry = results.pop(key, None)
+    if entry is None:
+        return
+    for term in entry[1]:
+        index = bisect_left(terms, (term, *key))
+        if index < len(terms) and terms[index] == (term, *key):
+            del terms[index]
+
+
+def _get_terms(label: str) -> Tuple[str, ...]:
+    name = _normalize(label)
+    return tuple(sorted({name, *name.split()}))
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.casefold().split())
+
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _collect_search_changes(session: RoutingSession, flush_context: Any) -> None:
+    changes = session.info.setdefault(_PENDING_CHANGES_KEY, [])
+    for instance in list(session.new) + list(session.dirty):
+        result = get_search_result(instance)
+        if result is not None:
+            changes.append((result.kind, result.id, result))
+    for instance in session.deleted:
+        result = get_search_result(instance)
+        if result is not None:
+            changes.append((result.kind, result.id, None))
+
+
+@event.listens_for(RoutingSession, 'after_commit')
+def _apply_search_changes(session: RoutingSession) -> None:
+    changes = session.info.pop(_PENDING_CHANGES_KEY, None)
+    if changes:
+        search_index.apply(changes)
+
+
+@event.listens_for(RoutingSession, 'after_soft_rollback')
+def _discard_search_changes(session: RoutingSession, previous_transaction: Any) -> None:
+    session.info.pop(_PENDING_CHANGES_KEY, None)
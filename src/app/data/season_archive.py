@@ -0,0 +1,202 @@
+import mmap
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Dict, List, Tuple
+
+from app.data.models.season_snapshot import (GAME_COLUMN_TYPECODES, NULL_INDEX, NULL_NUMERIC,
+                                             TEAM_SEASON_COLUMN_TYPECODES, SeasonSnapshot)
+
+# The layout of a season archive, all little-endian:
+#   header      magic, format version, season year, team season count, game count, team name count, name count,
+#               column count and the offset of the first column, padded to HEADER.size bytes
+#   strings     the byte length of the string table, then the team names followed by the league, conference and
+#               division names and the game notes, UTF-8 encoded and separated by NUL bytes
+#   directory   one entry per column: table (b'T' or b'G'), array typecode, name length, name, offset, value count
+#   columns     the raw values of each column, each starting on an 8-byte boundary
+MAGIC = b'PFSA'
+FORMAT_VERSION = 2
+# The columns that each format version added, which are read as NULLs from archives of earlier versions.
+ADDED_COLUMNS: Dict[int, Tuple[Tuple[bytes, str], ...]] = {
+    2: ((b'T', 'simple_rating'), (b'T', 'elo_rating'), (b'G', 'notes'), (b'G', 'elo_delta')),
+}
+HEADER = struct.Struct('<4sHhIIIIHQ')
+STRING_TABLE_LENGTH = struct.Struct('<I')
+DIRECTORY_ENTRY = struct.Struct('<ccB')
+COLUMN_LOCATION = struct.Struct('<QI')
+ALIGNMENT = 8
+
+TEAM_SEASON_TABLE = b'T'
+GAME_TABLE = b'G'
+
+
+class SeasonArchiveError(ValueError):
+    """
+    Raised when a file is not a valid season archive.
+    """
+    pass
+
+
+def write_season_archive(snapshot: SeasonSnapshot, file: BinaryIO) -> int:
+    """
+    Writes a season snapshot to a binary file as a season archive.
+
+    :param snapshot: The snapshot to write.
+    :param file: The binary file to which the archive will be written.
+
+    :return: The number of bytes written.
+    """
+    columns = [
+        (TEAM_SEASON_TABLE, name, typecode, snapshot.get_team_season_column(name))
+        for name, typecode in TEAM_SEASON_COLUMN_TYPECODES.items()
+    ] + [
+        (GAME_TABLE, name, typecode, snapshot.get_game_column(name))
+        for name, typecode in GAME_COLUMN_TYPECODES.items()
+    ]
+
+    strings = '\0'.join(snapshot.team_names + snapshot.names).encode('utf-8')
+    directory_length = sum(
+        DIRECTORY_ENTRY.size + len(name.encode('ascii')) + COLUMN_LOCATION.size for _, name, _, _ in columns
+    )
+    offset = _align(HEADER.size + STRING_TABLE_LENGTH.size + len(strings) + directory_length)
+    data_offset = offset
+
+    directory = bytearray()
+    blobs = []
+    for table, name, typecode, column in columns:
+        blob = _to_little_endian(column, typecode)
+        encoded_name = name.encode('ascii')
+        directory += DIRECTORY_ENTRY.pack(table, typecode.encode('ascii'), len(encoded_name))
+        directory += encoded_name
+        directory += COLUMN_LOCATION.pack(offset, len(column))
+        blobs.append((offset, blob))
+        offset = _align(offset + len(blob))
+
+    file.write(HEADER.pack(
+        MAGIC, FORMAT_VERSION, snapshot.season_year, snapshot.team_season_count, snapshot.game_count,
+        len(snapshot.team_names), len(snapshot.names), len(columns), data_offset
+    ))
+    file.write(STRING_TABLE_LENGTH.pack(len(strings)))
+    file.write(strings)
+    file.write(directory)
+    position = HEADER.size + STRING_TABLE_LENGTH.size + len(strings) + len(directory)
+    for blob_offset, blob in blobs:
+        file.write(b'\0' * (blob_offset - position))
+        file.write(blob)
+        position = blob_offset + len(blob)
+    return position
+
+
+def read_season_archive(path: str, version: int = 0) -> SeasonSnapshot:
+    """
+    Reads a season archive into a season snapshot.
+
+    The file is memory-mapped, and on little-endian machines the snapshot's columns are views of the mapped file,
+    so no column is copied or parsed.
+
+    :param path: The path of the archive.
+    :param version: The data version to give the snapshot.
+
+    :return: The snapshot of the archived season.
+
+    :raises SeasonArchiveError: If the file is not a valid season archive.
+    """
+    with open(path, 'rb') as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise SeasonArchiveError(f"{path} is empty.")
+
+    buffer = memoryview(mapped)
+    if len(buffer) < HEADER.size:
+        raise SeasonArchiveError(f"{path} is too short to be a season archive.")
+
+    (magic, format_version, season_year, team_season_count, game_count, team_name_count, name_count, column_count,
+     _) = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise SeasonArchiveError(f"{path} is not a season archive.")
+    if not 1 <= format_version <= FORMAT_VERSION:
+        raise SeasonArchiveError(f"{path} has unsupported format version {format_version}.")
+
+    position = HEADER.size
+    try:
+        team_names, names, position = _read_strings(buffer, position, team_name_count, name_count)
+        team_season_columns: Dict[str, memoryview] = {}
+        game_columns: Dict[str, memoryview] = {}
+        for _ in range(column_count):
+            table, name, column, position = _read_column(buffer, position)
+            (team_season_columns if table == TEAM_SEASON_TABLE else game_columns)[name] = column
+    except (struct.error, ValueError, TypeError) as err:
+        raise SeasonArchiveError(f"{path} is corrupt: {err}")
+
+    for added_in in range(format_version + 1, FORMAT_VERSION + 1):
+        for table, name in ADDED_COLUMNS[added_in]:
+            if table == TEAM_SEASON_TABLE:
+                team_season_columns[name] = _null_column(TEAM_SEASON_COLUMN_TYPECODES[name], team_season_count)
+            else:
+                game_columns[name] = _null_column(GAME_COLUMN_TYPECODES[name], game_count)
+
+    _check_columns(path, team_season_columns, TEAM_SEASON_COLUMN_TYPECODES, team_season_count)
+    _check_columns(path, game_columns, GAME_COLUMN_TYPECODES, game_count)
+    return SeasonSnapshot(season_year, version, team_names, names, team_season_columns, game_columns)
+
+
+def _read_strings(
+        buffer: memoryview, position: int, team_name_count: int, name_count: int
+) -> Tuple[List[str], List[str], int]:
+    (length,) = STRING_TABLE_LENGTH.unpack_from(buffer, position)
+    position += STRING_TABLE_LENGTH.size
+    text = bytes(buffer[position:position + length]).decode('utf-8')
+    strings = text.split('\0') if text else []
+    if len(strings) != team_name_count + name_count:
+        raise SeasonArchiveError("The string table does not hold the expected number of names.")
+
+    return strings[:team_name_count], strings[team_name_count:], position + length
+
+
+def _read_column(buffer: memoryview, position: int) -> Tuple[bytes, str, memoryview, int]:
+    table, typecode, name_length = DIRECTORY_ENTRY.unpack_from(buffer, position)
+    position += DIRECTORY_ENTRY.size
+    name = bytes(buffer[position:position + name_length]).decode('ascii')
+    position += name_length
+    offset, count = COLUMN_LOCATION.unpack_from(buffer, position)
+    position += COLUMN_LOCATION.size
+
+    typecode = typecode.decode('ascii')
+    length = count * array(typecode).itemsize
+    if offset + length > len(buffer):
+        raise SeasonArchiveError(f"Column {name} extends past the end of the archive.")
+
+    column = buffer[offset:offset + length].cast(typecode)
+    if sys.byteorder != 'little':
+        swapped = array(typecode, column)
+        swapped.byteswap()
+        column = memoryview(swapped)
+    return table, name, column, position
+
+
+def _check_columns(path: str, columns: Dict[str, memoryview], typecodes: Dict[str, str], count: int) -> None:
+    for name, typecode in typecodes.items():
+        column = columns.get(name)
+        if column is None:
+            raise SeasonArchiveError(f"{path} has no {name} column.")
+        if column.format != typecode or len(column) != count:
+            raise SeasonArchiveError(f"{path} has an invalid {name} column.")
+
+
+def _null_column(typecode: str, count: int) -> memoryview:
+    # Name columns hold indices and numeric columns hold scaled integers; each has its own NULL.
+    return memoryview(array(typecode, [NULL_INDEX if typecode == 'h' else NULL_NUMERIC]) * count)
+
+
+def _to_little_endian(column: memoryview, typecode: str) -> bytes:
+    if sys.byteorder == 'little':
+        return column.tobytes()
+
+    values = array(typecode, column)
+    values.byteswap()
+    return values.tobytes()
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
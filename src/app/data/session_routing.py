@@ -0,0 +1,136 @@
+import functools
+import sqlite3
+import time
+from contextlib import closing, contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+import sqlalchemy as sa
+from flask import current_app, g, has_app_context, has_request_context, session as user_session
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+
+READ_BIND_KEY = 'read'
+LAST_WRITE_AT_KEY = '_last_write_at'
+
+_read_only = ContextVar('read_only', default=False)
+_primary_only = ContextVar('primary_only', default=False)
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+def read_only(func: F) -> F:
+    """
+    Marks a repository method as read-only, so that its queries may be sent to the read engine.
+
+    The read engine is configured under the 'read' key of SQLALCHEMY_BINDS. When it is not configured, or when the
+    queries must see the latest writes, they are sent to the primary engine as usual.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        token = _read_only.set(True)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _read_only.reset(token)
+
+    return wrapper
+
+
+@contextmanager
+def use_primary() -> Iterator[None]:
+    """
+    Sends every query made within the block to the primary engine, including those of read-only repository methods.
+
+    Services that read rows in order to change them use this so that they never change a stale copy of a row.
+    """
+    token = _primary_only.set(True)
+    try:
+        yield
+    finally:
+        _primary_only.reset(token)
+
+
+class RoutingSession(Session):
+    """
+    A Flask-SQLAlchemy session that sends the queries of read-only repository methods to the read engine and
+    everything else to the primary engine.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self._routes_to_read_engine(clause):
+            return self._db.engines[READ_BIND_KEY]
+
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _routes_to_read_engine(self, clause: Optional[sa.ClauseElement]) -> bool:
+        if not _read_only.get() or _primary_only.get():
+            return False
+        if isinstance(clause, sa.UpdateBase) or self._flushing or self.new or self.dirty or self.deleted:
+            return False
+        if not has_app_context() or READ_BIND_KEY not in self._db.engines:
+            return False
+
+        return not reads_pinned_to_primary()
+
+
+def reads_pinned_to_primary() -> bool:
+    """
+    Checks whether the reads of the current request must be sent to the primary engine: a user who has just written
+    sees the primary until the read engine has caught up.
+
+    :return: True if the reads must be sent to the primary engine; otherwise false.
+    """
+    if not has_request_context():
+        return False
+    if g.get('wrote_to_primary', False):
+        return True
+
+    window = current_app.config.get('SQLALCHEMY_READ_YOUR_WRITES_SECONDS', 0)
+    last_write_at = user_session.get(LAST_WRITE_AT_KEY)
+    return bool(window) and last_write_at is not None and time.time() - last_write_at < window
+
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _record_write(session: RoutingSession, flush_context: Any) -> None:
+    session.info['wrote'] = True
+
+
+@event.listens_for(RoutingSession, 'after_soft_rollback')
+def _forget_write(session: RoutingSession, previous_transaction: Any) -> None:
+    session.info.pop('wrote', None)
+
+
+@event.listens_for(RoutingSession, 'after_commit')
+def _after_write_committed(session: RoutingSession) -> None:
+    if not session.info.pop('wrote', False) or not has_app_context():
+        return
+
+    if has_request_context():
+        g.wrote_to_primary = True
+        if current_app.config.get('SQLALCHEMY_READ_YOUR_WRITES_SECONDS', 0):
+            user_session[LAST_WRITE_AT_KEY] = time.time()
+
+    if current_app.config.get('SQLALCHEMY_SYNC_SQLITE_READ_REPLICA', False):
+        sync_sqlite_read_replica(session._db.engines)
+
+
+def sync_sqlite_read_replica(engines: dict) -> None:
+    """
+    Copies the primary SQLite database over the read replica SQLite database.
+
+    This keeps a local two-file setup consistent without a real replication mechanism.
+
+    :param engines: The engines of the Flask-SQLAlchemy extension, keyed by bind key.
+
+    :return: None
+    """
+    primary_path = engines[None].url.database
+    replica_path = engines[READ_BIND_KEY].url.database
+    if not primary_path or not replica_path:
+        raise ValueError("Both the primary and the read database must be SQLite files.")
+
+    # Pooled read connections would keep serving their old snapshot of the replica.
+    engines[READ_BIND_KEY].dispose()
+    with closing(sqlite3.connect(primary_path)) as source, closing(sqlite3.connect(replica_path)) as target:
+        source.backup(target)
@@ -1,7 +1,16 @@
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy.exc import IntegrityError
 
-sqla = SQLAlchemy()
+from app.data import data_versions  # Registers the listeners that version the committed season data.
+from app.data import procedure_metrics  # Registers the listeners that time the stored procedure calls.
+from app.data import reference_data  # Registers the listeners that invalidate the cached reference data.
+from app.data import search_index  # Registers the listeners that keep the search index current.
+from app.data.session_routing import RoutingSession
+
+sqla = SQLAlchemy(session_options={'class_': RoutingSession})
+
+# The number of rows that the streaming repository methods fetch from the cursor at a time.
+STREAM_BATCH_SIZE = 1000
 
 
 def try_commit() -> None:
@@ -0,0 +1,181 @@
+import asyncio
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Sequence, Tuple
+
+import click
+from flask import Flask, current_app
+from flask.cli import with_appcontext
+
+from app import injector
+from app.data.async_sqla import async_sqla
+from app.data.repositories.game_repository import GameRepository
+from app.data.repositories.team_repository import TeamRepository
+from app.data.repositories.team_season_repository import TeamSeasonRepository
+from app.data.repositories.team_season_schedule_repository import TeamSeasonScheduleRepository
+from app.data.sqla import sqla
+
+
+@click.command('benchmark-list-views')
+@click.option('--season', '-s', 'season_year', required=True, type=int, help="The season whose lists are fetched.")
+@click.option('--repeat', '-r', default=20, show_default=True, type=click.IntRange(min=1),
+              help="The number of times each list is fetched.")
+@with_appcontext
+def benchmark_list_views_command(season_year: int, repeat: int) -> None:
+    """
+    Compares the latency and memory of the index page lists fetched as ORM objects and as projected rows.
+    """
+    game_repository = injector.get(GameRepository)
+    team_repository = injector.get(TeamRepository)
+    team_season_repository = injector.get(TeamSeasonRepository)
+
+    cases = [
+        ('games (ORM)', lambda: game_repository.get_games_by_season_year(season_year)),
+        ('games (rows)', lambda: game_repository.get_game_rows_by_season_year(season_year)),
+        ('teams (ORM)', team_repository.get_teams),
+        ('teams (rows)', team_repository.get_team_rows),
+        ('team seasons (ORM)', lambda: team_season_repository.get_team_seasons_by_season_year(season_year)),
+        ('team seasons (rows)', lambda: team_season_repository.get_team_season_rows_by_season_year(season_year)),
+    ]
+    results = [(name,) + measure(fetch, repeat) for name, fetch in cases]
+    click.echo(format_measurements(results))
+
+
+def measure(fetch: Callable[[], List[Any]], repeat: int) -> Tuple[int, float, int]:
+    """
+    Measures a list fetch from a fresh session, as a request would make it.
+
+    :param fetch: The callable that fetches the list.
+    :param repeat: The number of times to fetch the list.
+
+    :return: The number of items fetched, the mean time in milliseconds, and the peak memory in bytes allocated
+    while the list was fetched, which is traced in a separate fetch so that tracing does not skew the times.
+    """
+    durations = []
+    for _ in range(repeat):
+        sqla.session.remove()
+        start = time.perf_counter()
+        fetch()
+        durations.append(time.perf_counter() - start)
+
+    sqla.session.remove()
+    tracemalloc.start()
+    try:
+        items = fetch()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    sqla.session.remove()
+    return len(items), 1000 * sum(durations) / len(durations), peak
+
+
+def format_measurements(results: List[Tuple[str, int, float, int]]) -> str:
+    """
+    Formats list fetch measurements into a plain text table.
+
+    :param results: The name, item count, mean milliseconds, and peak bytes of each measured fetch.
+
+    :return: The table.
+    """
+    headers = ('List', 'Items', 'Mean (ms)', 'Peak memory (KiB)')
+    rows = [(name, str(count), f"{mean:.3f}", f"{peak / 1024:.1f}") for name, count, mean, peak in results]
+    return _format_table(headers, rows)
+
+
+@click.command('benchmark-read-views')
+@click.option('--team', '-t', 'team_name', required=True, help="The team whose season schedule is fetched.")
+@click.option('--season', '-s', 'season_year', required=True, type=int, help="The season of the team season.")
+@click.option('--clients', '-c', default=8, show_default=True, type=click.IntRange(min=1),
+              help="The number of clients fetching at the same time.")
+@click.option('--requests', '-n', 'request_count', default=50, show_default=True, type=click.IntRange(min=1),
+              help="The number of fetches made by all the clients together.")
+@with_appcontext
+def benchmark_read_views_command(team_name: str, season_year: int, clients: int, request_count: int) -> None:
+    """
+    Compares the throughput of the team season details page's schedule queries run one after another on the
+    synchronous session and concurrently on the async engine, under concurrent clients. Each mode starts without
+    pooled connections, so that the time to open its connections is counted.
+    """
+    if not async_sqla.is_enabled:
+        raise click.ClickException("Configure SQLALCHEMY_ASYNC_DATABASE_URI to benchmark the async engine.")
+
+    repository = injector.get(TeamSeasonScheduleRepository)
+
+    def fetch_sync() -> None:
+        repository.get_team_season_schedule_profile(team_name, season_year)
+        repository.get_team_season_schedule_totals(team_name, season_year)
+        repository.get_team_season_schedule_averages(team_name, season_year)
+
+    def fetch_async() -> None:
+        # Each request of an async view runs in an event loop of its own.
+        asyncio.run(repository.get_team_season_schedule(team_name, season_year))
+
+    app = current_app._get_current_object()
+    results = []
+    for name, fetch in (('sync', fetch_sync), ('async', fetch_async)):
+        dispose_pools()
+        results.append((name,) + measure_throughput(app, fetch, clients, request_count))
+    click.echo(format_throughput(results))
+
+
+def dispose_pools() -> None:
+    """
+    Closes the pooled connections of the current app's synchronous and async engines.
+
+    :return: None
+    """
+    for engine in sqla.engines.values():
+        engine.dispose()
+    async_sqla.dispose()
+
+
+def measure_throughput(
+        app: Flask, fetch: Callable[[], Any], clients: int, request_count: int
+) -> Tuple[int, float, float]:
+    """
+    Measures the throughput of a fetch made by concurrent clients, each fetch in an app context and session of its
+    own, as a request would make it.
+
+    :param app: The app in whose context the fetches are made.
+    :param fetch: The callable that makes one fetch.
+    :param clients: The number of clients fetching at the same time.
+    :param request_count: The number of fetches made by all the clients together.
+
+    :return: The number of fetches, the fetches per second, and the mean time of a fetch in milliseconds.
+    """
+    def timed_fetch(_: int) -> float:
+        with app.app_context():
+            start = time.perf_counter()
+            try:
+                fetch()
+            finally:
+                sqla.session.remove()
+            return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as executor:
+        durations = list(executor.map(timed_fetch, range(request_count)))
+    elapsed = time.perf_counter() - start
+    return request_count, request_count / elapsed, 1000 * sum(durations) / len(durations)
+
+
+def format_throughput(results: List[Tuple[str, int, float, float]]) -> str:
+    """
+    Formats throughput measurements into a plain text table.
+
+    :param results: The name, fetch count, fetches per second, and mean milliseconds of each measured mode.
+
+    :return: The table.
+    """
+    headers = ('Mode', 'Requests', 'Requests/s', 'Mean (ms)')
+    rows = [(name, str(count), f"{rate:.1f}", f"{mean:.3f}") for name, count, rate, mean in results]
+    return _format_table(headers, rows)
+
+
+def _format_table(headers: Sequence[str], rows: List[Sequence[str]]) -> str:
+    widths = [max(len(row[i]) for row in [headers] + rows) for i in range(len(headers))]
+    return '\n'.join(
+        '  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+        for row in [headers, tuple('-' * width for width in widths)] + rows
+    )
@@ -0,0 +1,27 @@
+import click
+from flask.cli import with_appcontext
+
+from app import injector
+from app.flask.commands.weekly_update_commands import parse_season_years
+from app.services.elo_rating_service.elo_rating_service import EloRatingService
+
+
+@click.command('replay-elo')
+@click.option(
+    '--seasons', '-s', 'seasons', required=True,
+    help="Seasons to replay, as years and ranges separated by commas, e.g. '1970-1979,1985'."
+)
+@with_appcontext
+def replay_elo_command(seasons: str) -> None:
+    """
+    Rebuilds the Elo ratings of many seasons from their games in week order.
+    """
+    try:
+        season_years = parse_season_years(seasons)
+    except ValueError as err:
+        raise click.BadParameter(str(err), param_hint="'--seasons'")
+
+    elo_rating_service = injector.get(EloRatingService)
+    for season_year in season_years:
+        game_count = elo_rating_service.replay_season(season_year)
+        click.echo(f"{season_year}: replayed {game_count} games.")
@@ -0,0 +1,36 @@
+from typing import BinaryIO, Optional
+
+import click
+from flask.cli import with_appcontext
+
+from app import injector
+from app.services.export_service.export_service import EXPORT_FORMATS, EXPORT_KINDS, ExportService
+
+
+@click.command('export-data')
+@click.argument('kind', type=click.Choice(EXPORT_KINDS))
+@click.argument('output', type=click.File('wb'))
+@click.option('--format', 'export_format', type=click.Choice(tuple(EXPORT_FORMATS)), default='csv',
+              show_default=True, help="The format to write.")
+@click.option('--first-season', type=int, help="The first season to export. Defaults to the first season.")
+@click.option('--last-season', type=int, help="The last season to export. Defaults to the last season.")
+@click.option('--gzip', 'compress', is_flag=True, help="Compress the output with gzip.")
+@with_appcontext
+def export_data_command(
+        kind: str,
+        output: BinaryIO,
+        export_format: str,
+        first_season: Optional[int],
+        last_season: Optional[int],
+        compress: bool
+) -> None:
+    """
+    Exports games, team seasons, standings or rankings over a range of seasons to OUTPUT, or to stdout if OUTPUT is
+    '-'. The rows are streamed, so the whole history can be exported in constant memory.
+    """
+    size = 0
+    for chunk in injector.get(ExportService).export(kind, export_format, first_season, last_season, compress):
+        output.write(chunk)
+        size += len(chunk)
+    if output.name != '<stdout>':
+        click.echo(f"Exported {kind} to {output.name} in {size} bytes.")
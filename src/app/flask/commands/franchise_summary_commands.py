@@ -0,0 +1,15 @@
+import click
+from flask.cli import with_appcontext
+
+from app import injector
+from app.services.franchise_summary_service.franchise_summary_service import FranchiseSummaryService
+
+
+@click.command('rebuild-franchise-summaries')
+@with_appcontext
+def rebuild_franchise_summaries_command() -> None:
+    """
+    Rebuilds the all-time summary of every team from its games and team seasons.
+    """
+    summary_count = injector.get(FranchiseSummaryService).rebuild_franchise_summaries()
+    click.echo(f"Rebuilt {summary_count} franchise summaries.")
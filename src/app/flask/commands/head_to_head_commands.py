@@ -0,0 +1,15 @@
+import click
+from flask.cli import with_appcontext
+
+from app import injector
+from app.services.head_to_head_service.head_to_head_service import HeadToHeadService
+
+
+@click.command('rebuild-head-to-head-summaries')
+@with_appcontext
+def rebuild_head_to_head_summaries_command() -> None:
+    """
+    Rebuilds the all-time series summary of every pair of teams from their games.
+    """
+    summary_count = injector.get(HeadToHeadService).rebuild_head_to_head_summaries()
+    click.echo(f"Rebuilt {summary_count} head-to-head summaries.")
@@ -0,0 +1,70 @@
+from typing import Optional
+
+import click
+from flask.cli import with_appcontext
+
+from app import injector
+from app.data.models.team_season import TeamSeason
+from app.data.repositories.season_repository import SeasonRepository
+from app.flask.commands.weekly_update_commands import parse_season_years
+from app.services.weekly_update_service.numeric_mode_comparison import NumericModeComparison
+from app.services.weekly_update_service.weekly_update_service import WeeklyUpdateService
+
+
+@click.command('verify-numeric-mode')
+@click.option(
+    '--seasons', '-s', 'seasons',
+    help="Seasons to compare, as years and ranges separated by commas, e.g. '1970-1979,1985'. "
+         "Every season in the data store is compared when omitted."
+)
+@with_appcontext
+def verify_numeric_mode_command(seasons: Optional[str]) -> None:
+    """
+    Calculates rankings in both the Decimal and float numeric modes, without saving them, and reports the largest
+    divergence in each ranking column once values are rounded to the column's scale.
+    """
+    if seasons:
+        try:
+            season_years = parse_season_years(seasons)
+        except ValueError as err:
+            raise click.BadParameter(str(err), param_hint="'--seasons'")
+    else:
+        season_years = sorted(season.year for season in injector.get(SeasonRepository).get_seasons())
+
+    comparison = injector.get(WeeklyUpdateService).compare_numeric_modes(season_years)
+    click.echo(format_numeric_mode_comparison(comparison))
+
+
+def format_numeric_mode_comparison(comparison: NumericModeComparison) -> str:
+    """
+    Formats a numeric mode comparison into a plain text table with one row per ranking column.
+
+    :param comparison: The comparison to format.
+
+    :return: The table, followed by the number of team seasons compared and the largest divergence of any column.
+    """
+    headers = ('Column', 'Scale', 'Compared', 'Max Divergence', 'Team Season')
+    rows = [
+        (
+            column.column,
+            str(TeamSeason.__table__.c[column.column].type.scale),
+            str(column.values_compared),
+            f"{float(column.max_divergence):.3E}",
+            '' if column.team_name is None else f"{column.team_name} {column.season_year}"
+        )
+        for column in comparison.columns.values()
+    ]
+
+    widths = [max(len(row[i]) for row in [headers] + rows) for i in range(len(headers))]
+    lines = [
+        '  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+        for row in [headers, tuple('-' * width for width in widths)] + rows
+    ]
+    lines.append(
+        f"Compared {comparison.team_seasons_compared} team seasons; "
+        f"largest divergence {float(comparison.max_divergence):.3E}."
+    )
+    null_mismatches = sum(column.null_mismatches for column in comparison.columns.values())
+    if null_mismatches:
+        lines.append(f"{null_mismatches} values were empty in one mode only.")
+    return '\n'.join(lines)
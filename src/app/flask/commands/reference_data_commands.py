@@ -0,0 +1,95 @@
+import csv
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+import click
+from flask.cli import with_appcontext
+
+from app import injector
+from app.data.factories.batch_validation import BatchValidationError
+from app.data.factories.conference_factory import create_conferences
+from app.data.factories.division_factory import create_divisions
+from app.data.factories.league_factory import create_leagues
+from app.data.factories.season_factory import create_seasons
+from app.data.factories.team_factory import create_teams
+from app.data.models.conference import Conference
+from app.data.models.division import Division
+from app.data.models.league import League
+from app.data.models.season import Season
+from app.data.models.team import Team
+from app.data.repositories.conference_repository import ConferenceRepository
+from app.data.repositories.division_repository import DivisionRepository
+from app.data.repositories.league_repository import LeagueRepository
+from app.data.repositories.season_repository import SeasonRepository
+from app.data.repositories.team_repository import TeamRepository
+
+# Each kind maps to its model, its batch factory, and the repository whose add_<kind> method adds the created entities.
+REFERENCE_DATA_KINDS: Dict[str, Tuple[Any, Callable[[List[Dict[str, Any]]], List[Any]], Type]] = {
+    'seasons': (Season, create_seasons, SeasonRepository),
+    'leagues': (League, create_leagues, LeagueRepository),
+    'conferences': (Conference, create_conferences, ConferenceRepository),
+    'divisions': (Division, create_divisions, DivisionRepository),
+    'teams': (Team, create_teams, TeamRepository),
+}
+
+
+@click.command('import-reference-data')
+@click.argument('kind', type=click.Choice(tuple(REFERENCE_DATA_KINDS)))
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@with_appcontext
+def import_reference_data_command(kind: str, path: str) -> None:
+    """
+    Imports seasons, leagues, conferences, divisions or teams from a CSV file whose columns are those of the kind.
+    The whole file is validated together, and nothing is imported unless every row is valid.
+    """
+    model, create_entities, repository = REFERENCE_DATA_KINDS[kind]
+    with open(path, newline='') as file:
+        try:
+            kwargs_list = read_reference_data(model, csv.DictReader(file))
+        except ValueError as err:
+            raise click.ClickException(str(err))
+
+    try:
+        entities = create_entities(kwargs_list)
+    except BatchValidationError as err:
+        # The items are numbered from the first row after the header.
+        raise click.ClickException('\n'.join(err.errors))
+
+    getattr(injector.get(repository), f"add_{kind}")(entities)
+    click.echo(f"Imported {len(entities)} {kind} from {path}.")
+
+
+def read_reference_data(model: Any, reader: csv.DictReader) -> List[Dict[str, Any]]:
+    """
+    Reads the keyword arguments of the entities to create from the rows of a reference data CSV file.
+
+    :param model: The model class of the entities.
+    :param reader: The reader of the file.
+
+    :return: The keyword arguments of each row. Empty cells are left out, and the values of integer columns are
+    converted to integers.
+
+    :raises ValueError: If a column is not one of the model's, or a row has a bad value.
+    """
+    columns = model.__table__.columns
+    unknown_columns = [name for name in (reader.fieldnames or ()) if name == 'id' or name not in columns]
+    if unknown_columns:
+        raise ValueError(f"The file has unknown columns: {', '.join(unknown_columns)}.")
+
+    kwargs_list = []
+    for line_number, row in enumerate(reader, start=2):
+        if None in row:
+            raise ValueError(f"Line {line_number}: the row has more cells than the file has columns.")
+
+        kwargs = {}
+        for name, value in row.items():
+            value = (value or '').strip()
+            if not value:
+                continue
+            if columns[name].type.python_type is int:
+                try:
+                    value = int(value)
+                except ValueError:
+                    raise ValueError(f"Line {line_number}: {name} must be a whole number.")
+            kwargs[name] = value
+        kwargs_list.append(kwargs)
+    return kwargs_list
@@ -0,0 +1,59 @@
+import csv
+from typing import Any, Dict, List
+
+import click
+from flask.cli import with_appcontext
+
+from app import injector
+from app.services.forecast_service.forecast_service import ForecastService
+
+SCHEDULE_COLUMNS = ('season_year', 'week', 'guest_name', 'host_name')
+
+
+@click.command('import-schedule')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@with_appcontext
+def import_schedule_command(path: str) -> None:
+    """
+    Imports season schedules from a CSV file with season_year, week, guest_name and host_name columns, replacing the
+    schedule of every season in the file.
+    """
+    with open(path, newline='') as file:
+        try:
+            scheduled_games = read_schedule(csv.DictReader(file))
+        except ValueError as err:
+            raise click.ClickException(str(err))
+
+    count = injector.get(ForecastService).import_schedule(scheduled_games)
+    click.echo(f"Imported {count} scheduled games from {path}.")
+
+
+def read_schedule(reader: csv.DictReader) -> List[Dict[str, Any]]:
+    """
+    Reads the scheduled games from the rows of a schedule CSV file.
+
+    :param reader: The reader of the file.
+
+    :return: The scheduled games, as dictionaries of season_year, week, guest_name and host_name.
+
+    :raises ValueError: If a column is missing or a row has a bad value.
+    """
+    missing_columns = [column for column in SCHEDULE_COLUMNS if column not in (reader.fieldnames or ())]
+    if missing_columns:
+        raise ValueError(f"The schedule is missing the columns: {', '.join(missing_columns)}.")
+
+    scheduled_games = []
+    for line_number, row in enumerate(reader, start=2):
+        try:
+            scheduled_game = {
+                'season_year': int(row['season_year']),
+                'week': int(row['week']),
+                'guest_name': row['guest_name'].strip(),
+                'host_name': row['host_name'].strip(),
+            }
+        except (TypeError, ValueError):
+            raise ValueError(f"Line {line_number}: season_year and week must be whole numbers.")
+        if not (scheduled_game['guest_name'] and scheduled_game['host_name']):
+            raise ValueError(f"Line {line_number}: guest_name and host_name are required.")
+        scheduled_games.append(scheduled_game)
+    return scheduled_games
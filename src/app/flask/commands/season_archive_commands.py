@@ -0,0 +1,44 @@
+import os
+
+import click
+from flask.cli import with_appcontext
+
+from app import injector
+from app.data.season_archive import SeasonArchiveError
+from app.services.season_archive_service.season_archive_service import SeasonArchiveService
+
+
+@click.command('export-season')
+@click.argument('season_year', type=int)
+@click.argument('path', type=click.Path(dir_okay=False, writable=True))
+@with_appcontext
+def export_season_command(season_year: int, path: str) -> None:
+    """
+    Exports the team seasons and games of one season to a binary season archive.
+    """
+    season_archive_service = injector.get(SeasonArchiveService)
+    snapshot = season_archive_service.export_season(season_year, path)
+    click.echo(
+        f"Exported the {season_year} season ({snapshot.team_season_count} team seasons, {snapshot.game_count} games) "
+        f"to {path} in {os.path.getsize(path)} bytes."
+    )
+
+
+@click.command('import-season')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--replace', is_flag=True, help="Delete the season's team seasons and games before the import.")
+@with_appcontext
+def import_season_command(path: str, replace: bool) -> None:
+    """
+    Imports the team seasons and games of one season from a binary season archive.
+    """
+    season_archive_service = injector.get(SeasonArchiveService)
+    try:
+        snapshot = season_archive_service.import_season(path, replace=replace)
+    except (SeasonArchiveError, ValueError) as err:
+        raise click.ClickException(str(err))
+
+    click.echo(
+        f"Imported the {snapshot.season_year} season ({snapshot.team_season_count} team seasons, "
+        f"{snapshot.game_count} games) from {path}."
+    )
@@ -0,0 +1,141 @@
+from typing import List
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+from app import injector
+from app.data.repositories.league_repository import LeagueRepository
+from app.services.weekly_update_service.weekly_update_report import WeeklyUpdateReport
+from app.services.weekly_update_service.weekly_update_runner import WeeklyUpdateRunner
+from app.services.weekly_update_service.weekly_update_service import WeeklyUpdateService
+
+
+@click.command('weekly-update')
+@click.option(
+    '--seasons', '-s', 'seasons', required=True,
+    help="Seasons to update, as years and ranges separated by commas, e.g. '1970-1979,1985'."
+)
+@click.option(
+    '--league', '-l', 'league_names', multiple=True,
+    help="A league to update. May be repeated. Every league in the data store is updated when omitted."
+)
+@click.option('--workers', '-w', default=4, show_default=True, type=click.IntRange(min=1),
+              help="The maximum number of seasons updated at the same time.")
+@click.option('--retries', '-r', default=0, show_default=True, type=click.IntRange(min=0),
+              help="The number of times a failed league season update is retried.")
+@click.option('--verify-totals', 'verify_totals', is_flag=True,
+              help="Compare each league season's maintained totals with freshly aggregated totals and correct them.")
+@with_appcontext
+def weekly_update_command(seasons: str, league_names: tuple, workers: int, retries: int, verify_totals: bool) -> None:
+    """
+    Runs the weekly update for many leagues and seasons.
+    """
+    try:
+        season_years = parse_season_years(seasons)
+    except ValueError as err:
+        raise click.BadParameter(str(err), param_hint="'--seasons'")
+
+    if not league_names:
+        league_repository = injector.get(LeagueRepository)
+        league_names = tuple(league.short_name for league in league_repository.get_leagues())
+
+    runner = WeeklyUpdateRunner(
+        current_app._get_current_object(), injector.get(WeeklyUpdateService), max_workers=workers, retries=retries,
+        verify_league_season_totals=verify_totals
+    )
+    reports = runner.run(league_names, season_years)
+
+    click.echo(format_summary(reports))
+    if verify_totals:
+        click.echo(format_totals_verification(reports))
+    if not all(report.succeeded for report in reports):
+        raise click.exceptions.Exit(1)
+
+
+def parse_season_years(value: str) -> List[int]:
+    """
+    Parses a list of season years and season year ranges, e.g. '1970-1979,1985'.
+
+    :param value: The text to parse.
+
+    :return: The sorted, distinct season years.
+
+    :raises ValueError: If the text is not a valid list of years and ranges.
+    """
+    season_years = set()
+    for part in value.split(','):
+        part = part.strip()
+        if not part:
+            continue
+
+        first, separator, last = part.partition('-')
+        try:
+            first_year = int(first)
+            last_year = int(last) if separator else first_year
+        except ValueError:
+            raise ValueError(f"'{part}' is not a season year or a range of season years.")
+
+        if last_year < first_year:
+            raise ValueError(f"'{part}' ends before it starts.")
+
+        season_years.update(range(first_year, last_year + 1))
+
+    if not season_years:
+        raise ValueError("At least one season year is required.")
+
+    return sorted(season_years)
+
+
+def format_summary(reports: List[WeeklyUpdateReport]) -> str:
+    """
+    Formats a list of weekly update reports into a plain text summary table.
+
+    :param reports: The reports to format.
+
+    :return: The summary table.
+    """
+    headers = ('League', 'Season', 'Attempts', 'Duration (s)', 'Rows', 'Status')
+    rows = [
+        (
+            report.league_name,
+            str(report.season_year),
+            str(report.attempts),
+            f"{report.duration:.3f}",
+            str(report.rows_touched),
+            'OK' if report.succeeded else f"FAILED: {report.error}"
+        )
+        for report in reports
+    ]
+    rows.append((
+        'Total',
+        '',
+        str(sum(report.attempts for report in reports)),
+        f"{sum(report.duration for report in reports):.3f}",
+        str(sum(report.rows_touched for report in reports)),
+        f"{sum(1 for report in reports if not report.succeeded)} failed"
+    ))
+
+    widths = [max(len(row[i]) for row in [headers] + rows) for i in range(len(headers))]
+    lines = [
+        '  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+        for row in [headers, tuple('-' * width for width in widths)] + rows
+    ]
+    return '\n'.join(lines)
+
+
+def format_totals_verification(reports: List[WeeklyUpdateReport]) -> str:
+    """
+    Formats the league season totals verification of a list of weekly update reports.
+
+    :param reports: The reports to format.
+
+    :return: One line per corrected league season, followed by a count of the league seasons verified.
+    """
+    lines = [
+        f"Corrected {report.league_name} {report.season_year}: {report.league_season_totals_mismatch}"
+        for report in reports if report.league_season_totals_mismatch is not None
+    ]
+    verified = sum(1 for report in reports if report.league_season_totals_verified)
+    lines.append(f"Verified league season totals: {verified} checked, {len(lines)} corrected.")
+    return '\n'.join(lines)
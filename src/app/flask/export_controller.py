@@ -0,0 +1,31 @@
+from flask import Blueprint, abort, request, Response, stream_with_context
+
+from app import injector
+from app.services.export_service.export_service import EXPORT_FORMATS, EXPORT_KINDS, ExportService
+
+blueprint = Blueprint('export', __name__)
+
+export_service = injector.get(ExportService)
+
+
+@blueprint.route('/<kind>.<export_format>')
+def export(kind: str, export_format: str) -> Response:
+    global export_service
+
+    if kind not in EXPORT_KINDS or export_format not in EXPORT_FORMATS:
+        abort(404)
+
+    compress = request.args.get('gzip', '').lower() in ('1', 'true', 'yes')
+    chunks = export_service.export(
+        kind, export_format,
+        first_season_year=request.args.get('first_season', type=int),
+        last_season_year=request.args.get('last_season', type=int),
+        compress=compress
+    )
+
+    # The rows are read and written as the response is sent, so the request context must outlive this view.
+    response = Response(stream_with_context(chunks), mimetype=EXPORT_FORMATS[export_format][0])
+    response.headers['Content-Disposition'] = f'attachment; filename="{kind}.{export_format}"'
+    if compress:
+        response.headers['Content-Encoding'] = 'gzip'
+    return response
@@ -0,0 +1,45 @@
+from typing import Optional
+
+from flask import Blueprint, abort, jsonify, render_template, request, Response
+
+from app import injector
+from app.data.repositories.season_repository import SeasonRepository
+from app.services.forecast_service.forecast_service import ForecastService
+
+blueprint = Blueprint('forecast', __name__)
+
+forecast_service = injector.get(ForecastService)
+season_repository = injector.get(SeasonRepository)
+
+
+@blueprint.route('/')
+def index() -> str:
+    global forecast_service
+    global season_repository
+
+    season_year = _get_season_year()
+    forecast = forecast_service.get_season_forecast(season_year) if season_year else None
+    return render_template(
+        'forecast/index.html',
+        seasons=season_repository.get_season_records(), selected_year=season_year, forecast=forecast
+    )
+
+
+@blueprint.route('/standings')
+def standings() -> Response:
+    global forecast_service
+
+    season_year = _get_season_year()
+    if not season_year:
+        abort(400, description="A season is required.")
+
+    forecast = forecast_service.get_season_forecast(season_year)
+    return jsonify({
+        'season_year': forecast.season_year,
+        'standings': [standing.to_dict() for standing in forecast.standings],
+        'predictions': [prediction._asdict() for prediction in forecast.predictions],
+    })
+
+
+def _get_season_year() -> Optional[int]:
+    return request.args.get('season', type=int)
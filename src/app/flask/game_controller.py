@@ -14,7 +14,6 @@ from app.services.game_service.game_service import GameService
 
 blueprint = Blueprint('game', __name__)
 
-seasons = []
 selected_season = Season(year=0, num_of_weeks_scheduled=17, num_of_weeks_completed=17)
 selected_week = 0
 
@@ -25,17 +24,14 @@ game_service = injector.get(GameService)
 
 @blueprint.route('/')
 def index() -> str:
-    global season_repository
-    global seasons
     global selected_season
     global selected_week
     global game_repository
 
-    seasons = season_repository.get_seasons()
-    games = game_repository.get_games_by_season_year(season_year=None)
+    games = game_repository.get_game_rows_by_season_year(season_year=None)
     return render_template(
         'games/index.html',
-        seasons=seasons, selected_season=selected_season, selected_week=selected_week, games=games
+        selected_season=selected_season, selected_week=selected_week, games=games
     )
 
 
@@ -164,35 +160,49 @@ def delete(id: int) -> Response | str:
 @blueprint.route('/select_season', methods=['POST'])
 def select_season() -> str:
     global season_repository
-    global seasons
     global selected_season
     global selected_week
     global game_repository
 
-    selected_value = int(request.form.get('season_dropdown'))  # Fetch the selected season.
-    selected_season = season_repository.get_season_by_year(selected_value)
-    games = game_repository.get_games_by_season_year(season_year=selected_value)
+    # The season is typed into a search box rather than picked from a list, so it may not be a known season.
+    season = _get_season(request.form.get('season_dropdown'))  # Fetch the selected season.
+    if season is None:
+        flash("Please choose a season from the suggestions.", 'danger')
+        games = game_repository.get_game_rows_by_season_year(season_year=selected_season.year or None)
+    else:
+        selected_season = season
+        games = game_repository.get_game_rows_by_season_year(season_year=selected_season.year)
     return render_template(
         'games/index.html',
-        seasons=seasons, selected_season=selected_season, selected_week=selected_week, games=games
+        selected_season=selected_season, selected_week=selected_week, games=games
     )
 
 
 @blueprint.route('/select_week', methods=['POST'])
 def select_week() -> str:
-    global seasons
     global selected_season
     global selected_week
     global game_repository
 
     selected_week = int(request.form.get('week_dropdown'))  # Fetch the selected week.
-    games = game_repository.get_games_by_season_year_and_week(season_year=selected_season.year, week=selected_week)
+    games = game_repository.get_game_rows_by_season_year_and_week(
+        season_year=selected_season.year, week=selected_week
+    )
     return render_template(
         'games/index.html',
-        seasons=seasons, selected_season=selected_season, selected_week=selected_week, games=games
+        selected_season=selected_season, selected_week=selected_week, games=games
     )
 
 
+def _get_season(value: Any) -> Season | None:
+    global season_repository
+
+    try:
+        return season_repository.get_season_by_year(int(value))
+    except (TypeError, ValueError):
+        return None
+
+
 def _handle_error(err: Any, template_name: str, form: GameForm, game: Game=None) -> str:
     flash(str(err), 'danger')
     return render_template(template_name, form=form, game=game)
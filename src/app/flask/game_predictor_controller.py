@@ -1,20 +1,21 @@
-from flask import Blueprint, render_template, flash, request
+from typing import Any, Iterable, List, Optional, Set
+
+from flask import Blueprint, render_template, flash, request, abort, jsonify, Response
 
 from app import injector
 from app.data.repositories.season_repository import SeasonRepository
-from app.data.repositories.team_season_repository import TeamSeasonRepository
+from app.data.repositories.season_snapshot_repository import SeasonSnapshotRepository
+from app.services.game_predictor_service.game_prediction import Matchup
 from app.services.game_predictor_service.game_predictor_service import GamePredictorService
 
 blueprint = Blueprint('game_predictor', __name__)
 
-team_season_repository = injector.get(TeamSeasonRepository)
+season_snapshot_repository = injector.get(SeasonSnapshotRepository)
 
-guest_seasons = None
 selected_guest_year = None
 guests = None
 selected_guest_name = None
 
-host_seasons = None
 selected_host_year = None
 hosts = None
 selected_host_name = None
@@ -22,25 +23,19 @@ selected_host_name = None
 
 @blueprint.route('/')
 def index() -> str:
-    global guest_seasons
     global selected_guest_year
     global guests
     global selected_guest_name
 
-    global host_seasons
     global selected_host_year
     global hosts
     global selected_host_name
 
-    season_repository = injector.get(SeasonRepository)
-
-    guest_seasons = season_repository.get_seasons()
     selected_guest_year = None
 
     guests = []
     selected_guest_name = None
 
-    host_seasons = season_repository.get_seasons()
     selected_host_year = None
 
     hosts = []
@@ -48,48 +43,44 @@ def index() -> str:
 
     return render_template(
         'game_predictor/index.html',
-        guest_seasons=guest_seasons, selected_guest_year=selected_guest_year,
-        guests=guests, selected_guest_name=selected_guest_name,
-        host_seasons=host_seasons, selected_host_year=selected_host_year,
-        hosts=hosts, selected_host_name=selected_host_name
+        selected_guest_year=selected_guest_year, guests=guests, selected_guest_name=selected_guest_name,
+        selected_host_year=selected_host_year, hosts=hosts, selected_host_name=selected_host_name
     )
 
 
 @blueprint.route('/select_guest_season', methods=['POST'])
 def select_guest_season() -> str:
-    global team_season_repository
+    global season_snapshot_repository
 
-    global guest_seasons
     global selected_guest_year
     global guests
     global selected_guest_name
 
-    global host_seasons
     global selected_host_year
     global hosts
     global selected_host_name
 
-    selected_guest_year = int(request.form.get('guest_season_dropdown'))  # Fetch the selected guest season.
-
-    guests = team_season_repository.get_team_seasons_by_season_year(season_year=selected_guest_year)
+    # The season is typed into a search box rather than picked from a list, so it may not be a known season.
+    season_year = _get_season_year(request.form.get('guest_season_dropdown'))  # Fetch the selected guest season.
+    if season_year is None:
+        flash("Please choose a guest season from the suggestions.", 'danger')
+    else:
+        selected_guest_year = season_year
+        guests = season_snapshot_repository.get_team_seasons_by_season_year(season_year=selected_guest_year)
 
     return render_template(
         'game_predictor/index.html',
-        guest_seasons=guest_seasons, selected_guest_year=selected_guest_year,
-        guests=guests, selected_guest_name=selected_guest_name,
-        host_seasons=host_seasons, selected_host_year=selected_host_year,
-        hosts=hosts, selected_host_name=selected_host_name
+        selected_guest_year=selected_guest_year, guests=guests, selected_guest_name=selected_guest_name,
+        selected_host_year=selected_host_year, hosts=hosts, selected_host_name=selected_host_name
     )
 
 
 @blueprint.route('/select_guest', methods=['POST'])
 def select_guest():
-    global guest_seasons
     global selected_guest_year
     global guests
     global selected_guest_name
 
-    global host_seasons
     global selected_host_year
     global hosts
     global selected_host_name
@@ -97,48 +88,44 @@ def select_guest():
     selected_guest_name = str(request.form.get('guest_dropdown'))
     return render_template(
         'game_predictor/index.html',
-        guest_seasons=guest_seasons, selected_guest_year=selected_guest_year,
-        guests=guests, selected_guest_name=selected_guest_name,
-        host_seasons=host_seasons, selected_host_year=selected_host_year,
-        hosts=hosts, selected_host_name=selected_host_name
+        selected_guest_year=selected_guest_year, guests=guests, selected_guest_name=selected_guest_name,
+        selected_host_year=selected_host_year, hosts=hosts, selected_host_name=selected_host_name
     )
 
 
 @blueprint.route('/select_host_season', methods=['POST'])
 def select_host_season() -> str:
-    global team_season_repository
+    global season_snapshot_repository
 
-    global guest_seasons
     global selected_guest_year
     global guests
     global selected_guest_name
 
-    global host_seasons
     global selected_host_year
     global hosts
     global selected_host_name
 
-    selected_host_year = int(request.form.get('host_season_dropdown'))  # Fetch the selected host season.
-
-    hosts = team_season_repository.get_team_seasons_by_season_year(season_year=selected_host_year)
+    # The season is typed into a search box rather than picked from a list, so it may not be a known season.
+    season_year = _get_season_year(request.form.get('host_season_dropdown'))  # Fetch the selected host season.
+    if season_year is None:
+        flash("Please choose a host season from the suggestions.", 'danger')
+    else:
+        selected_host_year = season_year
+        hosts = season_snapshot_repository.get_team_seasons_by_season_year(season_year=selected_host_year)
 
     return render_template(
         'game_predictor/index.html',
-        guest_seasons=guest_seasons, selected_guest_year=selected_guest_year,
-        guests=guests, selected_guest_name=selected_guest_name,
-        host_seasons=host_seasons, selected_host_year=selected_host_year,
-        hosts=hosts, selected_host_name=selected_host_name
+        selected_guest_year=selected_guest_year, guests=guests, selected_guest_name=selected_guest_name,
+        selected_host_year=selected_host_year, hosts=hosts, selected_host_name=selected_host_name
     )
 
 
 @blueprint.route('/select_host', methods=['POST'])
 def select_host():
-    global guest_seasons
     global selected_guest_year
     global guests
     global selected_guest_name
 
-    global host_seasons
     global selected_host_year
     global hosts
     global selected_host_name
@@ -146,21 +133,17 @@ def select_host():
     selected_host_name = str(request.form.get('host_dropdown'))  # Fetch the selected host season.
     return render_template(
         'game_predictor/index.html',
-        guest_seasons=guest_seasons, selected_guest_year=selected_guest_year,
-        guests=guests, selected_guest_name=selected_guest_name,
-        host_seasons=host_seasons, selected_host_year=selected_host_year,
-        hosts=hosts, selected_host_name=selected_host_name
+        selected_guest_year=selected_guest_year, guests=guests, selected_guest_name=selected_guest_name,
+        selected_host_year=selected_host_year, hosts=hosts, selected_host_name=selected_host_name
     )
 
 
 @blueprint.route('/predict_game')
 def predict_game() -> str:
-    global guest_seasons
     global selected_guest_year
     global guests
     global selected_guest_name
 
-    global host_seasons
     global selected_host_year
     global hosts
     global selected_host_name
@@ -184,10 +167,8 @@ def predict_game() -> str:
 
         return render_template(
             'game_predictor/index.html',
-            guest_seasons=guest_seasons, selected_guest_year=selected_guest_year,
-            guests=guests, selected_guest_name=selected_guest_name,
-            host_seasons=host_seasons, selected_host_year=selected_host_year,
-            hosts=hosts, selected_host_name=selected_host_name
+            selected_guest_year=selected_guest_year, guests=guests, selected_guest_name=selected_guest_name,
+            selected_host_year=selected_host_year, hosts=hosts, selected_host_name=selected_host_name
         )
 
     flash(
@@ -198,20 +179,121 @@ def predict_game() -> str:
 
     return render_template(
         'game_predictor/index.html',
-        guest_seasons=guest_seasons, selected_guest_year=selected_guest_year,
-        guests=guests, selected_guest_name=selected_guest_name,
-        host_seasons=host_seasons, selected_host_year=selected_host_year,
-        hosts=hosts, selected_host_name=selected_host_name
+        selected_guest_year=selected_guest_year, guests=guests, selected_guest_name=selected_guest_name,
+        selected_host_year=selected_host_year, hosts=hosts, selected_host_name=selected_host_name
+    )
+
+
+@blueprint.route('/predict_games', methods=['POST'])
+def predict_games() -> Response:
+    """
+    Predicts the scores of a list of matchups posted as JSON, e.g.
+    {"matchups": [{"guest_name": "...", "guest_season_year": 1985, "host_name": "...", "host_season_year": 1985}]}.
+    Every season year must be the year of a season in the data store.
+    """
+    payload = request.get_json(silent=True)
+    try:
+        matchups = [_get_matchup(item) for item in payload['matchups']]
+    except (KeyError, TypeError, ValueError):
+        abort(400, description="A list of matchups with guest and host names and season years is required.")
+
+    unknown_season_years = _get_unknown_season_years(matchups)
+    if unknown_season_years:
+        abort(404, description=f"No season could be found for the years {sorted(unknown_season_years)}.")
+
+    game_predictor_service = injector.get(GamePredictorService)
+    predictions = game_predictor_service.predict_game_scores(matchups)
+    return jsonify({'predictions': [prediction._asdict() for prediction in predictions]})
+
+
+@blueprint.route('/slate', methods=['GET', 'POST'])
+def slate() -> str:
+    """
+    Predicts the scores of a slate of matchups pasted one per line.
+    """
+    matchups_text = request.form.get('matchups', '')
+    predictions = None
+    if request.method == 'POST':
+        try:
+            matchups = parse_matchups(matchups_text)
+            unknown_season_years = _get_unknown_season_years(matchups)
+            if unknown_season_years:
+                raise ValueError(f"No season could be found for the years {sorted(unknown_season_years)}.")
+        except ValueError as err:
+            flash(str(err), 'danger')
+        else:
+            game_predictor_service = injector.get(GamePredictorService)
+            predictions = game_predictor_service.predict_game_scores(matchups)
+
+    return render_template('game_predictor/slate.html', matchups_text=matchups_text, predictions=predictions)
+
+
+def parse_matchups(text: str) -> List[Matchup]:
+    """
+    Parses matchups pasted one per line, as either 'guest, host, season year' or
+    'guest, guest season year, host, host season year'. Blank lines are skipped.
+
+    :param text: The text to parse.
+
+    :return: The matchups, in the order they were listed.
+
+    :raises ValueError: If a line is not a valid matchup, or no matchups are listed.
+    """
+    matchups = []
+    for number, line in enumerate(text.splitlines(), start=1):
+        fields = [field.strip() for field in line.split(',')]
+        if fields == ['']:
+            continue
+
+        try:
+            if len(fields) == 3:
+                matchups.append(Matchup(fields[0], int(fields[2]), fields[1], int(fields[2])))
+            elif len(fields) == 4:
+                matchups.append(Matchup(fields[0], int(fields[1]), fields[2], int(fields[3])))
+            else:
+                raise ValueError()
+        except ValueError:
+            raise ValueError(
+                f"Line {number} is not a matchup: '{line.strip()}'. "
+                f"Use 'guest, host, season year' or 'guest, guest season year, host, host season year'."
+            )
+
+    if not matchups:
+        raise ValueError("Please list at least one matchup.")
+
+    return matchups
+
+
+def _get_unknown_season_years(matchups: Iterable[Matchup]) -> Set[int]:
+    # Unknown years are turned away before a season snapshot is built and cached for them.
+    season_years = set()
+    for matchup in matchups:
+        season_years.update((matchup.guest_season_year, matchup.host_season_year))
+    season_repository = injector.get(SeasonRepository)
+    return season_years - {season.year for season in season_repository.get_season_records()}
+
+
+def _get_season_year(value: Any) -> Optional[int]:
+    try:
+        season_year = int(value)
+    except (TypeError, ValueError):
+        return None
+
+    season_repository = injector.get(SeasonRepository)
+    return None if season_repository.get_season_by_year(season_year) is None else season_year
+
+
+def _get_matchup(item: Any) -> Matchup:
+    return Matchup(
+        str(item['guest_name']), int(item['guest_season_year']), str(item['host_name']), int(item['host_season_year'])
     )
 
 
 def _handle_error(message: str) -> str:
-    global guest_seasons
     global selected_guest_year
     global guests
     global selected_guest_name
 
-    global host_seasons
     global selected_host_year
     global hosts
     global selected_host_name
@@ -219,8 +301,6 @@ def _handle_error(message: str) -> str:
     flash(message, 'danger')
     return render_template(
         'game_predictor/index.html',
-        guest_seasons=guest_seasons, selected_guest_year=selected_guest_year,
-        guests=guests, selected_guest_name=selected_guest_name,
-        host_seasons=host_seasons, selected_host_year=selected_host_year,
-        hosts=hosts, selected_host_name=selected_host_name
+        selected_guest_year=selected_guest_year, guests=guests, selected_guest_name=selected_guest_name,
+        selected_host_year=selected_host_year, hosts=hosts, selected_host_name=selected_host_name
     )
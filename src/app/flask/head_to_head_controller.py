@@ -0,0 +1,78 @@
+from typing import Optional, Tuple
+
+from flask import Blueprint, abort, jsonify, render_template, request, Response
+
+from app import injector
+from app.services.head_to_head_service.head_to_head_service import HeadToHeadService
+
+blueprint = Blueprint('head_to_head', __name__)
+
+head_to_head_service = injector.get(HeadToHeadService)
+
+
+@blueprint.route('/')
+def index() -> str:
+    global head_to_head_service
+
+    team_name, opponent_name = _get_team_names()
+    first_season_year, last_season_year = _get_season_years()
+    head_to_head = None
+    if team_name and opponent_name:
+        head_to_head = head_to_head_service.get_head_to_head(
+            team_name, opponent_name, first_season_year, last_season_year
+        )
+
+    return render_template(
+        'head_to_head/index.html',
+        selected_team_name=team_name, selected_opponent_name=opponent_name,
+        first_season_year=first_season_year, last_season_year=last_season_year, head_to_head=head_to_head
+    )
+
+
+@blueprint.route('/games')
+def games() -> Response:
+    global head_to_head_service
+
+    team_name, opponent_name = _get_required_team_names()
+    first_season_year, last_season_year = _get_season_years()
+    head_to_head = head_to_head_service.get_head_to_head(team_name, opponent_name, first_season_year, last_season_year)
+    return jsonify({
+        'record': head_to_head.record.to_dict(),
+        'games': [
+            {
+                'id': game.id,
+                'season_year': game.season_year,
+                'week': game.week,
+                'guest_name': game.guest_name,
+                'guest_score': game.guest_score,
+                'host_name': game.host_name,
+                'host_score': game.host_score,
+                'is_playoff': bool(game.is_playoff),
+                'notes': game.notes,
+            }
+            for game in head_to_head.games
+        ],
+    })
+
+
+@blueprint.route('/series')
+def series() -> Response:
+    global head_to_head_service
+
+    team_name, opponent_name = _get_required_team_names()
+    return jsonify(head_to_head_service.get_series_record(team_name, opponent_name).to_dict())
+
+
+def _get_team_names() -> Tuple[Optional[str], Optional[str]]:
+    return request.args.get('team') or None, request.args.get('opponent') or None
+
+
+def _get_required_team_names() -> Tuple[str, str]:
+    team_name, opponent_name = _get_team_names()
+    if not (team_name and opponent_name):
+        abort(400, description="Both a team and an opponent are required.")
+    return team_name, opponent_name
+
+
+def _get_season_years() -> Tuple[Optional[int], Optional[int]]:
+    return request.args.get('first_season', type=int), request.args.get('last_season', type=int)
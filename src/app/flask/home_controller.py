@@ -1,4 +1,6 @@
-from flask import Blueprint, render_template
+from flask import Blueprint, jsonify, render_template, Response
+
+from app.data.reference_data import reference_data_cache
 
 blueprint = Blueprint('home', __name__)
 
@@ -11,3 +13,8 @@ def index():
 @blueprint.route('/privacy')
 def privacy():
     return render_template('home/privacy.html')
+
+
+@blueprint.route('/cache_metrics')
+def cache_metrics() -> Response:
+    return jsonify({'reference_data': reference_data_cache.get_metrics()})
@@ -0,0 +1,50 @@
+from typing import Any, Dict
+
+from flask import Blueprint, abort, jsonify, render_template, request, Response
+
+from app import injector
+from app.services.leaderboard_service.leaderboard_service import (
+    DEFAULT_LIMIT, LEADERBOARD_METRICS, LeaderboardService
+)
+
+blueprint = Blueprint('leaderboard', __name__)
+
+leaderboard_service = injector.get(LeaderboardService)
+
+DEFAULT_METRIC = 'offensive_index'
+
+
+@blueprint.route('/')
+def index() -> str:
+    global leaderboard_service
+
+    query = _get_query()
+    try:
+        leaders = leaderboard_service.get_leaders(**query)
+    except ValueError as err:
+        abort(400, description=str(err))
+
+    return render_template('leaderboard/index.html', metrics=list(LEADERBOARD_METRICS), leaders=leaders, **query)
+
+
+@blueprint.route('/leaders')
+def leaders() -> Response:
+    global leaderboard_service
+
+    query = _get_query()
+    try:
+        entries = leaderboard_service.get_leaders(**query)
+    except ValueError as err:
+        abort(400, description=str(err))
+
+    return jsonify({**query, 'leaders': [entry._asdict() for entry in entries]})
+
+
+def _get_query() -> Dict[str, Any]:
+    return {
+        'metric': request.args.get('metric') or DEFAULT_METRIC,
+        'first_season_year': request.args.get('first_season', type=int),
+        'last_season_year': request.args.get('last_season', type=int),
+        'limit': request.args.get('limit', DEFAULT_LIMIT, type=int),
+        'ascending': request.args.get('order') == 'asc',
+    }
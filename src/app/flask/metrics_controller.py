@@ -0,0 +1,141 @@
+import os
+import time
+from typing import List
+
+from flask import Blueprint, current_app, g, has_app_context, request, Response
+
+from app.data.reference_data import reference_data_cache
+from app.data.repositories.season_snapshot_repository import season_snapshot_cache_counters
+from app.data.sqla import sqla
+from app.metrics import format_prometheus, metrics, MetricFamily, Sample
+from app.services.forecast_service.forecast_service import forecast_cache_counters
+from app.services.leaderboard_service.leaderboard_service import leaderboard_cache_counters
+from app.services.season_standings_service.season_standings_service import (standings_cache_counters,
+                                                                            tiebreaker_tables_cache_counters)
+
+blueprint = Blueprint('metrics', __name__)
+
+_STARTED_AT_KEY = 'metrics_started_at'
+
+# The in-process caches of season data whose hits and misses are exposed.
+CACHE_COUNTERS = (
+    season_snapshot_cache_counters,
+    forecast_cache_counters,
+    standings_cache_counters,
+    tiebreaker_tables_cache_counters,
+    leaderboard_cache_counters,
+)
+
+
+@blueprint.route('/')
+def index() -> Response:
+    families = metrics.collect_all(current_app.config.get('METRICS_MULTIPROCESS_DIR'))
+    return Response(format_prometheus(families), mimetype='text/plain; version=0.0.4')
+
+
+@blueprint.before_app_request
+def start_request_timer() -> None:
+    setattr(g, _STARTED_AT_KEY, time.perf_counter())
+
+
+@blueprint.teardown_app_request
+def record_request_time(exception: BaseException = None) -> None:
+    started_at = g.pop(_STARTED_AT_KEY, None)
+    if started_at is None:
+        return
+
+    metrics.observe(
+        'http_request_duration_seconds', time.perf_counter() - started_at,
+        endpoint=request.endpoint or 'unmatched', method=request.method
+    )
+    directory = current_app.config.get('METRICS_MULTIPROCESS_DIR')
+    if directory:
+        metrics.flush(directory)
+
+
+def get_pool_families() -> List[MetricFamily]:
+    """
+    Gets the connection pool gauges of each engine of the current app, if there is one.
+
+    :return: The pool size, checked-out connections and overflow of each engine that pools its connections.
+    """
+    gauges = {
+        'db_pool_size': ("Connections held open by the pool of an engine.", 'size'),
+        'db_pool_checked_out': ("Connections of the pool of an engine that are in use.", 'checkedout'),
+        'db_pool_overflow': ("Connections opened beyond the size of the pool of an engine.", 'overflow'),
+    }
+    samples = {name: [] for name in gauges}
+    if has_app_context():
+        pid = str(os.getpid())
+        for bind_key, engine in sqla.engines.items():
+            for name, (_, attribute) in gauges.items():
+                value = getattr(engine.pool, attribute, None)
+                if callable(value):
+                    samples[name].append(
+                        Sample(name, (('engine', bind_key or 'default'), ('pid', pid)), value())
+                    )
+    return [MetricFamily(name, 'gauge', help_text, samples[name]) for name, (help_text, _) in gauges.items()]
+
+
+def get_reference_data_families() -> List[MetricFamily]:
+    """
+    Gets the hits and misses of the reference data cache of this process, by kind.
+
+    :return: The hit and miss counters and the hit ratio gauge.
+    """
+    hits, misses, ratios = [], [], []
+    pid = str(os.getpid())
+    for kind, kind_metrics in reference_data_cache.get_metrics().items():
+        hits.append(Sample('reference_data_cache_hits_total', (('kind', kind),), kind_metrics['hits']))
+        misses.append(Sample('reference_data_cache_misses_total', (('kind', kind),), kind_metrics['misses']))
+        if kind_metrics['hit_rate'] is not None:
+            ratios.append(
+                Sample('reference_data_cache_hit_ratio', (('kind', kind), ('pid', pid)), kind_metrics['hit_rate'])
+            )
+    return [
+        MetricFamily('reference_data_cache_hits_total', 'counter', "Reference data reads served from the cache.", hits),
+        MetricFamily('reference_data_cache_misses_total', 'counter', "Reference data reads that loaded the data.",
+                     misses),
+        MetricFamily('reference_data_cache_hit_ratio', 'gauge', "Share of reference data reads served from the cache.",
+                     ratios),
+    ]
+
+
+def get_cache_families() -> List[MetricFamily]:
+    """
+    Gets the hits and misses of the in-process caches of season data of this process, by cache.
+
+    :return: The hit and miss counters and the hit ratio gauge.
+    """
+    hits, misses, ratios = [], [], []
+    pid = str(os.getpid())
+    for counters in CACHE_COUNTERS:
+        cache_hits, cache_misses = counters.get()
+        hits.append(Sample('cache_hits_total', (('cache', counters.cache),), cache_hits))
+        misses.append(Sample('cache_misses_total', (('cache', counters.cache),), cache_misses))
+        if cache_hits + cache_misses:
+            ratios.append(Sample(
+                'cache_hit_ratio', (('cache', counters.cache), ('pid', pid)), cache_hits / (cache_hits + cache_misses)
+            ))
+    return [
+        MetricFamily('cache_hits_total', 'counter', "Reads served from an in-process cache of season data.", hits),
+        MetricFamily('cache_misses_total', 'counter', "Reads that built or rebuilt a cached value of season data.",
+                     misses),
+        MetricFamily('cache_hit_ratio', 'gauge', "Share of the reads of a cache of season data served from it.",
+                     ratios),
+    ]
+
+
+def reset_cache_counters() -> None:
+    """
+    Resets the hits and misses of the in-process caches of season data.
+
+    :return: None
+    """
+    for counters in CACHE_COUNTERS:
+        counters.reset()
+
+
+metrics.add_collector(get_pool_families)
+metrics.add_collector(get_reference_data_families, reset=reference_data_cache.reset_metrics)
+metrics.add_collector(get_cache_families, reset=reset_cache_counters)
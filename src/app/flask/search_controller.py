@@ -0,0 +1,25 @@
+from flask import Blueprint, abort, jsonify, request, Response
+
+from app import injector
+from app.data.repositories.search_repository import SearchRepository
+from app.data.search_index import SEARCH_KINDS
+
+blueprint = Blueprint('search', __name__)
+
+search_repository = injector.get(SearchRepository)
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+
+
+@blueprint.route('/')
+def search() -> Response:
+    global search_repository
+
+    kinds = request.args.getlist('kind') or None
+    if kinds and not set(kinds).issubset(SEARCH_KINDS):
+        abort(400, description=f"Choose kinds from: {', '.join(SEARCH_KINDS)}.")
+    limit = min(max(request.args.get('limit', DEFAULT_LIMIT, type=int), 1), MAX_LIMIT)
+
+    results = search_repository.search(request.args.get('q', ''), kinds, limit)
+    return jsonify([result._asdict() for result in results])
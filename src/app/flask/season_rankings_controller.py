@@ -1,19 +1,19 @@
-from flask import Blueprint, render_template, request, url_for, redirect, flash, Response
+from typing import Any, Optional
+
+from flask import Blueprint, abort, render_template, request, url_for, redirect, flash, jsonify, Response
 
 from app import injector
 from app.data.repositories.league_repository import LeagueRepository
 from app.data.repositories.season_rankings_repository import SeasonRankingsRepository
 from app.data.repositories.season_repository import SeasonRepository
-from app.services.weekly_update_service.weekly_update_service import WeeklyUpdateService
+from app.services.job_service.job_service import JobService
+from app.services.weekly_update_service.weekly_update_job_service import WeeklyUpdateJobService
 
 blueprint = Blueprint('season_rankings', __name__)
 
 RANKING_TYPES = ['Offense', 'Defense', 'Total']
 
-seasons = []
 selected_year = None
-
-leagues = []
 selected_league_name = None
 
 selected_type = None
@@ -23,53 +23,51 @@ season_rankings_repository = injector.get(SeasonRankingsRepository)
 
 @blueprint.route('/')
 def index() -> str:
-    global seasons
     global selected_year
-    global leagues
     global selected_league_name
     global selected_type
 
-    season_repository = injector.get(SeasonRepository)
-    seasons = season_repository.get_seasons()
-
-    league_repository = injector.get(LeagueRepository)
-    leagues = league_repository.get_leagues()
-
     return render_template(
         'season_rankings/index.html',
-        seasons=seasons, selected_year=selected_year, leagues=leagues, selected_league_name=selected_league_name,
+        selected_year=selected_year, selected_league_name=selected_league_name,
         types=RANKING_TYPES, selected_type=selected_type, season_rankings=None
     )
 
 
 @blueprint.route('select_season', methods=['POST'])
 def select_season():
-    global seasons
     global selected_year
-    global leagues
     global selected_league_name
     global selected_type
 
-    selected_year = int(request.form.get('season_dropdown'))  # Fetch the selected season.
+    # The season is typed into a search box rather than picked from a list, so it may not be a known season.
+    season_year = _get_season_year(request.form.get('season_dropdown'))  # Fetch the selected season.
+    if season_year is None:
+        flash("Please choose a season from the suggestions.", 'danger')
+    else:
+        selected_year = season_year
     return render_template(
         'season_rankings/index.html',
-        seasons=seasons, selected_year=selected_year, leagues=leagues, selected_league_name=selected_league_name,
+        selected_year=selected_year, selected_league_name=selected_league_name,
         types=RANKING_TYPES, selected_type=selected_type, season_rankings=None
     )
 
 
 @blueprint.route('select_league', methods=['POST'])
 def select_league():
-    global seasons
     global selected_year
-    global leagues
     global selected_league_name
     global selected_type
 
-    selected_league_name = str(request.form.get('league_dropdown'))  # Fetch the selected league.
+    # The league is typed into a search box rather than picked from a list, so it may not be a known league.
+    league_name = _get_league_name(request.form.get('league_dropdown'))  # Fetch the selected league.
+    if league_name is None:
+        flash("Please choose a league from the suggestions.", 'danger')
+    else:
+        selected_league_name = league_name
     return render_template(
         'season_rankings/index.html',
-        seasons=seasons, selected_year=selected_year, leagues=leagues, selected_league_name=selected_league_name,
+        selected_year=selected_year, selected_league_name=selected_league_name,
         types=RANKING_TYPES, selected_type=selected_type, season_rankings=None
     )
 
@@ -92,26 +90,72 @@ def select_type() -> Response | str:
 
 @blueprint.route('weekly_update', methods=['POST'])
 def run_weekly_update():
-    global seasons
     global selected_year
-    global leagues
     global selected_league_name
     global selected_type
 
-    weekly_update_service = injector.get(WeeklyUpdateService)
-    weekly_update_service.run_weekly_update(selected_league_name, selected_year)
+    weekly_update_job_service = injector.get(WeeklyUpdateJobService)
+    job = weekly_update_job_service.enqueue_weekly_update(selected_league_name, selected_year)
 
     flash(
-        f"The weekly update has been successfully completed for the '{selected_league_name}' in {selected_year}.",
+        f"The weekly update for the '{selected_league_name}' in {selected_year} has been queued as job {job.id}. "
+        f"Its status is available at {url_for('season_rankings.weekly_update_status', job_id=job.id)}.",
         'success'
     )
     return render_template(
         'season_rankings/index.html',
-        seasons=seasons, selected_year=selected_year, leagues=leagues, selected_league_name=selected_league_name,
+        selected_year=selected_year, selected_league_name=selected_league_name,
         types=RANKING_TYPES, selected_type=selected_type, season_rankings=None
     )
 
 
+@blueprint.route('weekly_update/<int:job_id>')
+def weekly_update_status(job_id: int) -> Response:
+    job_service = injector.get(JobService)
+    job = job_service.get_job(job_id)
+    if job is None:
+        abort(404)
+
+    return jsonify({
+        'id': job.id,
+        'kind': job.kind,
+        'key': job.key,
+        'status': job.status,
+        'progress': job.progress,
+        'phases_completed': job.phases_completed,
+        'phase_count': job.phase_count,
+        'phase_durations': job.phase_durations or {},
+        'result': job.result,
+        'error': job.error,
+        'created_at': _isoformat(job.created_at),
+        'started_at': _isoformat(job.started_at),
+        'finished_at': _isoformat(job.finished_at),
+    })
+
+
+def _isoformat(value) -> str | None:
+    return None if value is None else value.isoformat()
+
+
+def _get_season_year(value: Any) -> Optional[int]:
+    try:
+        season_year = int(value)
+    except (TypeError, ValueError):
+        return None
+
+    season_repository = injector.get(SeasonRepository)
+    return None if season_repository.get_season_by_year(season_year) is None else season_year
+
+
+def _get_league_name(value: Any) -> Optional[str]:
+    if not value:
+        return None
+
+    league_repository = injector.get(LeagueRepository)
+    league = league_repository.get_league_by_name(str(value).strip())
+    return None if league is None else league.short_name
+
+
 @blueprint.route('/offense')
 def offense():
     global selected_year
@@ -121,7 +165,7 @@ def offense():
 
     return render_template(
         'season_rankings/offense.html',
-        seasons=seasons, selected_year=selected_year, leagues=leagues, selected_league_name=selected_league_name,
+        selected_year=selected_year, selected_league_name=selected_league_name,
         types=RANKING_TYPES, selected_type=selected_type, season_rankings=season_rankings
     )
 
@@ -135,7 +179,7 @@ def defense():
 
     return render_template(
         'season_rankings/defense.html',
-        seasons=seasons, selected_year=selected_year, leagues=leagues, selected_league_name=selected_league_name,
+        selected_year=selected_year, selected_league_name=selected_league_name,
         types=RANKING_TYPES, selected_type=selected_type, season_rankings=season_rankings
     )
 
@@ -149,6 +193,6 @@ def total():
 
     return render_template(
         'season_rankings/total.html',
-        seasons=seasons, selected_year=selected_year, leagues=leagues, selected_league_name=selected_league_name,
+        selected_year=selected_year, selected_league_name=selected_league_name,
         types=RANKING_TYPES, selected_type=selected_type, season_rankings=season_rankings
     )
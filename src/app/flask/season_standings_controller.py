@@ -2,7 +2,7 @@ from flask import Blueprint, render_template, request
 
 from app import injector
 from app.data.repositories.season_repository import SeasonRepository
-from app.data.repositories.season_standings_repository import SeasonStandingsRepository
+from app.services.season_standings_service.season_standings_service import SeasonStandingsService
 
 blueprint = Blueprint('season_standings', __name__)
 
@@ -16,7 +16,7 @@ def index() -> str:
     global selected_year
 
     season_repository = injector.get(SeasonRepository)
-    seasons = season_repository.get_seasons()
+    seasons = season_repository.get_season_records()
 
     season_standings = []
     return render_template(
@@ -31,9 +31,9 @@ def select_season() -> str:
     global selected_year
 
     selected_year = int(request.form.get('season_dropdown'))  # Fetch the selected season.
-    season_standings_repository = injector.get(SeasonStandingsRepository)
+    season_standings_service = injector.get(SeasonStandingsService)
 
-    season_standings = season_standings_repository.get_season_standings_by_season_year(season_year=selected_year)
+    season_standings = season_standings_service.get_season_standings(selected_year)
     return render_template(
         'season_standings/index.html',
         seasons=seasons, selected_year=selected_year, season_standings=season_standings
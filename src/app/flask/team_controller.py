@@ -18,7 +18,7 @@ team_repository = injector.get(TeamRepository)
 def index() -> str:
     global team_repository
 
-    teams = team_repository.get_teams()
+    teams = team_repository.get_team_rows()
     return render_template('teams/index.html', teams=teams)
 
 
@@ -29,7 +29,8 @@ def details(id: int) -> str:
     form = DeleteTeamForm()
     try:
         team = team_repository.get_team(id)
-        return render_template('teams/details.html', team=team, form=form)
+        summary = team_repository.get_franchise_summary(team.name) if team else None
+        return render_template('teams/details.html', team=team, summary=summary, form=form)
     except IndexError:
         abort(404)
 
@@ -0,0 +1,186 @@
+import gc
+import os
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+from flask import Flask
+
+from app import injector
+from app.data.data_versions import data_versions
+from app.data.reference_data import reference_data_cache
+from app.data.repositories.conference_repository import ConferenceRepository
+from app.data.repositories.division_repository import DivisionRepository
+from app.data.repositories.league_repository import LeagueRepository
+from app.data.repositories.search_repository import SearchRepository
+from app.data.repositories.season_repository import SeasonRepository
+from app.data.repositories.season_snapshot_repository import SeasonSnapshotRepository
+from app.data.repositories.team_repository import TeamRepository
+from app.data.search_index import search_index
+from app.data.sqla import sqla
+
+_KIB = 1024
+
+
+class MemoryUsage(NamedTuple):
+    """
+    Class to represent the memory of one process, in bytes. Pages shared copy-on-write with the master count in
+    shared, and only the pages a worker has written to count in private. A value is None where the platform does
+    not report it.
+    """
+    rss: Optional[int]
+    pss: Optional[int]
+    shared: Optional[int]
+    private: Optional[int]
+
+    def __str__(self):
+        return ', '.join(
+            f"{name}={'n/a' if value is None else f'{value / _KIB / _KIB:.1f} MiB'}"
+            for name, value in self._asdict().items()
+        )
+
+
+def warm_caches(app: Flask) -> Dict[str, float]:
+    """
+    Loads the data versions, the reference data, the snapshot of every season and the search index of this
+    process, and then closes the connections opened to load them, which must not be shared with forked workers.
+
+    The versions are read first, so that every cache is keyed on the versions current when it was loaded. The
+    versions are kept in the data store and shared by every process, so a worker forked with these caches still
+    loads again whatever another worker, or a command run from the shell, has changed since.
+
+    :param app: The app whose data is loaded.
+
+    :return: The seconds taken by each cache, by name.
+    """
+    steps: Tuple[Tuple[str, Callable[[], Any]], ...] = (
+        ('data versions', data_versions.refresh),
+        ('reference data', _warm_reference_data),
+        ('season snapshots', _warm_season_snapshots),
+        ('search index', injector.get(SearchRepository).rebuild),
+    )
+
+    durations = {}
+    with app.app_context():
+        try:
+            for name, warm in steps:
+                start = time.perf_counter()
+                warm()
+                durations[name] = time.perf_counter() - start
+        finally:
+            sqla.session.remove()
+            for engine in sqla.engines.values():
+                engine.dispose()
+    return durations
+
+
+def prepare_master(app: Flask, log: Any) -> None:
+    """
+    Rebuilds the caches of the master process and freezes its heap, so that the workers forked afterwards start
+    warm and share those pages with the master copy-on-write. It runs before the first workers are forked and again
+    on a graceful reload, before the new workers replace the old ones.
+
+    :param app: The app built by the master.
+    :param log: The logger to report the warm-up to.
+
+    :return: None
+    """
+    gc.unfreeze()
+    reference_data_cache.invalidate()
+    injector.get(SeasonSnapshotRepository).clear()
+    search_index.clear()
+
+    durations = warm_caches(app)
+    frozen = freeze_heap()
+    log.info(
+        "Master %s warmed its caches in %.1f ms (%s) and froze %d objects; memory: %s.",
+        os.getpid(), 1000 * sum(durations.values()),
+        ', '.join(f"{name} {1000 * seconds:.1f} ms" for name, seconds in durations.items()),
+        frozen, get_memory_usage()
+    )
+
+
+def freeze_heap() -> int:
+    """
+    Collects garbage and then moves every surviving object to the permanent generation. The collector no longer
+    visits those objects, so it does not write to their pages, and forked workers keep sharing them.
+
+    :return: The number of frozen objects.
+    """
+    gc.collect()
+    gc.freeze()
+    return gc.get_freeze_count()
+
+
+def report_worker_start(started_at: float, log: Any) -> None:
+    """
+    Reports the cold-start latency and memory of a worker that has just become ready to serve.
+
+    :param started_at: The time.monotonic() value at which the master began to fork the worker.
+    :param log: The logger to report to.
+
+    :return: None
+    """
+    log.info(
+        "Worker %s ready %.1f ms after fork; memory: %s.",
+        os.getpid(), 1000 * (time.monotonic() - started_at), get_memory_usage()
+    )
+
+
+def report_worker_exit(pid: int, log: Any) -> None:
+    """
+    Reports the memory of a worker that is about to exit, which shows how many of the master's pages it has
+    written to while serving.
+
+    :param pid: The process id of the worker.
+    :param log: The logger to report to.
+
+    :return: None
+    """
+    log.info("Worker %s exiting; memory: %s.", pid, get_memory_usage(pid))
+
+
+def get_memory_usage(pid: Optional[int] = None) -> MemoryUsage:
+    """
+    Gets the memory of a process from /proc, on Linux.
+
+    :param pid: The process id, or None for this process.
+
+    :return: The memory of the process. Every value is None where /proc is not available.
+    """
+    path = f"/proc/{'self' if pid is None else pid}/smaps_rollup"
+    try:
+        with open(path) as file:
+            fields = _parse_smaps_rollup(file.read())
+    except OSError:
+        return MemoryUsage(None, None, None, None)
+
+    return MemoryUsage(
+        rss=fields.get('Rss'),
+        pss=fields.get('Pss'),
+        shared=fields.get('Shared_Clean', 0) + fields.get('Shared_Dirty', 0),
+        private=fields.get('Private_Clean', 0) + fields.get('Private_Dirty', 0),
+    )
+
+
+def _parse_smaps_rollup(text: str) -> Dict[str, int]:
+    fields = {}
+    for line in text.splitlines():
+        name, _, value = line.partition(':')
+        parts = value.split()
+        if len(parts) == 2 and parts[1] == 'kB' and parts[0].isdigit():
+            fields[name] = int(parts[0]) * _KIB
+    return fields
+
+
+def _warm_reference_data() -> None:
+    injector.get(SeasonRepository).get_season_records()
+    injector.get(LeagueRepository).get_league_records()
+    injector.get(ConferenceRepository).get_conference_records()
+    injector.get(DivisionRepository).get_division_records()
+    injector.get(TeamRepository).get_team_records()
+
+
+def _warm_season_snapshots() -> None:
+    season_snapshot_repository = injector.get(SeasonSnapshotRepository)
+    for season in injector.get(SeasonRepository).get_season_records():
+        season_snapshot_repository.get_season_snapshot(season.year)
@@ -0,0 +1,442 @@
+import functools
+import glob
+import inspect
+import json
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+# Upper bounds, in seconds, of the buckets of the latency histograms.
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PHASE_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+# Each histogram maps to its help text and the upper bounds of its buckets.
+HISTOGRAMS: Dict[str, Tuple[str, Sequence[float]]] = {
+    'http_request_duration_seconds': ("Time taken to handle a request, by blueprint endpoint.", LATENCY_BUCKETS),
+    'repository_call_duration_seconds': ("Time taken by a repository method call.", LATENCY_BUCKETS),
+    'db_procedure_duration_seconds': ("Time taken by a stored procedure call.", LATENCY_BUCKETS),
+    'weekly_update_phase_duration_seconds': ("Time taken by a phase of the weekly update.", PHASE_BUCKETS),
+}
+
+# How often, at most, a process writes its metrics to the shared directory.
+FLUSH_INTERVAL_SECONDS = 1.0
+
+# The file of the shared directory that keeps the counters and histograms of the processes that have exited.
+EXITED_PROCESSES_FILE_NAME = 'exited.json'
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Sample(NamedTuple):
+    """
+    Class to represent one value of a metric family.
+    """
+    name: str
+    labels: Labels
+    value: float
+
+
+class MetricFamily(NamedTuple):
+    """
+    Class to represent one metric and its samples, as Prometheus exposes it.
+    """
+    name: str
+    type: str
+    help: str
+    samples: List[Sample]
+
+
+class MetricsRegistry:
+    """
+    Records the latency histograms of this process.
+
+    Recording an observation takes one lock and a binary search for its bucket. When a shared directory is given,
+    the process writes its families there at most once a second, and the families of every process are merged when
+    they are exposed, so a scrape of any worker reports all of them. Counters and histograms are summed across
+    processes, including those that have exited, whose files are folded into one by retire(); gauges carry a pid
+    label and are dropped once their process has exited.
+    """
+
+    def __init__(self, histograms: Dict[str, Tuple[str, Sequence[float]]] = HISTOGRAMS) -> None:
+        """
+        Initializes a new instance of the MetricsRegistry class.
+
+        :param histograms: The help text and bucket bounds of each histogram, by name.
+        """
+        self.histograms = histograms
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._values: Dict[Tuple[str, Labels], List[float]] = {}
+        self._collectors: List[Callable[[], Iterable[MetricFamily]]] = []
+        self._resets: List[Callable[[], None]] = []
+        self._flushed_at = 0.0
+
+    def __repr__(self):
+        return f"{type(self).__name__}(histograms={list(self.histograms)})"
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """
+        Records one observation of a histogram.
+
+        :param name: The name of the histogram, one of the histograms of this registry.
+        :param value: The observed value.
+        :param labels: The labels of the observation.
+
+        :return: None
+        """
+        buckets = self.histograms[name][1]
+        index = bisect_left(buckets, value)
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            values = self._values.get(key)
+            if values is None:
+                # One count per bucket, then the count above the last bucket, the sum and the total count.
+                values = self._values[key] = [0] * (len(buckets) + 1) + [0.0, 0]
+            values[index] += 1
+            values[-2] += value
+            values[-1] += 1
+
+    def add_collector(
+            self,
+            collector: Callable[[], Iterable[MetricFamily]],
+            reset: Optional[Callable[[], None]] = None
+    ) -> None:
+        """
+        Adds a function that gets metric families, such as gauges, when the metrics are exposed.
+
+        :param collector: The function.
+        :param reset: A function that resets the counters behind the collector's families, called by clear().
+
+        :return: None
+        """
+        self._collectors.append(collector)
+        if reset is not None:
+            self._resets.append(reset)
+
+    def clear(self) -> None:
+        """
+        Drops every recorded observation, and resets the counters of every collector.
+
+        :return: None
+        """
+        with self._lock:
+            self._values.clear()
+        for reset in self._resets:
+            reset()
+
+    def collect(self) -> List[MetricFamily]:
+        """
+        Gets the metric families of this process.
+
+        :return: The histograms, followed by the families of the collectors.
+        """
+        with self._lock:
+            values = {key: list(value) for key, value in self._values.items()}
+
+        families = []
+        for name, (help_text, buckets) in self.histograms.items():
+            samples = []
+            for (metric_name, labels), counts in sorted(values.items()):
+                if metric_name != name:
+                    continue
+                cumulative = 0
+                for bound, count in zip([*buckets, float('inf')], counts):
+                    cumulative += count
+                    samples.append(Sample(f"{name}_bucket", labels + (('le', _format_bound(bound)),), cumulative))
+                samples.append(Sample(f"{name}_sum", labels, counts[-2]))
+                samples.append(Sample(f"{name}_count", labels, counts[-1]))
+            families.append(MetricFamily(name, 'histogram', help_text, samples))
+
+        for collector in self._collectors:
+            families.extend(collector())
+        return families
+
+    def flush(self, directory: str, force: bool = False) -> None:
+        """
+        Writes the metric families of this process to a shared directory, unless they were written less than a
+        second ago.
+
+        :param directory: The directory.
+        :param force: True to write them however recently they were written.
+
+        :return: None
+        """
+        # Each thread of a worker may flush at the end of its request, so flushes are serialized.
+        with self._flush_lock:
+            now = time.monotonic()
+            if not force and now - self._flushed_at < FLUSH_INTERVAL_SECONDS:
+                return
+            self._flushed_at = now
+            _write_families(os.path.join(directory, f"{os.getpid()}.json"), self.collect())
+
+    def retire(self, directory: str, pid: int) -> None:
+        """
+        Folds the counters and histograms of a process that has exited into the file of the exited processes of a
+        shared directory, and removes the process's own file. Its gauges are dropped.
+
+        :param directory: The directory.
+        :param pid: The process id of the process.
+
+        :return: None
+        """
+        path = os.path.join(directory, f"{pid}.json")
+        families = _read_families(path)
+        if families is None:
+            return
+
+        exited_path = os.path.join(directory, EXITED_PROCESSES_FILE_NAME)
+        processes = [(None, _read_families(exited_path) or []), (None, families)]
+        exited = [family for family in merge_families(processes) if family.type != 'gauge']
+        _write_families(exited_path, exited)
+        os.remove(path)
+
+    def collect_all(self, directory: Optional[str] = None) -> List[MetricFamily]:
+        """
+        Gets the metric families of every process that writes to a shared directory, merged.
+
+        :param directory: The directory, or None to get the families of this process only.
+
+        :return: The merged families.
+        """
+        if directory is None:
+            return self.collect()
+
+        self.flush(directory, force=True)
+        processes = []
+        for path in sorted(glob.glob(os.path.join(directory, '*.json'))):
+            name = os.path.basename(path).split('.')[0]
+            families = _read_families(path)
+            if families is not None:
+                processes.append((int(name) if name.isdigit() else None, families))
+        return merge_families(processes)
+
+
+class CacheCounters:
+    """
+    Counts the hits and misses of one in-process cache, for a metrics collector to expose.
+    """
+
+    def __init__(self, cache: str) -> None:
+        """
+        Initializes a new instance of the CacheCounters class.
+
+        :param cache: The name of the cache, used as the cache label of its metrics.
+        """
+        self.cache = cache
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self):
+        return f"{type(self).__name__}(cache={self.cache!r})"
+
+    def hit(self, count: int = 1) -> None:
+        """
+        Counts reads served from the cache.
+
+        :param count: The number of reads.
+
+        :return: None
+        """
+        with self._lock:
+            self._hits += count
+
+    def miss(self, count: int = 1) -> None:
+        """
+        Counts reads that had to build or rebuild the cached value.
+
+        :param count: The number of reads.
+
+        :return: None
+        """
+        with self._lock:
+            self._misses += count
+
+    def get(self) -> Tuple[int, int]:
+        """
+        Gets the counts.
+
+        :return: The number of hits and the number of misses.
+        """
+        with self._lock:
+            return self._hits, self._misses
+
+    def reset(self) -> None:
+        """
+        Resets the counts.
+
+        :return: None
+        """
+        with self._lock:
+            self._hits = self._misses = 0
+
+
+def merge_families(processes: Iterable[Tuple[Optional[int], List[MetricFamily]]]) -> List[MetricFamily]:
+    """
+    Merges the metric families of several processes.
+
+    :param processes: The process id and metric families of each process. The process id is None for the families
+    of processes that have exited.
+
+    :return: The merged families, in the order in which they were first seen.
+    """
+    merged: Dict[str, Tuple[MetricFamily, Dict[Tuple[str, Labels], float]]] = {}
+    for pid, families in processes:
+        is_alive = pid is not None and _is_alive(pid)
+        for family in families:
+            entry = merged.setdefault(family.name, (family, {}))
+            if family.type == 'gauge' and not is_alive:
+                continue
+            totals = entry[1]
+            for sample in family.samples:
+                key = (sample.name, sample.labels)
+                totals[key] = totals.get(key, 0) + sample.value
+    return [
+        MetricFamily(family.name, family.type, family.help, [Sample(name, labels, value) for (name, labels), value in
+                                                             totals.items()])
+        for family, totals in merged.values()
+    ]
+
+
+def format_prometheus(families: Iterable[MetricFamily]) -> str:
+    """
+    Formats metric families in the Prometheus text exposition format.
+
+    :param families: The families.
+
+    :return: The text.
+    """
+    lines = []
+    for family in families:
+        lines.append(f"# HELP {family.name} {family.help}")
+        lines.append(f"# TYPE {family.name} {family.type}")
+        for sample in family.samples:
+            labels = ','.join(f'{name}="{_escape(value)}"' for name, value in sample.labels)
+            lines.append(f"{sample.name}{{{labels}}} {_format_value(sample.value)}" if labels
+                         else f"{sample.name} {_format_value(sample.value)}")
+    return '\n'.join(lines) + '\n'
+
+
+def instrumented(cls: type) -> type:
+    """
+    Times every public method of a repository class in the repository_call_duration_seconds histogram. The
+    stream_* methods, and generator methods, return iterators that read their rows as they are consumed; their
+    calls are timed until the iterator is exhausted or closed, counting only the time spent producing rows.
+    """
+    for name, member in list(vars(cls).items()):
+        if name.startswith('_') or not inspect.isfunction(member):
+            continue
+        setattr(cls, name, _timed(member, cls.__name__, name))
+    return cls
+
+
+def _timed(func: Callable, repository: str, method: str) -> Callable:
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                metrics.observe(
+                    'repository_call_duration_seconds', time.perf_counter() - start,
+                    repository=repository, method=method
+                )
+
+        return async_wrapper
+
+    if method.startswith('stream_') or inspect.isgeneratorfunction(func):
+        @functools.wraps(func)
+        def stream_wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            iterator = iter(func(*args, **kwargs))
+            return _timed_iteration(iterator, time.perf_counter() - start, repository, method)
+
+        return stream_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            metrics.observe(
+                'repository_call_duration_seconds', time.perf_counter() - start, repository=repository, method=method
+            )
+
+    return wrapper
+
+
+def _timed_iteration(iterator: Iterator, elapsed: float, repository: str, method: str) -> Iterator:
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                elapsed += time.perf_counter() - start
+            yield item
+    finally:
+        close = getattr(iterator, 'close', None)
+        if close is not None:
+            close()
+        metrics.observe('repository_call_duration_seconds', elapsed, repository=repository, method=method)
+
+
+def _read_families(path: str) -> Optional[List[MetricFamily]]:
+    try:
+        with open(path) as file:
+            return [_load_family(family) for family in json.load(file)]
+    except (OSError, ValueError):
+        return None
+
+
+def _write_families(path: str, families: Iterable[MetricFamily]) -> None:
+    # Each write goes to a temporary file of its own, which then replaces the file, so readers never see part of it.
+    descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'w') as file:
+            json.dump([family._asdict() for family in families], file)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+
+
+def _load_family(family: Dict[str, Any]) -> MetricFamily:
+    return MetricFamily(
+        family['name'], family['type'], family['help'],
+        [Sample(name, tuple(tuple(label) for label in labels), value) for name, labels, value in family['samples']]
+    )
+
+
+def _is_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _format_bound(bound: float) -> str:
+    return '+Inf' if bound == float('inf') else repr(float(bound))
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+metrics = MetricsRegistry()
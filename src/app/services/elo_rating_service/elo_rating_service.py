@@ -0,0 +1,177 @@
+import math
+from decimal import Decimal
+from typing import Optional, Tuple
+
+from injector import inject
+
+from app.data.models.game import Game
+from app.data.models.team_season import TeamSeason
+from app.data.repositories.game_repository import GameRepository
+from app.data.repositories.team_season_repository import TeamSeasonRepository
+from app.data.session_routing import use_primary
+from app.data.sqla import try_commit
+from app.services.utilities import guard
+from app.services.utilities.utils import typename
+
+ELO_INITIAL_RATING = Decimal('1500')
+ELO_K_FACTOR = 20.0
+ELO_HOME_FIELD_ADVANTAGE = 65.0
+ELO_QUANTUM = Decimal('1e-13')
+
+
+class EloRatingService:
+    """
+    A service to keep an Elo rating on every team season current as games are added, edited, and deleted.
+
+    Each game records the rating points that its host gained from it, which its guest lost, so the game can later be
+    reversed exactly. Ratings depend on the order of the games; replay_season() rebuilds a season's ratings from its
+    games in week order after games are entered out of order.
+    """
+
+    @inject
+    def __init__(self, game_repository: GameRepository, team_season_repository: TeamSeasonRepository) -> None:
+        """
+        Initializes a new instance of the EloRatingService class.
+
+        :param game_repository: The repository from which the games of a replayed season will be fetched.
+        :param team_season_repository: The repository from which the team seasons of each game will be fetched.
+        """
+        self.game_repository = game_repository
+        self.team_season_repository = team_season_repository
+
+    def __repr__(self):
+        return (
+            f"{typename(self)}("
+            f"game_repository={self.game_repository}, "
+            f"team_season_repository={self.team_season_repository}"
+            f")"
+        )
+
+    def rate_game(self, game: Optional[Game]) -> None:
+        """
+        Applies a game's result to the Elo ratings of its teams and records the change on the game.
+
+        The changes are made in the current session and saved with the game.
+
+        :param game: The game to rate.
+
+        :return: None
+
+        :raises ValueError: If the game argument is None.
+        """
+        guard.raise_if_none(game, f"{typename(self)}.rate_game: game")
+
+        guest_season, host_season = self._get_team_seasons(game)
+        game.elo_delta = calculate_elo_delta(
+            get_elo_rating(guest_season), game.guest_score, get_elo_rating(host_season), game.host_score
+        )
+        _shift_elo_rating(host_season, game.elo_delta)
+        _shift_elo_rating(guest_season, -game.elo_delta)
+
+    def unrate_game(self, game: Optional[Game]) -> None:
+        """
+        Reverses the change that a game made to the Elo ratings of its teams.
+
+        :param game: The game to reverse. A game without a recorded change is ignored.
+
+        :return: None
+
+        :raises ValueError: If the game argument is None.
+        """
+        guard.raise_if_none(game, f"{typename(self)}.unrate_game: game")
+
+        if game.elo_delta is None:
+            return
+
+        guest_season, host_season = self._get_team_seasons(game)
+        _shift_elo_rating(host_season, -game.elo_delta)
+        _shift_elo_rating(guest_season, game.elo_delta)
+
+    @use_primary()
+    def replay_season(self, season_year: int) -> int:
+        """
+        Rebuilds the Elo ratings of every team season of one season by rating its games in order, in one pass.
+
+        The team seasons and games are read from the primary engine, since the ratings are written back to them.
+
+        :param season_year: The year of the season to replay.
+
+        :return: The number of games rated.
+
+        :raises ValueError: If the season_year argument is None.
+        """
+        guard.raise_if_none(season_year, f"{typename(self)}.replay_season: season_year")
+
+        team_seasons = {
+            team_season.team_name: team_season
+            for team_season in self.team_season_repository.get_team_seasons_by_season_year(season_year)
+        }
+        for team_season in team_seasons.values():
+            team_season.elo_rating = ELO_INITIAL_RATING
+
+        games = sorted(self.game_repository.get_games_by_season_year(season_year), key=lambda g: (g.week, g.id))
+        for game in games:
+            guest_season = team_seasons.get(game.guest_name)
+            host_season = team_seasons.get(game.host_name)
+            game.elo_delta = calculate_elo_delta(
+                get_elo_rating(guest_season), game.guest_score, get_elo_rating(host_season), game.host_score
+            )
+            _shift_elo_rating(host_season, game.elo_delta)
+            _shift_elo_rating(guest_season, -game.elo_delta)
+
+        try_commit()
+        return len(games)
+
+    def _get_team_seasons(self, game: Game) -> Tuple[Optional[TeamSeason], Optional[TeamSeason]]:
+        return (
+            self.team_season_repository.get_team_season_by_team_name_and_season_year(game.guest_name,
+                                                                                      game.season_year),
+            self.team_season_repository.get_team_season_by_team_name_and_season_year(game.host_name,
+                                                                                     game.season_year),
+        )
+
+
+def get_elo_rating(team_season: Optional[TeamSeason]) -> Decimal:
+    """
+    Gets the Elo rating of a team season, which starts at ELO_INITIAL_RATING.
+
+    :param team_season: The team season, or None for a team without a team season.
+
+    :return: The team season's Elo rating.
+    """
+    if team_season is None or team_season.elo_rating is None:
+        return ELO_INITIAL_RATING
+
+    return Decimal(team_season.elo_rating)
+
+
+def calculate_elo_delta(guest_rating: Decimal, guest_score: int, host_rating: Decimal, host_score: int) -> Decimal:
+    """
+    Calculates the Elo rating points that a game's host gains, and its guest loses, from the game's result.
+
+    The host's expected result includes a home-field advantage, and the change grows with the margin of victory,
+    damped when the favorite wins so that ratings do not run away.
+
+    :param guest_rating: The guest's rating before the game.
+    :param guest_score: The guest's score.
+    :param host_rating: The host's rating before the game.
+    :param host_score: The host's score.
+
+    :return: The host's gain, rounded to the scale of the stored ratings.
+    """
+    rating_difference = float(host_rating) + ELO_HOME_FIELD_ADVANTAGE - float(guest_rating)
+    expected = 1.0 / (1.0 + 10.0 ** (-rating_difference / 400.0))
+    margin = host_score - guest_score
+    if margin == 0:
+        actual, multiplier = 0.5, 1.0
+    else:
+        actual = 1.0 if margin > 0 else 0.0
+        winner_difference = rating_difference if margin > 0 else -rating_difference
+        multiplier = math.log(abs(margin) + 1) * 2.2 / (winner_difference * 0.001 + 2.2)
+
+    return Decimal(repr(ELO_K_FACTOR * multiplier * (actual - expected))).quantize(ELO_QUANTUM)
+
+
+def _shift_elo_rating(team_season: Optional[TeamSeason], amount: Decimal) -> None:
+    if team_season is not None:
+        team_season.elo_rating = get_elo_rating(team_season) + amount
@@ -0,0 +1,123 @@
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple, Type, Union
+
+from app.services.utilities import guard
+from app.services.utilities.utils import typename
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[Sequence[Any]], None]
+EventTypes = Union[Type, Tuple[Type, ...]]
+
+_pending_events: ContextVar[Optional[List[Any]]] = ContextVar('pending_events', default=None)
+
+
+class EventBus:
+    """
+    An in-process bus through which services announce committed changes to subscribers.
+
+    Every handler is called with a list of the events of the types that it subscribed to. Outside a batch each
+    published event is delivered at once, as a list of one; within batch() the events are held and delivered
+    together when the batch ends, so that a bulk operation reaches each subscriber as one coalesced call.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the EventBus class.
+        """
+        self._lock = threading.Lock()
+        self._subscriptions: List[Tuple[EventTypes, Handler]] = []
+
+    def __repr__(self):
+        return f"{typename(self)}(subscriptions={len(self._subscriptions)})"
+
+    def subscribe(self, event_types: EventTypes, handler: Handler) -> Handler:
+        """
+        Registers a handler for one or more event types, including their subclasses.
+
+        :param event_types: The event type, or tuple of event types, to handle.
+        :param handler: The callable to which lists of events will be delivered.
+
+        :return: The handler, so that subscribe may be used to decorate it.
+
+        :raises ValueError: If the event_types or handler argument is None.
+        """
+        guard.raise_if_none(event_types, f"{typename(self)}.subscribe: event_types")
+        guard.raise_if_none(handler, f"{typename(self)}.subscribe: handler")
+
+        with self._lock:
+            self._subscriptions.append((event_types, handler))
+        return handler
+
+    def unsubscribe(self, handler: Handler) -> None:
+        """
+        Removes every registration of a handler.
+
+        :param handler: The handler to remove.
+
+        :return: None
+        """
+        with self._lock:
+            self._subscriptions = [
+                (event_types, subscribed) for event_types, subscribed in self._subscriptions if subscribed != handler
+            ]
+
+    def publish(self, event: Any) -> None:
+        """
+        Delivers an event to its subscribers, or holds it until the end of the current batch.
+
+        Publish only after the change that the event describes has been committed.
+
+        :param event: The event to publish.
+
+        :return: None
+
+        :raises ValueError: If the event argument is None.
+        """
+        guard.raise_if_none(event, f"{typename(self)}.publish: event")
+
+        pending = _pending_events.get()
+        if pending is not None:
+            pending.append(event)
+        else:
+            self._deliver([event])
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Holds the events published within the block and delivers them together when it ends.
+
+        Batches may be nested; the events are delivered when the outermost batch ends. They are delivered even if the
+        block raises, since every published event describes a change that was already committed.
+        """
+        if _pending_events.get() is not None:
+            yield
+            return
+
+        pending: List[Any] = []
+        token = _pending_events.set(pending)
+        try:
+            yield
+        finally:
+            _pending_events.reset(token)
+            self._deliver(pending)
+
+    def _deliver(self, events: List[Any]) -> None:
+        if not events:
+            return
+
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+
+        for event_types, handler in subscriptions:
+            handled = [event for event in events if isinstance(event, event_types)]
+            if not handled:
+                continue
+            try:
+                handler(handled)
+            except Exception:
+                # One failing subscriber must neither undo the committed write nor starve the other subscribers.
+                logger.exception("Event handler %r failed.", handler)
@@ -0,0 +1,97 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Optional, Tuple
+
+from app.data.models.game import Game
+
+
+@dataclass(frozen=True)
+class GameValues:
+    """
+    Class to represent the values of one game at the time of an event, detached from the data store.
+    """
+    id: Optional[int]
+    season_year: int
+    week: int
+    guest_name: str
+    guest_score: int
+    host_name: str
+    host_score: int
+    winner_name: Optional[str] = None
+    loser_name: Optional[str] = None
+    is_playoff: bool = False
+    elo_delta: Optional[Decimal] = None
+
+    @classmethod
+    def from_game(cls, game: Game) -> 'GameValues':
+        """
+        Copies the values of a game.
+
+        :param game: The game to copy.
+
+        :return: The game's values.
+        """
+        return cls(
+            id=game.id,
+            season_year=game.season_year,
+            week=game.week,
+            guest_name=game.guest_name,
+            guest_score=game.guest_score,
+            host_name=game.host_name,
+            host_score=game.host_score,
+            winner_name=game.winner_name,
+            loser_name=game.loser_name,
+            is_playoff=bool(game.is_playoff),
+            elo_delta=game.elo_delta,
+        )
+
+
+@dataclass(frozen=True)
+class GameEvent:
+    """
+    Base class for the events published after a game write has been committed.
+    """
+
+    @property
+    def season_years(self) -> Tuple[int, ...]:
+        """
+        Gets the years of the seasons changed by the event.
+        """
+        raise NotImplementedError(f"{type(self).__name__}.season_years must be implemented in a subclass.")
+
+
+@dataclass(frozen=True)
+class GameAdded(GameEvent):
+    """
+    Published after a game has been added.
+    """
+    game: GameValues
+
+    @property
+    def season_years(self) -> Tuple[int, ...]:
+        return self.game.season_year,
+
+
+@dataclass(frozen=True)
+class GameUpdated(GameEvent):
+    """
+    Published after a game has been edited, with its values before and after the edit.
+    """
+    old_game: GameValues
+    new_game: GameValues
+
+    @property
+    def season_years(self) -> Tuple[int, ...]:
+        return tuple(sorted({self.old_game.season_year, self.new_game.season_year}))
+
+
+@dataclass(frozen=True)
+class GameDeleted(GameEvent):
+    """
+    Published after a game has been deleted, with its values before the deletion.
+    """
+    game: GameValues
+
+    @property
+    def season_years(self) -> Tuple[int, ...]:
+        return self.game.season_year,
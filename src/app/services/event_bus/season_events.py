@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RankingsUpdated:
+    """
+    Published after the weekly update has committed new rankings for the team seasons of a season.
+    """
+    season_year: int
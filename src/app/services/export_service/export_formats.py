@@ -0,0 +1,88 @@
+import csv
+import io
+import json
+import zlib
+from decimal import Decimal
+from typing import Any, Iterable, Iterator, Sequence
+
+# The number of characters gathered into each chunk before it is handed on.
+CHUNK_SIZE = 64 * 1024
+
+# Tells zlib to write a gzip header and trailer around the deflate stream.
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def iter_csv(columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> Iterator[str]:
+    """
+    Writes rows as CSV text, a chunk at a time.
+
+    :param columns: The column names, written as the header line.
+    :param rows: The rows, each with one value per column.
+
+    :return: An iterator over chunks of the CSV text.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= CHUNK_SIZE:
+            yield _drain(buffer)
+    if buffer.tell():
+        yield _drain(buffer)
+
+
+def iter_json(columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> Iterator[str]:
+    """
+    Writes rows as a JSON array of objects, a chunk at a time. Decimal values are written as strings so that they
+    keep their exact value, as the JSON responses of the app do.
+
+    :param columns: The column names, used as the keys of each object.
+    :param rows: The rows, each with one value per column.
+
+    :return: An iterator over chunks of the JSON text.
+    """
+    buffer = io.StringIO()
+    buffer.write('[')
+    separator = '\n'
+    for row in rows:
+        buffer.write(separator)
+        buffer.write(json.dumps(dict(zip(columns, row)), default=_to_json))
+        separator = ',\n'
+        if buffer.tell() >= CHUNK_SIZE:
+            yield _drain(buffer)
+    buffer.write('\n]\n')
+    yield _drain(buffer)
+
+
+def encode_chunks(chunks: Iterable[str], compress: bool = False) -> Iterator[bytes]:
+    """
+    Encodes text chunks as UTF-8, optionally compressing them into one gzip stream as they pass.
+
+    :param chunks: The text chunks.
+    :param compress: True to gzip the chunks.
+
+    :return: An iterator over the encoded chunks. Empty chunks are skipped.
+    """
+    compressor = zlib.compressobj(wbits=_GZIP_WBITS) if compress else None
+    for chunk in chunks:
+        data = chunk.encode('utf-8')
+        if compressor is not None:
+            data = compressor.compress(data)
+        if data:
+            yield data
+    if compressor is not None:
+        yield compressor.flush()
+
+
+def _drain(buffer: io.StringIO) -> str:
+    text = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return text
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,147 @@
+from dataclasses import astuple
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+from injector import inject
+
+from app.data.models.team_season import RANKING_COLUMNS
+from app.data.repositories.game_repository import GAME_LIST_COLUMNS, GameRepository
+from app.data.repositories.season_repository import SeasonRepository
+from app.data.repositories.team_season_repository import TEAM_SEASON_LIST_COLUMNS, TeamSeasonRepository
+from app.services.export_service.export_formats import encode_chunks, iter_csv, iter_json
+from app.services.season_standings_service.season_standing import SeasonStanding
+from app.services.season_standings_service.season_standings_service import get_season_standings
+from app.services.season_standings_service.tiebreaker_tables import TiebreakerTables
+from app.services.utilities.utils import typename
+
+EXPORT_KINDS = ('games', 'team_seasons', 'standings', 'rankings')
+
+# Each format maps to its media type and the function that writes rows in it.
+EXPORT_FORMATS: Dict[str, Tuple[str, Callable[[Sequence[str], Iterable[Sequence[Any]]], Iterator[str]]]] = {
+    'csv': ('text/csv', iter_csv),
+    'json': ('application/json', iter_json),
+}
+
+GAME_EXPORT_COLUMNS = tuple(column.key for column in GAME_LIST_COLUMNS)
+TEAM_SEASON_EXPORT_COLUMNS = tuple(column.key for column in TEAM_SEASON_LIST_COLUMNS)
+STANDINGS_EXPORT_COLUMNS = ('season_year',) + tuple(SeasonStanding.__dataclass_fields__)
+RANKINGS_EXPORT_COLUMNS = ('season_year', 'team_name', 'league_name', 'wins', 'losses', 'ties') + RANKING_COLUMNS
+
+
+class ExportService:
+    """
+    A service to export games, team seasons, standings and rankings over a range of seasons as CSV or JSON.
+
+    Exports are generated lazily. Games and team seasons are streamed from the data store a batch at a time, and
+    standings are worked out one season at a time, so an export of the whole history runs in constant memory. An
+    export must be consumed while the session it was started in is open.
+    """
+
+    @inject
+    def __init__(
+            self,
+            game_repository: GameRepository,
+            team_season_repository: TeamSeasonRepository,
+            season_repository: SeasonRepository
+    ) -> None:
+        """
+        Initializes a new instance of the ExportService class.
+
+        :param game_repository: The repository from which the games will be streamed.
+        :param team_season_repository: The repository from which the team seasons will be streamed.
+        :param season_repository: The repository from which the seasons to work out standings for will be fetched.
+        """
+        self.game_repository = game_repository
+        self.team_season_repository = team_season_repository
+        self.season_repository = season_repository
+
+    def __repr__(self):
+        return (
+            f"{typename(self)}("
+            f"game_repository={self.game_repository}, "
+            f"team_season_repository={self.team_season_repository}, "
+            f"season_repository={self.season_repository}"
+            f")"
+        )
+
+    def export(
+            self,
+            kind: str,
+            export_format: str,
+            first_season_year: Optional[int] = None,
+            last_season_year: Optional[int] = None,
+            compress: bool = False
+    ) -> Iterator[bytes]:
+        """
+        Exports one kind of data over a range of seasons.
+
+        :param kind: The kind of data to export, one of the EXPORT_KINDS.
+        :param export_format: The format to export in, one of the EXPORT_FORMATS.
+        :param first_season_year: The first season to include, or None to start with the first season.
+        :param last_season_year: The last season to include, or None to end with the last season.
+        :param compress: True to gzip the export.
+
+        :return: An iterator over the chunks of the export.
+
+        :raises ValueError: If the kind or format is not known.
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format: {export_format}. Choose one of: {', '.join(EXPORT_FORMATS)}.")
+        columns, rows = self.get_rows(kind, first_season_year, last_season_year)
+        write = EXPORT_FORMATS[export_format][1]
+        return encode_chunks(write(columns, rows), compress)
+
+    def get_rows(
+            self, kind: str, first_season_year: Optional[int] = None, last_season_year: Optional[int] = None
+    ) -> Tuple[Sequence[str], Iterator[Sequence[Any]]]:
+        """
+        Gets the columns and a lazy iterator over the rows of one kind of data over a range of seasons.
+
+        :param kind: The kind of data, one of the EXPORT_KINDS.
+        :param first_season_year: The first season to include, or None to start with the first season.
+        :param last_season_year: The last season to include, or None to end with the last season.
+
+        :return: The column names, and an iterator over the rows.
+
+        :raises ValueError: If the kind is not known.
+        """
+        if kind == 'games':
+            return GAME_EXPORT_COLUMNS, self._iter_game_rows(first_season_year, last_season_year)
+        if kind == 'team_seasons':
+            return TEAM_SEASON_EXPORT_COLUMNS, self._iter_team_season_rows(first_season_year, last_season_year)
+        if kind == 'standings':
+            return STANDINGS_EXPORT_COLUMNS, self._iter_standings_rows(first_season_year, last_season_year)
+        if kind == 'rankings':
+            return RANKINGS_EXPORT_COLUMNS, self._iter_rankings_rows(first_season_year, last_season_year)
+        raise ValueError(f"Unknown export kind: {kind}. Choose one of: {', '.join(EXPORT_KINDS)}.")
+
+    def _iter_game_rows(self, first_season_year: Optional[int], last_season_year: Optional[int]) -> Iterator[Tuple]:
+        for row in self.game_repository.stream_game_rows(first_season_year, last_season_year):
+            yield tuple(row)
+
+    def _iter_team_season_rows(
+            self, first_season_year: Optional[int], last_season_year: Optional[int]
+    ) -> Iterator[Tuple]:
+        for row in self.team_season_repository.stream_team_season_rows(first_season_year, last_season_year):
+            yield tuple(row)
+
+    def _iter_rankings_rows(
+            self, first_season_year: Optional[int], last_season_year: Optional[int]
+    ) -> Iterator[Tuple]:
+        for row in self.team_season_repository.stream_team_season_rows(first_season_year, last_season_year):
+            yield tuple(getattr(row, column) for column in RANKINGS_EXPORT_COLUMNS)
+
+    def _iter_standings_rows(
+            self, first_season_year: Optional[int], last_season_year: Optional[int]
+    ) -> Iterator[Tuple]:
+        season_years = sorted(
+            season.year for season in self.season_repository.get_season_records()
+            if (first_season_year is None or season.year >= first_season_year)
+            and (last_season_year is None or season.year <= last_season_year)
+        )
+        for season_year in season_years:
+            # Only one season's rows are held at a time.
+            team_season_rows = self.team_season_repository.get_team_season_rows_by_season_year(season_year)
+            game_rows = self.game_repository.get_game_rows_by_season_year(season_year)
+            tables = TiebreakerTables(team_season_rows, game_rows)
+            for standing in get_season_standings(team_season_rows, tables):
+                yield (season_year,) + astuple(standing)
@@ -0,0 +1,248 @@
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Sequence, Set, Tuple
+
+from injector import inject
+
+from app.data.data_versions import data_versions
+from app.data.repositories.game_repository import GameRepository
+from app.data.repositories.scheduled_game_repository import ScheduledGameRepository
+from app.metrics import CacheCounters
+from app.services.event_bus.event_bus import EventBus
+from app.services.event_bus.game_events import GameAdded, GameDeleted, GameEvent, GameUpdated
+from app.services.event_bus.season_events import RankingsUpdated
+from app.services.forecast_service.season_forecast import ProjectedStanding, SeasonForecast, WeekForecast
+from app.services.game_predictor_service.game_prediction import Matchup
+from app.services.game_predictor_service.game_predictor_service import GamePredictorService
+from app.services.utilities import guard
+from app.services.utilities.utils import typename
+
+forecast_cache_counters = CacheCounters('forecast')
+
+
+class ForecastService:
+    """
+    A service to forecast whole pro football seasons from their schedules.
+
+    A forecast predicts every scheduled game that has not been played and adds the predictions to the results of the
+    games that have, to project each team's final record. Forecasts are kept per season, with the version of the
+    season's data they were built at. A game write marks only the week it touched as stale, and the next read
+    recomputes just the stale weeks, with one batch prediction for all their unplayed games. New rankings change
+    every prediction, so they drop the season's forecast instead, and so does any change to the season that another
+    process committed, since its events are not received here.
+
+    Each season is forecast under a lock of its own, so reads of other seasons do not wait for its queries.
+    """
+
+    @inject
+    def __init__(
+            self,
+            scheduled_game_repository: ScheduledGameRepository,
+            game_repository: GameRepository,
+            game_predictor_service: GamePredictorService,
+            event_bus: EventBus
+    ) -> None:
+        """
+        Initializes a new instance of the ForecastService class.
+
+        :param scheduled_game_repository: The repository from which the season schedules will be fetched.
+        :param game_repository: The repository from which the played games will be fetched.
+        :param game_predictor_service: The service that will predict the unplayed games.
+        :param event_bus: The bus from which game and rankings events will be received.
+        """
+        self.scheduled_game_repository = scheduled_game_repository
+        self.game_repository = game_repository
+        self.game_predictor_service = game_predictor_service
+        self.event_bus = event_bus
+        self._lock = threading.Lock()
+        self._season_locks: Dict[int, threading.Lock] = defaultdict(threading.Lock)
+        self._forecasts: Dict[int, Tuple[int, SeasonForecast]] = {}
+        self._stale_weeks: Dict[int, Set[int]] = defaultdict(set)
+        event_bus.subscribe((GameAdded, GameUpdated, GameDeleted), self.handle_game_events)
+        event_bus.subscribe(RankingsUpdated, self.handle_rankings_events)
+
+    def __repr__(self):
+        return (
+            f"{typename(self)}("
+            f"scheduled_game_repository={self.scheduled_game_repository}, "
+            f"game_repository={self.game_repository}, "
+            f"game_predictor_service={self.game_predictor_service}, "
+            f"event_bus={self.event_bus}"
+            f")"
+        )
+
+    def get_season_forecast(self, season_year: int) -> SeasonForecast:
+        """
+        Gets the forecast of one season, building it on first use and recomputing any weeks changed since.
+
+        :param season_year: The year of the season to forecast.
+
+        :return: The forecast.
+
+        :raises ValueError: If the season_year argument is None.
+        """
+        guard.raise_if_none(season_year, f"{typename(self)}.get_season_forecast: season_year")
+
+        with self._lock:
+            season_lock = self._season_locks[season_year]
+
+        with season_lock:
+            # The version is read before the season's rows, so a change committed while they are read is
+            # forecast again on the next read.
+            version = data_versions.get(season_year)
+            with self._lock:
+                cached = self._forecasts.get(season_year)
+                stale_weeks = self._stale_weeks.pop(season_year, set())
+
+            # A forecast whose stale weeks are recomputed counts as a miss, like one that is built again.
+            if cached is None or not self._is_current(season_year, cached[0], version, stale_weeks):
+                forecast_cache_counters.miss()
+                forecast = self._build_season_forecast(season_year)
+            elif stale_weeks:
+                forecast_cache_counters.miss()
+                forecast = self._update_season_forecast(cached[1], stale_weeks)
+            else:
+                forecast_cache_counters.hit()
+                forecast = cached[1]
+
+            with self._lock:
+                self._forecasts[season_year] = (version, forecast)
+            return forecast
+
+    def import_schedule(self, scheduled_games: Sequence[Dict[str, Any]]) -> int:
+        """
+        Replaces the schedules of the seasons in a list of scheduled games, and drops their forecasts.
+
+        :param scheduled_games: The scheduled games, as dictionaries of season_year, week, guest_name and host_name.
+
+        :return: The number of scheduled games imported.
+        """
+        count = self.scheduled_game_repository.import_scheduled_games(scheduled_games)
+        self._discard_forecasts(scheduled_game['season_year'] for scheduled_game in scheduled_games)
+        return count
+
+    def handle_game_events(self, events: Sequence[GameEvent]) -> None:
+        """
+        Marks the weeks changed by committed game writes as stale in the forecasts that have been built.
+
+        :param events: The game events.
+
+        :return: None
+        """
+        with self._lock:
+            for event in events:
+                games = (event.old_game, event.new_game) if isinstance(event, GameUpdated) else (event.game,)
+                for game in games:
+                    if game.season_year in self._forecasts:
+                        self._stale_weeks[game.season_year].add(game.week)
+
+    def handle_rankings_events(self, events: Sequence[RankingsUpdated]) -> None:
+        """
+        Drops the forecasts of seasons whose rankings have changed, since every prediction in them is out of date.
+
+        :param events: The rankings events.
+
+        :return: None
+        """
+        self._discard_forecasts(event.season_year for event in events)
+
+    def _discard_forecasts(self, season_years: Iterable[int]) -> None:
+        with self._lock:
+            for season_year in set(season_years):
+                self._forecasts.pop(season_year, None)
+                self._stale_weeks.pop(season_year, None)
+
+    @staticmethod
+    def _is_current(season_year: int, forecast_version: int, version: int, stale_weeks: Set[int]) -> bool:
+        # Changes committed by this process are covered by the stale weeks that its game events marked.
+        if forecast_version == version:
+            return True
+        return bool(stale_weeks) and data_versions.committed_locally(season_year, forecast_version, version)
+
+    def _build_season_forecast(self, season_year: int) -> SeasonForecast:
+        weeks = self._forecast_weeks(
+            season_year,
+            self.game_repository.get_game_rows_by_season_year(season_year),
+            self.scheduled_game_repository.get_scheduled_game_rows_by_season_year(season_year)
+        )
+        return SeasonForecast(season_year, weeks, get_projected_standings(weeks.values()))
+
+    def _update_season_forecast(self, forecast: SeasonForecast, stale_weeks: Set[int]) -> SeasonForecast:
+        season_year = forecast.season_year
+        game_rows = [
+            game for week in sorted(stale_weeks)
+            for game in self.game_repository.get_game_rows_by_season_year_and_week(season_year, week)
+        ]
+        scheduled_game_rows = self.scheduled_game_repository.get_scheduled_game_rows_by_season_year_and_weeks(
+            season_year, sorted(stale_weeks)
+        )
+
+        weeks = {week: week_forecast for week, week_forecast in forecast.weeks.items() if week not in stale_weeks}
+        weeks.update(self._forecast_weeks(season_year, game_rows, scheduled_game_rows))
+        weeks = dict(sorted(weeks.items()))
+        return SeasonForecast(season_year, weeks, get_projected_standings(weeks.values()))
+
+    def _forecast_weeks(
+            self, season_year: int, game_rows: Sequence[Any], scheduled_game_rows: Sequence[Any]
+    ) -> Dict[int, WeekForecast]:
+        results: Dict[int, List[Any]] = defaultdict(list)
+        played = set()
+        for game in game_rows:
+            played.add((game.week, game.guest_name, game.host_name))
+            if not game.is_playoff:
+                results[game.week].append(game)
+
+        unplayed = [
+            scheduled_game for scheduled_game in scheduled_game_rows
+            if (scheduled_game.week, scheduled_game.guest_name, scheduled_game.host_name) not in played
+        ]
+        predictions = defaultdict(list)
+        if unplayed:
+            matchups = [
+                Matchup(scheduled_game.guest_name, season_year, scheduled_game.host_name, season_year)
+                for scheduled_game in unplayed
+            ]
+            for scheduled_game, prediction in zip(
+                    unplayed, self.game_predictor_service.predict_game_scores(matchups)
+            ):
+                predictions[scheduled_game.week].append(prediction)
+
+        return {
+            week: WeekForecast(week, tuple(results[week]), tuple(predictions[week]))
+            for week in sorted(results.keys() | predictions.keys())
+        }
+
+
+def get_projected_standings(weeks: Iterable[WeekForecast]) -> List[ProjectedStanding]:
+    """
+    Adds up the results and predictions of the weeks of a season forecast into each team's projected record.
+
+    Predictions without scores, for team seasons that have not been ranked, are left out.
+
+    :param weeks: The week forecasts.
+
+    :return: The projected standings, best projected winning percentage first.
+    """
+    standings: Dict[str, ProjectedStanding] = {}
+
+    def get_standing(team_name: str) -> ProjectedStanding:
+        if team_name not in standings:
+            standings[team_name] = ProjectedStanding(team_name)
+        return standings[team_name]
+
+    for week in weeks:
+        for game in week.results:
+            get_standing(game.guest_name).add_result(game.guest_score, game.host_score)
+            get_standing(game.host_name).add_result(game.host_score, game.guest_score)
+        for prediction in week.predictions:
+            if prediction.guest_score is None or prediction.host_score is None:
+                continue
+            get_standing(prediction.guest_name).add_prediction(prediction.guest_score, prediction.host_score)
+            get_standing(prediction.host_name).add_prediction(prediction.host_score, prediction.guest_score)
+
+    return sorted(
+        standings.values(),
+        key=lambda standing: (
+            -(standing.projected_winning_percentage or 0), -standing.projected_point_differential, standing.team_name
+        )
+    )
@@ -0,0 +1,142 @@
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.game_predictor_service.game_prediction import GamePrediction
+
+
+@dataclass(frozen=True)
+class WeekForecast:
+    """
+    Class to represent one week of a season forecast: the regular-season games already played and the predicted
+    scores of the scheduled games that have not been.
+    """
+    week: int
+    results: Tuple[Any, ...] = ()
+    predictions: Tuple[GamePrediction, ...] = ()
+
+
+@dataclass
+class ProjectedStanding:
+    """
+    Class to represent one team's record in a season forecast: its actual record so far and the record it is
+    projected to add in its remaining scheduled games.
+    """
+    team_name: str
+    wins: int = 0
+    losses: int = 0
+    ties: int = 0
+    points_for: int = 0
+    points_against: int = 0
+    projected_wins: int = 0
+    projected_losses: int = 0
+    projected_ties: int = 0
+    projected_points_for: float = 0.0
+    projected_points_against: float = 0.0
+
+    @property
+    def total_wins(self) -> int:
+        """
+        Gets the wins so far plus the projected wins.
+        """
+        return self.wins + self.projected_wins
+
+    @property
+    def total_losses(self) -> int:
+        """
+        Gets the losses so far plus the projected losses.
+        """
+        return self.losses + self.projected_losses
+
+    @property
+    def total_ties(self) -> int:
+        """
+        Gets the ties so far plus the projected ties.
+        """
+        return self.ties + self.projected_ties
+
+    @property
+    def projected_winning_percentage(self) -> Optional[float]:
+        """
+        Gets the winning percentage of the full projected record, counting ties as half a win.
+        """
+        games = self.total_wins + self.total_losses + self.total_ties
+        if games == 0:
+            return None
+        return (self.total_wins + self.total_ties / 2) / games
+
+    @property
+    def projected_point_differential(self) -> float:
+        """
+        Gets the points scored minus the points allowed over the full projected season.
+        """
+        return (
+            self.points_for + self.projected_points_for
+            - self.points_against - self.projected_points_against
+        )
+
+    def add_result(self, team_score: int, opponent_score: int) -> None:
+        """
+        Adds one game that the team has played.
+
+        :param team_score: The team's score.
+        :param opponent_score: The opponent's score.
+
+        :return: None
+        """
+        self.points_for += team_score
+        self.points_against += opponent_score
+        if team_score > opponent_score:
+            self.wins += 1
+        elif team_score < opponent_score:
+            self.losses += 1
+        else:
+            self.ties += 1
+
+    def add_prediction(self, team_score: float, opponent_score: float) -> None:
+        """
+        Adds one game that the team is scheduled to play, at its predicted score.
+
+        :param team_score: The team's predicted score.
+        :param opponent_score: The opponent's predicted score.
+
+        :return: None
+        """
+        self.projected_points_for += team_score
+        self.projected_points_against += opponent_score
+        if team_score > opponent_score:
+            self.projected_wins += 1
+        elif team_score < opponent_score:
+            self.projected_losses += 1
+        else:
+            self.projected_ties += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converts the standing to a dictionary of its fields and projected totals, e.g. for a JSON response.
+
+        :return: The dictionary.
+        """
+        return {
+            **asdict(self),
+            'total_wins': self.total_wins,
+            'total_losses': self.total_losses,
+            'total_ties': self.total_ties,
+            'projected_winning_percentage': self.projected_winning_percentage,
+        }
+
+
+@dataclass(frozen=True)
+class SeasonForecast:
+    """
+    Class to represent the forecast of one season: its weeks and the projected standings they add up to.
+    """
+    season_year: int
+    weeks: Dict[int, WeekForecast] = field(default_factory=dict)
+    standings: List[ProjectedStanding] = field(default_factory=list)
+
+    @property
+    def predictions(self) -> List[GamePrediction]:
+        """
+        Gets the predictions of every week, in week order.
+        """
+        return [prediction for week in sorted(self.weeks) for prediction in self.weeks[week].predictions]
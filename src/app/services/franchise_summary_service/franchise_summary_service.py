@@ -0,0 +1,106 @@
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Sequence
+
+from injector import inject
+
+from app.data.models.team_franchise_summary import TeamFranchiseSummary
+from app.data.repositories.team_repository import TeamRepository
+from app.services.event_bus.event_bus import EventBus
+from app.services.event_bus.game_events import GameAdded, GameDeleted, GameEvent, GameUpdated, GameValues
+from app.services.utilities.utils import typename
+
+
+class FranchiseSummaryService:
+    """
+    A service to keep the all-time summary of every team current as games are added, edited, and deleted.
+
+    The service subscribes to the game events of the event bus when it is created, and applies each batch of events
+    to the summaries of the teams that played in them. rebuild_franchise_summaries() rebuilds every summary from the
+    data store, e.g. after games were written without publishing events.
+    """
+
+    @inject
+    def __init__(self, team_repository: TeamRepository, event_bus: EventBus) -> None:
+        """
+        Initializes a new instance of the FranchiseSummaryService class.
+
+        :param team_repository: The repository in which the summaries are stored.
+        :param event_bus: The bus from which game events will be received.
+        """
+        self.team_repository = team_repository
+        self.event_bus = event_bus
+        event_bus.subscribe((GameAdded, GameUpdated, GameDeleted), self.handle_game_events)
+
+    def __repr__(self):
+        return f"{typename(self)}(team_repository={self.team_repository}, event_bus={self.event_bus})"
+
+    def get_franchise_summary(self, team_name: str) -> Optional[TeamFranchiseSummary]:
+        """
+        Gets the all-time summary of the specified team.
+
+        :param team_name: The name of the team.
+
+        :return: The team's summary, or None if the team has no games or team seasons.
+        """
+        return self.team_repository.get_franchise_summary(team_name)
+
+    def handle_game_events(self, events: Sequence[GameEvent]) -> None:
+        """
+        Applies committed game writes to the summaries of the teams that played in them.
+
+        :param events: The game events to apply.
+
+        :return: None
+        """
+        self.team_repository.update_franchise_summaries(get_franchise_changes(events))
+
+    def rebuild_franchise_summaries(self) -> int:
+        """
+        Rebuilds the all-time summary of every team from the games and team seasons in the data store.
+
+        :return: The number of summaries rebuilt.
+        """
+        return self.team_repository.rebuild_franchise_summaries()
+
+
+def get_franchise_changes(events: Iterable[GameEvent]) -> Dict[str, Dict[str, int]]:
+    """
+    Sums the changes that game events make to the all-time game totals of each team.
+
+    :param events: The game events.
+
+    :return: The change in each game total, by team name. Every team that played in a game is included, even if its
+    totals did not change, since its season columns may have.
+    """
+    changes: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    for event in events:
+        if isinstance(event, GameAdded):
+            _add_game(changes, event.game, 1)
+        elif isinstance(event, GameUpdated):
+            _add_game(changes, event.old_game, -1)
+            _add_game(changes, event.new_game, 1)
+        elif isinstance(event, GameDeleted):
+            _add_game(changes, event.game, -1)
+    return {team_name: dict(deltas) for team_name, deltas in changes.items()}
+
+
+def _add_game(changes: Dict[str, Dict[str, int]], game: GameValues, sign: int) -> None:
+    for team_name, team_score, opponent_score in (
+            (game.guest_name, game.guest_score, game.host_score),
+            (game.host_name, game.host_score, game.guest_score),
+    ):
+        if team_score > opponent_score:
+            result = 'wins'
+        elif team_score < opponent_score:
+            result = 'losses'
+        else:
+            result = 'ties'
+
+        deltas = changes[team_name]
+        deltas['games'] += sign
+        deltas[result] += sign
+        deltas['points_for'] += sign * team_score
+        deltas['points_against'] += sign * opponent_score
+        if game.is_playoff:
+            deltas['playoff_games'] += sign
+            deltas[f"playoff_{result}"] += sign
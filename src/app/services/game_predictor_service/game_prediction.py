@@ -0,0 +1,24 @@
+from typing import NamedTuple, Optional
+
+
+class Matchup(NamedTuple):
+    """
+    Class to represent one game to predict: a guest team season against a host team season.
+    """
+    guest_name: str
+    guest_season_year: int
+    host_name: str
+    host_season_year: int
+
+
+class GamePrediction(NamedTuple):
+    """
+    Class to represent the predicted score of one matchup. Both scores are None when either team season is missing
+    or has not been ranked.
+    """
+    guest_name: str
+    guest_season_year: int
+    host_name: str
+    host_season_year: int
+    guest_score: Optional[float]
+    host_score: Optional[float]
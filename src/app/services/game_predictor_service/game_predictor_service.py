@@ -1,6 +1,14 @@
+from collections import defaultdict
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
 from injector import inject
 
-from app.data.repositories.team_season_repository import TeamSeasonRepository
+from app.data.models.season_snapshot import NULL_NUMERIC, TEAM_SEASON_NUMERIC_COLUMNS
+from app.data.repositories.season_snapshot_repository import SeasonSnapshotRepository
+from app.services.game_predictor_service.game_prediction import GamePrediction, Matchup
+
+PREDICTION_COLUMNS = ('offensive_average', 'offensive_factor', 'defensive_average', 'defensive_factor')
 
 
 class GamePredictorService:
@@ -9,17 +17,17 @@ class GamePredictorService:
     """
 
     @inject
-    def __init__(self, team_season_repository: TeamSeasonRepository) -> None:
+    def __init__(self, season_snapshot_repository: SeasonSnapshotRepository) -> None:
         """
         Initializes a new instance of the GamePredictorService class.
 
-        :param team_season_repository: The repository by which team_season data will be fetched
-        for both teams.
+        :param season_snapshot_repository: The repository from whose in-memory season snapshots the team seasons of
+        both teams will be fetched.
         """
-        self.team_season_repository = team_season_repository
+        self.season_snapshot_repository = season_snapshot_repository
 
     def __repr__(self):
-        return f"{type(self).__name__}(team_season_repository={self.team_season_repository})"
+        return f"{type(self).__name__}(season_snapshot_repository={self.season_snapshot_repository})"
 
     def predict_game_score(
             self,
@@ -27,10 +35,10 @@ class GamePredictorService:
             host_name: str, host_season_year: int
     ) -> tuple:
         guest_season = (
-            self.team_season_repository.get_team_season_by_team_name_and_season_year(guest_name, guest_season_year)
+            self.season_snapshot_repository.get_team_season_by_team_name_and_season_year(guest_name, guest_season_year)
         )
         host_season = (
-            self.team_season_repository.get_team_season_by_team_name_and_season_year(host_name, host_season_year)
+            self.season_snapshot_repository.get_team_season_by_team_name_and_season_year(host_name, host_season_year)
         )
         if guest_season is None or host_season is None:
             return None, None
@@ -41,3 +49,67 @@ class GamePredictorService:
                             + guest_season.defensive_factor * host_season.offensive_average) / 2), 1)
 
         return guest_score, host_score
+
+    def predict_game_scores(self, matchups: Sequence[Matchup]) -> List[GamePrediction]:
+        """
+        Predicts the scores of many games at once, such as a whole week's slate.
+
+        Each season's team seasons are read from its snapshot once, however many matchups refer to it, and every
+        score is calculated in one pass over arrays of the teams' rankings. Scores are rounded to one decimal place
+        in floating point, so a score that falls on a rounding boundary may differ from predict_game_score() by 0.1.
+
+        :param matchups: The matchups to predict.
+
+        :return: One prediction per matchup, in the same order.
+        """
+        count = len(matchups)
+        if count == 0:
+            return []
+
+        # Guests take rows [0, count) of each ranking array and hosts take rows [count, 2 * count).
+        teams = [(matchup.guest_name, matchup.guest_season_year) for matchup in matchups]
+        teams += [(matchup.host_name, matchup.host_season_year) for matchup in matchups]
+        rankings = self._get_rankings(teams)
+
+        guest = {name: values[:count] for name, values in rankings.items()}
+        host = {name: values[count:] for name, values in rankings.items()}
+        guest_scores = np.round(
+            (guest['offensive_factor'] * host['defensive_average']
+             + host['defensive_factor'] * guest['offensive_average']) / 2, 1
+        )
+        host_scores = np.round(
+            (host['offensive_factor'] * guest['defensive_average']
+             + guest['defensive_factor'] * host['offensive_average']) / 2, 1
+        )
+
+        predictions = []
+        for matchup, guest_score, host_score in zip(matchups, guest_scores.tolist(), host_scores.tolist()):
+            if np.isnan(guest_score) or np.isnan(host_score):
+                guest_score = host_score = None
+            predictions.append(GamePrediction(*matchup, guest_score=guest_score, host_score=host_score))
+        return predictions
+
+    def _get_rankings(self, teams: List[Tuple[str, int]]) -> Dict[str, np.ndarray]:
+        rankings = {name: np.full(len(teams), np.nan) for name in PREDICTION_COLUMNS}
+
+        rows_by_season_year: Dict[int, List[Tuple[int, str]]] = defaultdict(list)
+        for row, (team_name, season_year) in enumerate(teams):
+            rows_by_season_year[season_year].append((row, team_name))
+
+        for season_year, season_rows in rows_by_season_year.items():
+            snapshot = self.season_snapshot_repository.get_season_snapshot(season_year)
+            rows, indices = [], []
+            for row, team_name in season_rows:
+                index = snapshot.get_team_index(team_name)
+                if index is not None and index < snapshot.team_season_count:
+                    rows.append(row)
+                    indices.append(index)
+            if not rows:
+                continue
+
+            for name in PREDICTION_COLUMNS:
+                values = np.frombuffer(snapshot.get_team_season_column(name), dtype=np.int64)[indices]
+                rankings[name][rows] = np.where(
+                    values == NULL_NUMERIC, np.nan, values / 10.0 ** TEAM_SEASON_NUMERIC_COLUMNS[name]
+                )
+        return rankings
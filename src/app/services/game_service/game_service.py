@@ -1,12 +1,17 @@
-from typing import Optional
+from typing import Dict, Iterable, Optional, Tuple, Union
 
 from injector import inject
 
 from app.data.errors import EntityNotFoundError
 from app.data.models.game import Game
 from app.data.repositories.game_repository import GameRepository
+from app.data.repositories.league_season_repository import LeagueSeasonRepository
 from app.data.repositories.team_season_repository import TeamSeasonRepository
+from app.data.session_routing import use_primary
 from app.services.constants import Direction
+from app.services.elo_rating_service.elo_rating_service import EloRatingService
+from app.services.event_bus.event_bus import EventBus
+from app.services.event_bus.game_events import GameAdded, GameDeleted, GameUpdated, GameValues
 from app.services.game_service.process_game_strategy.process_game_strategy_factory \
     import ProcessGameStrategyFactory
 from app.services.utilities import guard
@@ -22,7 +27,10 @@ class GameService:
             self,
             game_repository: GameRepository,
             team_season_repository: TeamSeasonRepository,
-            process_game_strategy: ProcessGameStrategyFactory
+            process_game_strategy: ProcessGameStrategyFactory,
+            elo_rating_service: EloRatingService,
+            event_bus: EventBus,
+            league_season_repository: LeagueSeasonRepository
     ):
         """
         Initializes a new instance of the GameService class.
@@ -30,16 +38,23 @@ class GameService:
         self.game_repository = game_repository
         self.team_season_repository = team_season_repository
         self.process_game_strategy_factory = process_game_strategy
+        self.elo_rating_service = elo_rating_service
+        self.event_bus = event_bus
+        self.league_season_repository = league_season_repository
 
     def __repr__(self):
         return (
             f"{type(self).__name__}("
             f"game_repository={self.game_repository}, "
             f"team_season_repository={self.team_season_repository}, "
-            f"process_game_strategy_factory={self.process_game_strategy_factory}"
+            f"process_game_strategy_factory={self.process_game_strategy_factory}, "
+            f"elo_rating_service={self.elo_rating_service}, "
+            f"event_bus={self.event_bus}, "
+            f"league_season_repository={self.league_season_repository}"
             f")"
         )
 
+    @use_primary()
     def add_game(self, new_game: Optional[Game]) -> None:
         """
         Adds a game to the data store
@@ -61,9 +76,29 @@ class GameService:
             raise EntityNotFoundError()
 
         new_game.decide_winner_and_loser()
+        self.elo_rating_service.rate_game(new_game)
+        # The league season totals are changed in the transaction that the game's write commits.
+        self._edit_league_season_totals(1, new_game)
         self.game_repository.add_game(new_game)
         self._edit_team_seasons(Direction.UP, new_game)
+        self.event_bus.publish(GameAdded(GameValues.from_game(new_game)))
 
+    def add_games(self, new_games: Iterable[Game]) -> None:
+        """
+        Adds many games to the data store, e.g. a bulk import, and announces them to subscribers in one batch.
+
+        :param new_games: The games to be added to the data store.
+
+        :return: None
+
+        :raises EntityNotFoundError: When a game's teams have no team seasons. The games added before it are kept
+        and announced.
+        """
+        with self.event_bus.batch():
+            for new_game in new_games:
+                self.add_game(new_game)
+
+    @use_primary()
     def update_game(self, new_game: Optional[Game], old_game: Optional[Game]) -> None:
         """
         Edits a game in the data store.
@@ -84,11 +119,19 @@ class GameService:
             raise EntityNotFoundError(
                 f"{type(self).__name__}.update_game: A game with id={id} could not be found.")
 
+        old_values = GameValues.from_game(selected_game)
         new_game.decide_winner_and_loser()
+        # The recorded rating change must be reversed before the game's values are overwritten.
+        self.elo_rating_service.unrate_game(selected_game)
+        self.elo_rating_service.rate_game(new_game)
+        self._edit_league_season_totals(-1, old_values)
+        self._edit_league_season_totals(1, new_game)
         self.game_repository.update_game(new_game)
         self._edit_team_seasons(Direction.DOWN, old_game)
         self._edit_team_seasons(Direction.UP, new_game)
+        self.event_bus.publish(GameUpdated(old_values, GameValues.from_game(new_game)))
 
+    @use_primary()
     def delete_game(self, id: int) -> None:
         """
         Deletes a game from the data store.
@@ -105,9 +148,29 @@ class GameService:
             raise EntityNotFoundError(
                 f"{type(self).__name__}.delete_game: A game with id={id} could not be found.")
 
+        old_values = GameValues.from_game(old_game)
+        self.elo_rating_service.unrate_game(old_game)
         self._edit_team_seasons(Direction.DOWN, old_game)
+        self._edit_league_season_totals(-1, old_values)
         self.game_repository.delete_game(id)
+        self.event_bus.publish(GameDeleted(old_values))
 
     def _edit_team_seasons(self, direction: int, game: Game) -> None:
         process_game_strategy = self.process_game_strategy_factory.create_strategy(direction)
         process_game_strategy.process_game(game)
+
+    def _edit_league_season_totals(self, sign: int, game: Union[Game, GameValues]) -> None:
+        # A league season's totals sum the games and points of its team seasons, so each team with a team season
+        # adds its game and its own score to its league's totals.
+        changes: Dict[str, Tuple[int, int]] = {}
+        for team_name, team_score in ((game.guest_name, game.guest_score), (game.host_name, game.host_score)):
+            team_season = self.team_season_repository.get_team_season_by_team_name_and_season_year(
+                team_name, game.season_year
+            )
+            if team_season is None:
+                continue
+
+            games, points = changes.get(team_season.league_name, (0, 0))
+            changes[team_season.league_name] = (games + sign, points + sign * team_score)
+
+        self.league_season_repository.increment_league_season_totals(game.season_year, changes)
@@ -0,0 +1,105 @@
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.data.models.head_to_head_summary import HeadToHeadSummary
+
+
+@dataclass(frozen=True)
+class HeadToHeadRecord:
+    """
+    Class to represent the record of the series between two pro football teams, from the first team's side.
+    """
+    team_name: str
+    opponent_name: str
+    games: int = 0
+    team_wins: int = 0
+    opponent_wins: int = 0
+    ties: int = 0
+    team_points: int = 0
+    opponent_points: int = 0
+    first_season_year: Optional[int] = None
+    last_season_year: Optional[int] = None
+
+    @classmethod
+    def from_summary(
+            cls, team_name: str, opponent_name: str, summary: Optional[HeadToHeadSummary]
+    ) -> 'HeadToHeadRecord':
+        """
+        Orients a stored series summary to the requested team.
+
+        :param team_name: The name of the team whose side the record is from.
+        :param opponent_name: The name of the opponent.
+        :param summary: The stored summary of the two teams, or None if they have not played.
+
+        :return: The record.
+        """
+        if summary is None:
+            return cls(team_name, opponent_name)
+
+        same_side = summary.team_name == team_name
+        return cls(
+            team_name=team_name,
+            opponent_name=opponent_name,
+            games=summary.games,
+            team_wins=summary.team_wins if same_side else summary.opponent_wins,
+            opponent_wins=summary.opponent_wins if same_side else summary.team_wins,
+            ties=summary.ties,
+            team_points=summary.team_points if same_side else summary.opponent_points,
+            opponent_points=summary.opponent_points if same_side else summary.team_points,
+            first_season_year=summary.first_season_year,
+            last_season_year=summary.last_season_year,
+        )
+
+    @classmethod
+    def from_games(cls, team_name: str, opponent_name: str, games: Iterable[Any]) -> 'HeadToHeadRecord':
+        """
+        Tallies the record of a list of games between two teams.
+
+        :param team_name: The name of the team whose side the record is from.
+        :param opponent_name: The name of the opponent.
+        :param games: The games, with guest_name, guest_score, host_score and season_year attributes.
+
+        :return: The record.
+        """
+        values: Dict[str, Any] = {
+            'games': 0, 'team_wins': 0, 'opponent_wins': 0, 'ties': 0, 'team_points': 0, 'opponent_points': 0
+        }
+        season_years = []
+        for game in games:
+            if game.guest_name == team_name:
+                team_score, opponent_score = game.guest_score, game.host_score
+            else:
+                team_score, opponent_score = game.host_score, game.guest_score
+
+            values['games'] += 1
+            values['team_points'] += team_score
+            values['opponent_points'] += opponent_score
+            if team_score > opponent_score:
+                values['team_wins'] += 1
+            elif team_score < opponent_score:
+                values['opponent_wins'] += 1
+            else:
+                values['ties'] += 1
+            season_years.append(game.season_year)
+
+        return cls(
+            team_name, opponent_name, **values,
+            first_season_year=min(season_years, default=None), last_season_year=max(season_years, default=None)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converts the record to a dictionary of its fields, e.g. for a JSON response.
+
+        :return: The dictionary.
+        """
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class HeadToHead:
+    """
+    Class to represent the series between two pro football teams over a range of seasons, with its games.
+    """
+    record: HeadToHeadRecord
+    games: List[Any] = field(default_factory=list)
@@ -0,0 +1,152 @@
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+from injector import inject
+
+from app.data.models.head_to_head_summary import get_team_pair
+from app.data.repositories.game_repository import GameRepository
+from app.data.repositories.head_to_head_repository import HeadToHeadRepository
+from app.services.event_bus.event_bus import EventBus
+from app.services.event_bus.game_events import GameAdded, GameDeleted, GameEvent, GameUpdated, GameValues
+from app.services.head_to_head_service.head_to_head_record import HeadToHead, HeadToHeadRecord
+from app.services.utilities import guard
+from app.services.utilities.utils import typename
+
+
+class HeadToHeadService:
+    """
+    A service to report the series between any two pro football teams.
+
+    The all-time record of every pair of teams is stored, and kept current from the game events of the event bus, so
+    that it can be read without touching the pair's games. Records over a range of seasons are tallied from the
+    pair's games, which are found through an index on the guest and host of each game.
+    """
+
+    @inject
+    def __init__(
+            self,
+            game_repository: GameRepository,
+            head_to_head_repository: HeadToHeadRepository,
+            event_bus: EventBus
+    ) -> None:
+        """
+        Initializes a new instance of the HeadToHeadService class.
+
+        :param game_repository: The repository from which the games between two teams will be fetched.
+        :param head_to_head_repository: The repository in which the all-time records are stored.
+        :param event_bus: The bus from which game events will be received.
+        """
+        self.game_repository = game_repository
+        self.head_to_head_repository = head_to_head_repository
+        self.event_bus = event_bus
+        event_bus.subscribe((GameAdded, GameUpdated, GameDeleted), self.handle_game_events)
+
+    def __repr__(self):
+        return (
+            f"{typename(self)}("
+            f"game_repository={self.game_repository}, "
+            f"head_to_head_repository={self.head_to_head_repository}, "
+            f"event_bus={self.event_bus}"
+            f")"
+        )
+
+    def get_series_record(self, team_name: Optional[str], opponent_name: Optional[str]) -> HeadToHeadRecord:
+        """
+        Gets the all-time record of the series between two teams with a single-row read.
+
+        :param team_name: The name of the team whose side the record is from.
+        :param opponent_name: The name of the opponent.
+
+        :return: The record. Teams that have not played have a record of no games.
+
+        :raises ValueError: If the team_name or opponent_name argument is None.
+        """
+        guard.raise_if_none(team_name, f"{typename(self)}.get_series_record: team_name")
+        guard.raise_if_none(opponent_name, f"{typename(self)}.get_series_record: opponent_name")
+
+        summary = self.head_to_head_repository.get_head_to_head_summary(team_name, opponent_name)
+        return HeadToHeadRecord.from_summary(team_name, opponent_name, summary)
+
+    def get_head_to_head(
+            self,
+            team_name: Optional[str],
+            opponent_name: Optional[str],
+            first_season_year: Optional[int] = None,
+            last_season_year: Optional[int] = None
+    ) -> HeadToHead:
+        """
+        Gets the series between two teams over a range of seasons, with its games.
+
+        :param team_name: The name of the team whose side the record is from.
+        :param opponent_name: The name of the opponent.
+        :param first_season_year: The first season to include, or None to start with the teams' first game.
+        :param last_season_year: The last season to include, or None to end with the teams' last game.
+
+        :return: The record and the games of the series, in the order they were played.
+
+        :raises ValueError: If the team_name or opponent_name argument is None.
+        """
+        guard.raise_if_none(team_name, f"{typename(self)}.get_head_to_head: team_name")
+        guard.raise_if_none(opponent_name, f"{typename(self)}.get_head_to_head: opponent_name")
+
+        games = self.game_repository.get_game_rows_between_teams(
+            team_name, opponent_name, first_season_year, last_season_year
+        )
+        return HeadToHead(HeadToHeadRecord.from_games(team_name, opponent_name, games), games)
+
+    def handle_game_events(self, events: Sequence[GameEvent]) -> None:
+        """
+        Applies committed game writes to the all-time records of the pairs of teams that played in them.
+
+        :param events: The game events to apply.
+
+        :return: None
+        """
+        self.head_to_head_repository.update_head_to_head_summaries(get_head_to_head_changes(events))
+
+    def rebuild_head_to_head_summaries(self) -> int:
+        """
+        Rebuilds the all-time record of every pair of teams from the games in the data store.
+
+        :return: The number of records rebuilt.
+        """
+        return self.head_to_head_repository.rebuild_head_to_head_summaries()
+
+
+def get_head_to_head_changes(events: Iterable[GameEvent]) -> Dict[Tuple[str, str], Dict[str, int]]:
+    """
+    Sums the changes that game events make to the all-time game totals of each pair of teams.
+
+    :param events: The game events.
+
+    :return: The change in each game total, by sorted pair of team names, from the side of the pair's first team.
+    """
+    changes: Dict[Tuple[str, str], Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    for event in events:
+        if isinstance(event, GameAdded):
+            _add_game(changes, event.game, 1)
+        elif isinstance(event, GameUpdated):
+            _add_game(changes, event.old_game, -1)
+            _add_game(changes, event.new_game, 1)
+        elif isinstance(event, GameDeleted):
+            _add_game(changes, event.game, -1)
+    return {pair: dict(deltas) for pair, deltas in changes.items()}
+
+
+def _add_game(changes: Dict[Tuple[str, str], Dict[str, int]], game: GameValues, sign: int) -> None:
+    pair = get_team_pair(game.guest_name, game.host_name)
+    if game.guest_name == pair[0]:
+        team_score, opponent_score = game.guest_score, game.host_score
+    else:
+        team_score, opponent_score = game.host_score, game.guest_score
+
+    deltas = changes[pair]
+    deltas['games'] += sign
+    deltas['team_points'] += sign * team_score
+    deltas['opponent_points'] += sign * opponent_score
+    if team_score > opponent_score:
+        deltas['team_wins'] += sign
+    elif team_score < opponent_score:
+        deltas['opponent_wins'] += sign
+    else:
+        deltas['ties'] += sign
@@ -0,0 +1,191 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional
+
+from flask import Flask, current_app
+from injector import inject
+from sqlalchemy.exc import IntegrityError
+
+from app.data.models.job import Job
+from app.data.repositories.job_repository import JobRepository
+from app.data.sqla import sqla
+from app.services.utilities import guard
+from app.services.utilities.utils import typename
+
+DEFAULT_MAX_WORKERS = 2
+DEFAULT_STALE_AFTER = timedelta(hours=1)
+
+
+class JobProgress:
+    """
+    Records the progress of a running job in the data store as each of its phases completes.
+    """
+
+    def __init__(self, job_repository: JobRepository, job: Job) -> None:
+        """
+        Initializes a new instance of the JobProgress class.
+
+        :param job_repository: The repository by which the job will be saved.
+        :param job: The running job.
+        """
+        self.job_repository = job_repository
+        self.job = job
+
+    def __repr__(self):
+        return f"{typename(self)}(job_repository={self.job_repository}, job={self.job})"
+
+    def phase_completed(self, phase: str, duration: float) -> None:
+        """
+        Records the completion of one phase of the running job.
+
+        :param phase: The name of the completed phase.
+        :param duration: The time in seconds that the phase took.
+
+        :return: None
+        """
+        self.job.phase_durations = {**(self.job.phase_durations or {}), phase: duration}
+        self.job.phases_completed = len(self.job.phase_durations)
+        self.job.updated_at = utcnow()
+        self.job_repository.update_job(self.job)
+
+
+class JobService:
+    """
+    A service to run long operations, such as weekly updates, in the background on a local thread pool.
+
+    Every job is recorded in the Job table, so its status can be polled from any request. A job is identified by its
+    kind and key; submitting a job while another one with the same kind and key is queued or running returns the
+    existing job instead of starting a second one. The Job table allows only one queued or running job of each kind
+    and key, so this holds across processes; the lock of this service only spares its own threads the failed insert.
+    """
+
+    @inject
+    def __init__(self, job_repository: JobRepository) -> None:
+        """
+        Initializes a new instance of the JobService class.
+
+        :param job_repository: The repository by which jobs will be saved and fetched.
+        """
+        self.job_repository = job_repository
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"{typename(self)}(job_repository={self.job_repository})"
+
+    def enqueue(
+            self,
+            kind: str,
+            key: str,
+            task: Callable[[JobProgress], Any],
+            phase_count: int = 0
+    ) -> Job:
+        """
+        Queues a job unless an equivalent job is already queued or running.
+
+        :param kind: The kind of the job, e.g. 'weekly_update'.
+        :param key: The key that identifies equivalent jobs of the same kind.
+        :param task: The work to run. It is called within an application context with a JobProgress through which it
+        may report each completed phase, and its return value, if any, is saved as the job's result.
+        :param phase_count: The number of phases that the task will report.
+
+        :return: The queued job, or the equivalent job that was already queued or running.
+
+        :raises ValueError: If the kind, key, or task argument is None.
+        """
+        guard.raise_if_none(kind, f"{typename(self)}.enqueue: kind")
+        guard.raise_if_none(key, f"{typename(self)}.enqueue: key")
+        guard.raise_if_none(task, f"{typename(self)}.enqueue: task")
+
+        app = current_app._get_current_object()
+        with self._lock:
+            job = self._get_active_job(kind, key, app)
+            if job is not None:
+                return job
+
+            now = utcnow()
+            try:
+                job = self.job_repository.add_job(
+                    Job(kind=kind, key=key, status=Job.QUEUED, phase_count=phase_count, phases_completed=0,
+                        created_at=now, updated_at=now)
+                )
+            except IntegrityError:
+                # Another process queued an equivalent job after this one looked for it.
+                job = self.job_repository.get_active_job_by_kind_and_key(kind, key)
+                if job is None:
+                    raise
+                return job
+
+            self._get_executor(app).submit(self._run, app, job.id, task)
+            return job
+
+    def get_job(self, id: int) -> Optional[Job]:
+        """
+        Gets the job with the specified id.
+
+        :param id: The id of the job to fetch.
+
+        :return: The fetched job.
+        """
+        return self.job_repository.get_job(id)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the background thread pool.
+
+        :param wait: True to wait for queued and running jobs to finish; otherwise false.
+
+        :return: None
+        """
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
+
+    def _get_active_job(self, kind: str, key: str, app: Flask) -> Optional[Job]:
+        job = self.job_repository.get_active_job_by_kind_and_key(kind, key)
+        if job is None:
+            return None
+
+        stale_after = app.config.get('JOB_STALE_AFTER', DEFAULT_STALE_AFTER)
+        if job.updated_at < utcnow() - stale_after:
+            # The process that ran this job stopped without finishing it.
+            self._finish(job, Job.FAILED, error="The job was abandoned.")
+            return None
+
+        return job
+
+    def _get_executor(self, app: Flask) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=app.config.get('JOB_WORKERS', DEFAULT_MAX_WORKERS), thread_name_prefix='job'
+            )
+        return self._executor
+
+    def _run(self, app: Flask, job_id: int, task: Callable[[JobProgress], Any]) -> None:
+        with app.app_context():
+            job = self.job_repository.get_job(job_id)
+            job.status = Job.RUNNING
+            job.started_at = job.updated_at = utcnow()
+            self.job_repository.update_job(job)
+
+            try:
+                result = task(JobProgress(self.job_repository, job))
+            except Exception as err:
+                sqla.session.rollback()
+                self._finish(job, Job.FAILED, error=str(err)[:1024])
+                return
+
+            self._finish(job, Job.SUCCEEDED, result=result)
+
+    def _finish(self, job: Job, status: str, result: Any = None, error: Optional[str] = None) -> None:
+        job.status = status
+        job.result = result
+        job.error = error
+        job.finished_at = job.updated_at = utcnow()
+        self.job_repository.update_job(job)
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
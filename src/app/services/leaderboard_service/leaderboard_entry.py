@@ -0,0 +1,12 @@
+from decimal import Decimal
+from typing import NamedTuple, Union
+
+
+class LeaderboardEntry(NamedTuple):
+    """
+    Class to represent one team season's place on a leaderboard.
+    """
+    rank: int
+    team_name: str
+    season_year: int
+    value: Union[int, Decimal]
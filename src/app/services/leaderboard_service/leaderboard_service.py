@@ -0,0 +1,203 @@
+import heapq
+import threading
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from injector import inject
+
+from app.data.data_versions import data_versions
+from app.data.models.season_snapshot import TEAM_SEASON_NUMERIC_COLUMNS, from_scaled_int, to_scaled_int
+from app.data.repositories.season_repository import SeasonRepository
+from app.data.repositories.team_season_repository import TeamSeasonRepository
+from app.services.leaderboard_service.leaderboard_entry import LeaderboardEntry
+from app.metrics import CacheCounters
+from app.services.utilities.utils import typename
+
+# Each metric maps to the scale of its column, by which its values are sorted as integers; the integer columns have a
+# scale of 0.
+LEADERBOARD_METRICS: Dict[str, int] = {
+    'wins': 0,
+    'points_for': 0,
+    'points_against': 0,
+    **TEAM_SEASON_NUMERIC_COLUMNS,
+}
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 1000
+
+leaderboard_cache_counters = CacheCounters('leaderboard')
+
+# One season's ordering of a metric: (scaled value, team name) pairs.
+SeasonOrdering = Tuple[Tuple[int, str], ...]
+
+
+class LeaderboardService:
+    """
+    A service to find the team seasons with the highest or lowest value of a ranking metric over any range of
+    seasons.
+
+    The team seasons of each season are sorted by every metric once, and the orderings are kept until the season's
+    data version changes. The seasons of a range whose orderings are missing or stale are read together with one
+    query of the metric columns alone. A query merges the orderings of the seasons in its range with a heap and stops
+    after the requested number of entries, so it reads only a handful of entries from each season however many
+    seasons the range spans.
+    """
+
+    @inject
+    def __init__(
+            self,
+            season_repository: SeasonRepository,
+            team_season_repository: TeamSeasonRepository
+    ) -> None:
+        """
+        Initializes a new instance of the LeaderboardService class.
+
+        :param season_repository: The repository from which the seasons in a range will be fetched.
+        :param team_season_repository: The repository from which the metrics of the team seasons will be fetched.
+        """
+        self.season_repository = season_repository
+        self.team_season_repository = team_season_repository
+        self._lock = threading.Lock()
+        self._orderings: Dict[int, Tuple[int, Dict[Tuple[str, bool], SeasonOrdering]]] = {}
+
+    def __repr__(self):
+        return (
+            f"{typename(self)}("
+            f"season_repository={self.season_repository}, "
+            f"team_season_repository={self.team_season_repository}"
+            f")"
+        )
+
+    def get_leaders(
+            self,
+            metric: str,
+            first_season_year: Optional[int] = None,
+            last_season_year: Optional[int] = None,
+            limit: int = DEFAULT_LIMIT,
+            ascending: bool = False
+    ) -> List[LeaderboardEntry]:
+        """
+        Gets the team seasons with the best values of a metric over a range of seasons.
+
+        :param metric: The metric, one of the LEADERBOARD_METRICS.
+        :param first_season_year: The first season to include, or None to start with the first season.
+        :param last_season_year: The last season to include, or None to end with the last season.
+        :param limit: The number of entries to get, from 1 to MAX_LIMIT.
+        :param ascending: True to get the lowest values; False to get the highest.
+
+        :return: The entries, ranked from 1. Team seasons whose value of the metric is empty are left out, and
+        equal values are ranked by season and then by team name.
+
+        :raises ValueError: If the metric is not known or the limit is out of range.
+        """
+        if metric not in LEADERBOARD_METRICS:
+            raise ValueError(f"Unknown leaderboard metric: {metric}.")
+        if not 1 <= limit <= MAX_LIMIT:
+            raise ValueError(f"The limit must be from 1 to {MAX_LIMIT}.")
+
+        orderings = self.get_season_orderings(self.get_season_years(first_season_year, last_season_year))
+        seasons = [
+            _iter_entries(season_year, season_orderings[metric, ascending])
+            for season_year, season_orderings in orderings.items()
+        ]
+
+        merged = heapq.merge(*seasons, key=lambda entry: entry[0], reverse=not ascending)
+        scale = LEADERBOARD_METRICS[metric]
+        return [
+            LeaderboardEntry(rank, team_name, season_year, value if scale == 0 else from_scaled_int(value, scale))
+            for rank, (value, season_year, team_name) in enumerate(islice(merged, limit), start=1)
+        ]
+
+    def get_season_years(
+            self, first_season_year: Optional[int] = None, last_season_year: Optional[int] = None
+    ) -> List[int]:
+        """
+        Gets the years of the seasons in a range.
+
+        :param first_season_year: The first season to include, or None to start with the first season.
+        :param last_season_year: The last season to include, or None to end with the last season.
+
+        :return: The season years, in order.
+        """
+        return sorted(
+            season.year for season in self.season_repository.get_season_records()
+            if (first_season_year is None or season.year >= first_season_year)
+            and (last_season_year is None or season.year <= last_season_year)
+        )
+
+    def get_season_orderings(self, season_years: Iterable[int]) -> Dict[int, Dict[Tuple[str, bool], SeasonOrdering]]:
+        """
+        Gets the orderings of the team seasons of several seasons by every metric, sorting those of a season on first
+        use and again after the season's data has changed.
+
+        :param season_years: The years of the seasons.
+
+        :return: The orderings of each season, by metric and whether they are ascending.
+        """
+        versions = {season_year: data_versions.get(season_year) for season_year in season_years}
+        orderings = {}
+        for season_year, version in versions.items():
+            cached = self._orderings.get(season_year)
+            if cached is not None and cached[0] == version:
+                orderings[season_year] = cached[1]
+        if len(orderings) == len(versions):
+            leaderboard_cache_counters.hit(len(orderings))
+            return orderings
+
+        with self._lock:
+            # Another thread may have sorted some of the seasons while this one waited.
+            stale = []
+            for season_year, version in versions.items():
+                cached = self._orderings.get(season_year)
+                if cached is not None and cached[0] == version:
+                    orderings[season_year] = cached[1]
+                else:
+                    stale.append(season_year)
+            # Each season of the range counts as one read of the cache.
+            leaderboard_cache_counters.hit(len(versions) - len(stale))
+            leaderboard_cache_counters.miss(len(stale))
+
+            if stale:
+                rows = self.team_season_repository.get_team_season_column_rows(stale, LEADERBOARD_METRICS)
+                for season_year, season_orderings in get_season_orderings(stale, rows).items():
+                    self._orderings[season_year] = (versions[season_year], season_orderings)
+                    orderings[season_year] = season_orderings
+
+        return {season_year: orderings[season_year] for season_year in versions}
+
+
+def get_season_orderings(
+        season_years: Iterable[int], team_season_rows: Iterable[Any]
+) -> Dict[int, Dict[Tuple[str, bool], SeasonOrdering]]:
+    """
+    Sorts the team seasons of several seasons by every leaderboard metric, both ways.
+
+    :param season_years: The years of the seasons.
+    :param team_season_rows: Rows with the team_name, season_year and every leaderboard metric of the team seasons of
+    the seasons.
+
+    :return: The orderings of each season, by metric and whether they are ascending. Equal values are ordered by
+    team name, and team seasons whose value is empty are left out.
+    """
+    entries: Dict[int, Dict[str, List[Tuple[int, str]]]] = {
+        season_year: {metric: [] for metric in LEADERBOARD_METRICS} for season_year in season_years
+    }
+    for row in team_season_rows:
+        season_entries = entries[row.season_year]
+        for metric, scale in LEADERBOARD_METRICS.items():
+            value = getattr(row, metric)
+            if value is not None:
+                season_entries[metric].append((value if scale == 0 else to_scaled_int(value, scale), row.team_name))
+
+    orderings = {}
+    for season_year, season_entries in entries.items():
+        season_orderings = orderings[season_year] = {}
+        for metric, metric_entries in season_entries.items():
+            season_orderings[metric, True] = tuple(sorted(metric_entries))
+            season_orderings[metric, False] = tuple(sorted(metric_entries, key=lambda entry: (-entry[0], entry[1])))
+    return orderings
+
+
+def _iter_entries(season_year: int, ordering: Iterable[Tuple[int, str]]) -> Iterator[Tuple[int, int, str]]:
+    for value, team_name in ordering:
+        yield value, season_year, team_name
@@ -0,0 +1,171 @@
+import os
+from typing import Dict, Tuple
+
+from injector import inject
+from sqlalchemy import delete, func, select
+
+from app.data.data_versions import data_versions
+from app.data.models.game import Game
+from app.data.models.season_snapshot import SeasonSnapshot
+from app.data.models.team_season import TeamSeason
+from app.data.repositories.league_season_repository import LeagueSeasonRepository
+from app.data.repositories.season_snapshot_repository import SeasonSnapshotRepository
+from app.data.season_archive import read_season_archive, write_season_archive
+from app.data.session_routing import use_primary
+from app.data.sqla import sqla, try_commit
+from app.services.event_bus.event_bus import EventBus
+from app.services.event_bus.game_events import GameAdded, GameDeleted, GameValues
+from app.services.utilities import guard
+from app.services.utilities.utils import typename
+
+
+class SeasonArchiveService:
+    """
+    A service to export seasons to, and import seasons from, compact binary season archives.
+    """
+
+    @inject
+    def __init__(
+            self,
+            season_snapshot_repository: SeasonSnapshotRepository,
+            league_season_repository: LeagueSeasonRepository,
+            event_bus: EventBus
+    ) -> None:
+        """
+        Initializes a new instance of the SeasonArchiveService class.
+
+        :param season_snapshot_repository: The repository from which the snapshots of exported seasons will be
+        fetched.
+        :param league_season_repository: The repository whose league season totals will follow the imported games.
+        :param event_bus: The bus on which the replaced and imported games will be announced.
+        """
+        self.season_snapshot_repository = season_snapshot_repository
+        self.league_season_repository = league_season_repository
+        self.event_bus = event_bus
+
+    def __repr__(self):
+        return (
+            f"{typename(self)}("
+            f"season_snapshot_repository={self.season_snapshot_repository}, "
+            f"league_season_repository={self.league_season_repository}, "
+            f"event_bus={self.event_bus}"
+            f")"
+        )
+
+    def export_season(self, season_year: int, path: str) -> SeasonSnapshot:
+        """
+        Writes the team seasons and games of one season to a season archive.
+
+        :param season_year: The year of the season to export.
+        :param path: The path of the archive. An existing file is replaced only once the new archive is complete.
+
+        :return: The exported snapshot of the season.
+
+        :raises ValueError: If the season_year or path argument is None.
+        """
+        guard.raise_if_none(season_year, f"{typename(self)}.export_season: season_year")
+        guard.raise_if_none(path, f"{typename(self)}.export_season: path")
+
+        snapshot = self.season_snapshot_repository.get_season_snapshot(season_year)
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, 'wb') as file:
+            write_season_archive(snapshot, file)
+        os.replace(temporary_path, path)
+        return snapshot
+
+    def load_season_snapshot(self, path: str) -> SeasonSnapshot:
+        """
+        Loads a season archive into an in-memory snapshot without touching the data store.
+
+        :param path: The path of the archive.
+
+        :return: The snapshot of the archived season.
+
+        :raises SeasonArchiveError: If the file is not a valid season archive.
+        """
+        guard.raise_if_none(path, f"{typename(self)}.load_season_snapshot: path")
+
+        return read_season_archive(path)
+
+    @use_primary()
+    def import_season(self, path: str, replace: bool = False) -> SeasonSnapshot:
+        """
+        Loads a season archive into the data store.
+
+        The archived team seasons and games are added with new ids. The season, its teams, and its leagues,
+        conferences, and divisions must already be in the data store. The league season totals are changed in the
+        same transaction, and once it commits the replaced games are announced as deleted and the imported games as
+        added, so that the summaries, rankings and forecasts derived from them follow the import.
+
+        :param path: The path of the archive.
+        :param replace: True to delete the season's team seasons and games before the import; otherwise false.
+
+        :return: The snapshot of the imported season.
+
+        :raises SeasonArchiveError: If the file is not a valid season archive.
+        :raises ValueError: If the season already has team seasons or games and replace is false.
+        """
+        guard.raise_if_none(path, f"{typename(self)}.import_season: path")
+
+        snapshot = read_season_archive(path)
+        season_year = snapshot.season_year
+        old_games = []
+        league_totals_change: Dict[str, Tuple[int, int]] = {}
+        if replace:
+            old_games = [
+                GameValues.from_game(game)
+                for game in sqla.session.scalars(select(Game).where(Game.season_year == season_year).order_by(Game.id))
+            ]
+            for league_name, games, points in sqla.session.execute(
+                select(TeamSeason.league_name, func.sum(TeamSeason.games), func.sum(TeamSeason.points_for))
+                .where(TeamSeason.season_year == season_year)
+                .group_by(TeamSeason.league_name)
+            ):
+                league_totals_change[league_name] = (-(games or 0), -(points or 0))
+            sqla.session.execute(
+                delete(Game).where(Game.season_year == season_year).execution_options(synchronize_session='fetch')
+            )
+            sqla.session.execute(
+                delete(TeamSeason)
+                .where(TeamSeason.season_year == season_year)
+                .execution_options(synchronize_session='fetch')
+            )
+            data_versions.mark_changed(sqla.session, [season_year])
+        elif self._season_has_rows(season_year):
+            raise ValueError(
+                f"The {season_year} season already has team seasons or games. Import it with replace to overwrite "
+                f"them."
+            )
+
+        for record in snapshot.get_team_seasons():
+            sqla.session.add(TeamSeason(**{name: value for name, value in record._asdict().items() if name != 'id'}))
+            games, points = league_totals_change.get(record.league_name, (0, 0))
+            league_totals_change[record.league_name] = (games + record.games, points + record.points_for)
+
+        new_games = []
+        for record in snapshot.get_games():
+            game = Game(**{name: value for name, value in record._asdict().items() if name != 'id'})
+            game.decide_winner_and_loser()
+            sqla.session.add(game)
+            new_games.append(game)
+        sqla.session.flush()
+        new_games = [GameValues.from_game(game) for game in new_games]
+        self.league_season_repository.increment_league_season_totals(season_year, league_totals_change)
+        try_commit()
+
+        with self.event_bus.batch():
+            for game in old_games:
+                self.event_bus.publish(GameDeleted(game))
+            for game in new_games:
+                self.event_bus.publish(GameAdded(game))
+        return snapshot
+
+    @staticmethod
+    def _season_has_rows(season_year: int) -> bool:
+        team_season_count = sqla.session.scalar(
+            select(func.count()).select_from(TeamSeason).where(TeamSeason.season_year == season_year)
+        )
+        game_count = sqla.session.scalar(
+            select(func.count()).select_from(Game).where(Game.season_year == season_year)
+        )
+        return bool(team_season_count or game_count)
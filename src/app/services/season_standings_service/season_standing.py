@@ -0,0 +1,34 @@
+from dataclasses import asdict, dataclass
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+
+@dataclass(frozen=True)
+class SeasonStanding:
+    """
+    Class to represent one team's place in the standings of a pro football season, with the tiebreaker, if any, that
+    placed it above the teams with the same winning percentage.
+    """
+    team_name: str
+    league_name: Optional[str]
+    conference_name: Optional[str]
+    division_name: Optional[str]
+    wins: int
+    losses: int
+    ties: int
+    winning_percentage: float
+    points_for: int
+    points_against: int
+    avg_points_for: float
+    avg_points_against: float
+    expected_wins: Optional[Decimal] = None
+    expected_losses: Optional[Decimal] = None
+    tiebreaker: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converts the standing to a dictionary of its fields, e.g. for a JSON response.
+
+        :return: The dictionary.
+        """
+        return asdict(self)
@@ -0,0 +1,246 @@
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from injector import inject
+
+from app.data.models.season_snapshot import SeasonSnapshot
+from app.data.repositories.season_snapshot_repository import SeasonSnapshotRepository
+from app.metrics import CacheCounters
+from app.services.season_standings_service.season_standing import SeasonStanding
+from app.services.season_standings_service.tiebreaker_tables import TiebreakerTables, get_winning_percentage
+from app.services.utilities import guard
+from app.services.utilities.utils import typename
+
+# A tiebreaker gets the value of each tied team, higher being better, or None if it does not apply to the group.
+Tiebreaker = Callable[[TiebreakerTables, Sequence[str]], Optional[Dict[str, float]]]
+
+TEAM_NAME_TIEBREAKER = 'team name'
+
+standings_cache_counters = CacheCounters('standings')
+tiebreaker_tables_cache_counters = CacheCounters('tiebreaker_tables')
+
+
+class SeasonStandingsService:
+    """
+    A service to order the standings of a pro football season, breaking ties between teams with the same winning
+    percentage.
+
+    Ties are broken by head-to-head record, division record, record in common games, strength of victory and point
+    differential, in that order. Each season's tiebreaker tables are built in one pass over its games, and the
+    ordered standings are kept until the season's data version changes.
+    """
+
+    @inject
+    def __init__(self, season_snapshot_repository: SeasonSnapshotRepository) -> None:
+        """
+        Initializes a new instance of the SeasonStandingsService class.
+
+        :param season_snapshot_repository: The repository from which the season snapshots will be fetched.
+        """
+        self.season_snapshot_repository = season_snapshot_repository
+        self._lock = threading.Lock()
+        self._tables: Dict[int, Tuple[int, TiebreakerTables]] = {}
+        self._standings: Dict[Tuple[int, bool], Tuple[int, List[SeasonStanding]]] = {}
+
+    def __repr__(self):
+        return f"{typename(self)}(season_snapshot_repository={self.season_snapshot_repository})"
+
+    def get_season_standings(self, season_year: int, group_by_division: bool = False) -> List[SeasonStanding]:
+        """
+        Gets the ordered standings of one season.
+
+        :param season_year: The year of the season.
+        :param group_by_division: True to order the teams within their divisions, with the divisions in name order;
+        False to order the teams of the whole season together.
+
+        :return: The standings.
+
+        :raises ValueError: If the season_year argument is None.
+        """
+        guard.raise_if_none(season_year, f"{typename(self)}.get_season_standings: season_year")
+
+        snapshot = self.season_snapshot_repository.get_season_snapshot(season_year)
+        key = (season_year, group_by_division)
+        cached = self._standings.get(key)
+        if cached is not None and cached[0] == snapshot.version:
+            standings_cache_counters.hit()
+            return cached[1]
+
+        with self._lock:
+            cached = self._standings.get(key)
+            if cached is not None and cached[0] == snapshot.version:
+                standings_cache_counters.hit()
+            else:
+                standings_cache_counters.miss()
+                standings = get_season_standings(
+                    snapshot.get_team_seasons(), self._get_tiebreaker_tables(snapshot), group_by_division
+                )
+                cached = self._standings[key] = (snapshot.version, standings)
+            return cached[1]
+
+    def _get_tiebreaker_tables(self, snapshot: SeasonSnapshot) -> TiebreakerTables:
+        cached = self._tables.get(snapshot.season_year)
+        if cached is not None and cached[0] == snapshot.version:
+            tiebreaker_tables_cache_counters.hit()
+        else:
+            tiebreaker_tables_cache_counters.miss()
+            tables = TiebreakerTables(snapshot.get_team_seasons(), snapshot.get_games())
+            cached = self._tables[snapshot.season_year] = (snapshot.version, tables)
+        return cached[1]
+
+
+def get_season_standings(
+        team_seasons: Iterable[Any], tables: TiebreakerTables, group_by_division: bool = False
+) -> List[SeasonStanding]:
+    """
+    Orders the standings of one season.
+
+    :param team_seasons: The team seasons of the season, with the attributes of a TeamSeasonRecord.
+    :param tables: The tiebreaker tables of the season.
+    :param group_by_division: True to order the teams within their divisions; False to order them all together.
+
+    :return: The standings.
+    """
+    team_seasons = {team_season.team_name: team_season for team_season in team_seasons}
+
+    def get_group(team_name: str) -> Tuple[str, str, str]:
+        team_season = team_seasons.get(team_name)
+        if not group_by_division or team_season is None:
+            return '', '', ''
+        return team_season.league_name or '', team_season.conference_name or '', team_season.division_name or ''
+
+    groups = defaultdict(list)
+    for team_name in tables.records:
+        groups[get_group(team_name)].append(team_name)
+
+    standings = []
+    for group in sorted(groups):
+        for team_name, tiebreaker in order_teams(tables, groups[group]):
+            standings.append(_get_standing(tables, team_name, team_seasons.get(team_name), tiebreaker))
+    return standings
+
+
+def order_teams(tables: TiebreakerTables, team_names: Sequence[str]) -> List[Tuple[str, Optional[str]]]:
+    """
+    Orders teams by winning percentage, breaking ties with the tiebreaker tables.
+
+    :param tables: The tiebreaker tables of the teams' season.
+    :param team_names: The names of the teams.
+
+    :return: The team names in order, each with the tiebreaker that placed it above the teams with its winning
+    percentage, or None if no tiebreaker was needed.
+    """
+    tie_groups = defaultdict(list)
+    for team_name in team_names:
+        tie_groups[get_winning_percentage(tables.records[team_name])].append(team_name)
+
+    ordered = []
+    for winning_percentage in sorted(tie_groups, reverse=True):
+        ordered.extend(break_tie(tables, sorted(tie_groups[winning_percentage])))
+    return ordered
+
+
+def break_tie(tables: TiebreakerTables, team_names: Sequence[str]) -> List[Tuple[str, Optional[str]]]:
+    """
+    Orders a group of teams with the same winning percentage. The best team is found and taken out of the group,
+    and the tiebreakers start over with the teams that remain.
+
+    :param tables: The tiebreaker tables of the teams' season.
+    :param team_names: The names of the tied teams.
+
+    :return: The team names in order, each with the tiebreaker that placed it above the teams that remained.
+    """
+    remaining = list(team_names)
+    ordered = []
+    while len(remaining) > 1:
+        team_name, tiebreaker = _select_best(tables, remaining)
+        ordered.append((team_name, tiebreaker))
+        remaining.remove(team_name)
+    ordered.extend((team_name, None) for team_name in remaining)
+    return ordered
+
+
+def _select_best(tables: TiebreakerTables, team_names: List[str]) -> Tuple[str, str]:
+    candidates = team_names
+    for name, tiebreaker in TIEBREAKERS:
+        values = tiebreaker(tables, candidates)
+        if values is None:
+            continue
+        best = max(values.values())
+        candidates = [team_name for team_name in candidates if values[team_name] == best]
+        if len(candidates) == 1:
+            return candidates[0], name
+    return min(candidates), TEAM_NAME_TIEBREAKER
+
+
+def _head_to_head(tables: TiebreakerTables, team_names: Sequence[str]) -> Optional[Dict[str, float]]:
+    # Applies only when every tied team has played every other one.
+    records = {}
+    for team_name in team_names:
+        opponents = tables.head_to_head.get(team_name, {})
+        others = [other for other in team_names if other != team_name]
+        if not all(other in opponents for other in others):
+            return None
+        records[team_name] = get_winning_percentage(tables.get_head_to_head_record(team_name, others))
+    return records
+
+
+def _division_record(tables: TiebreakerTables, team_names: Sequence[str]) -> Optional[Dict[str, float]]:
+    # Applies only when the tied teams share a division.
+    divisions = {tables.divisions.get(team_name) for team_name in team_names}
+    if len(divisions) != 1 or None in divisions:
+        return None
+    return {team_name: get_winning_percentage(tables.division_records[team_name]) for team_name in team_names}
+
+
+def _common_games(tables: TiebreakerTables, team_names: Sequence[str]) -> Optional[Dict[str, float]]:
+    common_opponents = tables.get_common_opponents(team_names)
+    if not common_opponents:
+        return None
+    return {
+        team_name: get_winning_percentage(tables.get_head_to_head_record(team_name, common_opponents))
+        for team_name in team_names
+    }
+
+
+def _strength_of_victory(tables: TiebreakerTables, team_names: Sequence[str]) -> Dict[str, float]:
+    return {team_name: tables.strengths_of_victory[team_name] for team_name in team_names}
+
+
+def _point_differential(tables: TiebreakerTables, team_names: Sequence[str]) -> Dict[str, float]:
+    return {team_name: tables.get_point_differential(team_name) for team_name in team_names}
+
+
+TIEBREAKERS: Tuple[Tuple[str, Tiebreaker], ...] = (
+    ('head-to-head', _head_to_head),
+    ('division record', _division_record),
+    ('common games', _common_games),
+    ('strength of victory', _strength_of_victory),
+    ('point differential', _point_differential),
+)
+
+
+def _get_standing(
+        tables: TiebreakerTables, team_name: str, team_season: Optional[Any], tiebreaker: Optional[str]
+) -> SeasonStanding:
+    wins, losses, ties = tables.records[team_name]
+    points_for, points_against = tables.points[team_name]
+    games = wins + losses + ties
+    return SeasonStanding(
+        team_name=team_name,
+        league_name=team_season.league_name if team_season else None,
+        conference_name=team_season.conference_name if team_season else None,
+        division_name=team_season.division_name if team_season else None,
+        wins=wins,
+        losses=losses,
+        ties=ties,
+        winning_percentage=get_winning_percentage(tables.records[team_name]),
+        points_for=points_for,
+        points_against=points_against,
+        avg_points_for=points_for / games if games else 0.0,
+        avg_points_against=points_against / games if games else 0.0,
+        expected_wins=team_season.expected_wins if team_season else None,
+        expected_losses=team_season.expected_losses if team_season else None,
+        tiebreaker=tiebreaker,
+    )
@@ -0,0 +1,130 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+from app.data.models.season_snapshot import GameRecord, TeamSeasonRecord
+
+# A record is held as [wins, losses, ties].
+Record = List[int]
+
+
+def get_winning_percentage(record: Optional[Record]) -> float:
+    """
+    Gets the winning percentage of a record, counting ties as half a win.
+
+    :param record: The record, as [wins, losses, ties], or None for no games.
+
+    :return: The winning percentage, or 0 for no games.
+    """
+    if not record:
+        return 0.0
+    wins, losses, ties = record
+    games = wins + losses + ties
+    return (wins + ties / 2) / games if games else 0.0
+
+
+class TiebreakerTables:
+    """
+    Class to hold the tables from which the standings tiebreakers of one season are read.
+
+    The tables are filled in one pass over the season's regular-season games, so that breaking a tie between any
+    group of teams takes table lookups rather than another pass over the games.
+    """
+
+    def __init__(self, team_seasons: Iterable[TeamSeasonRecord], games: Iterable[GameRecord]) -> None:
+        """
+        Initializes a new instance of the TiebreakerTables class.
+
+        :param team_seasons: The team seasons of the season.
+        :param games: The games of the season. Playoff games are left out of every table.
+        """
+        self.divisions: Dict[str, Optional[str]] = {}
+        self.records: Dict[str, Record] = {}
+        self.points: Dict[str, List[int]] = {}
+        self.head_to_head: Dict[str, Dict[str, Record]] = defaultdict(dict)
+        self.division_records: Dict[str, Record] = {}
+        self.defeated: Dict[str, List[str]] = defaultdict(list)
+
+        for team_season in team_seasons:
+            self._add_team(team_season.team_name, team_season.division_name)
+
+        for game in games:
+            if game.is_playoff:
+                continue
+            self._add_team(game.guest_name)
+            self._add_team(game.host_name)
+            self._add_result(game.guest_name, game.guest_score, game.host_name, game.host_score)
+            self._add_result(game.host_name, game.host_score, game.guest_name, game.guest_score)
+
+        self.strengths_of_victory: Dict[str, float] = {
+            team_name: self._get_strength_of_victory(team_name) for team_name in self.records
+        }
+
+    def get_head_to_head_record(self, team_name: str, opponent_names: Iterable[str]) -> Record:
+        """
+        Sums one team's record against a group of opponents.
+
+        :param team_name: The name of the team.
+        :param opponent_names: The names of the opponents.
+
+        :return: The record, as [wins, losses, ties].
+        """
+        team_head_to_head = self.head_to_head.get(team_name, {})
+        return _sum_records(team_head_to_head.get(opponent_name) for opponent_name in opponent_names)
+
+    def get_common_opponents(self, team_names: Iterable[str]) -> List[str]:
+        """
+        Gets the opponents that every team of a group has played, other than the teams of the group.
+
+        :param team_names: The names of the teams.
+
+        :return: The names of the common opponents, sorted.
+        """
+        team_names = list(team_names)
+        opponent_sets = [set(self.head_to_head.get(team_name, {})) for team_name in team_names]
+        if not opponent_sets:
+            return []
+        return sorted(set.intersection(*opponent_sets).difference(team_names))
+
+    def get_point_differential(self, team_name: str) -> int:
+        """
+        Gets one team's points scored minus its points allowed.
+
+        :param team_name: The name of the team.
+
+        :return: The point differential.
+        """
+        points_for, points_against = self.points.get(team_name, (0, 0))
+        return points_for - points_against
+
+    def _add_team(self, team_name: str, division_name: Optional[str] = None) -> None:
+        if team_name not in self.records:
+            self.divisions[team_name] = division_name
+            self.records[team_name] = [0, 0, 0]
+            self.points[team_name] = [0, 0]
+            self.division_records[team_name] = [0, 0, 0]
+
+    def _add_result(self, team_name: str, team_score: int, opponent_name: str, opponent_score: int) -> None:
+        outcome = 0 if team_score > opponent_score else 1 if team_score < opponent_score else 2
+        self.records[team_name][outcome] += 1
+        self.points[team_name][0] += team_score
+        self.points[team_name][1] += opponent_score
+        self.head_to_head[team_name].setdefault(opponent_name, [0, 0, 0])[outcome] += 1
+
+        division_name = self.divisions[team_name]
+        if division_name is not None and division_name == self.divisions[opponent_name]:
+            self.division_records[team_name][outcome] += 1
+        if outcome == 0:
+            self.defeated[team_name].append(opponent_name)
+
+    def _get_strength_of_victory(self, team_name: str) -> float:
+        return get_winning_percentage(_sum_records(self.records[name] for name in self.defeated.get(team_name, ())))
+
+
+def _sum_records(records: Iterable[Optional[Record]]) -> Record:
+    total = [0, 0, 0]
+    for record in records:
+        if record:
+            total[0] += record[0]
+            total[1] += record[1]
+            total[2] += record[2]
+    return total
@@ -0,0 +1,135 @@
+from decimal import Decimal
+from typing import Dict
+
+import numpy as np
+from injector import inject
+
+from app.data.models.season_snapshot import SeasonSnapshot
+from app.data.repositories.season_snapshot_repository import SeasonSnapshotRepository
+from app.data.repositories.team_season_repository import TeamSeasonRepository
+from app.services.utilities import guard
+from app.services.utilities.utils import typename
+
+RATING_QUANTUM = Decimal('1e-15')
+
+
+class SimpleRatingService:
+    """
+    A service to rate every team of a season with the Simple Rating System.
+
+    A team's simple rating is its average margin of victory adjusted for the strength of its whole schedule,
+    including its opponents' opponents: the ratings are the least-squares solution of one equation per game,
+    host_rating - guest_rating = host_score - guest_score.
+    """
+
+    @inject
+    def __init__(
+            self,
+            season_snapshot_repository: SeasonSnapshotRepository,
+            team_season_repository: TeamSeasonRepository
+    ) -> None:
+        """
+        Initializes a new instance of the SimpleRatingService class.
+
+        :param season_snapshot_repository: The repository from which each season's games will be fetched.
+        :param team_season_repository: The repository by which the ratings will be saved.
+        """
+        self.season_snapshot_repository = season_snapshot_repository
+        self.team_season_repository = team_season_repository
+
+    def __repr__(self):
+        return (
+            f"{typename(self)}("
+            f"season_snapshot_repository={self.season_snapshot_repository}, "
+            f"team_season_repository={self.team_season_repository}"
+            f")"
+        )
+
+    def get_simple_ratings(self, season_year: int) -> Dict[str, float]:
+        """
+        Solves the simple ratings of every team that played in one season.
+
+        :param season_year: The year of the season to rate.
+
+        :return: The rating of each team, keyed by team name.
+        """
+        guard.raise_if_none(season_year, f"{typename(self)}.get_simple_ratings: season_year")
+
+        snapshot = self.season_snapshot_repository.get_season_snapshot(season_year)
+        return dict(zip(snapshot.team_names, solve_simple_ratings(snapshot).tolist()))
+
+    def update_simple_ratings(self, season_year: int) -> int:
+        """
+        Solves and saves the simple ratings of every team season of one season.
+
+        :param season_year: The year of the season to rate.
+
+        :return: The number of team seasons updated.
+        """
+        guard.raise_if_none(season_year, f"{typename(self)}.update_simple_ratings: season_year")
+
+        snapshot = self.season_snapshot_repository.get_season_snapshot(season_year)
+        if snapshot.game_count == 0:
+            return 0
+
+        ratings = solve_simple_ratings(snapshot)
+        ids = snapshot.get_team_season_column('id')
+        simple_ratings = {
+            ids[index]: Decimal(repr(rating)).quantize(RATING_QUANTUM)
+            for index, rating in enumerate(ratings[:snapshot.team_season_count].tolist())
+        }
+        return self.team_season_repository.update_simple_ratings(season_year, simple_ratings)
+
+
+def solve_simple_ratings(snapshot: SeasonSnapshot) -> np.ndarray:
+    """
+    Solves the simple ratings of every team in a season snapshot in one least-squares call.
+
+    Each game adds one row to the system, so ties simply ask for equal ratings. Ratings are only relative within
+    a group of teams connected by games, so one more row per group, e.g. per league that never played another,
+    asks for the group's ratings to average zero. A team without games is a group of its own and rates zero.
+
+    :param snapshot: The snapshot of the season to rate.
+
+    :return: The rating of each team, in the order of the snapshot's team_names.
+    """
+    team_count = len(snapshot.team_names)
+    guests = np.frombuffer(snapshot.get_game_column('guest_index'), dtype=np.int16).astype(np.intp)
+    hosts = np.frombuffer(snapshot.get_game_column('host_index'), dtype=np.int16).astype(np.intp)
+    margins = (
+        np.frombuffer(snapshot.get_game_column('host_score'), dtype=np.int16).astype(np.float64)
+        - np.frombuffer(snapshot.get_game_column('guest_score'), dtype=np.int16)
+    )
+    if team_count == 0:
+        return np.zeros(0)
+
+    groups = _label_connected_teams(team_count, guests, hosts)
+    group_count = groups.max() + 1
+    game_count = len(margins)
+
+    matrix = np.zeros((game_count + group_count, team_count))
+    game_rows = np.arange(game_count)
+    matrix[game_rows, hosts] = 1.0
+    matrix[game_rows, guests] = -1.0
+    matrix[game_count + groups, np.arange(team_count)] = 1.0
+    targets = np.concatenate((margins, np.zeros(group_count)))
+
+    ratings, *_ = np.linalg.lstsq(matrix, targets, rcond=None)
+    return ratings
+
+
+def _label_connected_teams(team_count: int, guests: np.ndarray, hosts: np.ndarray) -> np.ndarray:
+    # Each team repeatedly takes the smallest label of its opponents until no label changes.
+    labels = np.arange(team_count)
+    while True:
+        smallest = np.minimum(labels[guests], labels[hosts])
+        new_labels = labels.copy()
+        np.minimum.at(new_labels, guests, smallest)
+        np.minimum.at(new_labels, hosts, smallest)
+        new_labels = new_labels[new_labels]
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+
+    _, groups = np.unique(labels, return_inverse=True)
+    return groups
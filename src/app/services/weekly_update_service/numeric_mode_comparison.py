@@ -0,0 +1,70 @@
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Dict, Optional
+
+from app.data.models.team_season import RANKING_COLUMNS
+
+
+@dataclass
+class ColumnDivergence:
+    """
+    Class to represent the largest difference between the Decimal and float rankings found in one ranking column.
+    """
+    column: str
+    max_divergence: Decimal = Decimal(0)
+    team_name: Optional[str] = None
+    season_year: Optional[int] = None
+    values_compared: int = 0
+    null_mismatches: int = 0
+
+
+@dataclass
+class NumericModeComparison:
+    """
+    Class to represent how far apart the rankings calculated in the Decimal and float numeric modes are.
+    """
+    team_seasons_compared: int = 0
+    columns: Dict[str, ColumnDivergence] = field(
+        default_factory=lambda: {name: ColumnDivergence(name) for name in RANKING_COLUMNS}
+    )
+
+    @property
+    def max_divergence(self) -> Decimal:
+        """
+        Gets the largest divergence found in any column.
+
+        :return: The divergence.
+        """
+        return max(column.max_divergence for column in self.columns.values())
+
+    def add(
+            self,
+            team_name: str,
+            season_year: int,
+            decimal_rankings: Dict[str, Optional[Decimal]],
+            float_rankings: Dict[str, Optional[Decimal]]
+    ) -> None:
+        """
+        Adds the rankings of one team season, calculated in both modes and rounded to their columns' scales.
+
+        :param team_name: The team_name of the team season.
+        :param season_year: The season_year of the team season.
+        :param decimal_rankings: The rankings calculated in Decimal, by column.
+        :param float_rankings: The rankings calculated in floating point, by column.
+
+        :return: None
+        """
+        self.team_seasons_compared += 1
+        for name, column in self.columns.items():
+            decimal_value, float_value = decimal_rankings.get(name), float_rankings.get(name)
+            if decimal_value is None or float_value is None:
+                if (decimal_value is None) != (float_value is None):
+                    column.null_mismatches += 1
+                continue
+
+            column.values_compared += 1
+            divergence = abs(decimal_value - float_value)
+            if divergence > column.max_divergence:
+                column.max_divergence = divergence
+                column.team_name = team_name
+                column.season_year = season_year
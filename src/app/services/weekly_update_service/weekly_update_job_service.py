@@ -0,0 +1,56 @@
+from injector import inject
+
+from app.data.models.job import Job
+from app.services.job_service.job_service import JobProgress, JobService
+from app.services.utilities import guard
+from app.services.utilities.utils import typename
+from app.services.weekly_update_service.weekly_update_service import WeeklyUpdateService
+
+WEEKLY_UPDATE_JOB_KIND = 'weekly_update'
+
+
+class WeeklyUpdateJobService:
+    """
+    A service to run weekly updates as background jobs.
+    """
+
+    @inject
+    def __init__(self, job_service: JobService, weekly_update_service: WeeklyUpdateService) -> None:
+        """
+        Initializes a new instance of the WeeklyUpdateJobService class.
+        """
+        self.job_service = job_service
+        self.weekly_update_service = weekly_update_service
+
+    def __repr__(self):
+        return (
+            f"{typename(self)}("
+            f"job_service={self.job_service}, "
+            f"weekly_update_service={self.weekly_update_service}"
+            f")"
+        )
+
+    def enqueue_weekly_update(self, league_name: str, season_year: int) -> Job:
+        """
+        Queues a weekly update of one league season, unless one is already queued or running for it.
+
+        :param league_name: The league_name of the league_season within which a weekly update will be run.
+        :param season_year: The season_year of the league_season within which a weekly update will be run.
+
+        :return: The job that will run, or is already running, the weekly update.
+
+        :raises ValueError: If the league_name or season_year argument is None.
+        """
+        guard.raise_if_none(league_name, 'league_name')
+        guard.raise_if_none(season_year, 'season_year')
+
+        def run(progress: JobProgress) -> dict:
+            report = self.weekly_update_service.run_weekly_update(
+                league_name, season_year, on_phase_completed=progress.phase_completed
+            )
+            return {'rows_touched': report.rows_touched}
+
+        return self.job_service.enqueue(
+            WEEKLY_UPDATE_JOB_KIND, f"{league_name}:{season_year}", run,
+            phase_count=len(WeeklyUpdateService.PHASES)
+        )
@@ -0,0 +1,27 @@
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass
+class WeeklyUpdateReport:
+    """
+    Class to represent the outcome of a weekly update for one pro football league season.
+    """
+    league_name: str
+    season_year: int
+    rows_touched: int = 0
+    attempts: int = 0
+    duration: float = 0.0
+    error: Optional[str] = None
+    phase_durations: Dict[str, float] = field(default_factory=dict)
+    league_season_totals_verified: bool = False
+    league_season_totals_mismatch: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        """
+        Checks to see if the weekly update completed without an error.
+
+        :return: True if the weekly update completed without an error; otherwise false.
+        """
+        return self.error is None
@@ -0,0 +1,110 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List
+
+from flask import Flask
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.data.sqla import sqla
+from app.services.utilities import guard
+from app.services.utilities.utils import typename
+from app.services.weekly_update_service.weekly_update_report import WeeklyUpdateReport
+from app.services.weekly_update_service.weekly_update_service import WeeklyUpdateService
+
+
+class WeeklyUpdateRunner:
+    """
+    Runs weekly updates for many league seasons concurrently on a bounded pool of worker threads.
+
+    Every league of one season is updated by the same worker, one after another, because the rankings phase of a
+    weekly update touches every team season of its season regardless of league. Separate seasons are independent and
+    run concurrently, each in its own application context and therefore its own database session.
+    """
+
+    def __init__(
+            self,
+            app: Flask,
+            weekly_update_service: WeeklyUpdateService,
+            max_workers: int = 4,
+            retries: int = 0,
+            verify_league_season_totals: bool = False
+    ) -> None:
+        """
+        Initializes a new instance of the WeeklyUpdateRunner class.
+
+        :param app: The application within whose context each weekly update will be run.
+        :param weekly_update_service: The service that will run each weekly update.
+        :param max_workers: The maximum number of seasons that will be updated at the same time.
+        :param retries: The number of times a failed league season update will be retried.
+        :param verify_league_season_totals: True to verify the maintained totals of each league season.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        if retries < 0:
+            raise ValueError("retries must not be negative.")
+
+        self.app = app
+        self.weekly_update_service = weekly_update_service
+        self.max_workers = max_workers
+        self.retries = retries
+        self.verify_league_season_totals = verify_league_season_totals
+
+    def __repr__(self):
+        return (
+            f"{typename(self)}("
+            f"app={self.app}, "
+            f"weekly_update_service={self.weekly_update_service}, "
+            f"max_workers={self.max_workers}, "
+            f"retries={self.retries}, "
+            f"verify_league_season_totals={self.verify_league_season_totals}"
+            f")"
+        )
+
+    def run(self, league_names: Iterable[str], season_years: Iterable[int]) -> List[WeeklyUpdateReport]:
+        """
+        Runs a weekly update for every combination of the specified leagues and seasons.
+
+        :param league_names: The names of the leagues to update.
+        :param season_years: The years of the seasons to update.
+
+        :return: One WeeklyUpdateReport per league season, ordered by season_year and then by league_name.
+        """
+        guard.raise_if_none(league_names, 'league_names')
+        guard.raise_if_none(season_years, 'season_years')
+
+        league_names = list(dict.fromkeys(league_names))
+        season_years = sorted(set(season_years))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='weekly-update') as executor:
+            futures = [
+                executor.submit(self._run_season, league_names, season_year) for season_year in season_years
+            ]
+            return [report for future in futures for report in future.result()]
+
+    def _run_season(self, league_names: List[str], season_year: int) -> List[WeeklyUpdateReport]:
+        with self.app.app_context():
+            return [self._run_league_season(league_name, season_year) for league_name in league_names]
+
+    def _run_league_season(self, league_name: str, season_year: int) -> WeeklyUpdateReport:
+        start = time.perf_counter()
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                report = self.weekly_update_service.run_weekly_update(
+                    league_name, season_year, verify_league_season_totals=self.verify_league_season_totals
+                )
+                break
+            except SQLAlchemyError as err:
+                sqla.session.rollback()
+                if attempts > self.retries:
+                    report = WeeklyUpdateReport(league_name=league_name, season_year=season_year, error=str(err))
+                    break
+            except Exception as err:
+                sqla.session.rollback()
+                report = WeeklyUpdateReport(league_name=league_name, season_year=season_year, error=str(err))
+                break
+
+        report.attempts = attempts
+        report.duration = time.perf_counter() - start
+        return report
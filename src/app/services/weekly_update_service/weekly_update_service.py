@@ -1,21 +1,46 @@
+import logging
+import time
+from decimal import Decimal
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from flask import current_app, has_app_context
 from injector import inject
 
-from app.data.models.team_season import TeamSeason
+from app.data.models.team_season import DECIMAL_MODE, FLOAT_MODE, RANKING_COLUMNS, TeamSeason, quantize_to_column
 from app.data.repositories.game_repository import GameRepository
 from app.data.repositories.league_season_repository import LeagueSeasonRepository
 from app.data.repositories.league_season_totals_repository import LeagueSeasonTotalsRepository
 from app.data.repositories.season_repository import SeasonRepository
 from app.data.repositories.team_season_repository import TeamSeasonRepository
 from app.data.repositories.team_season_schedule_repository import TeamSeasonScheduleRepository
+from app.data.session_routing import use_primary
+from app.metrics import metrics
+from app.services.event_bus.event_bus import EventBus
+from app.services.event_bus.season_events import RankingsUpdated
+from app.services.simple_rating_service.simple_rating_service import SimpleRatingService
 from app.services.utilities.utils import typename
 from app.services.utilities import guard
+from app.services.weekly_update_service.numeric_mode_comparison import NumericModeComparison
+from app.services.weekly_update_service.weekly_update_report import WeeklyUpdateReport
+
+logger = logging.getLogger(__name__)
 
 
 class WeeklyUpdateService:
     """
     A service to run a weekly update of the pro football data store.
+
+    League season totals are kept current by the game service as games are written, so the weekly update only
+    aggregates them again when asked to verify them.
+
+    Rankings are calculated in the numeric mode set by the RANKINGS_NUMERIC_MODE config value: Decimal by default, or
+    floating point with each result rounded to its column's scale. Floating point carries about 16 significant digits,
+    so the float mode is expected to stay within 1E-13 of Decimal in every ranking column, which is a few units in the
+    last stored place; compare_numeric_modes() measures the actual divergence over stored seasons.
     """
 
+    PHASES = ('league_season', 'week_count', 'rankings', 'simple_ratings')
+
     @inject
     def __init__(
             self,
@@ -24,7 +49,9 @@ class WeeklyUpdateService:
             league_season_repository: LeagueSeasonRepository,
             team_season_repository: TeamSeasonRepository,
             league_season_totals_repository: LeagueSeasonTotalsRepository,
-            team_season_schedule_repository: TeamSeasonScheduleRepository
+            team_season_schedule_repository: TeamSeasonScheduleRepository,
+            simple_rating_service: SimpleRatingService,
+            event_bus: EventBus
     ):
         """
         Initializes a new instance of the WeeklyUpdateService class.
@@ -35,6 +62,8 @@ class WeeklyUpdateService:
         self.team_season_repository = team_season_repository
         self.league_season_totals_repository = league_season_totals_repository
         self.team_season_schedule_repository = team_season_schedule_repository
+        self.simple_rating_service = simple_rating_service
+        self.event_bus = event_bus
 
     def __repr__(self):
         return (
@@ -44,7 +73,9 @@ class WeeklyUpdateService:
             f"league_season_repository={self.league_season_repository}, "
             f"team_season_repository={self.team_season_repository}, "
             f"league_season_totals_repository={self.league_season_totals_repository}, "
-            f"team_season_schedule_repository={self.team_season_schedule_repository}"
+            f"team_season_schedule_repository={self.team_season_schedule_repository}, "
+            f"simple_rating_service={self.simple_rating_service}, "
+            f"event_bus={self.event_bus}"
             f")"
         )
 
@@ -57,75 +88,168 @@ class WeeklyUpdateService:
                f"League Season Repository: {self.league_season_repository}," \
                f"Team Season Repository: {self.team_season_repository}," \
                f"League Season Totals Repository: {self.league_season_totals_repository}," \
-               f"Team Season Schedule Repository: {self.team_season_schedule_repository})"
+               f"Team Season Schedule Repository: {self.team_season_schedule_repository}," \
+               f"Simple Rating Service: {self.simple_rating_service})"
 
-    def run_weekly_update(self, league_name: str, season_year: int) -> None:
+    @use_primary()
+    def run_weekly_update(
+            self,
+            league_name: str,
+            season_year: int,
+            on_phase_completed: Optional[Callable[[str, float], None]] = None,
+            verify_league_season_totals: bool = False,
+            numeric_mode: Optional[str] = None
+    ) -> WeeklyUpdateReport:
         """
         Runs a weekly update of the data store.
 
         :param league_name: The league_name of the league_season within which a weekly update will be run.
         :param season_year: The season_year of the league_season within which a weekly update will be run.
+        :param on_phase_completed: An optional callback, called with the name and duration in seconds of each phase
+        in PHASES as soon as that phase completes.
+        :param verify_league_season_totals: True to compare the league season's maintained totals with totals
+        aggregated from its team seasons, and to correct them if they differ.
+        :param numeric_mode: The numeric mode in which to calculate rankings, or None for the configured mode.
 
-        :return: None
+        :return: A WeeklyUpdateReport recording the rows touched by the update and the duration of each phase.
         """
         guard.raise_if_none(league_name, 'league_name')
         guard.raise_if_none(season_year, 'season_year')
 
-        self._update_league_season(league_name, season_year)
-        src_week_count = self._update_week_count(season_year)
+        report = WeeklyUpdateReport(league_name=league_name, season_year=season_year)
+
+        start = time.perf_counter()
+        if verify_league_season_totals:
+            report.rows_touched += self._verify_league_season_totals(report)
+        start = self._complete_phase(report, 'league_season', start, on_phase_completed)
+
+        src_week_count, rows_touched = self._update_week_count(season_year)
+        report.rows_touched += rows_touched
+        start = self._complete_phase(report, 'week_count', start, on_phase_completed)
 
         if src_week_count >= 3:
-            self._update_rankings(season_year)
+            rankings_updated = self._update_rankings(season_year, numeric_mode or get_rankings_numeric_mode())
+            report.rows_touched += rankings_updated
+            if rankings_updated:
+                self.event_bus.publish(RankingsUpdated(season_year))
+        start = self._complete_phase(report, 'rankings', start, on_phase_completed)
+
+        report.rows_touched += self.simple_rating_service.update_simple_ratings(season_year)
+        self._complete_phase(report, 'simple_ratings', start, on_phase_completed)
+
+        return report
 
-    def _update_league_season(self, league_name: str, season_year: int) -> None:
+    @staticmethod
+    def _complete_phase(
+            report: WeeklyUpdateReport,
+            phase: str,
+            start: float,
+            on_phase_completed: Optional[Callable[[str, float], None]]
+    ) -> float:
+        end = time.perf_counter()
+        report.phase_durations[phase] = end - start
+        metrics.observe('weekly_update_phase_duration_seconds', end - start, phase=phase)
+        if on_phase_completed is not None:
+            on_phase_completed(phase, end - start)
+        return end
+
+    def _verify_league_season_totals(self, report: WeeklyUpdateReport) -> int:
+        league_name, season_year = report.league_name, report.season_year
         league_season_totals = self.league_season_totals_repository.get_league_season_totals(league_name, season_year)
         if (
                 league_season_totals is None
                 or league_season_totals.total_games is None
                 or league_season_totals.total_points is None
         ):
-            return
+            return 0
 
         league_season = (
             self.league_season_repository.get_league_season_by_league_name_and_season_year(league_name, season_year)
         )
         if league_season is None:
-            return
+            return 0
+
+        report.league_season_totals_verified = True
+        maintained = (league_season.total_games, league_season.total_points)
+        aggregated = (league_season_totals.total_games, league_season_totals.total_points)
+        if maintained == aggregated:
+            return 0
 
+        report.league_season_totals_mismatch = (
+            f"maintained {maintained[0]} games and {maintained[1]} points; "
+            f"aggregated {aggregated[0]} games and {aggregated[1]} points"
+        )
+        logger.warning(
+            "League season totals of %s %s were corrected: %s.",
+            league_name, season_year, report.league_season_totals_mismatch
+        )
         league_season.update_games_and_points(league_season_totals.total_games, league_season_totals.total_points)
         self.league_season_repository.update_league_season(league_season)
+        return 1
 
-    def _update_week_count(self, season_year: int) -> int:
+    def _update_week_count(self, season_year: int) -> tuple[int, int]:
         try:
             src_week_count = max(
                 [game.week for game in self.game_repository.get_games() if game.season_year == season_year]
             )
         except TypeError:
-            return 0
+            return 0, 0
         except ValueError:
-            return 0
+            return 0, 0
 
         dest_season = self.season_repository.get_season_by_year(season_year)
         if dest_season is not None:
             dest_season.num_of_weeks_completed = src_week_count
 
         self.season_repository.update_season(dest_season)
-        return src_week_count
+        return src_week_count, 0 if dest_season is None else 1
+
+    def compare_numeric_modes(self, season_years: Iterable[int]) -> NumericModeComparison:
+        """
+        Calculates the rankings of every team season of the specified seasons in both numeric modes, without saving
+        them, and measures how far apart the two modes' values are once rounded to their columns' scales.
+
+        :param season_years: The years of the seasons to compare.
+
+        :return: The largest divergence of each ranking column, with the team season it was found in.
+        """
+        comparison = NumericModeComparison()
+        for season_year in season_years:
+            for team_season in self.team_season_repository.get_team_seasons_by_season_year(season_year) or []:
+                inputs = self._get_rankings_inputs(team_season)
+                if inputs is None:
+                    continue
+
+                decimal_rankings = _calculate_rankings(team_season, inputs, DECIMAL_MODE)
+                float_rankings = _calculate_rankings(team_season, inputs, FLOAT_MODE)
+                comparison.add(team_season.team_name, team_season.season_year, decimal_rankings, float_rankings)
+        return comparison
 
-    def _update_rankings(self, season_year: int) -> None:
+    def _update_rankings(self, season_year: int, numeric_mode: str) -> int:
         team_seasons = self.team_season_repository.get_team_seasons_by_season_year(season_year)
         if team_seasons is None:
-            return
+            return 0
 
+        rows_touched = 0
         for team_season in team_seasons:
-            self._update_rankings_for_team_season(team_season)
+            rows_touched += self._update_rankings_for_team_season(team_season, numeric_mode)
+        return rows_touched
+
+    def _update_rankings_for_team_season(self, team_season: TeamSeason, numeric_mode: str) -> int:
+        inputs = self._get_rankings_inputs(team_season)
+        if inputs is None:
+            return 0
+
+        team_season.update_rankings(*inputs, numeric_mode=numeric_mode)
+        self.team_season_repository.update_team_season(team_season)
+        return 1
 
-    def _update_rankings_for_team_season(self, team_season: TeamSeason) -> None:
+    def _get_rankings_inputs(self, team_season: TeamSeason) -> Optional[Tuple[Decimal, Decimal, Decimal]]:
         team_season_schedule_totals = self.team_season_schedule_repository.get_team_season_schedule_totals(
             team_season.team_name, team_season.season_year
         )
         if (team_season_schedule_totals is None) or (team_season_schedule_totals.schedule_games is None):
-            return
+            return None
 
         team_season_schedule_averages = \
             self.team_season_schedule_repository.get_team_season_schedule_averages(
@@ -136,15 +260,37 @@ class WeeklyUpdateService:
                 or team_season_schedule_averages.points_for is None
                 or team_season_schedule_averages.points_against is None
         ):
-            return
+            return None
 
         league_season = self.league_season_repository.get_league_season_by_league_name_and_season_year(
             team_season.league_name, team_season.season_year
         )
         if (league_season is None) or (league_season.average_points is None):
-            return
+            return None
 
-        team_season.update_rankings(team_season_schedule_averages.points_for,
-                                    team_season_schedule_averages.points_against,
-                                    league_season.average_points)
-        self.team_season_repository.update_team_season(team_season)
+        return (
+            team_season_schedule_averages.points_for,
+            team_season_schedule_averages.points_against,
+            league_season.average_points
+        )
+
+
+def get_rankings_numeric_mode() -> str:
+    """
+    Gets the numeric mode in which rankings are calculated.
+
+    :return: The RANKINGS_NUMERIC_MODE config value of the current app, or DECIMAL_MODE outside an app context.
+    """
+    if not has_app_context():
+        return DECIMAL_MODE
+    return current_app.config.get('RANKINGS_NUMERIC_MODE', DECIMAL_MODE)
+
+
+def _calculate_rankings(
+        team_season: TeamSeason, inputs: Tuple[Decimal, Decimal, Decimal], numeric_mode: str
+) -> Dict[str, Optional[Decimal]]:
+    # A detached copy keeps the team season in the session from being changed.
+    copy = TeamSeason(games=team_season.games, points_for=team_season.points_for,
+                      points_against=team_season.points_against)
+    copy.update_rankings(*inputs, numeric_mode=numeric_mode)
+    return {name: quantize_to_column(name, getattr(copy, name)) for name in RANKING_COLUMNS}
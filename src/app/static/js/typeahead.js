@@ -0,0 +1,26 @@
+// Fills the datalist of each <input data-typeahead="kind"> with matches from the search endpoint as the user types,
+// so that pages need not render every option up front.
+document.querySelectorAll('input[data-typeahead]').forEach(function (input) {
+    var timer = null;
+    input.addEventListener('input', function () {
+        clearTimeout(timer);
+        timer = setTimeout(function () {
+            var query = input.value.trim();
+            if (!query || !input.list) {
+                return;
+            }
+            var url = '/search/?kind=' + encodeURIComponent(input.dataset.typeahead)
+                + '&q=' + encodeURIComponent(query);
+            fetch(url)
+                .then(function (response) { return response.json(); })
+                .then(function (results) {
+                    input.list.replaceChildren.apply(input.list, results.map(function (result) {
+                        var option = document.createElement('option');
+                        option.value = result.value;
+                        option.label = result.label;
+                        return option;
+                    }));
+                });
+        }, 150);
+    });
+});
@@ -0,0 +1,48 @@
+"""Add a unique index on the kind and key of queued and running jobs
+
+Revision ID: 0b9e6d2f7a41
+Revises: f9c4a2e7b815
+Create Date: 2026-10-19 21:08:37.502913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0b9e6d2f7a41'
+down_revision = 'f9c4a2e7b815'
+branch_labels = None
+depends_on = None
+
+ACTIVE_STATUS_FILTER = "status IN ('queued', 'running')"
+
+
+def upgrade():
+    # Of the jobs of one kind and key that were queued or running together before the index existed, only the latest
+    # is kept active.
+    job = sa.table(
+        'Job', sa.column('id'), sa.column('kind'), sa.column('key'), sa.column('status'), sa.column('error')
+    )
+    is_active = job.c.status.in_(['queued', 'running'])
+    latest = (
+        sa.select(sa.func.max(job.c.id).label('id')).where(is_active).group_by(job.c.kind, job.c.key).subquery()
+    )
+    op.execute(
+        job.update()
+        .where(is_active, job.c.id.not_in(sa.select(latest.c.id)))
+        .values(status='failed', error="The job was superseded.")
+    )
+
+    with op.batch_alter_table('Job', schema=None) as batch_op:
+        batch_op.create_index(
+            'ux_job_kind_key_active', ['kind', 'key'], unique=True,
+            mssql_where=sa.text(ACTIVE_STATUS_FILTER),
+            postgresql_where=sa.text(ACTIVE_STATUS_FILTER),
+            sqlite_where=sa.text(ACTIVE_STATUS_FILTER)
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('Job', schema=None) as batch_op:
+        batch_op.drop_index('ux_job_kind_key_active')
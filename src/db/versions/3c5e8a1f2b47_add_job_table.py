@@ -0,0 +1,45 @@
+"""Add the Job table for background jobs
+
+Revision ID: 3c5e8a1f2b47
+Revises: 
+Create Date: 2026-10-19 09:12:41.218734
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c5e8a1f2b47'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'Job',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('kind', sa.String(length=50), nullable=False),
+        sa.Column('key', sa.String(length=100), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('phase_count', sa.SmallInteger(), nullable=False),
+        sa.Column('phases_completed', sa.SmallInteger(), nullable=False),
+        sa.Column('phase_durations', sa.JSON(), nullable=True),
+        sa.Column('result', sa.JSON(), nullable=True),
+        sa.Column('error', sa.String(length=1024), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('Job', schema=None) as batch_op:
+        batch_op.create_index('ix_job_kind_key_status', ['kind', 'key', 'status'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('Job', schema=None) as batch_op:
+        batch_op.drop_index('ix_job_kind_key_status')
+
+    op.drop_table('Job')
@@ -0,0 +1,26 @@
+"""Add the simple_rating column to the TeamSeason table
+
+Revision ID: 8d41f6c2a9e3
+Revises: 3c5e8a1f2b47
+Create Date: 2026-10-19 13:40:02.518236
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d41f6c2a9e3'
+down_revision = '3c5e8a1f2b47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('TeamSeason', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('simple_rating', sa.Numeric(precision=18, scale=15), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('TeamSeason', schema=None) as batch_op:
+        batch_op.drop_column('simple_rating')
@@ -0,0 +1,101 @@
+"""Add the HeadToHeadSummary table and a head-to-head index on the Game table
+
+Revision ID: a6d83f1e4c90
+Revises: e4a1c9d7b302
+Create Date: 2026-10-19 17:42:08.113590
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a6d83f1e4c90'
+down_revision = 'e4a1c9d7b302'
+branch_labels = None
+depends_on = None
+
+# The series totals that game writes change by increments.
+HEAD_TO_HEAD_GAME_COLUMNS = ('games', 'team_wins', 'opponent_wins', 'ties', 'team_points', 'opponent_points')
+
+
+def upgrade():
+    with op.batch_alter_table('game', schema=None) as batch_op:
+        batch_op.create_index(
+            'ix_game_guest_name_host_name_season_year', ['guest_name', 'host_name', 'season_year'], unique=False
+        )
+
+    summary_table = op.create_table(
+        'HeadToHeadSummary',
+        sa.Column('team_name', sa.String(length=50), nullable=False),
+        sa.Column('opponent_name', sa.String(length=50), nullable=False),
+        sa.Column('games', sa.Integer(), nullable=False),
+        sa.Column('team_wins', sa.Integer(), nullable=False),
+        sa.Column('opponent_wins', sa.Integer(), nullable=False),
+        sa.Column('ties', sa.Integer(), nullable=False),
+        sa.Column('team_points', sa.Integer(), nullable=False),
+        sa.Column('opponent_points', sa.Integer(), nullable=False),
+        sa.Column('first_season_year', sa.SmallInteger(), nullable=True),
+        sa.Column('last_season_year', sa.SmallInteger(), nullable=True),
+        sa.PrimaryKeyConstraint('team_name', 'opponent_name')
+    )
+
+    # Game writes only change the summaries by increments, so the summaries of the games already in the data store are
+    # built here, the way rebuild_head_to_head_summaries() builds them.
+    summaries = _build_summaries(op.get_bind())
+    if summaries:
+        op.bulk_insert(summary_table, summaries)
+
+
+def _build_summaries(connection):
+    game = sa.table(
+        'game', sa.column('season_year', sa.Integer), sa.column('guest_name', sa.String),
+        sa.column('guest_score', sa.Integer), sa.column('host_name', sa.String), sa.column('host_score', sa.Integer)
+    )
+
+    def count_if(condition):
+        return sa.func.sum(sa.case((condition, 1), else_=0))
+
+    # Games are grouped by (guest, host) and folded into sorted pairs here rather than in SQL, so that pairs are
+    # ordered exactly as get_team_pair() orders them whatever the database's collation.
+    rows = connection.execute(
+        sa.select(
+            game.c.guest_name,
+            game.c.host_name,
+            sa.func.count().label('games'),
+            count_if(game.c.guest_score > game.c.host_score).label('guest_wins'),
+            count_if(game.c.guest_score < game.c.host_score).label('host_wins'),
+            count_if(game.c.guest_score == game.c.host_score).label('ties'),
+            sa.func.sum(game.c.guest_score).label('guest_points'),
+            sa.func.sum(game.c.host_score).label('host_points'),
+            sa.func.min(game.c.season_year).label('first_season_year'),
+            sa.func.max(game.c.season_year).label('last_season_year'),
+        ).group_by(game.c.guest_name, game.c.host_name)
+    )
+
+    summaries = {}
+    for row in rows:
+        pair = tuple(sorted((row.guest_name, row.host_name)))
+        summary = summaries.setdefault(pair, {
+            'team_name': pair[0], 'opponent_name': pair[1],
+            **{name: 0 for name in HEAD_TO_HEAD_GAME_COLUMNS},
+            'first_season_year': row.first_season_year, 'last_season_year': row.last_season_year,
+        })
+        guest_is_team = row.guest_name == pair[0]
+        summary['games'] += row.games
+        summary['ties'] += row.ties
+        summary['team_wins'] += row.guest_wins if guest_is_team else row.host_wins
+        summary['opponent_wins'] += row.host_wins if guest_is_team else row.guest_wins
+        summary['team_points'] += row.guest_points if guest_is_team else row.host_points
+        summary['opponent_points'] += row.host_points if guest_is_team else row.guest_points
+        summary['first_season_year'] = min(summary['first_season_year'], row.first_season_year)
+        summary['last_season_year'] = max(summary['last_season_year'], row.last_season_year)
+
+    return list(summaries.values())
+
+
+def downgrade():
+    op.drop_table('HeadToHeadSummary')
+
+    with op.batch_alter_table('game', schema=None) as batch_op:
+        batch_op.drop_index('ix_game_guest_name_host_name_season_year')
@@ -0,0 +1,32 @@
+"""Add Elo ratings to the TeamSeason table and Elo rating changes to the game table
+
+Revision ID: b7e2c4d19f05
+Revises: 8d41f6c2a9e3
+Create Date: 2026-10-19 14:21:37.904152
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e2c4d19f05'
+down_revision = '8d41f6c2a9e3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('TeamSeason', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('elo_rating', sa.Numeric(precision=18, scale=13), nullable=True))
+
+    with op.batch_alter_table('game', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('elo_delta', sa.Numeric(precision=18, scale=13), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('game', schema=None) as batch_op:
+        batch_op.drop_column('elo_delta')
+
+    with op.batch_alter_table('TeamSeason', schema=None) as batch_op:
+        batch_op.drop_column('elo_rating')
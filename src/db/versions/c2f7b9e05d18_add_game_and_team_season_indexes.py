@@ -0,0 +1,75 @@
+"""Add composite indexes on the Game, TeamSeason and LeagueSeason tables
+
+Revision ID: c2f7b9e05d18
+Revises: a6d83f1e4c90
+Create Date: 2026-10-19 18:26:41.902736
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c2f7b9e05d18'
+down_revision = 'a6d83f1e4c90'
+branch_labels = None
+depends_on = None
+
+# The columns of each unique index that this revision adds, by table.
+UNIQUE_KEYS = {
+    'TeamSeason': ('team_name', 'season_year'),
+    'LeagueSeason': ('league_name', 'season_year'),
+}
+
+
+def upgrade():
+    _raise_if_duplicated(op.get_bind())
+
+    with op.batch_alter_table('game', schema=None) as batch_op:
+        batch_op.create_index('ix_game_season_year_week', ['season_year', 'week'], unique=False)
+        batch_op.create_index('ix_game_host_name_season_year', ['host_name', 'season_year'], unique=False)
+
+    with op.batch_alter_table('TeamSeason', schema=None) as batch_op:
+        batch_op.create_index('uq_team_season_team_name_season_year', ['team_name', 'season_year'], unique=True)
+        batch_op.create_index('ix_team_season_season_year_league_name', ['season_year', 'league_name'], unique=False)
+
+    with op.batch_alter_table('LeagueSeason', schema=None) as batch_op:
+        batch_op.create_index(
+            'uq_league_season_league_name_season_year', ['league_name', 'season_year'], unique=True
+        )
+
+
+def _raise_if_duplicated(connection):
+    # A unique index cannot be created over duplicated keys. Which of the duplicated rows holds the right totals
+    # cannot be told here, so they are reported for a person to resolve rather than deleted.
+    duplicates = []
+    for table_name, columns in UNIQUE_KEYS.items():
+        table = sa.table(table_name, *(sa.column(name) for name in columns))
+        key = [table.c[name] for name in columns]
+        rows = connection.execute(
+            sa.select(*key, sa.func.count().label('row_count')).group_by(*key).having(sa.func.count() > 1)
+        ).all()
+        duplicates.extend(
+            f"{table_name} ({', '.join(f'{name}={value!r}' for name, value in zip(columns, row))}): "
+            f"{row.row_count} rows"
+            for row in rows
+        )
+
+    if duplicates:
+        raise RuntimeError(
+            "Cannot add the unique indexes while these keys are duplicated. Delete or merge the extra rows, then "
+            "upgrade again:\n" + "\n".join(duplicates)
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('LeagueSeason', schema=None) as batch_op:
+        batch_op.drop_index('uq_league_season_league_name_season_year')
+
+    with op.batch_alter_table('TeamSeason', schema=None) as batch_op:
+        batch_op.drop_index('ix_team_season_season_year_league_name')
+        batch_op.drop_index('uq_team_season_team_name_season_year')
+
+    with op.batch_alter_table('game', schema=None) as batch_op:
+        batch_op.drop_index('ix_game_host_name_season_year')
+        batch_op.drop_index('ix_game_season_year_week')
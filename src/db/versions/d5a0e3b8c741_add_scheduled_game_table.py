@@ -0,0 +1,41 @@
+"""Add the ScheduledGame table for season schedules
+
+Revision ID: d5a0e3b8c741
+Revises: c2f7b9e05d18
+Create Date: 2026-10-19 19:12:37.550184
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5a0e3b8c741'
+down_revision = 'c2f7b9e05d18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'ScheduledGame',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('season_year', sa.SmallInteger(), nullable=False),
+        sa.Column('week', sa.SmallInteger(), nullable=False),
+        sa.Column('guest_name', sa.String(length=50), nullable=False),
+        sa.Column('host_name', sa.String(length=50), nullable=False),
+        sa.ForeignKeyConstraint(['season_year'], ['Season.year'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('ScheduledGame', schema=None) as batch_op:
+        batch_op.create_index(
+            'uq_scheduled_game_season_year_week_guest_name_host_name',
+            ['season_year', 'week', 'guest_name', 'host_name'], unique=True
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('ScheduledGame', schema=None) as batch_op:
+        batch_op.drop_index('uq_scheduled_game_season_year_week_guest_name_host_name')
+
+    op.drop_table('ScheduledGame')
@@ -0,0 +1,122 @@
+"""Add the TeamFranchiseSummary table for all-time team records
+
+Revision ID: e4a1c9d7b302
+Revises: b7e2c4d19f05
+Create Date: 2026-10-19 16:05:12.447319
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4a1c9d7b302'
+down_revision = 'b7e2c4d19f05'
+branch_labels = None
+depends_on = None
+
+# The all-time totals that game writes change by increments.
+FRANCHISE_GAME_COLUMNS = (
+    'games', 'wins', 'losses', 'ties', 'points_for', 'points_against',
+    'playoff_games', 'playoff_wins', 'playoff_losses', 'playoff_ties',
+)
+
+
+def upgrade():
+    summary_table = op.create_table(
+        'TeamFranchiseSummary',
+        sa.Column('team_name', sa.String(length=50), nullable=False),
+        sa.Column('seasons', sa.SmallInteger(), nullable=False),
+        sa.Column('games', sa.Integer(), nullable=False),
+        sa.Column('wins', sa.Integer(), nullable=False),
+        sa.Column('losses', sa.Integer(), nullable=False),
+        sa.Column('ties', sa.Integer(), nullable=False),
+        sa.Column('points_for', sa.Integer(), nullable=False),
+        sa.Column('points_against', sa.Integer(), nullable=False),
+        sa.Column('playoff_games', sa.Integer(), nullable=False),
+        sa.Column('playoff_wins', sa.Integer(), nullable=False),
+        sa.Column('playoff_losses', sa.Integer(), nullable=False),
+        sa.Column('playoff_ties', sa.Integer(), nullable=False),
+        sa.Column('best_season_year', sa.SmallInteger(), nullable=True),
+        sa.Column('best_winning_percentage', sa.Numeric(precision=18, scale=17), nullable=True),
+        sa.Column('worst_season_year', sa.SmallInteger(), nullable=True),
+        sa.Column('worst_winning_percentage', sa.Numeric(precision=18, scale=17), nullable=True),
+        sa.PrimaryKeyConstraint('team_name')
+    )
+
+    # Game writes only change the summaries by increments, so the summaries of the games and team seasons already in
+    # the data store are built here, the way rebuild_franchise_summaries() builds them.
+    summaries = _build_summaries(op.get_bind())
+    if summaries:
+        op.bulk_insert(summary_table, summaries)
+
+
+def _build_summaries(connection):
+    game = sa.table(
+        'game', sa.column('guest_name', sa.String), sa.column('guest_score', sa.Integer),
+        sa.column('host_name', sa.String), sa.column('host_score', sa.Integer), sa.column('is_playoff', sa.Boolean)
+    )
+    team_season = sa.table(
+        'TeamSeason', sa.column('team_name', sa.String), sa.column('season_year', sa.Integer),
+        sa.column('games', sa.Integer), sa.column('winning_percentage', sa.Numeric)
+    )
+
+    def count_if(condition):
+        return sa.func.sum(sa.case((condition, 1), else_=0))
+
+    def new_summary(team_name):
+        return {
+            'team_name': team_name, 'seasons': 0, **{name: 0 for name in FRANCHISE_GAME_COLUMNS},
+            'best_season_year': None, 'best_winning_percentage': None,
+            'worst_season_year': None, 'worst_winning_percentage': None,
+        }
+
+    summaries = {}
+    for team, team_score, opponent_score in (
+            (game.c.guest_name, game.c.guest_score, game.c.host_score),
+            (game.c.host_name, game.c.host_score, game.c.guest_score),
+    ):
+        rows = connection.execute(
+            sa.select(
+                team.label('team_name'),
+                sa.func.count().label('games'),
+                count_if(team_score > opponent_score).label('wins'),
+                count_if(team_score < opponent_score).label('losses'),
+                count_if(team_score == opponent_score).label('ties'),
+                sa.func.sum(team_score).label('points_for'),
+                sa.func.sum(opponent_score).label('points_against'),
+                count_if(game.c.is_playoff).label('playoff_games'),
+                count_if(sa.and_(game.c.is_playoff, team_score > opponent_score)).label('playoff_wins'),
+                count_if(sa.and_(game.c.is_playoff, team_score < opponent_score)).label('playoff_losses'),
+                count_if(sa.and_(game.c.is_playoff, team_score == opponent_score)).label('playoff_ties'),
+            ).group_by(team)
+        )
+        for row in rows:
+            summary = summaries.setdefault(row.team_name, new_summary(row.team_name))
+            for name in FRANCHISE_GAME_COLUMNS:
+                summary[name] += getattr(row, name) or 0
+
+    # The best and worst seasons are those with the highest and lowest winning percentages among the seasons in
+    # which the team played; the earlier season wins a tie.
+    rows = connection.execute(
+        sa.select(team_season.c.team_name, team_season.c.season_year, team_season.c.games,
+                  team_season.c.winning_percentage)
+        .order_by(team_season.c.team_name, team_season.c.season_year)
+    )
+    for row in rows:
+        summary = summaries.setdefault(row.team_name, new_summary(row.team_name))
+        summary['seasons'] += 1
+        if not row.games or row.winning_percentage is None:
+            continue
+        if summary['best_season_year'] is None or row.winning_percentage > summary['best_winning_percentage']:
+            summary['best_season_year'] = row.season_year
+            summary['best_winning_percentage'] = row.winning_percentage
+        if summary['worst_season_year'] is None or row.winning_percentage < summary['worst_winning_percentage']:
+            summary['worst_season_year'] = row.season_year
+            summary['worst_winning_percentage'] = row.winning_percentage
+
+    return list(summaries.values())
+
+
+def downgrade():
+    op.drop_table('TeamFranchiseSummary')
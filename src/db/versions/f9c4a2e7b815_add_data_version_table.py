@@ -0,0 +1,36 @@
+"""Add the DataVersion table that versions the season data across processes
+
+Revision ID: f9c4a2e7b815
+Revises: d5a0e3b8c741
+Create Date: 2026-10-19 21:02:41.183526
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f9c4a2e7b815'
+down_revision = 'd5a0e3b8c741'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'DataVersion',
+        sa.Column('season_year', sa.SmallInteger(), autoincrement=False, nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('season_year')
+    )
+    # One row for all data, and one for each season, so that the first change to a season only updates a row.
+    data_version = sa.table('DataVersion', sa.column('season_year'), sa.column('version'))
+    season = sa.table('Season', sa.column('year'))
+    op.execute(data_version.insert().values(season_year=0, version=0))
+    op.execute(
+        data_version.insert().from_select(['season_year', 'version'], sa.select(season.c.year, sa.literal(0)))
+    )
+
+
+def downgrade():
+    op.drop_table('DataVersion')
@@ -0,0 +1,71 @@
+# Runs the app in production with preloaded, pre-forked workers:
+#
+#     cd src && gunicorn -c gunicorn.conf.py
+#
+# The master builds the app once, warms its caches and freezes its heap before forking, so the workers start warm
+# and share those pages with the master copy-on-write. Send SIGHUP for a graceful reload: the master re-warms its
+# caches before forking the new workers, and only then retires the old ones.
+#
+# Each worker keeps its own copy of those caches. They are keyed on the data versions in the DataVersion table, which
+# every worker reads at most DATA_VERSION_MAX_AGE_SECONDS apart, so a change committed by one worker, or by a command
+# run from the shell, is seen by the other workers within that time rather than only after a reload.
+#
+# Each worker writes its metrics to METRICS_MULTIPROCESS_DIR, so that a scrape of /metrics served by any worker
+# reports every worker's. When a worker exits, the master folds its counters and histograms into the file of the
+# exited workers and removes the worker's own file.
+import glob
+import multiprocessing
+import os
+import tempfile
+import time
+
+from app import launcher
+from app.data.data_versions import data_versions
+from app.metrics import metrics
+
+metrics_dir = os.environ.setdefault(
+    'METRICS_MULTIPROCESS_DIR', os.path.join(tempfile.gettempdir(), 'pro_football_metrics')
+)
+
+wsgi_app = 'app:create_app()'
+bind = os.environ.get('PRO_FOOTBALL_BIND', '127.0.0.1:8000')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+preload_app = True
+
+
+def on_starting(server):
+    os.makedirs(metrics_dir, exist_ok=True)
+    for path in glob.glob(os.path.join(metrics_dir, '*.json')):
+        os.remove(path)
+
+
+def when_ready(server):
+    launcher.prepare_master(server.app.wsgi(), server.log)
+
+
+def on_reload(server):
+    launcher.prepare_master(server.app.wsgi(), server.log)
+
+
+def pre_fork(server, worker):
+    worker.started_at = time.monotonic()
+
+
+def post_fork(server, worker):
+    # The observations the master made while warming its caches are not the worker's.
+    metrics.clear()
+    # The worker checks its inherited caches against the versions current when it starts serving.
+    data_versions.expire()
+
+
+def post_worker_init(worker):
+    launcher.report_worker_start(worker.started_at, worker.log)
+
+
+def child_exit(server, worker):
+    metrics.retire(metrics_dir, worker.pid)
+
+
+def worker_exit(server, worker):
+    metrics.flush(metrics_dir, force=True)
+    launcher.report_worker_exit(worker.pid, server.log)
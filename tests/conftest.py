@@ -0,0 +1,35 @@
+import pytest
+from flask import Flask
+
+from app.data.data_versions import data_versions
+from app.data.models.data_version import DataVersion
+from app.data.sqla import sqla
+
+
+@pytest.fixture()
+def create_sqlite_app():
+    """
+    Gets a function that creates an app backed by a new in-memory SQLite database. The function takes the models
+    whose tables the test needs, and any config to add or override. The DataVersion table, which every commit
+    writes to, is always created, on every engine of the app.
+    """
+    def create(*models, **config):
+        app = Flask(__name__)
+        app.config.from_mapping({
+            'SECRET_KEY': 'secretkey',
+            'SQLALCHEMY_DATABASE_URI': 'sqlite://',
+            'SQLALCHEMY_TRACK_MODIFICATIONS': False,
+            **config
+        })
+        sqla.init_app(app)
+        with app.app_context():
+            for engine in sqla.engines.values():
+                for model in (DataVersion, *models):
+                    model.__table__.create(engine)
+
+        # The versions read or committed against another test's database must not be mistaken for this one's.
+        data_versions.expire()
+        data_versions._local_versions.clear()
+        return app
+
+    return create
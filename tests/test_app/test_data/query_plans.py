@@ -0,0 +1,78 @@
+import re
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+EXPLAINED_STATEMENTS = ('SELECT', 'UPDATE', 'DELETE')
+
+_FULL_SCAN = re.compile(r'^SCAN (?!CONSTANT ROW)(?!\()(?P<table>\S+)')
+
+
+@dataclass
+class QueryPlan:
+    """
+    Class to represent the plan that SQLite chose for one statement, as reported by EXPLAIN QUERY PLAN.
+    """
+    statement: str
+    parameters: Any
+    details: List[str] = field(default_factory=list)
+
+    @property
+    def full_scans(self) -> List[str]:
+        """
+        Gets the tables that the plan reads from end to end instead of seeking through an index.
+
+        :return: The names of the scanned tables.
+        """
+        return [match.group('table') for match in map(_FULL_SCAN.match, self.details) if match]
+
+    def __str__(self):
+        return "\n".join([self.statement, *(f"  {detail}" for detail in self.details)])
+
+
+@contextmanager
+def capture_query_plans(engine: Engine) -> Iterator[List[QueryPlan]]:
+    """
+    Captures the plan of every SELECT, UPDATE and DELETE statement sent to a SQLite engine within the block.
+
+    Each statement is explained on the connection that runs it, just before it runs, so that the plan is made
+    against the same schema and rows as the statement itself.
+
+    :param engine: The SQLite engine to watch.
+
+    :return: A list to which the plans are appended as the statements run.
+    """
+    plans: List[QueryPlan] = []
+
+    def explain(conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(EXPLAINED_STATEMENTS):
+            return
+
+        if executemany:
+            parameters = parameters[0] if parameters else ()
+        explain_cursor = conn.connection.driver_connection.cursor()
+        try:
+            rows = explain_cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+        finally:
+            explain_cursor.close()
+        plans.append(QueryPlan(statement, parameters, [row[-1] for row in rows]))
+
+    event.listen(engine, 'before_cursor_execute', explain)
+    try:
+        yield plans
+    finally:
+        event.remove(engine, 'before_cursor_execute', explain)
+
+
+def find_full_scans(plans: Sequence[QueryPlan]) -> List[QueryPlan]:
+    """
+    Finds the plans that read any table from end to end.
+
+    :param plans: The captured plans.
+
+    :return: The plans with at least one full scan.
+    """
+    return [plan for plan in plans if plan.full_scans]
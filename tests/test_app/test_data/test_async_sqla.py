@@ -0,0 +1,84 @@
+import asyncio
+import threading
+from unittest.mock import patch
+
+from flask import Flask, g
+
+from app.data.async_sqla import EXTENSION_KEY, AsyncSQLAlchemy
+from app.data.session_routing import READ_BIND_KEY
+
+
+def test_init_app_when_no_async_uri_configured_should_leave_async_mode_off():
+    # Arrange
+    app = Flask(__name__)
+    test_async_sqla = AsyncSQLAlchemy()
+
+    # Act
+    test_async_sqla.init_app(app)
+
+    # Assert
+    with app.app_context():
+        assert not test_async_sqla.is_enabled
+
+
+def test_is_enabled_outside_app_context_should_be_false():
+    # Assert
+    assert not AsyncSQLAlchemy().is_enabled
+
+
+def test_get_engine_should_send_reads_to_read_engine_and_writes_to_primary():
+    # Arrange
+    app = Flask(__name__)
+    primary, read = object(), object()
+    app.extensions[EXTENSION_KEY] = {None: primary, READ_BIND_KEY: read}
+    test_async_sqla = AsyncSQLAlchemy()
+
+    with app.app_context():
+        # Act
+        read_engine = test_async_sqla._get_engine(read_only=True)
+        write_engine = test_async_sqla._get_engine(read_only=False)
+
+    # Assert
+    assert read_engine is read
+    assert write_engine is primary
+
+
+def test_get_engine_when_user_has_just_written_should_send_reads_to_primary():
+    # Arrange
+    app = Flask(__name__)
+    primary, read = object(), object()
+    app.extensions[EXTENSION_KEY] = {None: primary, READ_BIND_KEY: read}
+    test_async_sqla = AsyncSQLAlchemy()
+
+    with app.test_request_context('/'):
+        g.wrote_to_primary = True
+
+        # Act
+        result = test_async_sqla._get_engine(read_only=True)
+
+    # Assert
+    assert result is primary
+
+
+def test_fetch_all_should_run_statements_of_every_event_loop_on_one_shared_loop():
+    # Arrange
+    app = Flask(__name__)
+    app.extensions[EXTENSION_KEY] = {None: object()}
+    test_async_sqla = AsyncSQLAlchemy()
+    loops = []
+
+    async def fetch_all(engine, statement):
+        loops.append((asyncio.get_running_loop(), threading.current_thread()))
+        return [statement]
+
+    with app.app_context(), patch('app.data.async_sqla._fetch_all', side_effect=fetch_all):
+        # Act
+        # Each async view runs in an event loop of its own.
+        first = asyncio.run(test_async_sqla.fetch_all('first'))
+        second = asyncio.run(test_async_sqla.fetch_all('second'))
+
+    # Assert
+    assert (first, second) == (['first'], ['second'])
+    assert loops[0] == loops[1]
+    assert loops[0][0] is test_async_sqla._get_loop()
+    assert loops[0][1] is not threading.current_thread()
@@ -0,0 +1,175 @@
+from datetime import datetime
+
+import pytest
+
+from app.data.data_versions import DataVersions, data_versions
+from app.data.models.data_version import DataVersion, GLOBAL_SEASON_YEAR, REFERENCE_DATA_SEASON_YEARS
+from app.data.models.game import Game
+from app.data.models.job import Job
+from app.data.models.season import Season
+from app.data.sqla import sqla
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture()
+def test_app(create_sqlite_app):
+    return create_sqlite_app(Season, Game, Job)
+
+
+def test_bump_should_increment_versions_of_seasons_and_kinds_in_data_store(test_app):
+    with test_app.app_context():
+        # Arrange
+        test_versions = DataVersions()
+
+        # Act
+        test_versions.bump(sqla.session, [1920, 1920, 1921])
+        test_versions.bump(sqla.session, kinds=['team'])
+        test_versions.bump(sqla.session)
+        sqla.session.commit()
+
+        # Assert
+        assert {row.season_year: row.version for row in DataVersion.query} == {
+            GLOBAL_SEASON_YEAR: 1, REFERENCE_DATA_SEASON_YEARS['team']: 1, 1920: 1, 1921: 1
+        }
+        assert test_versions.get(1920) == 1
+        assert test_versions.get(1922) == 0
+        assert test_versions.get_reference_data_version('team') == 1
+        assert test_versions.get_reference_data_version('league') == 0
+        assert test_versions.global_version == 1
+
+
+def test_commit_should_bump_versions_of_changed_season_its_kind_and_global_version(test_app):
+    with test_app.app_context():
+        # Arrange
+        version = data_versions.get(1920)
+        kind_version = data_versions.get_reference_data_version('season')
+        global_version = data_versions.global_version
+
+        # Act
+        sqla.session.add(Season(year=1920, num_of_weeks_scheduled=13, num_of_weeks_completed=0))
+        sqla.session.commit()
+
+        # Assert
+        assert data_versions.get(1920) == version + 1
+        assert data_versions.get_reference_data_version('season') == kind_version + 1
+        assert data_versions.global_version == global_version + 1
+
+
+def test_commit_of_game_should_bump_version_of_its_season_only(test_app):
+    with test_app.app_context():
+        # Arrange
+        versions = {row.season_year: row.version for row in DataVersion.query}
+
+        # Act
+        sqla.session.add(Game(season_year=1920, week=1, guest_name="Pros", guest_score=0, host_name="Bears",
+                              host_score=7, is_playoff=False))
+        sqla.session.commit()
+
+        # Assert
+        assert {row.season_year: row.version for row in DataVersion.query} == {**versions, 1920: 1}
+        assert data_versions.global_version == 0
+
+
+def test_commit_of_job_should_not_bump_versions(test_app):
+    with test_app.app_context():
+        # Act
+        now = datetime.now()
+        sqla.session.add(Job(kind='weekly-update', key='1920', created_at=now, updated_at=now))
+        sqla.session.commit()
+
+        # Assert
+        assert DataVersion.query.count() == 0
+
+
+def test_commit_should_bump_versions_of_seasons_marked_changed_by_bulk_statements(test_app):
+    with test_app.app_context():
+        # Act
+        data_versions.mark_changed(sqla.session, [1921])
+        sqla.session.commit()
+
+        # Assert
+        assert data_versions.get(1921) == 1
+        assert data_versions.get(1920) == 0
+
+
+def test_rollback_should_not_bump_versions(test_app):
+    with test_app.app_context():
+        # Arrange
+        global_version = data_versions.global_version
+
+        # Act
+        sqla.session.add(Season(year=1921, num_of_weeks_scheduled=13, num_of_weeks_completed=0))
+        sqla.session.flush()
+        sqla.session.rollback()
+        sqla.session.commit()
+
+        # Assert
+        assert data_versions.global_version == global_version
+
+
+def test_get_should_see_changes_committed_by_other_processes_once_versions_are_older_than_max_age(test_app):
+    with test_app.app_context():
+        # Arrange
+        clock = FakeClock()
+        test_versions = DataVersions(max_age=1.0, clock=clock)
+        version = test_versions.get(1920)
+
+        # Another process's versions are only in the data store.
+        sqla.session.add(DataVersion(season_year=1920, version=5))
+        sqla.session.commit()
+
+        # Act
+        cached = test_versions.get(1920)
+        clock.now = 1.0
+        current = test_versions.get(1920)
+
+        # Assert
+        assert cached == version == 0
+        assert current == 5
+
+
+def test_committed_locally_should_tell_versions_committed_by_this_process_from_others(test_app):
+    with test_app.app_context():
+        # Arrange
+        data_versions.mark_changed(sqla.session, [1920])
+        sqla.session.commit()
+
+        # Another process's version is only in the data store.
+        DataVersion.query.filter_by(season_year=1920).one().version = 2
+        sqla.session.commit()
+
+        data_versions.mark_changed(sqla.session, [1920])
+        sqla.session.commit()
+
+        # Act
+        local = data_versions.committed_locally(1920, 0, 1)
+        remote = data_versions.committed_locally(1920, 1, 3)
+        latest = data_versions.committed_locally(1920, 2, 3)
+
+        # Assert
+        assert data_versions.get(1920) == 3
+        assert (local, remote, latest) == (True, False, True)
+
+
+def test_refresh_should_read_versions_committed_by_other_processes_at_once(test_app):
+    with test_app.app_context():
+        # Arrange
+        test_versions = DataVersions(max_age=60.0)
+        test_versions.get(1920)
+
+        # Another process's versions are only in the data store.
+        sqla.session.add(DataVersion(season_year=1920, version=5))
+        sqla.session.commit()
+
+        # Act
+        test_versions.refresh()
+
+        # Assert
+        assert test_versions.get(1920) == 5
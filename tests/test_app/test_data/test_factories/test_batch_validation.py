@@ -0,0 +1,102 @@
+import pytest
+from sqlalchemy import event
+
+from app.data.factories.batch_validation import BatchValidationError, create_batch, validate_batch
+from app.data.models.league import League
+from app.data.sqla import sqla
+
+
+@pytest.fixture()
+def test_app(create_sqlite_app):
+    app = create_sqlite_app(League)
+    with app.app_context():
+        sqla.session.add(League(short_name="NFL", long_name="National Football League", first_season_year=1922))
+        sqla.session.commit()
+    return app
+
+
+def test_validate_batch_when_batch_is_valid_should_run_one_query_per_key(test_app):
+    with test_app.app_context():
+        # Arrange
+        statements = []
+        event.listen(sqla.engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+        kwargs_list = [
+            {'short_name': f"L{i}", 'long_name': f"League {i}", 'first_season_year': 1920} for i in range(50)
+        ]
+
+        # Act
+        validate_batch(League, 'League', ['short_name', 'long_name'], kwargs_list)
+
+        # Assert
+        assert len(statements) == 2
+
+
+def test_validate_batch_should_report_every_error_together(test_app):
+    with test_app.app_context():
+        # Arrange
+        kwargs_list = [
+            {'short_name': "NFL", 'long_name': "New Football League"},
+            {'short_name': "AFL", 'long_name': "American Football League"},
+            {'short_name': "AFL", 'long_name': "All-America Football Conference"},
+            {'long_name': "United States Football League"},
+        ]
+
+        # Act
+        with pytest.raises(BatchValidationError) as err:
+            validate_batch(League, 'League', ['short_name', 'long_name'], kwargs_list)
+
+        # Assert
+        assert err.value.errors == [
+            "Item 4: short_name is required.",
+            "Items 2, 3: League short_name=AFL appears more than once in the batch.",
+            "Item 1: League already exists with short_name=NFL.",
+        ]
+
+
+def test_validate_batch_should_report_existing_values_of_each_key(test_app):
+    with test_app.app_context():
+        # Arrange
+        kwargs_list = [{'short_name': "NFL2", 'long_name': "National Football League"}]
+
+        # Act
+        with pytest.raises(BatchValidationError) as err:
+            validate_batch(League, 'League', ['short_name', 'long_name'], kwargs_list)
+
+        # Assert
+        assert err.value.errors == ["Item 1: League already exists with long_name=National Football League."]
+        assert isinstance(err.value, ValueError)
+
+
+def test_create_batch_when_batch_is_valid_should_return_entities_in_order(test_app):
+    with test_app.app_context():
+        # Arrange
+        kwargs_list = [
+            {'short_name': "AFL", 'long_name': "American Football League", 'first_season_year': 1960},
+            {'short_name': "AAFC", 'long_name': "All-America Football Conference", 'first_season_year': 1946},
+        ]
+
+        # Act
+        result = create_batch(League, 'League', ['short_name', 'long_name'], kwargs_list)
+
+    # Assert
+    assert [league.short_name for league in result] == ["AFL", "AAFC"]
+
+
+def test_create_batch_should_report_values_rejected_by_model_with_other_errors(test_app):
+    with test_app.app_context():
+        # Arrange
+        kwargs_list = [
+            {'short_name': "NFL", 'long_name': "New Football League", 'first_season_year': 1920},
+            {'short_name': "AFL", 'long_name': "", 'first_season_year': 1960},
+            {'short_name': "AAFC", 'long_name': "All-America Football Conference", 'first_season_year': 1946},
+        ]
+
+        # Act
+        with pytest.raises(BatchValidationError) as err:
+            create_batch(League, 'League', ['short_name', 'long_name'], kwargs_list)
+
+    # Assert
+    assert err.value.errors == [
+        "Item 1: League already exists with short_name=NFL.",
+        "Item 2: long_name is required.",
+    ]
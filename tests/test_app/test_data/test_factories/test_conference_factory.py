@@ -429,3 +429,63 @@ def test_validate_is_unique_when_short_name_is_not_unique_and_error_message_is_p
 
     # Assert
     assert err.value.args[0] == error_message
+
+
+@patch('app.data.factories.conference_factory.create_batch')
+def test_create_conferences_should_create_whole_batch_together(fake_create_batch):
+    # Arrange
+    kwargs_list = [
+        {'short_name': "NFC", 'long_name': "National Football Conference", 'league_name': "NFL",
+         'first_season_year': 1970},
+        {'short_name': "AFC", 'long_name': "American Football Conference", 'league_name': "NFL",
+         'first_season_year': 1970},
+    ]
+
+    # Act
+    test_conferences = conference_factory.create_conferences(iter(kwargs_list))
+
+    # Assert
+    fake_create_batch.assert_called_once_with(Conference, 'Conference', ['short_name', 'long_name'], kwargs_list)
+    assert test_conferences is fake_create_batch.return_value
+
+
+def test_create_conferences_when_batch_is_valid_should_return_conferences(create_sqlite_app):
+    # Arrange
+    app = create_sqlite_app(Conference)
+    with app.app_context():
+        kwargs_list = [
+            {'short_name': "NFC", 'long_name': "National Football Conference", 'league_name': "NFL",
+             'first_season_year': 1970},
+            {'short_name': "AFC", 'long_name': "American Football Conference", 'league_name': "NFL",
+             'first_season_year': 1970},
+        ]
+
+        # Act
+        test_conferences = conference_factory.create_conferences(kwargs_list)
+
+    # Assert
+    assert [conference.short_name for conference in test_conferences] == ["NFC", "AFC"]
+
+
+def test_create_conferences_should_report_errors_of_every_conference_together(create_sqlite_app):
+    # Arrange
+    from app.data.factories.batch_validation import BatchValidationError
+
+    app = create_sqlite_app(Conference)
+    with app.app_context():
+        kwargs_list = [
+            {'short_name': "NFC", 'long_name': "", 'league_name': "NFL", 'first_season_year': 1970},
+            {'short_name': "NFC", 'long_name': "American Football Conference", 'league_name': "",
+             'first_season_year': 1970},
+        ]
+
+        # Act
+        with pytest.raises(BatchValidationError) as err:
+            conference_factory.create_conferences(kwargs_list)
+
+    # Assert
+    assert err.value.errors == [
+        "Items 1, 2: Conference short_name=NFC appears more than once in the batch.",
+        "Item 1: long_name is required.",
+        "Item 2: league_name is required.",
+    ]
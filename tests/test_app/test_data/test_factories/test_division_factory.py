@@ -226,3 +226,46 @@ def test_validate_is_unique_when_name_is_not_unique_and_error_message_is_provide
 
     # Assert
     assert err.value.args[0] == error_message
+
+
+@patch('app.data.factories.division_factory.create_batch')
+def test_create_divisions_should_create_whole_batch_together(fake_create_batch):
+    # Arrange
+    kwargs_list = [
+        {'name': "NFC Central", 'league_name': "NFL", 'conference_name': "NFC", 'first_season_year': 1970},
+        {'name': "NFC East", 'league_name': "NFL", 'conference_name': "NFC", 'first_season_year': 1970},
+    ]
+
+    # Act
+    test_divisions = division_factory.create_divisions(iter(kwargs_list))
+
+    # Assert
+    fake_create_batch.assert_called_once_with(Division, 'Division', ['name'], kwargs_list)
+    assert test_divisions is fake_create_batch.return_value
+
+
+def test_create_divisions_should_report_errors_of_every_division_together(create_sqlite_app):
+    # Arrange
+    from app.data.factories.batch_validation import BatchValidationError
+    from app.data.sqla import sqla
+
+    app = create_sqlite_app(Division)
+    with app.app_context():
+        sqla.session.add(Division(name="NFC East", league_name="NFL", first_season_year=1970))
+        sqla.session.commit()
+        kwargs_list = [
+            {'league_name': "NFL", 'first_season_year': 1970},
+            {'name': "NFC East", 'league_name': "NFL", 'first_season_year': 1970},
+            {'name': "NFC Central", 'league_name': "", 'first_season_year': 1970},
+        ]
+
+        # Act
+        with pytest.raises(BatchValidationError) as err:
+            division_factory.create_divisions(kwargs_list)
+
+    # Assert
+    assert err.value.errors == [
+        "Item 1: name is required.",
+        "Item 2: Division already exists with name=NFC East.",
+        "Item 3: league_name is required.",
+    ]
@@ -405,3 +405,19 @@ def test_validate_is_unique_when_short_name_is_not_unique_and_error_message_is_p
 
     # Assert
     assert err.value.args[0] == error_message
+
+
+@patch('app.data.factories.league_factory.create_batch')
+def test_create_leagues_should_create_whole_batch_together(fake_create_batch):
+    # Arrange
+    kwargs_list = [
+        {'short_name': "NFL", 'long_name': "National Football League", 'first_season_year': 1922},
+        {'short_name': "AFL", 'long_name': "American Football League", 'first_season_year': 1960},
+    ]
+
+    # Act
+    test_leagues = league_factory.create_leagues(iter(kwargs_list))
+
+    # Assert
+    fake_create_batch.assert_called_once_with(League, 'League', ['short_name', 'long_name'], kwargs_list)
+    assert test_leagues is fake_create_batch.return_value
@@ -197,3 +197,17 @@ def test_validate_is_unique_when_year_is_not_unique_and_error_message_is_provide
 
     # Assert
     assert err.value.args[0] == error_message
+
+
+@patch('app.data.factories.season_factory.create_batch')
+def test_create_seasons_should_create_whole_batch_together(fake_create_batch):
+    # Arrange
+    kwargs_list = [{'year': 1920}, {'year': 1921}]
+
+    # Act
+    test_seasons = season_factory.create_seasons(iter(kwargs_list))
+
+    # Assert
+    fake_create_batch.assert_called_once_with(Season, 'Season', ['year'], kwargs_list,
+                                              required_message="Year is required.")
+    assert test_seasons is fake_create_batch.return_value
@@ -180,3 +180,38 @@ def test_validate_is_unique_when_name_is_not_unique_and_error_message_is_provide
 
     # Assert
     assert err.value.args[0] == error_message
+
+
+@patch('app.data.factories.team_factory.create_batch')
+def test_create_teams_should_create_whole_batch_together(fake_create_batch):
+    # Arrange
+    kwargs_list = [{'name': "Chicago Bears"}, {'name': "Green Bay Packers"}]
+
+    # Act
+    test_teams = team_factory.create_teams(iter(kwargs_list))
+
+    # Assert
+    fake_create_batch.assert_called_once_with(Team, 'Team', ['name'], kwargs_list)
+    assert test_teams is fake_create_batch.return_value
+
+
+def test_create_teams_should_report_errors_of_every_team_together(create_sqlite_app):
+    # Arrange
+    from app.data.factories.batch_validation import BatchValidationError
+    from app.data.sqla import sqla
+
+    app = create_sqlite_app(Team)
+    with app.app_context():
+        sqla.session.add(Team(name="Chicago Bears"))
+        sqla.session.commit()
+        kwargs_list = [{'name': "Chicago Bears"}, {'name': ""}, {'name': "Green Bay Packers"}]
+
+        # Act
+        with pytest.raises(BatchValidationError) as err:
+            team_factory.create_teams(kwargs_list)
+
+    # Assert
+    assert err.value.errors == [
+        "Item 1: Team already exists with name=Chicago Bears.",
+        "Item 2: name is required.",
+    ]
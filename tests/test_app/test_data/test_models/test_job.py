@@ -0,0 +1,31 @@
+from app.data.models.job import Job
+
+
+def test_progress_when_job_has_no_phases_should_return_none():
+    # Arrange
+    test_job = Job(kind='kind', key='key', phase_count=0, phases_completed=0)
+
+    # Act
+    result = test_job.progress
+
+    # Assert
+    assert result is None
+
+
+def test_progress_when_job_has_phases_should_return_completed_fraction():
+    # Arrange
+    test_job = Job(kind='kind', key='key', phase_count=4, phases_completed=1)
+
+    # Act
+    result = test_job.progress
+
+    # Assert
+    assert result == 0.25
+
+
+def test_is_active_should_be_true_only_for_queued_and_running_jobs():
+    # Act and Assert
+    assert Job(status=Job.QUEUED).is_active()
+    assert Job(status=Job.RUNNING).is_active()
+    assert not Job(status=Job.SUCCEEDED).is_active()
+    assert not Job(status=Job.FAILED).is_active()
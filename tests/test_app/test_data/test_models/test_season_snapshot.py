@@ -0,0 +1,124 @@
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from app.data.models.season_snapshot import (NULL_NUMERIC, GameRecord, SeasonSnapshot, TeamSeasonRecord,
+                                             from_scaled_int, to_scaled_int)
+
+
+def _team_season_row(id, team_name, **values):
+    row = {field: None for field in TeamSeasonRecord._fields}
+    row.update(id=id, team_name=team_name, season_year=1, league_name='NFL', games=0, wins=0, losses=0, ties=0,
+               points_for=0, points_against=0)
+    row.update(values)
+    return SimpleNamespace(**row)
+
+
+def _game_row(id, guest_name, guest_score, host_name, host_score, week=1, is_playoff=False):
+    return SimpleNamespace(id=id, season_year=1, week=week, guest_name=guest_name, guest_score=guest_score,
+                           host_name=host_name, host_score=host_score, is_playoff=is_playoff, notes=None,
+                           elo_delta=None)
+
+
+@pytest.fixture()
+def test_snapshot():
+    team_season_rows = [
+        _team_season_row(1, "Chicago Bears", conference_name='NFC', division_name='NFC North', games=2, wins=1,
+                         losses=1, points_for=40, points_against=38,
+                         winning_percentage=Decimal('0.50000000000000000'),
+                         offensive_average=Decimal('20.000000000000000'),
+                         offensive_factor=Decimal('1.05263157894737')),
+        _team_season_row(2, "Green Bay Packers", conference_name='NFC', division_name='NFC North', games=2, wins=1,
+                         losses=1, points_for=38, points_against=40),
+    ]
+    game_rows = [
+        _game_row(10, "Chicago Bears", 21, "Green Bay Packers", 17, week=1),
+        _game_row(11, "Green Bay Packers", 21, "Chicago Bears", 19, week=2, is_playoff=True),
+    ]
+    return SeasonSnapshot.build(1, 3, team_season_rows, game_rows)
+
+
+def test_to_scaled_int_and_from_scaled_int_should_round_trip_exactly():
+    # Arrange
+    value = Decimal('0.12345678901234567')
+
+    # Act
+    result = from_scaled_int(to_scaled_int(value, 17), 17)
+
+    # Assert
+    assert result == value
+
+
+def test_to_scaled_int_when_value_is_none_should_return_null_sentinel():
+    # Act and Assert
+    assert to_scaled_int(None, 15) == NULL_NUMERIC
+    assert from_scaled_int(NULL_NUMERIC, 15) is None
+
+
+def test_get_team_season_should_return_record_with_same_values_as_row(test_snapshot):
+    # Act
+    result = test_snapshot.get_team_season("Chicago Bears")
+
+    # Assert
+    assert result.id == 1
+    assert result.season_year == 1
+    assert result.league_name == 'NFL'
+    assert result.conference_name == 'NFC'
+    assert result.division_name == 'NFC North'
+    assert (result.games, result.wins, result.losses, result.ties) == (2, 1, 1, 0)
+    assert (result.points_for, result.points_against) == (40, 38)
+    assert result.winning_percentage == Decimal('0.5')
+    assert result.offensive_average == Decimal('20')
+    assert result.offensive_factor == Decimal('1.05263157894737')
+    assert result.defensive_factor is None
+
+
+def test_get_team_season_when_team_is_not_in_snapshot_should_return_none(test_snapshot):
+    # Act and Assert
+    assert test_snapshot.get_team_season("Detroit Lions") is None
+
+
+def test_get_team_seasons_should_return_every_team_season_in_order(test_snapshot):
+    # Act
+    result = test_snapshot.get_team_seasons()
+
+    # Assert
+    assert [team_season.team_name for team_season in result] == ["Chicago Bears", "Green Bay Packers"]
+    assert test_snapshot.team_season_count == 2
+
+
+def test_get_games_should_decode_team_names(test_snapshot):
+    # Act
+    result = list(test_snapshot.get_games())
+
+    # Assert
+    assert result == [
+        GameRecord(10, 1, 1, "Chicago Bears", 21, "Green Bay Packers", 17, False),
+        GameRecord(11, 1, 2, "Green Bay Packers", 21, "Chicago Bears", 19, True),
+    ]
+
+
+def test_build_when_game_team_has_no_team_season_should_not_return_a_team_season_for_it():
+    # Act
+    snapshot = SeasonSnapshot.build(1, 0, [], [_game_row(1, "Guest", 7, "Host", 3)])
+
+    # Assert
+    assert snapshot.get_team_season("Guest") is None
+    assert [game.guest_name for game in snapshot.get_games()] == ["Guest"]
+
+
+def test_columns_should_be_read_only(test_snapshot):
+    # Act
+    column = test_snapshot.get_game_column('guest_score')
+
+    # Assert
+    assert list(column) == [21, 21]
+    with pytest.raises(TypeError):
+        column[0] = 0
+
+
+def test_snapshot_should_be_immutable(test_snapshot):
+    # Act and Assert
+    with pytest.raises(AttributeError):
+        test_snapshot._version = 4
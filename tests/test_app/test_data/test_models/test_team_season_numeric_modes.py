@@ -0,0 +1,60 @@
+from decimal import Decimal
+
+import pytest
+
+from app.data.models import team_season as mut
+from app.data.models.team_season import TeamSeason
+
+
+def test_team_season_update_rankings_in_float_mode_should_round_rankings_to_column_scales():
+    # Arrange
+    test_team_season = TeamSeason(team_name="Team", season_year=1, league_name="League", games=12, points_for=300,
+                                  points_against=200)
+
+    # Act
+    test_team_season.update_rankings(Decimal('20.5'), Decimal('21.3'), Decimal('20.1'), numeric_mode=mut.FLOAT_MODE)
+
+    # Assert
+    assert test_team_season.offensive_average == Decimal('25.000000000000000')
+    assert test_team_season.offensive_factor.as_tuple().exponent == -14
+    assert test_team_season.final_expected_winning_percentage.as_tuple().exponent == -17
+
+
+def test_team_season_update_rankings_in_float_mode_should_stay_within_error_bound_of_decimal_mode():
+    # Arrange
+    decimal_team_season = TeamSeason(games=12, points_for=300, points_against=200)
+    float_team_season = TeamSeason(games=12, points_for=300, points_against=200)
+    inputs = (Decimal('20.5'), Decimal('21.3'), Decimal('20.1'))
+
+    # Act
+    decimal_team_season.update_rankings(*inputs)
+    float_team_season.update_rankings(*inputs, numeric_mode=mut.FLOAT_MODE)
+
+    # Assert
+    for name in mut.RANKING_COLUMNS:
+        assert abs(getattr(decimal_team_season, name) - getattr(float_team_season, name)) < Decimal('1E-13')
+
+
+def test_team_season_update_rankings_when_numeric_mode_is_unknown_should_raise_value_error():
+    # Arrange
+    test_team_season = TeamSeason(games=12, points_for=300, points_against=200)
+
+    # Act
+    with pytest.raises(ValueError):
+        test_team_season.update_rankings(Decimal('20.5'), Decimal('21.3'), Decimal('20.1'), numeric_mode="binary")
+
+
+def test_calculate_rankings_fast_when_games_equals_zero_should_return_no_rankings():
+    # Act
+    rankings = mut.calculate_rankings_fast(0, 0, 0, 20.5, 21.3, 20.1)
+
+    # Assert
+    assert rankings == {name: None for name in mut.RANKING_COLUMNS[:6]}
+
+
+def test_quantize_to_column_should_round_to_column_scale():
+    # Act
+    result = mut.quantize_to_column('offensive_factor', 1.1737089201877935)
+
+    # Assert
+    assert result == Decimal('1.17370892018779')
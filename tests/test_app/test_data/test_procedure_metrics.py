@@ -0,0 +1,31 @@
+from unittest.mock import patch
+
+from sqlalchemy import create_engine, text
+
+from app.data.procedure_metrics import get_procedure_name
+
+
+def test_get_procedure_name_should_get_name_without_schema_or_brackets():
+    # Act / Assert
+    assert get_procedure_name("EXEC sp_get_team_season_schedule_totals :team_name, :season_year") \
+        == 'sp_get_team_season_schedule_totals'
+    assert get_procedure_name("  execute dbo.[sp_rank_teams] 1920") == 'sp_rank_teams'
+
+
+def test_get_procedure_name_should_return_none_for_other_statements():
+    # Act / Assert
+    assert get_procedure_name("SELECT * FROM team") is None
+    assert get_procedure_name("UPDATE team SET name = 'EXEC sp_x'") is None
+
+
+@patch('app.data.procedure_metrics.metrics')
+def test_listeners_should_time_only_procedure_calls(fake_metrics):
+    # Arrange
+    engine = create_engine('sqlite://')
+
+    with engine.connect() as connection:
+        # Act
+        connection.execute(text("SELECT 1"))
+
+    # Assert
+    fake_metrics.observe.assert_not_called()
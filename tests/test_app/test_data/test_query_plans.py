@@ -0,0 +1,98 @@
+import pytest
+
+from app.data.models.game import Game
+from app.data.models.head_to_head_summary import HeadToHeadSummary
+from app.data.models.job import Job
+from app.data.models.league_season import LeagueSeason
+from app.data.models.scheduled_game import ScheduledGame
+from app.data.models.season import Season
+from app.data.models.team_franchise_summary import TeamFranchiseSummary
+from app.data.models.team_season import TeamSeason
+from app.data.repositories.game_repository import GameRepository
+from app.data.repositories.head_to_head_repository import HeadToHeadRepository
+from app.data.repositories.job_repository import JobRepository
+from app.data.repositories.league_season_repository import LeagueSeasonRepository
+from app.data.repositories.scheduled_game_repository import ScheduledGameRepository
+from app.data.repositories.season_repository import SeasonRepository
+from app.data.repositories.team_repository import TeamRepository
+from app.data.repositories.team_season_repository import TeamSeasonRepository
+from app.data.sqla import sqla
+from test_app.test_data.query_plans import capture_query_plans, find_full_scans
+
+# The queries that page views, game writes and the weekly update run over and over. Each must seek through an index;
+# queries that read whole tables on purpose, like the rebuilds, are left out.
+HOT_QUERIES = {
+    'game.get_game': lambda: GameRepository().get_game(1),
+    'game.get_games_by_season_year': lambda: GameRepository().get_games_by_season_year(1920),
+    'game.get_games_by_season_year_and_week': lambda: GameRepository().get_games_by_season_year_and_week(1920, 1),
+    'game.get_game_rows_by_season_year': lambda: GameRepository().get_game_rows_by_season_year(1920),
+    'game.get_game_rows_by_season_year_and_week':
+        lambda: GameRepository().get_game_rows_by_season_year_and_week(1920, 1),
+    'game.get_game_rows_between_teams': lambda: GameRepository().get_game_rows_between_teams("Bears", "Pros"),
+    'game.stream_game_rows': lambda: list(GameRepository().stream_game_rows(1920, 1921)),
+    'team_season.get_team_season': lambda: TeamSeasonRepository().get_team_season(1),
+    'team_season.get_team_seasons_by_season_year': lambda: TeamSeasonRepository().get_team_seasons_by_season_year(1920),
+    'team_season.get_team_season_rows_by_season_year':
+        lambda: TeamSeasonRepository().get_team_season_rows_by_season_year(1920),
+    'team_season.stream_team_season_rows': lambda: list(TeamSeasonRepository().stream_team_season_rows(1920, 1921)),
+    'team_season.get_team_season_by_team_name_and_season_year':
+        lambda: TeamSeasonRepository().get_team_season_by_team_name_and_season_year("Bears", 1920),
+    'league_season.get_league_season_by_league_name_and_season_year':
+        lambda: LeagueSeasonRepository().get_league_season_by_league_name_and_season_year("APFA", 1920),
+    'league_season.increment_league_season_totals':
+        lambda: LeagueSeasonRepository().increment_league_season_totals(1920, {"APFA": (1, 14)}),
+    'season.get_season_by_year': lambda: SeasonRepository().get_season_by_year(1920),
+    'job.get_active_job_by_kind_and_key':
+        lambda: JobRepository().get_active_job_by_kind_and_key("weekly_update", "1920"),
+    'team.get_franchise_summary': lambda: TeamRepository().get_franchise_summary("Bears"),
+    'team.update_franchise_summaries':
+        lambda: TeamRepository().update_franchise_summaries({"Bears": {'games': 1, 'wins': 1}}),
+    'head_to_head.get_head_to_head_summary': lambda: HeadToHeadRepository().get_head_to_head_summary("Bears", "Pros"),
+    'head_to_head.update_head_to_head_summaries':
+        lambda: HeadToHeadRepository().update_head_to_head_summaries({("Bears", "Pros"): {'games': 1, 'team_wins': 1}}),
+    'scheduled_game.get_scheduled_game_rows_by_season_year':
+        lambda: ScheduledGameRepository().get_scheduled_game_rows_by_season_year(1920),
+    'scheduled_game.get_scheduled_game_rows_by_season_year_and_weeks':
+        lambda: ScheduledGameRepository().get_scheduled_game_rows_by_season_year_and_weeks(1920, [1, 2]),
+}
+
+
+@pytest.fixture()
+def query_plan_app(create_sqlite_app):
+    app = create_sqlite_app(
+        Season, Game, TeamSeason, LeagueSeason, Job, TeamFranchiseSummary, HeadToHeadSummary, ScheduledGame
+    )
+    with app.app_context():
+        sqla.session.add_all([
+            Season(year=1920, num_of_weeks_scheduled=13, num_of_weeks_completed=13),
+            TeamSeason(team_name="Bears", season_year=1920, league_name="APFA"),
+            TeamSeason(team_name="Pros", season_year=1920, league_name="APFA"),
+            LeagueSeason(league_name="APFA", season_year=1920),
+            Game(season_year=1920, week=1, guest_name="Pros", guest_score=0, host_name="Bears", host_score=7,
+                 is_playoff=False),
+        ])
+        sqla.session.commit()
+    return app
+
+
+@pytest.mark.parametrize('query', HOT_QUERIES.values(), ids=HOT_QUERIES.keys())
+def test_hot_query_should_not_scan_full_table(query_plan_app, query):
+    with query_plan_app.app_context():
+        # Act
+        with capture_query_plans(sqla.engine) as plans:
+            query()
+
+    # Assert
+    assert plans, "The query ran no statements to explain."
+    full_scans = find_full_scans(plans)
+    assert not full_scans, "Full table scans:\n" + "\n\n".join(map(str, full_scans))
+
+
+def test_capture_query_plans_should_report_full_scan_of_unindexed_query(query_plan_app):
+    with query_plan_app.app_context():
+        # Act
+        with capture_query_plans(sqla.engine) as plans:
+            GameRepository().get_games()
+
+    # Assert
+    assert [plan.full_scans for plan in find_full_scans(plans)] == [['game']]
@@ -0,0 +1,202 @@
+import pytest
+
+from app.data.models.season import Season
+from app.data.models.team import Team
+from app.data.reference_data import ReferenceDataCache, reference_data_cache, to_record
+from app.data.sqla import sqla
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeVersions:
+    def __init__(self):
+        self.versions = {}
+        self.local_versions = set()
+
+    def get_reference_data_version(self, kind):
+        return self.versions.get(kind, 0)
+
+    def committed_locally(self, season_year, since_version, version):
+        return all(local_version in self.local_versions for local_version in range(since_version + 1, version + 1))
+
+
+def test_to_record_should_copy_column_values_into_named_tuple():
+    # Act
+    result = to_record(Season(id=1, year=1920, num_of_weeks_scheduled=13, num_of_weeks_completed=12))
+
+    # Assert
+    assert type(result).__name__ == 'SeasonRecord'
+    assert result.year == 1920
+    assert result == (1, 1920, 13, 12)
+
+
+def test_get_should_load_once_until_invalidated():
+    # Arrange
+    test_cache = ReferenceDataCache(versions=FakeVersions())
+    loads = []
+
+    def load():
+        loads.append(1)
+        return [Team(id=len(loads), name=f"Team {len(loads)}")]
+
+    # Act
+    first = test_cache.get('team', load)
+    second = test_cache.get('team', load)
+    test_cache.invalidate('team')
+    third = test_cache.get('team', load)
+
+    # Assert
+    assert first == second == [(1, "Team 1")]
+    assert third == [(2, "Team 2")]
+    assert test_cache.get_metrics()['team'] == {
+        'hits': 1, 'misses': 2, 'hit_rate': 1 / 3, 'invalidations': 1, 'records': 1,
+    }
+
+
+def test_get_when_records_older_than_max_age_should_load_again():
+    # Arrange
+    clock = FakeClock()
+    test_cache = ReferenceDataCache(max_age=10, clock=clock, versions=FakeVersions())
+    test_cache.get('team', lambda: [Team(id=1, name="Bears")])
+    clock.now = 10
+
+    # Act
+    result = test_cache.get('team', lambda: [Team(id=1, name="Staleys")])
+
+    # Assert
+    assert result == [(1, "Staleys")]
+
+
+def test_get_when_invalidated_during_load_should_not_keep_records():
+    # Arrange
+    test_cache = ReferenceDataCache(versions=FakeVersions())
+
+    def load():
+        test_cache.invalidate('team')
+        return [Team(id=1, name="Bears")]
+
+    # Act
+    result = test_cache.get('team', load)
+
+    # Assert
+    assert result == [(1, "Bears")]
+    assert test_cache.get_metrics()['team']['records'] == 0
+
+
+def test_records_should_outlive_session_commits(create_sqlite_app):
+    # Arrange
+    app = create_sqlite_app(Season)
+    test_cache = ReferenceDataCache()
+    with app.app_context():
+        sqla.session.add(Season(year=1920, num_of_weeks_scheduled=13, num_of_weeks_completed=0))
+        sqla.session.commit()
+        seasons = test_cache.get('season', lambda: Season.query.all())
+
+        # Act
+        sqla.session.commit()
+        sqla.session.remove()
+
+    # Assert
+    assert [season.year for season in seasons] == [1920]
+
+
+def test_get_when_other_process_changed_data_should_load_again():
+    # Arrange
+    versions = FakeVersions()
+    test_cache = ReferenceDataCache(versions=versions)
+    test_cache.get('team', lambda: [Team(id=1, name="Bears")])
+    versions.versions['team'] = 1
+
+    # Act
+    result = test_cache.get('team', lambda: [Team(id=1, name="Staleys")])
+
+    # Assert
+    assert result == [(1, "Staleys")]
+
+
+def test_get_when_only_this_process_changed_data_should_keep_records():
+    # Arrange
+    versions = FakeVersions()
+    test_cache = ReferenceDataCache(versions=versions)
+    test_cache.get('team', lambda: [Team(id=1, name="Bears")])
+    versions.versions['team'] = 2
+    versions.local_versions.update({1, 2})
+
+    # Act
+    result = test_cache.get('team', lambda: [Team(id=1, name="Staleys")])
+
+    # Assert
+    assert result == [(1, "Bears")]
+    assert test_cache.get_metrics()['team']['hits'] == 1
+
+
+def test_get_when_other_process_changed_other_kind_should_keep_records():
+    # Arrange
+    versions = FakeVersions()
+    test_cache = ReferenceDataCache(versions=versions)
+    test_cache.get('team', lambda: [Team(id=1, name="Bears")])
+    versions.versions['season'] = 1
+
+    # Act
+    result = test_cache.get('team', lambda: [Team(id=1, name="Staleys")])
+
+    # Assert
+    assert result == [(1, "Bears")]
+
+
+def test_reset_metrics_should_reset_counters_and_keep_records():
+    # Arrange
+    test_cache = ReferenceDataCache(versions=FakeVersions())
+    test_cache.get('team', lambda: [Team(id=1, name="Bears")])
+    test_cache.get('team', lambda: [Team(id=1, name="Bears")])
+
+    # Act
+    test_cache.reset_metrics()
+
+    # Assert
+    assert test_cache.get_metrics()['team'] == {
+        'hits': 0, 'misses': 0, 'hit_rate': None, 'invalidations': 0, 'records': 1,
+    }
+
+
+@pytest.mark.parametrize('kinds', [(), ('season', 'team')])
+def test_invalidate_should_drop_listed_kinds(kinds):
+    # Arrange
+    test_cache = ReferenceDataCache(versions=FakeVersions())
+    test_cache.get('season', lambda: [])
+    test_cache.get('team', lambda: [])
+    test_cache.get('league', lambda: [])
+
+    # Act
+    test_cache.invalidate(*kinds)
+
+    # Assert
+    metrics = test_cache.get_metrics()
+    assert metrics['season']['invalidations'] == metrics['team']['invalidations'] == 1
+    assert metrics['league']['invalidations'] == (0 if kinds else 1)
+
+
+def test_commit_should_invalidate_kinds_of_changed_rows(create_sqlite_app):
+    # Arrange
+    app = create_sqlite_app(Season, Team)
+    reference_data_cache.clear()
+    with app.app_context():
+        reference_data_cache.get('season', lambda: Season.query.all())
+        reference_data_cache.get('team', lambda: Team.query.all())
+
+        # Act
+        sqla.session.add(Season(year=1920, num_of_weeks_scheduled=13, num_of_weeks_completed=0))
+        sqla.session.commit()
+        seasons = reference_data_cache.get('season', lambda: Season.query.all())
+
+    # Assert
+    metrics = reference_data_cache.get_metrics()
+    assert [season.year for season in seasons] == [1920]
+    assert (metrics['season']['invalidations'], metrics['team']['invalidations']) == (1, 0)
+    reference_data_cache.clear()
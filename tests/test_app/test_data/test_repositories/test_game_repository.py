@@ -580,8 +580,7 @@ def test_get_games_by_season_year_and_week_when_args_are_not_none_should_return_
 def test_get_game_when_games_is_empty_should_return_none(fake_game, test_app, test_repo):
     with test_app.app_context():
         # Arrange
-        games_in = []
-        fake_game.query.all.return_value = games_in
+        fake_game.query.get.return_value = None
 
         # Act
         game_out = test_repo.get_game(1)
@@ -0,0 +1,74 @@
+import pytest
+
+from app.data.models.game import Game
+from app.data.repositories.game_repository import GameRepository
+from app.data.sqla import sqla
+
+
+@pytest.fixture
+def test_repo():
+    return GameRepository()
+
+
+@pytest.fixture()
+def test_app(create_sqlite_app):
+    app = create_sqlite_app(Game)
+    return app
+
+
+def test_get_game_rows_by_season_year_should_return_listed_columns_of_season_games_in_week_order(test_app, test_repo):
+    with test_app.app_context():
+        # Arrange
+        sqla.session.add_all([
+            Game(season_year=1920, week=2, guest_name="Wheeling Stogies", guest_score=0, host_name="Akron Pros",
+                 host_score=43, is_playoff=False),
+            Game(season_year=1920, week=1, guest_name="St. Paul Ideals", guest_score=0,
+                 host_name="Rock Island Independents", host_score=48, is_playoff=False),
+            Game(season_year=1921, week=1, guest_name="Muncie Flyers", guest_score=0,
+                 host_name="Rock Island Independents", host_score=45, is_playoff=False),
+        ])
+        sqla.session.commit()
+
+        # Act
+        rows = test_repo.get_game_rows_by_season_year(1920)
+        week_rows = test_repo.get_game_rows_by_season_year_and_week(1920, 2)
+
+    # Assert
+    assert [(row.week, row.guest_name, row.host_score) for row in rows] == [
+        (1, "St. Paul Ideals", 48), (2, "Wheeling Stogies", 43)
+    ]
+    assert [row.guest_name for row in week_rows] == ["Wheeling Stogies"]
+    assert 'elo_delta' not in rows[0]._fields
+
+
+def test_get_game_rows_by_season_year_when_season_year_is_none_should_return_empty_list(test_app, test_repo):
+    with test_app.app_context():
+        # Act
+        rows = test_repo.get_game_rows_by_season_year(None)
+
+    # Assert
+    assert rows == []
+
+
+def test_get_game_rows_between_teams_should_return_games_at_both_venues_in_season_range(test_app, test_repo):
+    with test_app.app_context():
+        # Arrange
+        sqla.session.add_all([
+            Game(season_year=1921, week=3, guest_name="Akron Pros", guest_score=7, host_name="Chicago Staleys",
+                 host_score=10, is_playoff=False),
+            Game(season_year=1920, week=5, guest_name="Chicago Staleys", guest_score=0, host_name="Akron Pros",
+                 host_score=0, is_playoff=False),
+            Game(season_year=1920, week=6, guest_name="Chicago Staleys", guest_score=7, host_name="Dayton Triangles",
+                 host_score=0, is_playoff=False),
+            Game(season_year=1922, week=1, guest_name="Chicago Staleys", guest_score=3, host_name="Akron Pros",
+                 host_score=0, is_playoff=False),
+        ])
+        sqla.session.commit()
+
+        # Act
+        rows = test_repo.get_game_rows_between_teams("Akron Pros", "Chicago Staleys")
+        range_rows = test_repo.get_game_rows_between_teams("Chicago Staleys", "Akron Pros", 1921, 1922)
+
+    # Assert
+    assert [(row.season_year, row.week) for row in rows] == [(1920, 5), (1921, 3), (1922, 1)]
+    assert [(row.season_year, row.week) for row in range_rows] == [(1921, 3), (1922, 1)]
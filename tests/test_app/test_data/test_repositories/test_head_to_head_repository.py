@@ -0,0 +1,116 @@
+from unittest.mock import patch
+
+import pytest
+
+from app.data.models.game import Game
+from app.data.models.head_to_head_summary import HeadToHeadSummary
+from app.data.repositories.head_to_head_repository import HeadToHeadRepository
+from app.data.sqla import sqla
+
+
+@pytest.fixture
+def test_repo():
+    return HeadToHeadRepository()
+
+
+@pytest.fixture()
+def head_to_head_app(create_sqlite_app):
+    app = create_sqlite_app(Game, HeadToHeadSummary)
+    with app.app_context():
+        sqla.session.add_all([
+            Game(season_year=1920, week=1, guest_name="Pros", guest_score=0, host_name="Bears", host_score=7,
+                 is_playoff=False),
+            Game(season_year=1921, week=2, guest_name="Bears", guest_score=14, host_name="Pros", host_score=14,
+                 is_playoff=False),
+            Game(season_year=1922, week=1, guest_name="Bears", guest_score=3, host_name="Pros", host_score=10,
+                 is_playoff=False),
+            Game(season_year=1921, week=1, guest_name="Bears", guest_score=3, host_name="Cardinals", host_score=10,
+                 is_playoff=False),
+        ])
+        sqla.session.commit()
+    return app
+
+
+def test_rebuild_head_to_head_summaries_should_fold_both_venues_into_one_summary_per_pair(
+        head_to_head_app, test_repo
+):
+    with head_to_head_app.app_context():
+        # Act
+        result = test_repo.rebuild_head_to_head_summaries()
+        bears_pros = test_repo.get_head_to_head_summary("Pros", "Bears")
+
+        # Assert
+        assert result == 2
+        assert (bears_pros.team_name, bears_pros.opponent_name) == ("Bears", "Pros")
+        assert (bears_pros.games, bears_pros.team_wins, bears_pros.opponent_wins, bears_pros.ties) == (3, 1, 1, 1)
+        assert (bears_pros.team_points, bears_pros.opponent_points) == (24, 24)
+        assert (bears_pros.first_season_year, bears_pros.last_season_year) == (1920, 1922)
+        assert test_repo.get_head_to_head_summary("Cardinals", "Pros") is None
+
+
+def test_update_head_to_head_summaries_should_increment_totals_and_create_missing_summaries(
+        head_to_head_app, test_repo
+):
+    with head_to_head_app.app_context():
+        # Arrange
+        test_repo.rebuild_head_to_head_summaries()
+        sqla.session.add(Game(season_year=1923, week=1, guest_name="Cardinals", guest_score=6, host_name="Pros",
+                              host_score=0, is_playoff=False))
+        sqla.session.commit()
+
+        # Act
+        test_repo.update_head_to_head_summaries({
+            ("Bears", "Pros"): {'games': 1, 'team_wins': 1, 'team_points': 20, 'opponent_points': 0},
+            ("Cardinals", "Pros"): {'games': 1, 'team_wins': 1, 'team_points': 6, 'opponent_points': 0},
+        })
+        bears_pros = test_repo.get_head_to_head_summary("Bears", "Pros")
+        cardinals_pros = test_repo.get_head_to_head_summary("Cardinals", "Pros")
+
+        # Assert
+        assert (bears_pros.games, bears_pros.team_wins, bears_pros.team_points) == (4, 2, 44)
+        assert (cardinals_pros.games, cardinals_pros.team_wins, cardinals_pros.opponent_wins) == (1, 1, 0)
+        assert (cardinals_pros.first_season_year, cardinals_pros.last_season_year) == (1923, 1923)
+
+
+def test_update_head_to_head_summaries_when_pair_has_no_games_left_should_delete_summary(
+        head_to_head_app, test_repo
+):
+    with head_to_head_app.app_context():
+        # Arrange
+        test_repo.rebuild_head_to_head_summaries()
+        sqla.session.query(Game).filter_by(host_name="Cardinals").delete()
+        sqla.session.commit()
+
+        # Act
+        test_repo.update_head_to_head_summaries({
+            ("Bears", "Cardinals"): {'games': -1, 'opponent_wins': -1, 'team_points': -3, 'opponent_points': -10},
+        })
+
+        # Assert
+        assert test_repo.get_head_to_head_summary("Bears", "Cardinals") is None
+
+
+def test_update_head_to_head_summaries_when_another_writer_adds_missing_summary_should_apply_changes_once(
+        head_to_head_app, test_repo
+):
+    with head_to_head_app.app_context():
+        # Arrange
+        test_repo.rebuild_head_to_head_summaries()
+        get = sqla.session.get
+        calls = []
+
+        def get_before_other_writer(*args, **kwargs):
+            # The first check runs before the other writer's summary of the pair is visible.
+            calls.append(args)
+            return None if len(calls) == 1 else get(*args, **kwargs)
+
+        # Act
+        with patch.object(sqla.session, 'get', side_effect=get_before_other_writer):
+            test_repo.update_head_to_head_summaries({
+                ("Bears", "Pros"): {'games': 1, 'team_wins': 1, 'team_points': 20, 'opponent_points': 0},
+            })
+        bears_pros = test_repo.get_head_to_head_summary("Bears", "Pros")
+
+        # Assert
+        assert len(calls) == 2
+        assert (bears_pros.games, bears_pros.team_wins, bears_pros.team_points) == (4, 2, 44)
@@ -25,17 +25,18 @@ def test_get_league_seasons_should_get_league_seasons(fake_league_season, test_r
     assert league_seasons == fake_league_season.query.all.return_value
 
 
+@patch('app.data.repositories.league_season_repository.LeagueSeason')
 @patch('app.data.repositories.league_season_repository.LeagueSeasonRepository.get_league_seasons')
-def test_get_league_season_when_league_seasons_is_empty_should_return_none(fake_get_league_seasons, test_repo):
-    # Arrange
-    league_seasons = []
-    fake_get_league_seasons.return_value = league_seasons
-
+def test_get_league_season_should_not_fetch_all_league_seasons(
+        fake_get_league_seasons, fake_league_season, test_repo
+):
     # Act
     league_season = test_repo.get_league_season(1)
 
     # Assert
-    assert league_season is None
+    fake_get_league_seasons.assert_not_called()
+    fake_league_season.query.get.assert_called_once_with(1)
+    assert league_season == fake_league_season.query.get.return_value
 
 
 @patch('app.data.repositories.league_season_repository.LeagueSeason')
@@ -84,19 +85,18 @@ def test_get_league_season_when_league_seasons_is_not_empty_and_league_season_is
     assert league_season == fake_league_season.query.get.return_value
 
 
+@patch('app.data.repositories.league_season_repository.LeagueSeason')
 @patch('app.data.repositories.league_season_repository.LeagueSeasonRepository.get_league_seasons')
-def test_get_league_season_by_league_name_and_season_year_when_league_seasons_is_empty_should_return_none(
-        fake_get_league_seasons, test_repo
+def test_get_league_season_by_league_name_and_season_year_should_not_fetch_all_league_seasons(
+        fake_get_league_seasons, fake_league_season, test_repo
 ):
-    # Arrange
-    league_seasons = []
-    fake_get_league_seasons.return_value = league_seasons
-
     # Act
     league_season = test_repo.get_league_season_by_league_name_and_season_year(league_name="A", season_year=1)
 
     # Assert
-    assert league_season is None
+    fake_get_league_seasons.assert_not_called()
+    fake_league_season.query.filter_by.assert_called_once_with(league_name="A", season_year=1)
+    assert league_season == fake_league_season.query.filter_by.return_value.first.return_value
 
 
 @patch('app.data.repositories.league_season_repository.LeagueSeason')
@@ -471,3 +471,51 @@ def test_delete_league_season_when_league_season_exists_and_integrity_error_caug
     # Assert
     fake_sqla.session.delete.assert_called_once_with(fake_league_season.query.get.return_value)
     fake_try_commit.assert_called_once()
+
+
+def test_increment_league_season_totals_should_increment_totals_and_recalculate_average_points(
+        test_repo, create_sqlite_app
+):
+    # Arrange
+    from decimal import Decimal
+
+    from app.data.sqla import sqla
+
+    app = create_sqlite_app(LeagueSeason)
+    with app.app_context():
+        sqla.session.add_all([
+            LeagueSeason(league_name="APFA", season_year=1920, total_games=4, total_points=40),
+            LeagueSeason(league_name="APFA", season_year=1921),
+        ])
+        sqla.session.commit()
+
+        # Act
+        result = test_repo.increment_league_season_totals(1920, {"APFA": (2, 8), "AFL": (1, 7), "NFL": (0, 0)})
+        sqla.session.expire_all()
+        league_seasons = {
+            league_season.season_year: league_season for league_season in LeagueSeason.query.all()
+        }
+
+        # Assert
+        assert result == 1
+        assert (league_seasons[1920].total_games, league_seasons[1920].total_points) == (6, 48)
+        assert league_seasons[1920].average_points == Decimal(8)
+        assert (league_seasons[1921].total_games, league_seasons[1921].total_points) == (0, 0)
+
+
+def test_increment_league_season_totals_should_leave_changes_to_callers_commit(test_repo, create_sqlite_app):
+    # Arrange
+    from app.data.sqla import sqla
+
+    app = create_sqlite_app(LeagueSeason)
+    with app.app_context():
+        sqla.session.add(LeagueSeason(league_name="APFA", season_year=1920, total_games=4, total_points=40))
+        sqla.session.commit()
+
+        # Act
+        test_repo.increment_league_season_totals(1920, {"APFA": (2, 8)})
+        sqla.session.rollback()
+        league_season = LeagueSeason.query.one()
+
+        # Assert
+        assert (league_season.total_games, league_season.total_points) == (4, 40)
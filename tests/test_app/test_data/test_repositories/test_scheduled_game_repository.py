@@ -0,0 +1,70 @@
+import pytest
+
+from app.data.models.scheduled_game import ScheduledGame
+from app.data.models.season import Season
+from app.data.repositories.scheduled_game_repository import ScheduledGameRepository
+from app.data.sqla import sqla
+
+
+@pytest.fixture
+def test_repo():
+    return ScheduledGameRepository()
+
+
+@pytest.fixture()
+def schedule_app(create_sqlite_app):
+    app = create_sqlite_app(Season, ScheduledGame)
+    with app.app_context():
+        sqla.session.add_all([
+            Season(year=1920, num_of_weeks_scheduled=13, num_of_weeks_completed=0),
+            Season(year=1921, num_of_weeks_scheduled=13, num_of_weeks_completed=0),
+            ScheduledGame(season_year=1920, week=2, guest_name="Bears", host_name="Pros"),
+            ScheduledGame(season_year=1920, week=1, guest_name="Pros", host_name="Bears"),
+            ScheduledGame(season_year=1921, week=1, guest_name="Bears", host_name="Cardinals"),
+        ])
+        sqla.session.commit()
+    return app
+
+
+def test_get_scheduled_game_rows_by_season_year_should_return_season_schedule_in_week_order(schedule_app, test_repo):
+    with schedule_app.app_context():
+        # Act
+        result = test_repo.get_scheduled_game_rows_by_season_year(1920)
+
+    # Assert
+    assert [(row.week, row.guest_name, row.host_name) for row in result] == [(1, "Pros", "Bears"), (2, "Bears", "Pros")]
+
+
+def test_get_scheduled_game_rows_by_season_year_and_weeks_should_return_only_listed_weeks(schedule_app, test_repo):
+    with schedule_app.app_context():
+        # Act
+        result = test_repo.get_scheduled_game_rows_by_season_year_and_weeks(1920, [2])
+
+    # Assert
+    assert [(row.week, row.guest_name, row.host_name) for row in result] == [(2, "Bears", "Pros")]
+
+
+def test_import_scheduled_games_should_replace_schedules_of_listed_seasons_only(schedule_app, test_repo):
+    with schedule_app.app_context():
+        # Act
+        result = test_repo.import_scheduled_games([
+            {'season_year': 1920, 'week': 3, 'guest_name': "Cardinals", 'host_name': "Bears"},
+        ])
+        season_1920 = test_repo.get_scheduled_game_rows_by_season_year(1920)
+        season_1921 = test_repo.get_scheduled_game_rows_by_season_year(1921)
+
+    # Assert
+    assert result == 1
+    assert [(row.week, row.guest_name, row.host_name) for row in season_1920] == [(3, "Cardinals", "Bears")]
+    assert len(season_1921) == 1
+
+
+def test_import_scheduled_games_when_list_is_empty_should_change_nothing(schedule_app, test_repo):
+    with schedule_app.app_context():
+        # Act
+        result = test_repo.import_scheduled_games([])
+        season_1920 = test_repo.get_scheduled_game_rows_by_season_year(1920)
+
+    # Assert
+    assert result == 0
+    assert len(season_1920) == 2
@@ -0,0 +1,119 @@
+from unittest.mock import patch
+
+import pytest
+
+from app.data.data_versions import data_versions
+from app.data.models.data_version import DataVersion, REFERENCE_DATA_SEASON_YEARS
+from app.data.models.league import League
+from app.data.models.season import Season
+from app.data.models.team import Team
+from app.data.repositories.search_repository import SearchRepository
+from app.data.search_index import SEARCH_KINDS, SearchResult, search_index
+from app.data.sqla import sqla
+
+
+@pytest.fixture
+def test_repo():
+    return SearchRepository()
+
+
+@pytest.fixture()
+def search_app(create_sqlite_app):
+    app = create_sqlite_app(Season, Team, League)
+    with app.app_context():
+        sqla.session.add_all([
+            Season(year=1920, num_of_weeks_scheduled=13, num_of_weeks_completed=0),
+            Team(name="Chicago Bears"),
+            League(short_name="APFA", long_name="American Professional Football Association", first_season_year=1920),
+        ])
+        sqla.session.commit()
+    data_versions.expire()
+    search_index.clear()
+    yield app
+    search_index.clear()
+
+
+def test_search_should_build_index_from_data_store(search_app, test_repo):
+    with search_app.app_context():
+        # Act
+        result = test_repo.search("a")
+
+    # Assert
+    assert search_index.is_built
+    assert result == [
+        SearchResult('league', 1, "APFA American Professional Football Association", "APFA"),
+    ]
+
+
+@patch.object(SearchRepository, 'rebuild', autospec=True, side_effect=SearchRepository.rebuild)
+def test_search_should_see_committed_changes_without_rebuilding(fake_rebuild, search_app, test_repo):
+    with search_app.app_context():
+        # Arrange
+        test_repo.search("chicago")
+        team = sqla.session.get(Team, 1)
+
+        # Act
+        team.name = "Decatur Staleys"
+        sqla.session.add(Team(name="Chicago Cardinals"))
+        sqla.session.commit()
+
+        # Assert
+        assert test_repo.search("chicago", kinds=['team']) == [
+            SearchResult('team', 2, "Chicago Cardinals", "Chicago Cardinals"),
+        ]
+        assert test_repo.search("stal") == [SearchResult('team', 1, "Decatur Staleys", "Decatur Staleys")]
+        assert fake_rebuild.call_count == 1
+        assert search_index.version == tuple(data_versions.get_reference_data_version(kind) for kind in SEARCH_KINDS)
+
+
+def test_search_should_rebuild_index_when_another_process_changed_data(search_app, test_repo):
+    with search_app.app_context():
+        # Arrange
+        test_repo.search("chicago")
+
+        # Another process's change is only in the data store.
+        sqla.session.execute(Team.__table__.insert().values(name="Rock Island Independents"))
+        DataVersion.query.filter_by(season_year=REFERENCE_DATA_SEASON_YEARS['team']).one().version += 1
+        sqla.session.commit()
+        data_versions.expire()
+
+        # Act
+        result = test_repo.search("rock")
+
+        # Assert
+        assert result == [SearchResult('team', 2, "Rock Island Independents", "Rock Island Independents")]
+
+
+@patch.object(SearchRepository, 'rebuild', autospec=True, side_effect=SearchRepository.rebuild)
+def test_search_when_another_process_changed_other_reference_data_should_not_rebuild_index(
+        fake_rebuild, search_app, test_repo
+):
+    with search_app.app_context():
+        # Arrange
+        test_repo.search("chicago")
+
+        # Another process's change to a conference is only in the data store.
+        sqla.session.add(DataVersion(season_year=REFERENCE_DATA_SEASON_YEARS['conference'], version=1))
+        sqla.session.commit()
+        data_versions.expire()
+
+        # Act
+        test_repo.search("chicago")
+
+        # Assert
+        assert fake_rebuild.call_count == 1
+
+
+def test_search_should_ignore_rolled_back_changes(search_app, test_repo):
+    with search_app.app_context():
+        # Arrange
+        test_repo.search("chicago")
+
+        # Act
+        sqla.session.add(Team(name="Rock Island Independents"))
+        sqla.session.flush()
+        sqla.session.rollback()
+        sqla.session.commit()
+
+        # Assert
+        assert test_repo.search("rock") == []
@@ -47,8 +47,7 @@ def test_get_seasons_should_get_seasons(test_app, test_repo):
 def test_get_season_when_seasons_is_empty_should_return_none(fake_season, test_app, test_repo):
     with test_app.app_context():
         # Arrange
-        seasons_in = []
-        fake_season.query.all.return_value = seasons_in
+        fake_season.query.get.return_value = None
 
         # Act
         season_out = test_repo.get_season(1)
@@ -106,8 +105,7 @@ def test_get_season_when_seasons_is_not_empty_and_season_is_found_should_return_
 def test_get_season_by_year_when_seasons_is_empty_should_return_none(fake_season, test_app, test_repo):
     with test_app.app_context():
         # Arrange
-        seasons_in = []
-        fake_season.query.all.return_value = seasons_in
+        fake_season.query.filter_by.return_value.first.return_value = None
 
         # Act
         season_out = test_repo.get_season_by_year(1)
@@ -0,0 +1,129 @@
+from unittest.mock import call, patch
+
+import pytest
+from sqlalchemy import update
+
+from app.data.data_versions import data_versions
+from app.data.models.data_version import DataVersion
+from app.data.models.game import Game
+from app.data.models.team_season import TeamSeason
+from app.data.repositories.season_snapshot_repository import SeasonSnapshotRepository
+from app.data.sqla import sqla
+
+
+@pytest.fixture()
+def test_app(create_sqlite_app):
+    app = create_sqlite_app(TeamSeason, Game)
+    with app.app_context():
+        sqla.session.add_all([
+            TeamSeason(team_name="Chicago Bears", season_year=1920, league_name='APFA', points_for=21),
+            TeamSeason(team_name="Decatur Staleys", season_year=1921, league_name='APFA'),
+            Game(season_year=1920, week=1, guest_name="Chicago Bears", guest_score=21, host_name="Rock Island",
+                 host_score=0, is_playoff=False),
+        ])
+        sqla.session.commit()
+    return app
+
+
+def test_get_team_season_by_team_name_and_season_year_should_return_team_season_from_snapshot(test_app):
+    with test_app.app_context():
+        # Arrange
+        test_repo = SeasonSnapshotRepository()
+
+        # Act
+        result = test_repo.get_team_season_by_team_name_and_season_year("Chicago Bears", 1920)
+
+        # Assert
+        assert result.team_name == "Chicago Bears"
+        assert result.points_for == 21
+        assert test_repo.get_team_season_by_team_name_and_season_year("Decatur Staleys", 1920) is None
+
+
+def test_get_season_snapshot_should_reuse_snapshot_until_season_data_changes(test_app):
+    with test_app.app_context():
+        # Arrange
+        test_repo = SeasonSnapshotRepository()
+        first = test_repo.get_season_snapshot(1920)
+
+        # Act
+        unchanged = test_repo.get_season_snapshot(1920)
+        team_season = TeamSeason.query.filter_by(team_name="Chicago Bears").first()
+        team_season.points_for = 28
+        sqla.session.commit()
+        changed = test_repo.get_season_snapshot(1920)
+
+        # Assert
+        assert unchanged is first
+        assert changed is not first
+        assert changed.version == data_versions.get(1920)
+        assert changed.get_team_season("Chicago Bears").points_for == 28
+
+
+@patch('app.data.repositories.season_snapshot_repository.season_snapshot_cache_counters')
+def test_get_season_snapshot_should_count_reuses_as_hits_and_builds_as_misses(fake_counters, test_app):
+    with test_app.app_context():
+        # Arrange
+        test_repo = SeasonSnapshotRepository()
+
+        # Act
+        test_repo.get_season_snapshot(1920)
+        test_repo.get_season_snapshot(1920)
+
+        # Assert
+        assert fake_counters.method_calls == [call.miss(), call.hit()]
+
+
+def test_get_season_snapshot_should_not_rebuild_for_changes_to_other_seasons(test_app):
+    with test_app.app_context():
+        # Arrange
+        test_repo = SeasonSnapshotRepository()
+        first = test_repo.get_season_snapshot(1920)
+
+        # Act
+        team_season = TeamSeason.query.filter_by(team_name="Decatur Staleys").first()
+        team_season.wins = 1
+        sqla.session.commit()
+        result = test_repo.get_season_snapshot(1920)
+
+        # Assert
+        assert result is first
+
+
+def test_get_season_snapshot_should_rebuild_after_change_committed_by_another_process(test_app):
+    with test_app.app_context():
+        # Arrange
+        test_repo = SeasonSnapshotRepository()
+        first = test_repo.get_season_snapshot(1920)
+
+        # Another process commits a change and its version; this process only sees them in the data store.
+        sqla.session.execute(update(TeamSeason).where(TeamSeason.team_name == "Chicago Bears").values(points_for=35))
+        sqla.session.execute(
+            update(DataVersion).where(DataVersion.season_year == 1920).values(version=DataVersion.version + 1)
+        )
+        sqla.session.commit()
+
+        # Act
+        data_versions.expire()
+        result = test_repo.get_season_snapshot(1920)
+
+        # Assert
+        assert result is not first
+        assert result.get_team_season("Chicago Bears").points_for == 35
+
+
+def test_get_games_by_season_year_should_return_games_of_season(test_app):
+    with test_app.app_context():
+        # Arrange
+        test_repo = SeasonSnapshotRepository()
+
+        # Act
+        result = test_repo.get_games_by_season_year(1920)
+
+        # Assert
+        assert [(game.guest_name, game.host_name) for game in result] == [("Chicago Bears", "Rock Island")]
+
+
+def test_get_team_seasons_by_season_year_when_season_year_is_none_should_return_empty_list(test_app):
+    with test_app.app_context():
+        # Act and Assert
+        assert SeasonSnapshotRepository().get_team_seasons_by_season_year(None) == []
@@ -447,3 +447,108 @@ def test_delete_team_when_team_exists_and_integrity_error_caught_should_rollback
     # Assert
     fake_sqla.session.delete.assert_called_once_with(fake_team.query.get.return_value)
     fake_try_commit.assert_called_once()
+
+
+def test_get_team_rows_should_get_ids_and_names_of_teams(create_sqlite_app):
+    # Arrange
+    from app.data.sqla import sqla
+
+    app = create_sqlite_app(Team)
+    with app.app_context():
+        sqla.session.add_all([Team(id=2, name="Team 2"), Team(id=1, name="Team 1")])
+        sqla.session.commit()
+
+        # Act
+        rows = TeamRepository().get_team_rows()
+
+        # Assert
+        assert [tuple(row) for row in rows] == [(1, "Team 1"), (2, "Team 2")]
+
+
+@pytest.fixture()
+def franchise_app(create_sqlite_app):
+    from app.data.models.game import Game
+    from app.data.models.team_franchise_summary import TeamFranchiseSummary
+    from app.data.models.team_season import TeamSeason
+    from app.data.sqla import sqla
+
+    app = create_sqlite_app(TeamSeason, Game, TeamFranchiseSummary)
+    with app.app_context():
+        sqla.session.add_all([
+            TeamSeason(team_name="Bears", season_year=1920, league_name="APFA", games=2, wins=2,
+                       winning_percentage=1),
+            TeamSeason(team_name="Bears", season_year=1921, league_name="APFA", games=1, losses=1,
+                       winning_percentage=0),
+            TeamSeason(team_name="Pros", season_year=1920, league_name="APFA", games=2, losses=1, ties=1,
+                       winning_percentage=0.25),
+            Game(season_year=1920, week=1, guest_name="Pros", guest_score=0, host_name="Bears", host_score=7,
+                 is_playoff=False),
+            Game(season_year=1920, week=2, guest_name="Bears", guest_score=14, host_name="Pros", host_score=14,
+                 is_playoff=True),
+            Game(season_year=1921, week=1, guest_name="Bears", guest_score=3, host_name="Cardinals", host_score=10,
+                 is_playoff=False),
+        ])
+        sqla.session.commit()
+    return app
+
+
+def test_rebuild_franchise_summaries_should_summarize_games_and_seasons_of_each_team(franchise_app, test_repo):
+    with franchise_app.app_context():
+        # Act
+        result = test_repo.rebuild_franchise_summaries()
+        bears = test_repo.get_franchise_summary("Bears")
+        cardinals = test_repo.get_franchise_summary("Cardinals")
+
+        # Assert
+        assert result == 3
+        assert (bears.seasons, bears.games, bears.wins, bears.losses, bears.ties) == (2, 3, 1, 1, 1)
+        assert (bears.points_for, bears.points_against) == (24, 24)
+        assert (bears.playoff_games, bears.playoff_wins, bears.playoff_losses, bears.playoff_ties) == (1, 0, 0, 1)
+        assert (bears.best_season_year, bears.worst_season_year) == (1920, 1921)
+        assert (cardinals.seasons, cardinals.wins, cardinals.best_season_year) == (0, 1, None)
+        assert test_repo.get_franchise_summary("Staleys") is None
+
+
+def test_update_franchise_summaries_should_increment_totals_and_create_missing_summaries(franchise_app, test_repo):
+    with franchise_app.app_context():
+        # Arrange
+        test_repo.rebuild_franchise_summaries()
+
+        # Act
+        test_repo.update_franchise_summaries({
+            "Bears": {'games': 1, 'wins': 1, 'points_for': 20, 'points_against': 0},
+            "Staleys": {'games': 1, 'losses': 1, 'points_for': 0, 'points_against': 20},
+        })
+        bears = test_repo.get_franchise_summary("Bears")
+        staleys = test_repo.get_franchise_summary("Staleys")
+
+        # Assert
+        assert (bears.games, bears.wins, bears.points_for, bears.seasons) == (4, 2, 44, 2)
+        assert (staleys.games, staleys.losses, staleys.wins, staleys.seasons) == (1, 1, 0, 0)
+
+
+def test_update_franchise_summaries_when_another_writer_adds_missing_summary_should_apply_changes_once(
+        franchise_app, test_repo
+):
+    from app.data.sqla import sqla
+
+    with franchise_app.app_context():
+        # Arrange
+        test_repo.rebuild_franchise_summaries()
+        test_repo.update_franchise_summaries({"Staleys": {'games': 1, 'losses': 1}})
+        scalars = sqla.session.scalars
+        calls = []
+
+        def scalars_before_other_writer(*args, **kwargs):
+            # The first check runs before the other writer's summary of the Staleys is visible.
+            calls.append(args)
+            return iter(()) if len(calls) == 1 else scalars(*args, **kwargs)
+
+        # Act
+        with patch.object(sqla.session, 'scalars', side_effect=scalars_before_other_writer):
+            test_repo.update_franchise_summaries({"Staleys": {'games': 1, 'wins': 1}})
+        staleys = test_repo.get_franchise_summary("Staleys")
+
+        # Assert
+        assert len(calls) == 2
+        assert (staleys.games, staleys.wins, staleys.losses) == (2, 1, 1)
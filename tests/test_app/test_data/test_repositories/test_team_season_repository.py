@@ -178,14 +178,14 @@ def test_get_team_seasons_by_season_year_when_season_year_is_not_none_should_get
 @patch('app.data.repositories.team_season_repository.TeamSeason')
 def test_get_team_season_when_team_seasons_is_empty_should_return_none(fake_team_season, test_repo):
     # Arrange
-    team_seasons_in = []
-    fake_team_season.query.all.return_value = team_seasons_in
+    fake_team_season.query.get.return_value = None
 
     # Act
     test_repo = TeamSeasonRepository()
     team_season_out = test_repo.get_team_season(1)
 
     # Assert
+    fake_team_season.query.all.assert_not_called()
     assert team_season_out is None
 
 
@@ -699,3 +699,99 @@ def test_update_team_season_when_and_team_season_exists_with_id_and_integrity_er
     # Assert
     fake_sqla.session.add.assert_called_once_with(old_team_season)
     fake_try_commit.assert_called_once()
+
+
+def test_update_simple_ratings_should_update_every_team_season_and_bump_data_version(test_repo, create_sqlite_app):
+    # Arrange
+    from app.data.data_versions import data_versions
+    from app.data.sqla import sqla
+
+    app = create_sqlite_app(TeamSeason)
+    with app.app_context():
+        sqla.session.add_all([
+            TeamSeason(id=1, team_name="Team 1", season_year=1, league_name="League"),
+            TeamSeason(id=2, team_name="Team 2", season_year=1, league_name="League"),
+        ])
+        sqla.session.commit()
+        version = data_versions.get(1)
+
+        # Act
+        result = test_repo.update_simple_ratings(1, {1: Decimal('3.5'), 2: Decimal('-3.5')})
+
+        # Assert
+        assert result == 2
+        assert data_versions.get(1) == version + 1
+        assert [team_season.simple_rating for team_season in TeamSeason.query.order_by(TeamSeason.id)] == [
+            Decimal('3.5'), Decimal('-3.5')
+        ]
+
+
+def test_get_team_season_rows_by_season_year_should_get_listed_columns_of_season(test_repo, create_sqlite_app):
+    # Arrange
+    from app.data.sqla import sqla
+
+    app = create_sqlite_app(TeamSeason)
+    with app.app_context():
+        sqla.session.add_all([
+            TeamSeason(id=2, team_name="Team 2", season_year=1, league_name="League", wins=3),
+            TeamSeason(id=1, team_name="Team 1", season_year=1, league_name="League", wins=5),
+            TeamSeason(id=3, team_name="Team 3", season_year=2, league_name="League"),
+        ])
+        sqla.session.commit()
+
+        # Act
+        rows = test_repo.get_team_season_rows_by_season_year(1)
+
+        # Assert
+        assert [(row.id, row.team_name, row.wins) for row in rows] == [(1, "Team 1", 5), (2, "Team 2", 3)]
+        assert 'simple_rating' not in rows[0]._fields
+        assert test_repo.get_team_season_rows_by_season_year(None) == []
+
+
+def test_get_team_season_column_rows_should_get_requested_columns_of_seasons(test_repo, create_sqlite_app):
+    # Arrange
+    from app.data.sqla import sqla
+
+    app = create_sqlite_app(TeamSeason)
+    with app.app_context():
+        sqla.session.add_all([
+            TeamSeason(id=1, team_name="Team 1", season_year=2, league_name="League", wins=5),
+            TeamSeason(id=2, team_name="Team 2", season_year=1, league_name="League", wins=3),
+            TeamSeason(id=3, team_name="Team 3", season_year=3, league_name="League", wins=4),
+        ])
+        sqla.session.commit()
+
+        # Act
+        rows = test_repo.get_team_season_column_rows([1, 2], ['wins'])
+
+        # Assert
+        assert [tuple(row) for row in rows] == [("Team 2", 1, 3), ("Team 1", 2, 5)]
+        assert rows[0]._fields == ('team_name', 'season_year', 'wins')
+        assert test_repo.get_team_season_column_rows([], ['wins']) == []
+
+
+def test_update_team_season_when_read_engine_is_configured_should_read_team_season_from_primary_engine(
+        test_repo, create_sqlite_app, tmp_path
+):
+    # Arrange
+    from app.data.sqla import sqla
+
+    app = create_sqlite_app(
+        TeamSeason,
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'primary.sqlite3'}",
+        SQLALCHEMY_BINDS={'read': f"sqlite:///{tmp_path / 'read.sqlite3'}"}
+    )
+    with app.app_context():
+        # The read engine has not caught up with this team_season yet.
+        sqla.session.add(TeamSeason(id=1, team_name="Team 1", season_year=1, league_name="League"))
+        sqla.session.commit()
+
+        # Act
+        test_repo.update_team_season(TeamSeason(
+            id=1, team_name="Team 1", season_year=1, league_name="League", games=1, wins=1, losses=0, ties=0,
+            winning_percentage=1, points_for=7, points_against=0, expected_wins=1, expected_losses=0
+        ))
+        sqla.session.expire_all()
+
+        # Assert
+        assert TeamSeason.query.one().wins == 1
@@ -1,3 +1,4 @@
+import asyncio
 from decimal import Decimal
 from unittest.mock import patch
 
@@ -30,9 +31,9 @@ def test_get_team_season_schedule_profile_when_query_returns_empty_list_should_g
     result = test_repo.get_team_season_schedule_profile(team_name, season_year)
 
     # Assert
-    querystring = f"EXEC sp_GetTeamSeasonScheduleProfile '{team_name}', {season_year};"
-    fake_SQLQuery.assert_called_once_with(querystring)
-    fake_sqla.session.execute.assert_called_once_with(fake_SQLQuery.return_value)
+    fake_SQLQuery.assert_called_once_with("EXEC sp_GetTeamSeasonScheduleProfile :team_name, :season_year;")
+    fake_SQLQuery.return_value.bindparams.assert_called_once_with(team_name=team_name, season_year=season_year)
+    fake_sqla.session.execute.assert_called_once_with(fake_SQLQuery.return_value.bindparams.return_value)
     fake_sqla.session.execute.return_value.all.assert_called_once()
     assert result == []
 
@@ -57,9 +58,9 @@ def test_get_team_season_schedule_profile_when_query_returns_non_empty_list_shou
     result = test_repo.get_team_season_schedule_profile(team_name, season_year)
 
     # Assert
-    querystring = f"EXEC sp_GetTeamSeasonScheduleProfile '{team_name}', {season_year};"
-    fake_SQLQuery.assert_called_once_with(querystring)
-    fake_sqla.session.execute.assert_called_once_with(fake_SQLQuery.return_value)
+    fake_SQLQuery.assert_called_once_with("EXEC sp_GetTeamSeasonScheduleProfile :team_name, :season_year;")
+    fake_SQLQuery.return_value.bindparams.assert_called_once_with(team_name=team_name, season_year=season_year)
+    fake_sqla.session.execute.assert_called_once_with(fake_SQLQuery.return_value.bindparams.return_value)
     fake_sqla.session.execute.return_value.all.assert_called_once()
     assert isinstance(result, list)
     assert len(result) == 3
@@ -96,9 +97,9 @@ def test_get_team_season_schedule_totals_when_query_returns_none_should_get_empt
     result = test_repo.get_team_season_schedule_totals(team_name, season_year)
 
     # Assert
-    querystring = f"EXEC sp_GetTeamSeasonScheduleTotals '{team_name}', {season_year};"
-    fake_SQLQuery.assert_called_once_with(querystring)
-    fake_sqla.session.execute.assert_called_once_with(fake_SQLQuery.return_value)
+    fake_SQLQuery.assert_called_once_with("EXEC sp_GetTeamSeasonScheduleTotals :team_name, :season_year;")
+    fake_SQLQuery.return_value.bindparams.assert_called_once_with(team_name=team_name, season_year=season_year)
+    fake_sqla.session.execute.assert_called_once_with(fake_SQLQuery.return_value.bindparams.return_value)
     fake_sqla.session.execute.return_value.first.assert_called_once()
 
     assert isinstance(result, TeamSeasonScheduleTotals)
@@ -142,9 +143,9 @@ def test_get_team_season_schedule_totals_when_query_does_not_return_none_should_
     result = test_repo.get_team_season_schedule_totals(team_name, season_year)
 
     # Assert
-    querystring = f"EXEC sp_GetTeamSeasonScheduleTotals '{team_name}', {season_year};"
-    fake_SQLQuery.assert_called_once_with(querystring)
-    fake_sqla.session.execute.assert_called_once_with(fake_SQLQuery.return_value)
+    fake_SQLQuery.assert_called_once_with("EXEC sp_GetTeamSeasonScheduleTotals :team_name, :season_year;")
+    fake_SQLQuery.return_value.bindparams.assert_called_once_with(team_name=team_name, season_year=season_year)
+    fake_sqla.session.execute.assert_called_once_with(fake_SQLQuery.return_value.bindparams.return_value)
     fake_sqla.session.execute.return_value.first.assert_called_once()
 
     assert isinstance(result, TeamSeasonScheduleTotals)
@@ -176,9 +177,9 @@ def test_get_team_season_schedule_averages_when_query_returns_none_should_get_em
     result = test_repo.get_team_season_schedule_averages(team_name, season_year)
 
     # Assert
-    querystring = f"EXEC sp_GetTeamSeasonScheduleAverages '{team_name}', {season_year};"
-    fake_SQLQuery.assert_called_once_with(querystring)
-    fake_sqla.session.execute.assert_called_once_with(fake_SQLQuery.return_value)
+    fake_SQLQuery.assert_called_once_with("EXEC sp_GetTeamSeasonScheduleAverages :team_name, :season_year;")
+    fake_SQLQuery.return_value.bindparams.assert_called_once_with(team_name=team_name, season_year=season_year)
+    fake_sqla.session.execute.assert_called_once_with(fake_SQLQuery.return_value.bindparams.return_value)
     fake_sqla.session.execute.return_value.first.assert_called_once()
 
     assert isinstance(result, TeamSeasonScheduleAverages)
@@ -210,9 +211,9 @@ def test_get_team_season_schedule_averages_when_query_does_not_return_none_shoul
     result = test_repo.get_team_season_schedule_averages(team_name, season_year)
 
     # Assert
-    querystring = f"EXEC sp_GetTeamSeasonScheduleAverages '{team_name}', {season_year};"
-    fake_SQLQuery.assert_called_once_with(querystring)
-    fake_sqla.session.execute.assert_called_once_with(fake_SQLQuery.return_value)
+    fake_SQLQuery.assert_called_once_with("EXEC sp_GetTeamSeasonScheduleAverages :team_name, :season_year;")
+    fake_SQLQuery.return_value.bindparams.assert_called_once_with(team_name=team_name, season_year=season_year)
+    fake_sqla.session.execute.assert_called_once_with(fake_SQLQuery.return_value.bindparams.return_value)
     fake_sqla.session.execute.return_value.first.assert_called_once()
 
     assert isinstance(result, TeamSeasonScheduleAverages)
@@ -220,3 +221,69 @@ def test_get_team_season_schedule_averages_when_query_does_not_return_none_shoul
     assert result.points_against == points_against
     assert result.schedule_points_for == schedule_points_for
     assert result.schedule_points_against == schedule_points_against
+
+
+@patch('app.data.repositories.team_season_schedule_repository.sqla')
+def test_get_team_season_schedule_totals_should_bind_team_name_rather_than_splice_it_into_sql(fake_sqla, test_repo):
+    # Arrange
+    fake_sqla.session.execute.return_value.first.return_value = None
+    team_name = "Team'; DROP TABLE Game; --"
+
+    # Act
+    test_repo.get_team_season_schedule_totals(team_name, 1)
+
+    # Assert
+    procedure = fake_sqla.session.execute.call_args.args[0]
+    assert "DROP" not in str(procedure)
+    assert procedure.compile().params == {'team_name': team_name, 'season_year': 1}
+
+
+@patch('app.data.repositories.team_season_schedule_repository.async_sqla')
+@patch('app.data.repositories.team_season_schedule_repository.sqla')
+def test_get_team_season_schedule_when_async_mode_off_should_call_procedures_on_session(
+        fake_sqla, fake_async_sqla, test_repo
+):
+    # Arrange
+    fake_async_sqla.is_enabled = False
+    fake_sqla.session.execute.return_value.all.return_value = []
+    fake_sqla.session.execute.return_value.first.return_value = None
+
+    # Act
+    result = asyncio.run(test_repo.get_team_season_schedule("Team", 1))
+
+    # Assert
+    assert fake_sqla.session.execute.call_count == 3
+    assert result == ([], TeamSeasonScheduleTotals(), TeamSeasonScheduleAverages())
+
+
+@patch('app.data.repositories.team_season_schedule_repository.async_sqla')
+@patch('app.data.repositories.team_season_schedule_repository.sqla')
+def test_get_team_season_schedule_when_async_mode_on_should_run_procedures_concurrently(
+        fake_sqla, fake_async_sqla, test_repo
+):
+    # Arrange
+    fake_async_sqla.is_enabled = True
+    started = []
+
+    async def fetch_all(statement):
+        procedure = str(statement)
+        started.append(procedure)
+        await asyncio.sleep(0)
+        # Every procedure has started before the first one finishes.
+        assert len(started) == 3
+        if 'Profile' in procedure:
+            return [("Opponent", 3, 2, 1, 1, 1, Decimal('0.5'), 10, 10, 10)]
+        if 'Totals' in procedure:
+            return [(1, 3, 2, 1, 1, 1, Decimal('0.5'), 10, 10, 10)]
+        return []
+
+    fake_async_sqla.fetch_all.side_effect = fetch_all
+
+    # Act
+    profile, totals, averages = asyncio.run(test_repo.get_team_season_schedule("Team", 1))
+
+    # Assert
+    fake_sqla.session.execute.assert_not_called()
+    assert [record.opponent for record in profile] == ["Opponent"]
+    assert totals.games == 1
+    assert averages == TeamSeasonScheduleAverages()
@@ -0,0 +1,83 @@
+from app.data.search_index import SearchIndex, SearchResult
+
+BEARS = SearchResult('team', 1, "Chicago Bears", "Chicago Bears")
+CARDINALS = SearchResult('team', 2, "Chicago Cardinals", "Chicago Cardinals")
+SEASON = SearchResult('season', 1, "1920", "1920")
+LEAGUE = SearchResult('league', 1, "APFA American Professional Football Association", "APFA")
+
+
+def test_search_should_match_prefix_of_any_word_ignoring_case():
+    # Arrange
+    test_index = SearchIndex()
+    test_index.build([BEARS, CARDINALS, SEASON, LEAGUE])
+
+    # Act
+    result = test_index.search("CHIC")
+
+    # Assert
+    assert result == [BEARS, CARDINALS]
+    assert test_index.search("bea") == [BEARS]
+    assert test_index.search("chicago b") == [BEARS]
+    assert test_index.search("19") == [SEASON]
+    assert test_index.search("prof") == [LEAGUE]
+
+
+def test_search_should_filter_kinds_and_apply_limit():
+    # Arrange
+    test_index = SearchIndex()
+    test_index.build([BEARS, CARDINALS, LEAGUE])
+
+    # Act
+    result = test_index.search("a", kinds=['league'])
+
+    # Assert
+    assert result == [LEAGUE]
+    assert test_index.search("chicago", limit=1) == [BEARS]
+    assert test_index.search("") == []
+
+
+def test_apply_should_add_rename_and_remove_entries():
+    # Arrange
+    test_index = SearchIndex()
+    test_index.build([BEARS, CARDINALS])
+    renamed = SearchResult('team', 2, "Arizona Cardinals", "Arizona Cardinals")
+
+    # Act
+    test_index.apply([
+        ('team', 2, renamed),
+        ('team', 1, None),
+        ('season', 1, SEASON),
+    ])
+
+    # Assert
+    assert test_index.search("chicago") == []
+    assert test_index.search("ari") == [renamed]
+    assert test_index.search("1920") == [SEASON]
+
+
+def test_apply_when_not_built_should_do_nothing():
+    # Arrange
+    test_index = SearchIndex()
+
+    # Act
+    test_index.apply([('team', 1, BEARS)])
+
+    # Assert
+    assert not test_index.is_built
+    assert test_index.search("bears") == []
+
+
+def test_mark_current_should_only_advance_version_of_built_index():
+    # Arrange
+    test_index = SearchIndex()
+    unbuilt_index = SearchIndex()
+    test_index.build([BEARS], version=(3, 1, 1))
+
+    # Act
+    test_index.mark_current((5, 1, 2))
+    test_index.mark_current((4, 1, 3))
+    unbuilt_index.mark_current((5, 1, 2))
+
+    # Assert
+    assert test_index.version == (5, 1, 2)
+    assert unbuilt_index.version == (0, 0, 0)
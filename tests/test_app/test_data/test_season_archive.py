@@ -0,0 +1,109 @@
+import io
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from app.data.models.season_snapshot import SeasonSnapshot, TeamSeasonRecord
+from app.data.season_archive import HEADER, SeasonArchiveError, read_season_archive, write_season_archive
+
+
+def _build_snapshot():
+    team_season_row = {field: None for field in TeamSeasonRecord._fields}
+    team_season_row.update(
+        id=7, team_name="Chicago Bears", season_year=1963, league_name='NFL', conference_name='Western',
+        division_name=None, games=1, wins=1, losses=0, ties=0, points_for=10, points_against=3,
+        winning_percentage=Decimal('1'), offensive_factor=Decimal('1.23456789012345'),
+        simple_rating=Decimal('3.5'), elo_rating=Decimal('1512.5')
+    )
+    game_row = SimpleNamespace(id=3, season_year=1963, week=1, guest_name="Green Bay Packers", guest_score=3,
+                               host_name="Chicago Bears", host_score=10, is_playoff=False, notes="Opener",
+                               elo_delta=Decimal('12.5'))
+    return SeasonSnapshot.build(1963, 0, [SimpleNamespace(**team_season_row)], [game_row])
+
+
+def _write(tmp_path, snapshot):
+    path = tmp_path / 'season.pfsa'
+    with open(path, 'wb') as file:
+        size = write_season_archive(snapshot, file)
+    return path, size
+
+
+def test_read_season_archive_should_round_trip_snapshot(tmp_path):
+    # Arrange
+    snapshot = _build_snapshot()
+    path, size = _write(tmp_path, snapshot)
+
+    # Act
+    result = read_season_archive(str(path))
+
+    # Assert
+    assert size == path.stat().st_size
+    assert result.season_year == 1963
+    assert result.get_team_seasons() == snapshot.get_team_seasons()
+    assert list(result.get_games()) == list(snapshot.get_games())
+    assert result.get_team_season("Green Bay Packers") is None
+
+
+def test_read_season_archive_when_format_version_is_1_should_read_added_columns_as_none(tmp_path):
+    # Arrange
+    path, _ = _write(tmp_path, _build_snapshot())
+    content = bytearray(path.read_bytes())
+    content[4:6] = (1).to_bytes(2, 'little')
+    path.write_bytes(bytes(content))
+
+    # Act
+    result = read_season_archive(str(path))
+
+    # Assert
+    team_season = result.get_team_season("Chicago Bears")
+    game = next(iter(result.get_games()))
+    assert team_season.points_for == 10
+    assert team_season.simple_rating is None
+    assert team_season.elo_rating is None
+    assert game.host_score == 10
+    assert game.notes is None
+    assert game.elo_delta is None
+
+
+def test_write_season_archive_should_align_columns_to_eight_bytes():
+    # Arrange
+    file = io.BytesIO()
+
+    # Act
+    write_season_archive(_build_snapshot(), file)
+
+    # Assert
+    magic, *_, data_offset = HEADER.unpack_from(file.getvalue())
+    assert magic == b'PFSA'
+    assert data_offset % 8 == 0
+
+
+def test_read_season_archive_when_file_is_not_an_archive_should_raise_season_archive_error(tmp_path):
+    # Arrange
+    path = tmp_path / 'season.pfsa'
+    path.write_bytes(b'INSERT INTO Game VALUES (1);' * 4)
+
+    # Act and Assert
+    with pytest.raises(SeasonArchiveError):
+        read_season_archive(str(path))
+
+
+def test_read_season_archive_when_file_is_truncated_should_raise_season_archive_error(tmp_path):
+    # Arrange
+    path, size = _write(tmp_path, _build_snapshot())
+    path.write_bytes(path.read_bytes()[:size - 16])
+
+    # Act and Assert
+    with pytest.raises(SeasonArchiveError):
+        read_season_archive(str(path))
+
+
+def test_read_season_archive_when_file_is_empty_should_raise_season_archive_error(tmp_path):
+    # Arrange
+    path = tmp_path / 'season.pfsa'
+    path.write_bytes(b'')
+
+    # Act and Assert
+    with pytest.raises(SeasonArchiveError):
+        read_season_archive(str(path))
@@ -0,0 +1,148 @@
+import pytest
+from flask import session
+
+from app.data.models.season import Season
+from app.data.session_routing import LAST_WRITE_AT_KEY, read_only, use_primary
+from app.data.sqla import sqla
+
+
+@pytest.fixture()
+def create_app(create_sqlite_app, tmp_path):
+    def create(**config):
+        return create_sqlite_app(
+            Season,
+            SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'primary.sqlite3'}",
+            SQLALCHEMY_BINDS={'read': f"sqlite:///{tmp_path / 'read.sqlite3'}"},
+            **config
+        )
+
+    return create
+
+
+@read_only
+def _get_season_years():
+    return [season.year for season in Season.query.order_by(Season.year).all()]
+
+
+def _add_season(year):
+    sqla.session.add(Season(year=year, num_of_weeks_scheduled=14, num_of_weeks_completed=0))
+    sqla.session.commit()
+
+
+def _add_season_to_read_engine_only(year):
+    with sqla.engines['read'].begin() as connection:
+        connection.execute(Season.__table__.insert().values(year=year, num_of_weeks_scheduled=14,
+                                                            num_of_weeks_completed=0))
+
+
+def test_read_only_method_should_read_from_read_engine(create_app):
+    # Arrange
+    app = create_app()
+    with app.app_context():
+        _add_season_to_read_engine_only(1920)
+
+        # Act
+        result = _get_season_years()
+
+    # Assert
+    assert result == [1920]
+
+
+def test_other_queries_should_read_from_primary_engine(create_app):
+    # Arrange
+    app = create_app()
+    with app.app_context():
+        _add_season_to_read_engine_only(1920)
+
+        # Act
+        result = [season.year for season in Season.query.all()]
+
+    # Assert
+    assert result == []
+
+
+def test_read_only_method_within_use_primary_should_read_from_primary_engine(create_app):
+    # Arrange
+    app = create_app()
+    with app.app_context():
+        _add_season_to_read_engine_only(1920)
+
+        # Act
+        with use_primary():
+            result = _get_season_years()
+
+    # Assert
+    assert result == []
+
+
+def test_read_only_method_when_no_read_engine_is_configured_should_read_from_primary_engine(create_sqlite_app):
+    # Arrange
+    app = create_sqlite_app(Season)
+    with app.app_context():
+        _add_season(1920)
+
+        # Act
+        result = _get_season_years()
+
+    # Assert
+    assert result == [1920]
+
+
+def test_read_only_method_after_write_in_same_request_should_read_from_primary_engine(create_app):
+    # Arrange
+    app = create_app()
+    with app.test_request_context('/'):
+        _add_season(1920)
+
+        # Act
+        result = _get_season_years()
+
+    # Assert
+    assert result == [1920]
+
+
+def test_read_only_method_within_read_your_writes_window_should_read_from_primary_engine(create_app):
+    # Arrange
+    app = create_app(SQLALCHEMY_READ_YOUR_WRITES_SECONDS=60)
+    with app.test_request_context('/'):
+        _add_season(1920)
+        last_write_at = session[LAST_WRITE_AT_KEY]
+
+    with app.test_request_context('/'):
+        session[LAST_WRITE_AT_KEY] = last_write_at
+
+        # Act
+        result = _get_season_years()
+
+    # Assert
+    assert result == [1920]
+
+
+def test_read_only_method_outside_read_your_writes_window_should_read_from_read_engine(create_app):
+    # Arrange
+    app = create_app(SQLALCHEMY_READ_YOUR_WRITES_SECONDS=60)
+    with app.test_request_context('/'):
+        _add_season(1920)
+
+    with app.test_request_context('/'):
+        session[LAST_WRITE_AT_KEY] = 0
+
+        # Act
+        result = _get_season_years()
+
+    # Assert
+    assert result == []
+
+
+def test_commit_when_sqlite_read_replica_sync_is_on_should_copy_writes_to_read_engine(create_app):
+    # Arrange
+    app = create_app(SQLALCHEMY_SYNC_SQLITE_READ_REPLICA=True)
+    with app.app_context():
+        _get_season_years()
+
+        # Act
+        _add_season(1920)
+        result = _get_season_years()
+
+    # Assert
+    assert result == [1920]
@@ -0,0 +1,95 @@
+from unittest.mock import Mock, patch
+
+from app.flask.commands.benchmark_commands import (benchmark_read_views_command, dispose_pools, format_measurements,
+                                                  format_throughput, measure, measure_throughput)
+
+
+@patch('app.flask.commands.benchmark_commands.sqla')
+def test_measure_should_fetch_once_per_repeat_plus_once_for_memory_in_fresh_sessions(fake_sqla):
+    # Arrange
+    fetch = Mock(return_value=[1, 2, 3])
+
+    # Act
+    count, mean, peak = measure(fetch, 4)
+
+    # Assert
+    assert count == 3
+    assert fetch.call_count == 5
+    assert fake_sqla.session.remove.call_count == 6
+    assert mean >= 0
+    assert peak >= 0
+
+
+def test_format_measurements_should_align_columns():
+    # Act
+    table = format_measurements([('games (ORM)', 240, 12.3456, 204800), ('games (rows)', 240, 2.5, 51200)])
+
+    # Assert
+    assert table.splitlines() == [
+        "List          Items  Mean (ms)  Peak memory (KiB)",
+        "------------  -----  ---------  -----------------",
+        "games (ORM)   240    12.346     200.0",
+        "games (rows)  240    2.500      50.0",
+    ]
+
+
+def test_measure_throughput_should_fetch_request_count_times_in_app_contexts(create_sqlite_app):
+    # Arrange
+    from flask import has_app_context
+
+    app = create_sqlite_app()
+    contexts = []
+    fetch = Mock(side_effect=lambda: contexts.append(has_app_context()))
+
+    # Act
+    count, rate, mean = measure_throughput(app, fetch, clients=3, request_count=7)
+
+    # Assert
+    assert count == 7
+    assert contexts == [True] * 7
+    assert rate > 0
+    assert mean >= 0
+
+
+def test_format_throughput_should_align_columns():
+    # Act
+    table = format_throughput([('sync', 50, 120.25, 66.5), ('async', 50, 310.0, 25.75)])
+
+    # Assert
+    assert table.splitlines() == [
+        "Mode   Requests  Requests/s  Mean (ms)",
+        "-----  --------  ----------  ---------",
+        "sync   50        120.2       66.500",
+        "async  50        310.0       25.750",
+    ]
+
+
+def test_benchmark_read_views_when_async_mode_off_should_fail():
+    # Arrange
+    from flask import Flask
+
+    test_app = Flask(__name__)
+    test_app.cli.add_command(benchmark_read_views_command)
+
+    # Act
+    result = test_app.test_cli_runner().invoke(args=['benchmark-read-views', '--team', "Bears", '--season', '1920'])
+
+    # Assert
+    assert result.exit_code != 0
+    assert "SQLALCHEMY_ASYNC_DATABASE_URI" in result.output
+
+
+@patch('app.flask.commands.benchmark_commands.async_sqla')
+@patch('app.flask.commands.benchmark_commands.sqla')
+def test_dispose_pools_should_dispose_sync_and_async_engines(fake_sqla, fake_async_sqla):
+    # Arrange
+    engines = [Mock(), Mock()]
+    fake_sqla.engines.values.return_value = engines
+
+    # Act
+    dispose_pools()
+
+    # Assert
+    for engine in engines:
+        engine.dispose.assert_called_once_with()
+    fake_async_sqla.dispose.assert_called_once_with()
@@ -0,0 +1,41 @@
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+
+from app.flask.commands import export_commands as mod
+
+
+@pytest.fixture()
+def test_app():
+    app = Flask(__name__)
+    app.cli.add_command(mod.export_data_command)
+    return app
+
+
+@patch('app.flask.commands.export_commands.injector')
+def test_export_data_command_should_write_export_chunks_to_output(fake_injector, test_app, tmp_path):
+    # Arrange
+    fake_injector.get.return_value.export.return_value = iter([b"id\r\n", b"1\r\n"])
+    path = tmp_path / "games.csv.gz"
+
+    # Act
+    result = test_app.test_cli_runner().invoke(
+        args=['export-data', 'games', str(path), '--first-season', '1920', '--gzip']
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    fake_injector.get.return_value.export.assert_called_once_with('games', 'csv', 1920, None, True)
+    assert path.read_bytes() == b"id\r\n1\r\n"
+    assert "in 7 bytes" in result.output
+
+
+@patch('app.flask.commands.export_commands.injector')
+def test_export_data_command_when_kind_unknown_should_fail(fake_injector, test_app, tmp_path):
+    # Act
+    result = test_app.test_cli_runner().invoke(args=['export-data', 'players', str(tmp_path / "players.csv")])
+
+    # Assert
+    assert result.exit_code != 0
+    fake_injector.get.assert_not_called()
@@ -0,0 +1,25 @@
+from decimal import Decimal
+
+from app.flask.commands.numeric_mode_commands import format_numeric_mode_comparison
+from app.services.weekly_update_service.numeric_mode_comparison import NumericModeComparison
+
+
+def test_format_numeric_mode_comparison_should_list_largest_divergence_of_each_column():
+    # Arrange
+    comparison = NumericModeComparison()
+    comparison.add(
+        "Chicago Bears", 1920,
+        {'offensive_average': Decimal('21.615384615384615'), 'offensive_factor': None},
+        {'offensive_average': Decimal('21.615384615384613'), 'offensive_factor': Decimal('1.05')}
+    )
+
+    # Act
+    result = format_numeric_mode_comparison(comparison)
+
+    # Assert
+    lines = result.splitlines()
+    assert lines[0].split() == ['Column', 'Scale', 'Compared', 'Max', 'Divergence', 'Team', 'Season']
+    assert lines[2].split() == ['offensive_average', '15', '1', '2.000E-15', 'Chicago', 'Bears', '1920']
+    assert lines[3].split() == ['offensive_factor', '14', '0', '0.000E+00']
+    assert lines[-2] == "Compared 1 team seasons; largest divergence 2.000E-15."
+    assert lines[-1] == "1 values were empty in one mode only."
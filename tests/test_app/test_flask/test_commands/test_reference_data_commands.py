@@ -0,0 +1,91 @@
+import csv
+import io
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+
+from app.data.factories.batch_validation import BatchValidationError
+from app.data.models.season import Season
+from app.data.models.team import Team
+from app.data.repositories.team_repository import TeamRepository
+from app.flask.commands import reference_data_commands as mod
+
+
+@pytest.fixture()
+def test_app():
+    app = Flask(__name__)
+    app.cli.add_command(mod.import_reference_data_command)
+    return app
+
+
+def test_read_reference_data_should_leave_out_empty_cells_and_convert_integer_columns():
+    # Arrange
+    reader = csv.DictReader(io.StringIO("year,num_of_weeks_scheduled\n1920, 13 \n1921,\n"))
+
+    # Act
+    result = mod.read_reference_data(Season, reader)
+
+    # Assert
+    assert result == [{'year': 1920, 'num_of_weeks_scheduled': 13}, {'year': 1921}]
+
+
+def test_read_reference_data_when_column_unknown_should_raise_value_error():
+    # Arrange
+    reader = csv.DictReader(io.StringIO("id,name,city\n1,Chicago Bears,Chicago\n"))
+
+    # Act
+    with pytest.raises(ValueError, match="id, city"):
+        mod.read_reference_data(Team, reader)
+
+
+def test_read_reference_data_when_integer_value_bad_should_raise_value_error_with_line_number():
+    # Arrange
+    reader = csv.DictReader(io.StringIO("year\n1920\nnineteen\n"))
+
+    # Act
+    with pytest.raises(ValueError, match="Line 3: year"):
+        mod.read_reference_data(Season, reader)
+
+
+@patch('app.flask.commands.reference_data_commands.injector')
+@patch('app.data.factories.team_factory.create_batch')
+def test_import_reference_data_command_should_add_whole_batch(
+        fake_create_batch, fake_injector, test_app, tmp_path
+):
+    # Arrange
+    path = tmp_path / 'teams.csv'
+    path.write_text("name\nChicago Bears\nGreen Bay Packers\n")
+    teams = [Team(name="Chicago Bears"), Team(name="Green Bay Packers")]
+    fake_create_batch.return_value = teams
+
+    # Act
+    result = test_app.test_cli_runner().invoke(args=['import-reference-data', 'teams', str(path)])
+
+    # Assert
+    assert result.exit_code == 0
+    assert "Imported 2 teams" in result.output
+    fake_create_batch.assert_called_once_with(
+        Team, 'Team', ['name'], [{'name': "Chicago Bears"}, {'name': "Green Bay Packers"}]
+    )
+    fake_injector.get.assert_called_once_with(TeamRepository)
+    fake_injector.get.return_value.add_teams.assert_called_once_with(teams)
+
+
+@patch('app.flask.commands.reference_data_commands.injector')
+@patch('app.data.factories.team_factory.create_batch')
+def test_import_reference_data_command_when_batch_invalid_should_report_every_error_and_add_nothing(
+        fake_create_batch, fake_injector, test_app, tmp_path
+):
+    # Arrange
+    path = tmp_path / 'teams.csv'
+    path.write_text("name\nChicago Bears\nChicago Bears\n")
+    fake_create_batch.side_effect = BatchValidationError(["Item 1: first error.", "Item 2: second error."])
+
+    # Act
+    result = test_app.test_cli_runner().invoke(args=['import-reference-data', 'teams', str(path)])
+
+    # Assert
+    assert result.exit_code == 1
+    assert "Item 1: first error.\nItem 2: second error." in result.output
+    fake_injector.get.assert_not_called()
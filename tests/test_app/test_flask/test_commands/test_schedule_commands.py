@@ -0,0 +1,35 @@
+import csv
+import io
+
+import pytest
+
+from app.flask.commands.schedule_commands import read_schedule
+
+
+def test_read_schedule_should_read_each_row_as_scheduled_game():
+    # Arrange
+    reader = csv.DictReader(io.StringIO("season_year,week,guest_name,host_name\n1920,1,Pros , Bears\n"))
+
+    # Act
+    result = read_schedule(reader)
+
+    # Assert
+    assert result == [{'season_year': 1920, 'week': 1, 'guest_name': "Pros", 'host_name': "Bears"}]
+
+
+def test_read_schedule_when_column_missing_should_raise_value_error():
+    # Arrange
+    reader = csv.DictReader(io.StringIO("season_year,week,guest_name\n1920,1,Pros\n"))
+
+    # Act
+    with pytest.raises(ValueError, match="host_name"):
+        read_schedule(reader)
+
+
+def test_read_schedule_when_week_not_number_should_raise_value_error_with_line_number():
+    # Arrange
+    reader = csv.DictReader(io.StringIO("season_year,week,guest_name,host_name\n1920,one,Pros,Bears\n"))
+
+    # Act
+    with pytest.raises(ValueError, match="Line 2"):
+        read_schedule(reader)
@@ -0,0 +1,52 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from flask import Flask
+
+from app.data.season_archive import SeasonArchiveError
+from app.flask.commands import season_archive_commands as mod
+
+
+@pytest.fixture()
+def test_app():
+    app = Flask(__name__)
+    app.cli.add_command(mod.export_season_command)
+    app.cli.add_command(mod.import_season_command)
+    return app
+
+
+@patch('app.flask.commands.season_archive_commands.injector')
+def test_export_season_command_should_export_season_and_report_size(fake_injector, test_app, tmp_path):
+    # Arrange
+    path = tmp_path / '1963.pfsa'
+
+    def export_season(season_year, path):
+        with open(path, 'wb') as file:
+            file.write(b'0' * 64)
+        return Mock(team_season_count=14, game_count=98)
+
+    fake_injector.get.return_value.export_season.side_effect = export_season
+
+    # Act
+    result = test_app.test_cli_runner().invoke(args=['export-season', '1963', str(path)])
+
+    # Assert
+    assert result.exit_code == 0
+    assert "Exported the 1963 season (14 team seasons, 98 games)" in result.output
+    assert "in 64 bytes" in result.output
+
+
+@patch('app.flask.commands.season_archive_commands.injector')
+def test_import_season_command_when_archive_is_invalid_should_fail(fake_injector, test_app, tmp_path):
+    # Arrange
+    path = tmp_path / '1963.pfsa'
+    path.write_bytes(b'junk')
+    fake_injector.get.return_value.import_season.side_effect = SeasonArchiveError("not a season archive")
+
+    # Act
+    result = test_app.test_cli_runner().invoke(args=['import-season', str(path), '--replace'])
+
+    # Assert
+    assert result.exit_code == 1
+    assert "not a season archive" in result.output
+    fake_injector.get.return_value.import_season.assert_called_once_with(str(path), replace=True)
@@ -0,0 +1,137 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from flask import Flask
+
+from app.data.repositories.league_repository import LeagueRepository
+from app.flask.commands import weekly_update_commands as mod
+from app.services.weekly_update_service.weekly_update_report import WeeklyUpdateReport
+
+
+@pytest.fixture()
+def test_app():
+    app = Flask(__name__)
+    app.cli.add_command(mod.weekly_update_command)
+    return app
+
+
+def test_parse_season_years_should_expand_ranges_and_single_years():
+    # Act
+    result = mod.parse_season_years('1970-1972, 1975,1971')
+
+    # Assert
+    assert result == [1970, 1971, 1972, 1975]
+
+
+@pytest.mark.parametrize('value', ['', 'abc', '1972-1970', '1970-'])
+def test_parse_season_years_when_value_is_invalid_should_raise_value_error(value):
+    # Act and Assert
+    with pytest.raises(ValueError):
+        mod.parse_season_years(value)
+
+
+def test_format_summary_should_include_one_row_per_report_and_a_total_row():
+    # Arrange
+    reports = [
+        WeeklyUpdateReport("NFL", 1970, rows_touched=27, attempts=1, duration=0.5),
+        WeeklyUpdateReport("AFL", 1969, attempts=2, duration=0.25, error="deadlock"),
+    ]
+
+    # Act
+    result = mod.format_summary(reports)
+
+    # Assert
+    lines = result.splitlines()
+    assert lines[0].split() == ['League', 'Season', 'Attempts', 'Duration', '(s)', 'Rows', 'Status']
+    assert lines[2].split() == ['NFL', '1970', '1', '0.500', '27', 'OK']
+    assert lines[3].split() == ['AFL', '1969', '2', '0.250', '0', 'FAILED:', 'deadlock']
+    assert lines[4].split() == ['Total', '3', '0.750', '27', '1', 'failed']
+
+
+@patch('app.flask.commands.weekly_update_commands.WeeklyUpdateRunner')
+@patch('app.flask.commands.weekly_update_commands.injector')
+def test_weekly_update_command_should_run_updates_for_specified_leagues_and_seasons(
+        fake_injector, fake_runner_class, test_app
+):
+    # Arrange
+    fake_runner_class.return_value.run.return_value = [WeeklyUpdateReport("NFL", 1970, attempts=1)]
+
+    # Act
+    result = test_app.test_cli_runner().invoke(
+        args=['weekly-update', '--seasons', '1970', '--league', 'NFL', '--workers', '2', '--retries', '1']
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    _, kwargs = fake_runner_class.call_args
+    assert kwargs == {'max_workers': 2, 'retries': 1, 'verify_league_season_totals': False}
+    fake_runner_class.return_value.run.assert_called_once_with(('NFL',), [1970])
+    assert 'NFL' in result.output
+
+
+@patch('app.flask.commands.weekly_update_commands.WeeklyUpdateRunner')
+@patch('app.flask.commands.weekly_update_commands.injector')
+def test_weekly_update_command_when_no_league_is_specified_should_update_every_league(
+        fake_injector, fake_runner_class, test_app
+):
+    # Arrange
+    fake_league_repository = Mock(LeagueRepository)
+    fake_league_repository.get_leagues.return_value = [Mock(short_name="NFL"), Mock(short_name="AFL")]
+    fake_injector.get.return_value = fake_league_repository
+    fake_runner_class.return_value.run.return_value = []
+
+    # Act
+    result = test_app.test_cli_runner().invoke(args=['weekly-update', '--seasons', '1960-1961'])
+
+    # Assert
+    assert result.exit_code == 0
+    fake_runner_class.return_value.run.assert_called_once_with(('NFL', 'AFL'), [1960, 1961])
+
+
+@patch('app.flask.commands.weekly_update_commands.WeeklyUpdateRunner')
+@patch('app.flask.commands.weekly_update_commands.injector')
+def test_weekly_update_command_when_an_update_fails_should_exit_with_error(
+        fake_injector, fake_runner_class, test_app
+):
+    # Arrange
+    fake_runner_class.return_value.run.return_value = [WeeklyUpdateReport("NFL", 1970, error="deadlock")]
+
+    # Act
+    result = test_app.test_cli_runner().invoke(args=['weekly-update', '--seasons', '1970', '--league', 'NFL'])
+
+    # Assert
+    assert result.exit_code == 1
+
+
+def test_weekly_update_command_when_seasons_are_invalid_should_exit_with_usage_error(test_app):
+    # Act
+    result = test_app.test_cli_runner().invoke(args=['weekly-update', '--seasons', 'abc', '--league', 'NFL'])
+
+    # Assert
+    assert result.exit_code == 2
+
+
+@patch('app.flask.commands.weekly_update_commands.WeeklyUpdateRunner')
+@patch('app.flask.commands.weekly_update_commands.injector')
+def test_weekly_update_command_when_verify_totals_should_verify_and_report_corrections(
+        fake_injector, fake_runner_class, test_app
+):
+    # Arrange
+    fake_runner_class.return_value.run.return_value = [
+        WeeklyUpdateReport("NFL", 1970, attempts=1, league_season_totals_verified=True,
+                           league_season_totals_mismatch=(
+                               "maintained 1 games and 7 points; aggregated 2 games and 9 points"
+                           )),
+        WeeklyUpdateReport("AFL", 1970, attempts=1, league_season_totals_verified=True),
+    ]
+
+    # Act
+    result = test_app.test_cli_runner().invoke(
+        args=['weekly-update', '--seasons', '1970', '--league', 'NFL', '--league', 'AFL', '--verify-totals']
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    assert fake_runner_class.call_args.kwargs['verify_league_season_totals'] is True
+    assert "Corrected NFL 1970: maintained 1 games" in result.output
+    assert "Verified league season totals: 2 checked, 1 corrected." in result.output
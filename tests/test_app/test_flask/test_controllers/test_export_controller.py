@@ -0,0 +1,52 @@
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+from werkzeug.exceptions import NotFound
+
+import app.flask.export_controller as mod
+
+
+@patch('app.flask.export_controller.export_service')
+def test_export_should_stream_export_with_season_range(fake_export_service):
+    # Arrange
+    fake_export_service.export.return_value = iter([b"id\r\n", b"1\r\n"])
+
+    with Flask(__name__).test_request_context('/export/games.csv?first_season=1920&last_season=1921'):
+        # Act
+        result = mod.export('games', 'csv')
+
+        # Assert
+        assert result.is_streamed
+        assert b"".join(result.response) == b"id\r\n1\r\n"
+
+    fake_export_service.export.assert_called_once_with(
+        'games', 'csv', first_season_year=1920, last_season_year=1921, compress=False
+    )
+    assert result.mimetype == 'text/csv'
+    assert result.headers['Content-Disposition'] == 'attachment; filename="games.csv"'
+    assert 'Content-Encoding' not in result.headers
+
+
+@patch('app.flask.export_controller.export_service')
+def test_export_when_gzip_requested_should_set_content_encoding(fake_export_service):
+    with Flask(__name__).test_request_context('/export/standings.json?gzip=1'):
+        # Act
+        result = mod.export('standings', 'json')
+
+    # Assert
+    assert fake_export_service.export.call_args.kwargs['compress'] is True
+    assert result.mimetype == 'application/json'
+    assert result.headers['Content-Encoding'] == 'gzip'
+
+
+@pytest.mark.parametrize('kind, export_format', [('players', 'csv'), ('games', 'xml')])
+@patch('app.flask.export_controller.export_service')
+def test_export_when_kind_or_format_unknown_should_abort_with_not_found(fake_export_service, kind, export_format):
+    with Flask(__name__).test_request_context(f'/export/{kind}.{export_format}'):
+        # Act
+        with pytest.raises(NotFound):
+            mod.export(kind, export_format)
+
+    # Assert
+    fake_export_service.export.assert_not_called()
@@ -0,0 +1,72 @@
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+from werkzeug.exceptions import BadRequest
+
+import app.flask.forecast_controller as mod
+from app.services.forecast_service.season_forecast import ProjectedStanding, SeasonForecast, WeekForecast
+from app.services.game_predictor_service.game_prediction import GamePrediction
+
+
+@patch('app.flask.forecast_controller.season_repository')
+@patch('app.flask.forecast_controller.forecast_service')
+@patch('app.flask.forecast_controller.render_template')
+def test_index_when_no_season_selected_should_render_index_template_without_forecast(
+        fake_render_template, fake_forecast_service, fake_season_repository
+):
+    with Flask(__name__).test_request_context('/forecast/'):
+        # Act
+        result = mod.index()
+
+    # Assert
+    fake_forecast_service.get_season_forecast.assert_not_called()
+    fake_render_template.assert_called_once_with(
+        'forecast/index.html',
+        seasons=fake_season_repository.get_season_records.return_value, selected_year=None, forecast=None
+    )
+    assert result is fake_render_template.return_value
+
+
+@patch('app.flask.forecast_controller.season_repository')
+@patch('app.flask.forecast_controller.forecast_service')
+@patch('app.flask.forecast_controller.render_template')
+def test_index_when_season_selected_should_render_index_template_with_forecast(
+        fake_render_template, fake_forecast_service, fake_season_repository
+):
+    with Flask(__name__).test_request_context('/forecast/?season=1920'):
+        # Act
+        mod.index()
+
+    # Assert
+    fake_forecast_service.get_season_forecast.assert_called_once_with(1920)
+    assert fake_render_template.call_args.kwargs['forecast'] is fake_forecast_service.get_season_forecast.return_value
+
+
+@patch('app.flask.forecast_controller.forecast_service')
+def test_standings_should_return_standings_and_predictions_as_json(fake_forecast_service):
+    # Arrange
+    prediction = GamePrediction("Bears", 1920, "Pros", 1920, 20.0, 10.0)
+    fake_forecast_service.get_season_forecast.return_value = SeasonForecast(
+        1920, {2: WeekForecast(2, predictions=(prediction,))},
+        [ProjectedStanding("Bears", wins=1, projected_wins=1, projected_points_for=20.0)]
+    )
+
+    with Flask(__name__).test_request_context('/forecast/standings?season=1920'):
+        # Act
+        result = mod.standings()
+
+    # Assert
+    body = result.get_json()
+    assert body['season_year'] == 1920
+    assert body['standings'][0]['team_name'] == "Bears"
+    assert body['standings'][0]['total_wins'] == 2
+    assert body['standings'][0]['projected_winning_percentage'] == 1.0
+    assert body['predictions'] == [prediction._asdict()]
+
+
+def test_standings_when_no_season_should_abort_with_bad_request():
+    with Flask(__name__).test_request_context('/forecast/standings'):
+        # Act
+        with pytest.raises(BadRequest):
+            mod.standings()
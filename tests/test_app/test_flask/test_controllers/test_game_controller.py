@@ -8,6 +8,7 @@ from werkzeug.exceptions import NotFound
 import app.flask.game_controller as mod
 
 from app.data.models.game import Game
+from app.data.models.season import Season
 
 from test_app import create_app
 
@@ -29,16 +30,61 @@ def test_index_should_render_game_index_template(fake_season_repository, fake_ga
     result = mod.index()
 
     # Assert
-    fake_season_repository.get_seasons.assert_called_once()
-    fake_game_repository.get_games_by_season_year.assert_called_once_with(season_year=None)
+    fake_season_repository.get_seasons.assert_not_called()
+    fake_game_repository.get_game_rows_by_season_year.assert_called_once_with(season_year=None)
     fake_render_template.assert_called_once_with(
         'games/index.html',
-        seasons=fake_season_repository.get_seasons.return_value, selected_season=mod.selected_season,
-        selected_week=mod.selected_week, games=fake_game_repository.get_games_by_season_year.return_value
+        selected_season=mod.selected_season, selected_week=mod.selected_week,
+        games=fake_game_repository.get_game_rows_by_season_year.return_value
     )
     assert result is fake_render_template.return_value
 
 
+@patch('app.flask.game_controller.render_template')
+@patch('app.flask.game_controller.game_repository')
+@patch('app.flask.game_controller.season_repository')
+def test_select_season_when_season_found_should_render_games_of_season(
+        fake_season_repository, fake_game_repository, fake_render_template, test_app
+):
+    # Arrange
+    season = Season(year=1920, num_of_weeks_scheduled=13, num_of_weeks_completed=13)
+    fake_season_repository.get_season_by_year.return_value = season
+
+    # Act
+    with test_app.test_request_context('/games/select_season', method='POST', data={'season_dropdown': '1920'}):
+        result = mod.select_season()
+
+    # Assert
+    fake_season_repository.get_season_by_year.assert_called_once_with(1920)
+    fake_game_repository.get_game_rows_by_season_year.assert_called_once_with(season_year=1920)
+    assert mod.selected_season is season
+    assert result is fake_render_template.return_value
+
+
+@pytest.mark.parametrize('typed_value', ["19", "Bears"])
+@patch('app.flask.game_controller.render_template')
+@patch('app.flask.game_controller.flash')
+@patch('app.flask.game_controller.game_repository')
+@patch('app.flask.game_controller.season_repository')
+def test_select_season_when_typed_value_is_not_a_season_should_flash_error_message(
+        fake_season_repository, fake_game_repository, fake_flash, fake_render_template, test_app, typed_value
+):
+    # Arrange
+    selected_season = Season(year=1920, num_of_weeks_scheduled=13, num_of_weeks_completed=13)
+    mod.selected_season = selected_season
+    fake_season_repository.get_season_by_year.return_value = None
+
+    # Act
+    with test_app.test_request_context(
+            '/games/select_season', method='POST', data={'season_dropdown': typed_value}
+    ):
+        mod.select_season()
+
+    # Assert
+    fake_flash.assert_called_once_with("Please choose a season from the suggestions.", 'danger')
+    assert mod.selected_season is selected_season
+
+
 @patch('app.flask.game_controller.game_repository')
 @patch('app.flask.game_controller.DeleteGameForm')
 @patch('app.flask.game_controller.render_template')
@@ -676,7 +722,7 @@ def test_select_season_should_render_game_index_template_for_selected_season(fak
     # selected_season = fake_season_repository.get_season_by_year.assert_called_once_with(
     #     fake_request.form.get.return_value
     # )
-    # games = fake_game_repository.get_games_by_season_year.assert_called_once_with(
+    # games = fake_game_repository.get_game_rows_by_season_year.assert_called_once_with(
     #     season_year=fake_request.form.get.return_value
     # )
     # fake_render_template.assert_called_once_with(
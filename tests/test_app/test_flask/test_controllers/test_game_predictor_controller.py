@@ -1,26 +1,23 @@
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
+from flask import Flask
+from werkzeug.exceptions import BadRequest, NotFound
 
 import app.flask.game_predictor_controller as mod
 from app.data.repositories.season_repository import SeasonRepository
+from app.services.game_predictor_service.game_prediction import GamePrediction, Matchup
 from app.services.game_predictor_service.game_predictor_service import GamePredictorService
 
 
 @patch('app.flask.game_predictor_controller.render_template')
 @patch('app.flask.game_predictor_controller.injector')
 def test_index_should_render_game_predictor_index_template(fake_injector, fake_render_template):
-    # Arrange
-    guest_seasons = [1920, 1921, 1922]
-    host_seasons = [1920, 1921, 1922]
-    fake_injector.get.return_value.get_seasons.side_effect = [guest_seasons, host_seasons]
-
     # Act
     result = mod.index()
 
     # Assert
-    fake_injector.get.assert_called_once_with(SeasonRepository)
-    assert fake_injector.get.return_value.get_seasons.call_count == 2
+    fake_injector.get.assert_not_called()
 
     selected_guest_year = None
     guests = []
@@ -31,10 +28,8 @@ def test_index_should_render_game_predictor_index_template(fake_injector, fake_r
 
     fake_render_template.assert_called_once_with(
         'game_predictor/index.html',
-        guest_seasons=guest_seasons, selected_guest_year=selected_guest_year,
-        guests=guests, selected_guest_name=selected_guest_name,
-        host_seasons=host_seasons, selected_host_year=selected_host_year,
-        hosts=hosts, selected_host_name=selected_host_name
+        selected_guest_year=selected_guest_year, guests=guests, selected_guest_name=selected_guest_name,
+        selected_host_year=selected_host_year, hosts=hosts, selected_host_name=selected_host_name
     )
     assert result is fake_render_template.return_value
 
@@ -58,6 +53,49 @@ def test_select_guest_season_should_render_game_predictor_index_template_with_gu
     # )
 
 
+@patch('app.flask.game_predictor_controller.render_template')
+@patch('app.flask.game_predictor_controller.season_snapshot_repository')
+@patch('app.flask.game_predictor_controller.injector')
+def test_select_guest_season_when_season_found_should_populate_guests_with_teams_of_season(
+        fake_injector, fake_season_snapshot_repository, fake_render_template
+):
+    # Act
+    with Flask(__name__).test_request_context(
+            '/game_predictor/select_guest_season', method='POST', data={'guest_season_dropdown': '1985'}
+    ):
+        result = mod.select_guest_season()
+
+    # Assert
+    fake_injector.get.assert_called_once_with(SeasonRepository)
+    fake_injector.get.return_value.get_season_by_year.assert_called_once_with(1985)
+    fake_season_snapshot_repository.get_team_seasons_by_season_year.assert_called_once_with(season_year=1985)
+    assert mod.selected_guest_year == 1985
+    assert mod.guests is fake_season_snapshot_repository.get_team_seasons_by_season_year.return_value
+    assert result is fake_render_template.return_value
+
+
+@pytest.mark.parametrize('typed_value', ["2985", "Bears"])
+@patch('app.flask.game_predictor_controller.render_template')
+@patch('app.flask.game_predictor_controller.flash')
+@patch('app.flask.game_predictor_controller.season_snapshot_repository')
+@patch('app.flask.game_predictor_controller.injector')
+def test_select_host_season_when_typed_value_is_not_a_season_should_flash_error_message_without_reading_snapshot(
+        fake_injector, fake_season_snapshot_repository, fake_flash, fake_render_template, typed_value
+):
+    # Arrange
+    fake_injector.get.return_value.get_season_by_year.return_value = None
+
+    # Act
+    with Flask(__name__).test_request_context(
+            '/game_predictor/select_host_season', method='POST', data={'host_season_dropdown': typed_value}
+    ):
+        mod.select_host_season()
+
+    # Assert
+    fake_flash.assert_called_once_with("Please choose a host season from the suggestions.", 'danger')
+    fake_season_snapshot_repository.get_team_seasons_by_season_year.assert_not_called()
+
+
 @pytest.mark.skip('WIP')
 def test_select_guest_should_render_game_predictor_index_template_with_guest_years_dropdown_set_to_selected_guest_year_and_guests_dropdown_set_to_selected_guest_name():
     # Arrange
@@ -128,10 +166,8 @@ def test_predict_game_when_selected_guest_year_is_none_should_flash_error_messag
     fake_flash.assert_called_once_with("Please select one guest season.", 'danger')
     fake_render_template.assert_called_once_with(
         'game_predictor/index.html',
-        guest_seasons=mod.guest_seasons, selected_guest_year=mod.selected_guest_year,
-        guests=mod.guests, selected_guest_name=mod.selected_guest_name,
-        host_seasons=mod.host_seasons, selected_host_year=mod.selected_host_year,
-        hosts=mod.hosts, selected_host_name=mod.selected_host_name
+        selected_guest_year=mod.selected_guest_year, guests=mod.guests, selected_guest_name=mod.selected_guest_name,
+        selected_host_year=mod.selected_host_year, hosts=mod.hosts, selected_host_name=mod.selected_host_name
     )
     assert result is fake_render_template.return_value
 
@@ -152,10 +188,8 @@ def test_predict_game_when_selected_guest_is_none_should_flash_error_message(
     fake_flash.assert_called_once_with("Please select one guest name.", 'danger')
     fake_render_template.assert_called_once_with(
         'game_predictor/index.html',
-        guest_seasons=mod.guest_seasons, selected_guest_year=mod.selected_guest_year,
-        guests=mod.guests, selected_guest_name=mod.selected_guest_name,
-        host_seasons=mod.host_seasons, selected_host_year=mod.selected_host_year,
-        hosts=mod.hosts, selected_host_name=mod.selected_host_name
+        selected_guest_year=mod.selected_guest_year, guests=mod.guests, selected_guest_name=mod.selected_guest_name,
+        selected_host_year=mod.selected_host_year, hosts=mod.hosts, selected_host_name=mod.selected_host_name
     )
     assert result is fake_render_template.return_value
 
@@ -177,10 +211,8 @@ def test_predict_game_when_selected_host_year_is_none_should_flash_error_message
     fake_flash.assert_called_once_with("Please select one host season.", 'danger')
     fake_render_template.assert_called_once_with(
         'game_predictor/index.html',
-        guest_seasons=mod.guest_seasons, selected_guest_year=mod.selected_guest_year,
-        guests=mod.guests, selected_guest_name=mod.selected_guest_name,
-        host_seasons=mod.host_seasons, selected_host_year=mod.selected_host_year,
-        hosts=mod.hosts, selected_host_name=mod.selected_host_name
+        selected_guest_year=mod.selected_guest_year, guests=mod.guests, selected_guest_name=mod.selected_guest_name,
+        selected_host_year=mod.selected_host_year, hosts=mod.hosts, selected_host_name=mod.selected_host_name
     )
     assert result is fake_render_template.return_value
 
@@ -203,10 +235,8 @@ def test_predict_game_when_selected_host_is_none_should_flash_error_message(
     fake_flash.assert_called_once_with("Please select one host name.", 'danger')
     fake_render_template.assert_called_once_with(
         'game_predictor/index.html',
-        guest_seasons=mod.guest_seasons, selected_guest_year=mod.selected_guest_year,
-        guests=mod.guests, selected_guest_name=mod.selected_guest_name,
-        host_seasons=mod.host_seasons, selected_host_year=mod.selected_host_year,
-        hosts=mod.hosts, selected_host_name=mod.selected_host_name
+        selected_guest_year=mod.selected_guest_year, guests=mod.guests, selected_guest_name=mod.selected_guest_name,
+        selected_host_year=mod.selected_host_year, hosts=mod.hosts, selected_host_name=mod.selected_host_name
     )
     assert result is fake_render_template.return_value
 
@@ -233,10 +263,8 @@ def test_predict_game_when_selected_guest_year_and_selected_guest_and_selected_h
     fake_flash.assert_called_once_with("The prediction could not be calculated.", 'danger')
     fake_render_template.assert_called_once_with(
         'game_predictor/index.html',
-        guest_seasons=mod.guest_seasons, selected_guest_year=mod.selected_guest_year,
-        guests=mod.guests, selected_guest_name=mod.selected_guest_name,
-        host_seasons=mod.host_seasons, selected_host_year=mod.selected_host_year,
-        hosts=mod.hosts, selected_host_name=mod.selected_host_name
+        selected_guest_year=mod.selected_guest_year, guests=mod.guests, selected_guest_name=mod.selected_guest_name,
+        selected_host_year=mod.selected_host_year, hosts=mod.hosts, selected_host_name=mod.selected_host_name
     )
     assert result is fake_render_template.return_value
 
@@ -273,9 +301,140 @@ def test_predict_game_when_type_error_is_not_caught_should_flash_success_message
     )
     fake_render_template.assert_called_once_with(
         'game_predictor/index.html',
-        guest_seasons=mod.guest_seasons, selected_guest_year=mod.selected_guest_year,
-        guests=mod.guests, selected_guest_name=mod.selected_guest_name,
-        host_seasons=mod.host_seasons, selected_host_year=mod.selected_host_year,
-        hosts=mod.hosts, selected_host_name=mod.selected_host_name
+        selected_guest_year=mod.selected_guest_year, guests=mod.guests, selected_guest_name=mod.selected_guest_name,
+        selected_host_year=mod.selected_host_year, hosts=mod.hosts, selected_host_name=mod.selected_host_name
     )
     assert result is fake_render_template.return_value
+
+
+def test_parse_matchups_should_parse_season_and_cross_season_lines_and_skip_blank_lines():
+    # Act
+    matchups = mod.parse_matchups("Chicago Bears, New England Patriots, 1985\n\n Giants,1986 , Bears, 1985 \n")
+
+    # Assert
+    assert matchups == [
+        Matchup("Chicago Bears", 1985, "New England Patriots", 1985),
+        Matchup("Giants", 1986, "Bears", 1985),
+    ]
+
+
+@pytest.mark.parametrize('text', ["", "Bears, Patriots", "Bears, Patriots, 85th", "Bears, 1985, Patriots, 1985, 1"])
+def test_parse_matchups_when_text_is_not_a_list_of_matchups_should_raise_value_error(text):
+    # Act
+    with pytest.raises(ValueError):
+        mod.parse_matchups(text)
+
+
+def _fake_get(fake_season_repository, fake_game_predictor_service):
+    return {SeasonRepository: fake_season_repository, GamePredictorService: fake_game_predictor_service}.get
+
+
+@patch('app.flask.game_predictor_controller.injector')
+def test_predict_games_should_return_predictions_as_json(fake_injector):
+    # Arrange
+    fake_season_repository, fake_game_predictor_service = Mock(), Mock()
+    fake_injector.get.side_effect = _fake_get(fake_season_repository, fake_game_predictor_service)
+    fake_season_repository.get_season_records.return_value = [Mock(year=1984), Mock(year=1985)]
+    fake_game_predictor_service.predict_game_scores.return_value = [
+        GamePrediction("Patriots", 1985, "Bears", 1985, 13.7, 25.4)
+    ]
+    matchup = {'guest_name': "Patriots", 'guest_season_year': 1985, 'host_name': "Bears", 'host_season_year': 1985}
+
+    with Flask(__name__).test_request_context(
+            '/game_predictor/predict_games', method='POST', json={'matchups': [matchup]}
+    ):
+        # Act
+        result = mod.predict_games()
+
+    # Assert
+    fake_game_predictor_service.predict_game_scores.assert_called_once_with(
+        [Matchup("Patriots", 1985, "Bears", 1985)]
+    )
+    assert result.get_json() == {'predictions': [{**matchup, 'guest_score': 13.7, 'host_score': 25.4}]}
+
+
+@pytest.mark.parametrize('payload', [None, {}, {'matchups': [{'guest_name': "Patriots"}]}])
+@patch('app.flask.game_predictor_controller.injector')
+def test_predict_games_when_matchups_are_invalid_should_abort_with_400_error(fake_injector, payload):
+    with Flask(__name__).test_request_context('/game_predictor/predict_games', method='POST', json=payload):
+        # Act
+        with pytest.raises(BadRequest):
+            mod.predict_games()
+
+    # Assert
+    fake_injector.get.return_value.predict_game_scores.assert_not_called()
+
+
+@patch('app.flask.game_predictor_controller.injector')
+def test_predict_games_when_season_year_is_unknown_should_abort_with_404_error(fake_injector):
+    # Arrange
+    fake_season_repository, fake_game_predictor_service = Mock(), Mock()
+    fake_injector.get.side_effect = _fake_get(fake_season_repository, fake_game_predictor_service)
+    fake_season_repository.get_season_records.return_value = [Mock(year=1985)]
+    matchup = {'guest_name': "Patriots", 'guest_season_year': 1985, 'host_name': "Bears", 'host_season_year': 2985}
+
+    with Flask(__name__).test_request_context(
+            '/game_predictor/predict_games', method='POST', json={'matchups': [matchup]}
+    ):
+        # Act
+        with pytest.raises(NotFound):
+            mod.predict_games()
+
+    # Assert
+    fake_game_predictor_service.predict_game_scores.assert_not_called()
+
+
+@patch('app.flask.game_predictor_controller.render_template')
+@patch('app.flask.game_predictor_controller.injector')
+def test_slate_when_matchups_posted_should_render_slate_template_with_predictions(
+        fake_injector, fake_render_template
+):
+    # Arrange
+    text = "Patriots, Bears, 1985"
+    fake_injector.get.return_value.get_season_records.return_value = [Mock(year=1985)]
+
+    with Flask(__name__).test_request_context('/game_predictor/slate', method='POST', data={'matchups': text}):
+        # Act
+        result = mod.slate()
+
+    # Assert
+    fake_injector.get.return_value.predict_game_scores.assert_called_once_with(
+        [Matchup("Patriots", 1985, "Bears", 1985)]
+    )
+    fake_render_template.assert_called_once_with(
+        'game_predictor/slate.html',
+        matchups_text=text, predictions=fake_injector.get.return_value.predict_game_scores.return_value
+    )
+    assert result is fake_render_template.return_value
+
+
+@patch('app.flask.game_predictor_controller.render_template')
+@patch('app.flask.game_predictor_controller.flash')
+@patch('app.flask.game_predictor_controller.injector')
+def test_slate_when_matchups_are_invalid_should_flash_error_message(fake_injector, fake_flash, fake_render_template):
+    with Flask(__name__).test_request_context('/game_predictor/slate', method='POST', data={'matchups': "Bears"}):
+        # Act
+        mod.slate()
+
+    # Assert
+    fake_injector.get.return_value.predict_game_scores.assert_not_called()
+    fake_flash.assert_called_once()
+    assert fake_flash.call_args.args[1] == 'danger'
+    fake_render_template.assert_called_once_with('game_predictor/slate.html', matchups_text="Bears", predictions=None)
+
+
+@patch('app.flask.game_predictor_controller.render_template')
+@patch('app.flask.game_predictor_controller.flash')
+@patch('app.flask.game_predictor_controller.injector')
+def test_slate_when_season_year_is_unknown_should_flash_error_message(fake_injector, fake_flash, fake_render_template):
+    # Arrange
+    text = "Patriots, Bears, 2985"
+    fake_injector.get.return_value.get_season_records.return_value = [Mock(year=1985)]
+
+    with Flask(__name__).test_request_context('/game_predictor/slate', method='POST', data={'matchups': text}):
+        # Act
+        mod.slate()
+
+    # Assert
+    fake_injector.get.return_value.predict_game_scores.assert_not_called()
+    fake_flash.assert_called_once_with("No season could be found for the years [2985].", 'danger')
@@ -0,0 +1,91 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+from werkzeug.exceptions import BadRequest
+
+import app.flask.head_to_head_controller as mod
+from app.services.head_to_head_service.head_to_head_record import HeadToHead, HeadToHeadRecord
+
+
+@patch('app.flask.head_to_head_controller.head_to_head_service')
+@patch('app.flask.head_to_head_controller.render_template')
+def test_index_when_no_teams_selected_should_render_index_template_without_head_to_head(
+        fake_render_template, fake_head_to_head_service
+):
+    with Flask(__name__).test_request_context('/head_to_head/'):
+        # Act
+        result = mod.index()
+
+    # Assert
+    fake_head_to_head_service.get_head_to_head.assert_not_called()
+    fake_render_template.assert_called_once_with(
+        'head_to_head/index.html',
+        selected_team_name=None, selected_opponent_name=None, first_season_year=None, last_season_year=None,
+        head_to_head=None
+    )
+    assert result is fake_render_template.return_value
+
+
+@patch('app.flask.head_to_head_controller.head_to_head_service')
+@patch('app.flask.head_to_head_controller.render_template')
+def test_index_when_teams_selected_should_render_index_template_with_head_to_head(
+        fake_render_template, fake_head_to_head_service
+):
+    with Flask(__name__).test_request_context('/head_to_head/?team=Bears&opponent=Pros&first_season=1920'):
+        # Act
+        mod.index()
+
+    # Assert
+    fake_head_to_head_service.get_head_to_head.assert_called_once_with("Bears", "Pros", 1920, None)
+    assert fake_render_template.call_args.kwargs['head_to_head'] is \
+        fake_head_to_head_service.get_head_to_head.return_value
+
+
+@patch('app.flask.head_to_head_controller.head_to_head_service')
+def test_games_should_return_record_and_games_as_json(fake_head_to_head_service):
+    # Arrange
+    game = SimpleNamespace(id=1, season_year=1920, week=1, guest_name="Pros", guest_score=0, host_name="Bears",
+                           host_score=7, is_playoff=0, notes=None)
+    record = HeadToHeadRecord("Bears", "Pros", 1, 1, 0, 0, 7, 0, 1920, 1920)
+    fake_head_to_head_service.get_head_to_head.return_value = HeadToHead(record, [game])
+
+    with Flask(__name__).test_request_context('/head_to_head/games?team=Bears&opponent=Pros'):
+        # Act
+        result = mod.games()
+
+    # Assert
+    assert result.get_json() == {
+        'record': record.to_dict(),
+        'games': [{
+            'id': 1, 'season_year': 1920, 'week': 1, 'guest_name': "Pros", 'guest_score': 0, 'host_name': "Bears",
+            'host_score': 7, 'is_playoff': False, 'notes': None
+        }],
+    }
+
+
+@patch('app.flask.head_to_head_controller.head_to_head_service')
+def test_series_should_return_series_record_as_json(fake_head_to_head_service):
+    # Arrange
+    record = HeadToHeadRecord("Bears", "Pros", 3, 2, 1, 0, 40, 20, 1920, 1922)
+    fake_head_to_head_service.get_series_record.return_value = record
+
+    with Flask(__name__).test_request_context('/head_to_head/series?team=Bears&opponent=Pros'):
+        # Act
+        result = mod.series()
+
+    # Assert
+    fake_head_to_head_service.get_series_record.assert_called_once_with("Bears", "Pros")
+    assert result.get_json() == record.to_dict()
+
+
+@patch('app.flask.head_to_head_controller.head_to_head_service')
+def test_series_when_opponent_missing_should_abort_with_400_error(fake_head_to_head_service):
+    with Flask(__name__).test_request_context('/head_to_head/series?team=Bears'):
+        # Act
+        with pytest.raises(BadRequest):
+            mod.series()
+
+    # Assert
+    fake_head_to_head_service.get_series_record.assert_not_called()
@@ -0,0 +1,18 @@
+from unittest.mock import patch
+
+from flask import Flask
+
+import app.flask.home_controller as mod
+
+
+@patch('app.flask.home_controller.reference_data_cache')
+def test_cache_metrics_should_return_reference_data_metrics_as_json(fake_reference_data_cache):
+    # Arrange
+    fake_reference_data_cache.get_metrics.return_value = {'season': {'hits': 3, 'misses': 1}}
+
+    with Flask(__name__).test_request_context('/cache_metrics'):
+        # Act
+        result = mod.cache_metrics()
+
+    # Assert
+    assert result.get_json() == {'reference_data': {'season': {'hits': 3, 'misses': 1}}}
@@ -0,0 +1,51 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+from werkzeug.exceptions import BadRequest
+
+import app.flask.leaderboard_controller as mod
+from app.services.leaderboard_service.leaderboard_entry import LeaderboardEntry
+
+
+@patch('app.flask.leaderboard_controller.leaderboard_service')
+@patch('app.flask.leaderboard_controller.render_template')
+def test_index_should_render_index_template_with_leaders(fake_render_template, fake_leaderboard_service):
+    with Flask(__name__).test_request_context('/leaderboards/?metric=defensive_index&order=asc&first_season=1980'):
+        # Act
+        result = mod.index()
+
+    # Assert
+    fake_leaderboard_service.get_leaders.assert_called_once_with(
+        metric='defensive_index', first_season_year=1980, last_season_year=None, limit=10, ascending=True
+    )
+    assert fake_render_template.call_args.args == ('leaderboard/index.html',)
+    assert fake_render_template.call_args.kwargs['leaders'] is fake_leaderboard_service.get_leaders.return_value
+    assert result is fake_render_template.return_value
+
+
+@patch('app.flask.leaderboard_controller.leaderboard_service')
+def test_leaders_should_return_entries_as_json(fake_leaderboard_service):
+    # Arrange
+    fake_leaderboard_service.get_leaders.return_value = [LeaderboardEntry(1, "Bears", 1985, Decimal('1.5'))]
+
+    with Flask(__name__).test_request_context('/leaderboards/leaders?limit=1'):
+        # Act
+        result = mod.leaders()
+
+    # Assert
+    body = result.get_json()
+    assert body['metric'] == mod.DEFAULT_METRIC
+    assert body['leaders'] == [{'rank': 1, 'team_name': "Bears", 'season_year': 1985, 'value': "1.5"}]
+
+
+@patch('app.flask.leaderboard_controller.leaderboard_service')
+def test_leaders_when_query_invalid_should_abort_with_bad_request(fake_leaderboard_service):
+    # Arrange
+    fake_leaderboard_service.get_leaders.side_effect = ValueError("Unknown leaderboard metric: x.")
+
+    with Flask(__name__).test_request_context('/leaderboards/leaders?metric=x'):
+        # Act
+        with pytest.raises(BadRequest):
+            mod.leaders()
@@ -0,0 +1,116 @@
+from unittest.mock import patch
+
+from flask import Flask, g
+
+import app.flask.metrics_controller as mod
+from app.metrics import CacheCounters, MetricFamily, Sample
+
+
+@patch('app.flask.metrics_controller.metrics')
+def test_index_should_return_metrics_in_prometheus_text_format(fake_metrics):
+    # Arrange
+    fake_metrics.collect_all.return_value = [
+        MetricFamily('test_total', 'counter', "A counter.", [Sample('test_total', (), 2)])
+    ]
+
+    test_app = Flask(__name__)
+    test_app.config['METRICS_MULTIPROCESS_DIR'] = '/tmp/metrics'
+    with test_app.test_request_context('/metrics/'):
+        # Act
+        result = mod.index()
+
+    # Assert
+    fake_metrics.collect_all.assert_called_once_with('/tmp/metrics')
+    assert result.mimetype == 'text/plain'
+    assert result.get_data(as_text=True) == '# HELP test_total A counter.\n# TYPE test_total counter\ntest_total 2\n'
+
+
+@patch('app.flask.metrics_controller.metrics')
+def test_record_request_time_should_observe_endpoint_and_method(fake_metrics):
+    # Arrange
+    with Flask(__name__).test_request_context('/teams/', method='POST'):
+        mod.start_request_timer()
+
+        # Act
+        mod.record_request_time()
+
+        # Assert
+        assert 'metrics_started_at' not in g
+
+    args, kwargs = fake_metrics.observe.call_args
+    assert args[0] == 'http_request_duration_seconds'
+    assert kwargs == {'endpoint': 'unmatched', 'method': 'POST'}
+    fake_metrics.flush.assert_not_called()
+
+
+@patch('app.flask.metrics_controller.metrics')
+def test_record_request_time_should_flush_to_multiprocess_dir(fake_metrics):
+    # Arrange
+    test_app = Flask(__name__)
+    test_app.config['METRICS_MULTIPROCESS_DIR'] = '/tmp/metrics'
+    with test_app.test_request_context('/'):
+        mod.start_request_timer()
+
+        # Act
+        mod.record_request_time()
+
+    # Assert
+    fake_metrics.flush.assert_called_once_with('/tmp/metrics')
+
+
+@patch('app.flask.metrics_controller.metrics')
+def test_record_request_time_should_do_nothing_when_timer_not_started(fake_metrics):
+    # Arrange
+    with Flask(__name__).test_request_context('/'):
+        # Act
+        mod.record_request_time()
+
+    # Assert
+    fake_metrics.observe.assert_not_called()
+
+
+@patch('app.flask.metrics_controller.reference_data_cache')
+def test_get_reference_data_families_should_report_hits_misses_and_ratio(fake_reference_data_cache):
+    # Arrange
+    fake_reference_data_cache.get_metrics.return_value = {
+        'season': {'hits': 3, 'misses': 1, 'hit_rate': 0.75},
+        'team': {'hits': 0, 'misses': 0, 'hit_rate': None},
+    }
+
+    # Act
+    result = mod.get_reference_data_families()
+
+    # Assert
+    hits, misses, ratios = result
+    assert [(sample.labels, sample.value) for sample in hits.samples] == [((('kind', 'season'),), 3),
+                                                                          ((('kind', 'team'),), 0)]
+    assert [sample.value for sample in misses.samples] == [1, 0]
+    assert ratios.type == 'gauge'
+    assert [sample.value for sample in ratios.samples] == [0.75]
+
+
+def test_get_pool_families_should_report_no_samples_outside_app_context():
+    # Act
+    result = mod.get_pool_families()
+
+    # Assert
+    assert [family.name for family in result] == ['db_pool_size', 'db_pool_checked_out', 'db_pool_overflow']
+    assert all(family.samples == [] for family in result)
+
+
+def test_get_cache_families_should_report_hits_misses_and_hit_ratio_of_each_cache():
+    # Arrange
+    used, unused = CacheCounters('used'), CacheCounters('unused')
+    used.hit(3)
+    used.miss()
+
+    # Act
+    with patch('app.flask.metrics_controller.CACHE_COUNTERS', (used, unused)):
+        hits, misses, ratios = mod.get_cache_families()
+
+    # Assert
+    assert [(sample.labels, sample.value) for sample in hits.samples] == [
+        ((('cache', 'used'),), 3), ((('cache', 'unused'),), 0)
+    ]
+    assert [sample.value for sample in misses.samples] == [1, 0]
+    assert [(sample.labels[0], sample.value) for sample in ratios.samples] == [(('cache', 'used'), 0.75)]
@@ -0,0 +1,33 @@
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+from werkzeug.exceptions import BadRequest
+
+import app.flask.search_controller as mod
+from app.data.search_index import SearchResult
+
+
+@patch('app.flask.search_controller.search_repository')
+def test_search_should_return_results_as_json(fake_search_repository):
+    # Arrange
+    fake_search_repository.search.return_value = [SearchResult('team', 1, "Chicago Bears", "Chicago Bears")]
+
+    with Flask(__name__).test_request_context('/search/?q=chi&kind=team&limit=500'):
+        # Act
+        result = mod.search()
+
+    # Assert
+    fake_search_repository.search.assert_called_once_with("chi", ['team'], mod.MAX_LIMIT)
+    assert result.get_json() == [{'kind': 'team', 'id': 1, 'label': "Chicago Bears", 'value': "Chicago Bears"}]
+
+
+@patch('app.flask.search_controller.search_repository')
+def test_search_when_kind_unknown_should_abort_with_400(fake_search_repository):
+    with Flask(__name__).test_request_context('/search/?q=chi&kind=player'):
+        # Act
+        with pytest.raises(BadRequest):
+            mod.search()
+
+    # Assert
+    fake_search_repository.search.assert_not_called()
@@ -1,14 +1,18 @@
+from datetime import datetime
 from unittest.mock import patch, call, Mock
 
 import pytest
+from flask import Flask
 from injector import Injector
+from werkzeug.exceptions import NotFound
 
 import app.flask.season_rankings_controller as mod
+from app.data.models.job import Job
 from app.data.models.league import League
-from app.data.models.season import Season
 from app.data.repositories.league_repository import LeagueRepository
 from app.data.repositories.season_repository import SeasonRepository
-from app.services.weekly_update_service.weekly_update_service import WeeklyUpdateService
+from app.services.job_service.job_service import JobService
+from app.services.weekly_update_service.weekly_update_job_service import WeeklyUpdateJobService
 
 from test_app import create_app
 
@@ -24,24 +28,18 @@ def test_index_should_render_season_rankings_index_template(
         fake_injector, fake_render_template
 ):
     # Arrange
-    fake_season_repository = Mock(SeasonRepository)
-    fake_league_repository = Mock(LeagueRepository)
-    fake_injector.get.side_effect = [fake_season_repository, fake_league_repository]
+    mod.selected_year = None
+    mod.selected_league_name = None
+    mod.selected_type = None
 
     # Act
     result = mod.index()
 
     # Assert
-    fake_injector.get.assert_has_calls([
-        call(SeasonRepository),
-        call(LeagueRepository),
-    ])
-    fake_season_repository.get_seasons.assert_called_once()
-    fake_league_repository.get_leagues.assert_called_once()
+    fake_injector.get.assert_not_called()
     fake_render_template.assert_called_once_with(
         'season_rankings/index.html',
-        seasons=fake_season_repository.get_seasons.return_value, selected_year=None,
-        leagues=fake_league_repository.get_leagues.return_value, selected_league_name=None,
+        selected_year=None, selected_league_name=None,
         types=mod.RANKING_TYPES, selected_type=None, season_rankings=None
     )
     assert result is fake_render_template.return_value
@@ -75,6 +73,88 @@ def test_select_league_should_render_rankings_index_template_for_selected_league
     # Assert
 
 
+@patch('app.flask.season_rankings_controller.render_template')
+@patch('app.flask.season_rankings_controller.injector')
+def test_select_season_when_season_found_should_select_season(fake_injector, fake_render_template, test_app):
+    # Arrange
+    mod.selected_year = None
+
+    # Act
+    with test_app.test_request_context(
+            '/season_rankings/select_season', method='POST', data={'season_dropdown': '1920'}
+    ):
+        result = mod.select_season()
+
+    # Assert
+    fake_injector.get.assert_called_once_with(SeasonRepository)
+    fake_injector.get.return_value.get_season_by_year.assert_called_once_with(1920)
+    assert mod.selected_year == 1920
+    assert result is fake_render_template.return_value
+
+
+@pytest.mark.parametrize('typed_value', ["2985", "Bears"])
+@patch('app.flask.season_rankings_controller.render_template')
+@patch('app.flask.season_rankings_controller.flash')
+@patch('app.flask.season_rankings_controller.injector')
+def test_select_season_when_typed_value_is_not_a_season_should_flash_error_message_and_keep_selected_year(
+        fake_injector, fake_flash, fake_render_template, test_app, typed_value
+):
+    # Arrange
+    mod.selected_year = 1
+    fake_injector.get.return_value.get_season_by_year.return_value = None
+
+    # Act
+    with test_app.test_request_context(
+            '/season_rankings/select_season', method='POST', data={'season_dropdown': typed_value}
+    ):
+        mod.select_season()
+
+    # Assert
+    fake_flash.assert_called_once_with("Please choose a season from the suggestions.", 'danger')
+    assert mod.selected_year == 1
+
+
+@patch('app.flask.season_rankings_controller.render_template')
+@patch('app.flask.season_rankings_controller.injector')
+def test_select_league_when_league_found_should_select_league(fake_injector, fake_render_template, test_app):
+    # Arrange
+    mod.selected_league_name = None
+    fake_injector.get.return_value.get_league_by_name.return_value = League(short_name="NFL")
+
+    # Act
+    with test_app.test_request_context(
+            '/season_rankings/select_league', method='POST', data={'league_dropdown': ' NFL '}
+    ):
+        result = mod.select_league()
+
+    # Assert
+    fake_injector.get.assert_called_once_with(LeagueRepository)
+    fake_injector.get.return_value.get_league_by_name.assert_called_once_with("NFL")
+    assert mod.selected_league_name == "NFL"
+    assert result is fake_render_template.return_value
+
+
+@patch('app.flask.season_rankings_controller.render_template')
+@patch('app.flask.season_rankings_controller.flash')
+@patch('app.flask.season_rankings_controller.injector')
+def test_select_league_when_league_not_found_should_flash_error_message_and_keep_selected_league(
+        fake_injector, fake_flash, fake_render_template, test_app
+):
+    # Arrange
+    mod.selected_league_name = "APFA"
+    fake_injector.get.return_value.get_league_by_name.return_value = None
+
+    # Act
+    with test_app.test_request_context(
+            '/season_rankings/select_league', method='POST', data={'league_dropdown': 'XFL'}
+    ):
+        mod.select_league()
+
+    # Assert
+    fake_flash.assert_called_once_with("Please choose a league from the suggestions.", 'danger')
+    assert mod.selected_league_name == "APFA"
+
+
 @pytest.mark.skip('WIP')
 def test_select_type_should_render_rankings_index_template_for_selected_type(test_app):
     with test_app.test_request_context(
@@ -89,67 +169,86 @@ def test_select_type_should_render_rankings_index_template_for_selected_type(tes
     # Assert
 
 
+@patch('app.flask.season_rankings_controller.url_for')
 @patch('app.flask.season_rankings_controller.render_template')
 @patch('app.flask.season_rankings_controller.flash')
 @patch('app.flask.season_rankings_controller.injector')
-def test_run_weekly_update_should_run_weekly_update(fake_injector, fake_flash, fake_render_template):
+def test_run_weekly_update_should_queue_weekly_update_job(
+        fake_injector, fake_flash, fake_render_template, fake_url_for
+):
     # Arrange
-    mod.seasons = [
-        Season(year=1),
-        Season(year=2),
-        Season(year=3),
-    ]
     mod.selected_year = 1
-
-    mod.leagues = [
-        League(long_name="American Professional Football Association", short_name="APFA", first_season_year=1),
-        League(long_name="National Football League", short_name="NFL", first_season_year=1),
-        League(long_name="American Football League", short_name="AFL", first_season_year=1),
-    ]
     mod.selected_league_name = "APFA"
-
     mod.selected_type = "Total"
 
+    job = Job(id=7, kind='weekly_update', key='APFA:1')
+    fake_injector.get.return_value.enqueue_weekly_update.return_value = job
+    fake_url_for.return_value = '/season_rankings/weekly_update/7'
+
     # Act
     mod.run_weekly_update()
 
     # Assert
     league_name = mod.selected_league_name
     season_year = mod.selected_year
-    fake_injector.get.assert_called_once_with(WeeklyUpdateService)
-    fake_injector.get.return_value.run_weekly_update.assert_called_once_with(league_name, season_year)
+    fake_injector.get.assert_called_once_with(WeeklyUpdateJobService)
+    fake_injector.get.return_value.enqueue_weekly_update.assert_called_once_with(league_name, season_year)
+    fake_url_for.assert_called_once_with('season_rankings.weekly_update_status', job_id=job.id)
     fake_flash.assert_called_once_with(
-        f"The weekly update has been successfully completed for the '{league_name}' in {season_year}.",
+        f"The weekly update for the '{league_name}' in {season_year} has been queued as job {job.id}. "
+        f"Its status is available at /season_rankings/weekly_update/7.",
         'success'
     )
     fake_render_template.assert_called_once_with(
         'season_rankings/index.html',
-        seasons=mod.seasons, selected_year=mod.selected_year,
-        leagues=mod.leagues, selected_league_name=mod.selected_league_name,
+        selected_year=mod.selected_year, selected_league_name=mod.selected_league_name,
         types=mod.RANKING_TYPES, selected_type=mod.selected_type, season_rankings=None
     )
 
 
+@patch('app.flask.season_rankings_controller.injector')
+def test_weekly_update_status_should_return_job_status_as_json(fake_injector):
+    # Arrange
+    job = Job(
+        id=7, kind='weekly_update', key='APFA:1', status=Job.RUNNING, phase_count=3, phases_completed=1,
+        phase_durations={'league_season': 0.25}, created_at=datetime(2026, 1, 1, 12, 0, 0)
+    )
+    fake_injector.get.return_value.get_job.return_value = job
+
+    # Act
+    with Flask(__name__).app_context():
+        result = mod.weekly_update_status(7)
+        json = result.get_json()
+
+    # Assert
+    fake_injector.get.assert_called_once_with(JobService)
+    fake_injector.get.return_value.get_job.assert_called_once_with(7)
+    assert json['id'] == 7
+    assert json['status'] == Job.RUNNING
+    assert json['progress'] == pytest.approx(1 / 3)
+    assert json['phase_durations'] == {'league_season': 0.25}
+    assert json['created_at'] == '2026-01-01T12:00:00'
+    assert json['finished_at'] is None
+
+
+@patch('app.flask.season_rankings_controller.injector')
+def test_weekly_update_status_when_job_is_not_found_should_abort_with_404(fake_injector):
+    # Arrange
+    fake_injector.get.return_value.get_job.return_value = None
+
+    # Act and Assert
+    with pytest.raises(NotFound):
+        mod.weekly_update_status(7)
+
+
 @patch('app.flask.season_rankings_controller.render_template')
 @patch('app.flask.season_rankings_controller.season_rankings_repository')
 def test_offense_should_render_season_offensive_rankings_template(
         fake_season_rankings_repository, fake_render_template
 ):
     # Arrange
-    mod.seasons = [
-        Season(year=1),
-        Season(year=2),
-        Season(year=3),
-    ]
     mod.selected_year = 1
-
-    mod.leagues = [
-        League(long_name="American Professional Football Association", short_name="APFA", first_season_year=1),
-        League(long_name="National Football League", short_name="NFL", first_season_year=1),
-        League(long_name="American Football League", short_name="AFL", first_season_year=1),
-    ]
     mod.selected_league_name = "APFA"
-
     mod.selected_type = "Offense"
 
     # Act
@@ -159,8 +258,7 @@ def test_offense_should_render_season_offensive_rankings_template(
     fake_season_rankings_repository.get_offensive_rankings_by_season_year.assert_called_once_with(mod.selected_year)
     fake_render_template.assert_called_once_with(
         'season_rankings/offense.html',
-        seasons=mod.seasons, selected_year=mod.selected_year,
-        leagues=mod.leagues, selected_league_name=mod.selected_league_name,
+        selected_year=mod.selected_year, selected_league_name=mod.selected_league_name,
         types=mod.RANKING_TYPES, selected_type=mod.selected_type,
         season_rankings=fake_season_rankings_repository.get_offensive_rankings_by_season_year.return_value
     )
@@ -173,20 +271,8 @@ def test_defense_should_render_season_offensive_rankings_template(
         fake_season_rankings_repository, fake_render_template
 ):
     # Arrange
-    mod.seasons = [
-        Season(year=1),
-        Season(year=2),
-        Season(year=3),
-    ]
     mod.selected_year = 1
-
-    mod.leagues = [
-        League(long_name="American Professional Football Association", short_name="APFA", first_season_year=1),
-        League(long_name="National Football League", short_name="NFL", first_season_year=1),
-        League(long_name="American Football League", short_name="AFL", first_season_year=1),
-    ]
     mod.selected_league_name = "APFA"
-
     mod.selected_type = "Defense"
 
     # Act
@@ -196,8 +282,7 @@ def test_defense_should_render_season_offensive_rankings_template(
     fake_season_rankings_repository.get_defensive_rankings_by_season_year.assert_called_once_with(mod.selected_year)
     fake_render_template.assert_called_once_with(
         'season_rankings/defense.html',
-        seasons=mod.seasons, selected_year=mod.selected_year,
-        leagues=mod.leagues, selected_league_name=mod.selected_league_name,
+        selected_year=mod.selected_year, selected_league_name=mod.selected_league_name,
         types=mod.RANKING_TYPES, selected_type=mod.selected_type,
         season_rankings=fake_season_rankings_repository.get_defensive_rankings_by_season_year.return_value
     )
@@ -208,20 +293,8 @@ def test_defense_should_render_season_offensive_rankings_template(
 @patch('app.flask.season_rankings_controller.season_rankings_repository')
 def test_total_should_render_season_offensive_rankings_template(fake_season_rankings_repository, fake_render_template):
     # Arrange
-    mod.seasons = [
-        Season(year=1),
-        Season(year=2),
-        Season(year=3),
-    ]
     mod.selected_year = 1
-
-    mod.leagues = [
-        League(long_name="American Professional Football Association", short_name="APFA", first_season_year=1),
-        League(long_name="National Football League", short_name="NFL", first_season_year=1),
-        League(long_name="American Football League", short_name="AFL", first_season_year=1),
-    ]
     mod.selected_league_name = "APFA"
-
     mod.selected_type = "Offense"
 
     # Act
@@ -231,8 +304,7 @@ def test_total_should_render_season_offensive_rankings_template(fake_season_rank
     fake_season_rankings_repository.get_total_rankings_by_season_year.assert_called_once_with(mod.selected_year)
     fake_render_template.assert_called_once_with(
         'season_rankings/total.html',
-        seasons=mod.seasons, selected_year=mod.selected_year,
-        leagues=mod.leagues, selected_league_name=mod.selected_league_name,
+        selected_year=mod.selected_year, selected_league_name=mod.selected_league_name,
         types=mod.RANKING_TYPES, selected_type=mod.selected_type,
         season_rankings=fake_season_rankings_repository.get_total_rankings_by_season_year.return_value
     )
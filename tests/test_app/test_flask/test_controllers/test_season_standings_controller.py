@@ -23,10 +23,10 @@ def test_index_should_render_season_standings_index_template(
 
     # Assert
     fake_injector.get.assert_called_once_with(SeasonRepository)
-    fake_injector.get.return_value.get_seasons.assert_called_once()
+    fake_injector.get.return_value.get_season_records.assert_called_once()
     fake_render_template.assert_called_once_with(
         'season_standings/index.html',
-        seasons=fake_injector.get.return_value.get_seasons.return_value, selected_year=None, season_standings=[]
+        seasons=fake_injector.get.return_value.get_season_records.return_value, selected_year=None, season_standings=[]
     )
     assert result is fake_render_template.return_value
 
@@ -53,7 +53,7 @@ def test_select_season_should_render_season_standings_index_template_for_selecte
     fake_season_standings_repository.get_season_standings_by_season_year.assert_called_once_with(season_year=selected_year)
     fake_render_template.assert_called_once_with(
         'season_standings/index.html',
-        seasons=fake_season_repository.get_seasons.return_value, selected_year=selected_year,
+        seasons=fake_season_repository.get_season_records.return_value, selected_year=selected_year,
         season_standings=fake_season_standings_repository.get_team_seasons_by_season_year.return_value
     )
     assert result is fake_render_template.return_value
@@ -23,9 +23,9 @@ def test_index_should_render_team_index_template(fake_team_repository, fake_rend
     result = mod.index()
 
     # Assert
-    fake_team_repository.get_teams.assert_called_once()
+    fake_team_repository.get_team_rows.assert_called_once()
     fake_render_template.assert_called_once_with(
-        'teams/index.html', teams=fake_team_repository.get_teams.return_value
+        'teams/index.html', teams=fake_team_repository.get_team_rows.return_value
     )
     assert result is fake_render_template.return_value
 
@@ -45,9 +45,11 @@ def test_details_when_team_found_should_render_team_details_template(
     # Assert
     fake_delete_team_form.assert_called_once()
     fake_team_repository.get_team.assert_called_once_with(id)
+    fake_team_repository.get_franchise_summary.assert_called_once_with(fake_team_repository.get_team.return_value.name)
     fake_render_template.assert_called_once_with(
         'teams/details.html',
         team=fake_team_repository.get_team.return_value,
+        summary=fake_team_repository.get_franchise_summary.return_value,
         form=fake_delete_team_form.return_value
     )
     assert result == fake_render_template.return_value
@@ -1,4 +1,5 @@
-from unittest.mock import patch, Mock
+import asyncio
+from unittest.mock import AsyncMock, patch, Mock
 
 import pytest
 
@@ -30,12 +31,10 @@ def test_index_should_render_team_season_index_template(fake_injector, fake_rend
     result = mod.index()
 
     # Assert
-    fake_injector.get.assert_called_once_with(SeasonRepository)
-    fake_injector.get.return_value.get_seasons.assert_called_once()
+    fake_injector.get.assert_not_called()
     fake_render_template.assert_called_once_with(
         'team_seasons/index.html',
-        seasons=fake_injector.get.return_value.get_seasons.return_value, selected_year=mod.selected_year,
-        team_seasons=[]
+        selected_year=mod.selected_year, team_seasons=mod.team_seasons
     )
     assert result is fake_render_template.return_value
 
@@ -50,30 +49,30 @@ def test_details_when_team_season_found_should_render_team_season_details_templa
     team_season = TeamSeason(team_name="Team", season_year=1)
     fake_team_season_repository.get_team_season.return_value = team_season
 
+    profile, totals, averages = Mock(), Mock(), Mock()
+    fake_team_season_schedule_repository = fake_injector.get.return_value
+    fake_team_season_schedule_repository.get_team_season_schedule = AsyncMock(
+        return_value=(profile, totals, averages)
+    )
+
     id = 1
 
     # Act
-    result = mod.details(id)
+    result = asyncio.run(mod.details(id))
 
     # Assert
     fake_injector.get.assert_called_once_with(TeamSeasonScheduleRepository)
 
     fake_team_season_repository.get_team_season.assert_called_once_with(id)
-    fake_injector.get.return_value.get_team_season_schedule_profile.assert_called_once_with(
-        team_season.team_name, team_season.season_year
-    )
-    fake_injector.get.return_value.get_team_season_schedule_totals.assert_called_once_with(
-        team_season.team_name, team_season.season_year
-    )
-    fake_injector.get.return_value.get_team_season_schedule_averages.assert_called_once_with(
+    fake_team_season_schedule_repository.get_team_season_schedule.assert_awaited_once_with(
         team_season.team_name, team_season.season_year
     )
     fake_render_template.assert_called_once_with(
         'team_seasons/details.html',
         team_season=team_season,
-        team_season_schedule_profile=fake_injector.get.return_value.get_team_season_schedule_profile.return_value,
-        team_season_schedule_totals=[fake_injector.get.return_value.get_team_season_schedule_totals.return_value],
-        team_season_schedule_averages=[fake_injector.get.return_value.get_team_season_schedule_averages.return_value]
+        team_season_schedule_profile=profile,
+        team_season_schedule_totals=[totals],
+        team_season_schedule_averages=[averages]
     )
     assert result is fake_render_template.return_value
 
@@ -85,7 +84,7 @@ def test_details_when_team_season_not_found_should_abort_with_404_error(fake_tea
 
     # Act
     with pytest.raises(NotFound):
-        result = mod.details(1)
+        result = asyncio.run(mod.details(1))
 
 
 @pytest.mark.skip('WIP')
@@ -100,3 +99,43 @@ def test_select_season_should_render_team_season_index_template_for_selected_yea
         result = mod.select_season()
 
     # Assert
+
+
+@patch('app.flask.team_season_controller.render_template')
+@patch('app.flask.team_season_controller.season_snapshot_repository')
+@patch('app.flask.team_season_controller.injector')
+def test_select_season_when_season_found_should_render_team_seasons_of_season(
+        fake_injector, fake_season_snapshot_repository, fake_render_template, test_app
+):
+    # Act
+    with test_app.test_request_context('/team_seasons/select_season', method='POST', data={'season_dropdown': '1920'}):
+        result = mod.select_season()
+
+    # Assert
+    fake_injector.get.assert_called_once_with(SeasonRepository)
+    fake_injector.get.return_value.get_season_by_year.assert_called_once_with(1920)
+    fake_season_snapshot_repository.get_team_seasons_by_season_year.assert_called_once_with(season_year=1920)
+    assert mod.selected_year == 1920
+    assert result is fake_render_template.return_value
+
+
+@pytest.mark.parametrize('typed_value', ["2985", "Bears"])
+@patch('app.flask.team_season_controller.render_template')
+@patch('app.flask.team_season_controller.flash')
+@patch('app.flask.team_season_controller.season_snapshot_repository')
+@patch('app.flask.team_season_controller.injector')
+def test_select_season_when_typed_value_is_not_a_season_should_flash_error_message_without_reading_snapshot(
+        fake_injector, fake_season_snapshot_repository, fake_flash, fake_render_template, test_app, typed_value
+):
+    # Arrange
+    fake_injector.get.return_value.get_season_by_year.return_value = None
+
+    # Act
+    with test_app.test_request_context(
+            '/team_seasons/select_season', method='POST', data={'season_dropdown': typed_value}
+    ):
+        mod.select_season()
+
+    # Assert
+    fake_flash.assert_called_once_with("Please choose a season from the suggestions.", 'danger')
+    fake_season_snapshot_repository.get_team_seasons_by_season_year.assert_not_called()
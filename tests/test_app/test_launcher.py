@@ -0,0 +1,107 @@
+import gc
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from flask import Flask
+
+from app import launcher
+from app.data.repositories.season_repository import SeasonRepository
+from app.data.repositories.season_snapshot_repository import SeasonSnapshotRepository
+
+SMAPS_ROLLUP = """5598697e4000-7ffe858e2000 ---p 00000000 00:00 0                          [rollup]
+Rss:                1412 kB
+Pss:                 414 kB
+Shared_Clean:       1256 kB
+Shared_Dirty:          0 kB
+Private_Clean:        52 kB
+Private_Dirty:       104 kB
+"""
+
+
+def test_parse_smaps_rollup_should_read_sizes_in_bytes():
+    # Act
+    result = launcher._parse_smaps_rollup(SMAPS_ROLLUP)
+
+    # Assert
+    assert result['Rss'] == 1412 * 1024
+    assert result['Private_Dirty'] == 104 * 1024
+
+
+def test_get_memory_usage_should_sum_shared_and_private_pages():
+    # Arrange
+    with patch('builtins.open') as fake_open:
+        fake_open.return_value.__enter__.return_value.read.return_value = SMAPS_ROLLUP
+
+        # Act
+        result = launcher.get_memory_usage(123)
+
+    # Assert
+    fake_open.assert_called_once_with('/proc/123/smaps_rollup')
+    assert result == launcher.MemoryUsage(rss=1412 * 1024, pss=414 * 1024, shared=1256 * 1024, private=156 * 1024)
+    assert str(result) == "rss=1.4 MiB, pss=0.4 MiB, shared=1.2 MiB, private=0.2 MiB"
+
+
+def test_get_memory_usage_when_proc_unavailable_should_return_none_values():
+    # Arrange
+    with patch('builtins.open', side_effect=OSError()):
+        # Act
+        result = launcher.get_memory_usage()
+
+    # Assert
+    assert result == launcher.MemoryUsage(None, None, None, None)
+    assert str(result) == "rss=n/a, pss=n/a, shared=n/a, private=n/a"
+
+
+def test_freeze_heap_should_move_objects_to_permanent_generation():
+    try:
+        # Act
+        result = launcher.freeze_heap()
+
+        # Assert
+        assert result > 0
+        assert gc.get_freeze_count() == result
+    finally:
+        gc.unfreeze()
+
+
+@patch('app.launcher.injector')
+def test_warm_caches_should_load_reference_data_and_every_season_snapshot(fake_injector, create_sqlite_app):
+    # Arrange
+    app = create_sqlite_app()
+    repositories = {}
+    fake_injector.get.side_effect = lambda cls: repositories.setdefault(cls, Mock())
+    season_repository = fake_injector.get(SeasonRepository)
+    season_repository.get_season_records.return_value = [SimpleNamespace(year=1920), SimpleNamespace(year=1921)]
+
+    # Act
+    result = launcher.warm_caches(app)
+
+    # Assert
+    assert list(result) == ['data versions', 'reference data', 'season snapshots', 'search index']
+    snapshot_repository = repositories[SeasonSnapshotRepository]
+    assert [c.args for c in snapshot_repository.get_season_snapshot.call_args_list] == [(1920,), (1921,)]
+
+
+@patch('app.launcher.warm_caches', return_value={'reference data': 0.001})
+@patch('app.launcher.search_index')
+@patch('app.launcher.reference_data_cache')
+@patch('app.launcher.injector')
+def test_prepare_master_should_drop_caches_before_warming_and_freezing(
+        fake_injector, fake_reference_data_cache, fake_search_index, fake_warm_caches
+):
+    # Arrange
+    app, log = Flask(__name__), Mock()
+
+    try:
+        # Act
+        launcher.prepare_master(app, log)
+
+        # Assert
+        fake_reference_data_cache.invalidate.assert_called_once_with()
+        fake_injector.get.return_value.clear.assert_called_once_with()
+        fake_search_index.clear.assert_called_once_with()
+        fake_warm_caches.assert_called_once_with(app)
+        assert gc.get_freeze_count() > 0
+        log.info.assert_called_once()
+    finally:
+        gc.unfreeze()
@@ -0,0 +1,325 @@
+import asyncio
+import os
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app import metrics as mod
+from app.metrics import (CacheCounters, format_prometheus, instrumented, merge_families, MetricFamily, MetricsRegistry,
+                         Sample)
+
+HISTOGRAMS = {'test_duration_seconds': ("Test durations.", (0.1, 1.0))}
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry(HISTOGRAMS)
+
+
+def test_collect_should_report_cumulative_buckets_sum_and_count(registry):
+    # Arrange
+    for value in (0.05, 0.5, 0.5, 5.0):
+        registry.observe('test_duration_seconds', value, endpoint='home.index')
+
+    # Act
+    result = registry.collect()
+
+    # Assert
+    labels = (('endpoint', 'home.index'),)
+    assert result == [
+        MetricFamily('test_duration_seconds', 'histogram', "Test durations.", [
+            Sample('test_duration_seconds_bucket', labels + (('le', '0.1'),), 1),
+            Sample('test_duration_seconds_bucket', labels + (('le', '1.0'),), 3),
+            Sample('test_duration_seconds_bucket', labels + (('le', '+Inf'),), 4),
+            Sample('test_duration_seconds_sum', labels, 6.05),
+            Sample('test_duration_seconds_count', labels, 4),
+        ])
+    ]
+
+
+def test_collect_should_put_a_value_equal_to_a_bound_in_that_bucket(registry):
+    # Arrange
+    registry.observe('test_duration_seconds', 0.1)
+
+    # Act
+    result = registry.collect()
+
+    # Assert
+    assert result[0].samples[0] == Sample('test_duration_seconds_bucket', (('le', '0.1'),), 1)
+
+
+def test_collect_should_append_the_families_of_the_collectors(registry):
+    # Arrange
+    gauge = MetricFamily('test_gauge', 'gauge', "A gauge.", [Sample('test_gauge', (), 2)])
+    registry.add_collector(lambda: [gauge])
+
+    # Act
+    result = registry.collect()
+
+    # Assert
+    assert result[-1] == gauge
+
+
+def test_clear_should_drop_every_observation(registry):
+    # Arrange
+    registry.observe('test_duration_seconds', 0.5)
+
+    # Act
+    registry.clear()
+
+    # Assert
+    assert registry.collect()[0].samples == []
+
+
+def test_clear_should_reset_the_counters_of_the_collectors(registry):
+    # Arrange
+    reset = Mock()
+    registry.add_collector(lambda: [], reset=reset)
+
+    # Act
+    registry.clear()
+
+    # Assert
+    reset.assert_called_once_with()
+
+
+def test_cache_counters_should_count_hits_and_misses_until_reset():
+    # Arrange
+    counters = CacheCounters('test')
+
+    # Act
+    counters.hit()
+    counters.hit(3)
+    counters.miss()
+    counted = counters.get()
+    counters.reset()
+
+    # Assert
+    assert counted == (4, 1)
+    assert counters.get() == (0, 0)
+
+
+def test_observe_should_raise_key_error_for_unknown_histogram(registry):
+    # Act / Assert
+    with pytest.raises(KeyError):
+        registry.observe('unknown_seconds', 0.5)
+
+
+def test_collect_all_should_merge_the_files_of_every_process(registry, tmp_path):
+    # Arrange
+    registry.observe('test_duration_seconds', 0.5)
+    other = MetricsRegistry(HISTOGRAMS)
+    other.observe('test_duration_seconds', 0.05)
+    with patch('app.metrics.os.getpid', return_value=os.getpid() + 1000000):
+        other.flush(str(tmp_path))
+
+    # Act
+    result = registry.collect_all(str(tmp_path))
+
+    # Assert
+    samples = {sample.name: sample.value for sample in result[0].samples if sample.labels[-1:] != (('le', '0.1'),)}
+    assert samples['test_duration_seconds_count'] == 2
+    assert samples['test_duration_seconds_sum'] == pytest.approx(0.55)
+    assert sorted(os.listdir(tmp_path)) == sorted([f"{os.getpid()}.json", f"{os.getpid() + 1000000}.json"])
+
+
+def test_flush_should_not_write_again_within_the_flush_interval(registry, tmp_path):
+    # Arrange
+    registry.flush(str(tmp_path))
+    os.remove(tmp_path / f"{os.getpid()}.json")
+
+    # Act
+    registry.flush(str(tmp_path))
+
+    # Assert
+    assert os.listdir(tmp_path) == []
+
+
+def test_flush_when_called_by_several_threads_should_write_whole_file_and_leave_no_temporary_files(registry, tmp_path):
+    # Arrange
+    registry.observe('test_duration_seconds', 0.5)
+    threads = [
+        threading.Thread(target=registry.flush, args=(str(tmp_path),), kwargs={'force': True}) for _ in range(8)
+    ]
+
+    # Act
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    assert os.listdir(tmp_path) == [f"{os.getpid()}.json"]
+    assert mod._read_families(str(tmp_path / f"{os.getpid()}.json")) == registry.collect()
+
+
+def test_retire_should_fold_counters_of_exited_process_and_remove_its_file(registry, tmp_path):
+    # Arrange
+    pid = os.getpid() + 1000000
+    exited = MetricsRegistry(HISTOGRAMS)
+    exited.observe('test_duration_seconds', 0.05)
+    exited.add_collector(lambda: [
+        MetricFamily('test_total', 'counter', "A counter.", [Sample('test_total', (), 3)]),
+        MetricFamily('test_gauge', 'gauge', "A gauge.", [Sample('test_gauge', (('pid', str(pid)),), 5)]),
+    ])
+    registry.observe('test_duration_seconds', 0.5)
+
+    # Act
+    for _ in range(2):
+        with patch('app.metrics.os.getpid', return_value=pid):
+            exited.flush(str(tmp_path), force=True)
+        registry.retire(str(tmp_path), pid)
+    result = {family.name: family for family in registry.collect_all(str(tmp_path))}
+
+    # Assert
+    assert sorted(os.listdir(tmp_path)) == sorted([mod.EXITED_PROCESSES_FILE_NAME, f"{os.getpid()}.json"])
+    counts = [sample for sample in result['test_duration_seconds'].samples if sample.name.endswith('_count')]
+    assert counts == [Sample('test_duration_seconds_count', (), 3)]
+    assert result['test_total'].samples == [Sample('test_total', (), 6)]
+    assert 'test_gauge' not in result
+
+
+def test_merge_families_should_drop_the_gauges_of_exited_processes():
+    # Arrange
+    def families(pid):
+        return [
+            MetricFamily('test_total', 'counter', "A counter.", [Sample('test_total', (), 1)]),
+            MetricFamily('test_gauge', 'gauge', "A gauge.", [Sample('test_gauge', (('pid', str(pid)),), 5)]),
+        ]
+
+    with patch('app.metrics._is_alive', side_effect=lambda pid: pid == 1):
+        # Act
+        result = merge_families([(1, families(1)), (2, families(2))])
+
+    # Assert
+    assert result == [
+        MetricFamily('test_total', 'counter', "A counter.", [Sample('test_total', (), 2)]),
+        MetricFamily('test_gauge', 'gauge', "A gauge.", [Sample('test_gauge', (('pid', '1'),), 5)]),
+    ]
+
+
+def test_format_prometheus_should_format_help_type_and_samples():
+    # Arrange
+    families = [
+        MetricFamily('test_seconds', 'histogram', "Test durations.", [
+            Sample('test_seconds_bucket', (('endpoint', 'a"b'), ('le', '+Inf')), 3),
+            Sample('test_seconds_sum', (('endpoint', 'a"b'),), 0.25),
+        ]),
+        MetricFamily('test_total', 'counter', "A counter.", [Sample('test_total', (), 7)]),
+    ]
+
+    # Act
+    result = format_prometheus(families)
+
+    # Assert
+    assert result == (
+        '# HELP test_seconds Test durations.\n'
+        '# TYPE test_seconds histogram\n'
+        'test_seconds_bucket{endpoint="a\\"b",le="+Inf"} 3\n'
+        'test_seconds_sum{endpoint="a\\"b"} 0.25\n'
+        '# HELP test_total A counter.\n'
+        '# TYPE test_total counter\n'
+        'test_total 7\n'
+    )
+
+
+@instrumented
+class FakeRepository:
+    def get_value(self, value):
+        return value
+
+    async def get_value_async(self, value):
+        return value
+
+    def _get_private_value(self, value):
+        return value
+
+    def stream_values(self, values):
+        return iter(values)
+
+
+@patch('app.metrics.metrics')
+def test_instrumented_should_time_public_methods(fake_metrics):
+    # Act
+    result = FakeRepository().get_value(3)
+
+    # Assert
+    assert result == 3
+    fake_metrics.observe.assert_called_once()
+    args, kwargs = fake_metrics.observe.call_args
+    assert args[0] == 'repository_call_duration_seconds'
+    assert kwargs == {'repository': 'FakeRepository', 'method': 'get_value'}
+
+
+@patch('app.metrics.metrics')
+def test_instrumented_should_time_async_methods_once_awaited(fake_metrics):
+    # Act
+    result = asyncio.run(FakeRepository().get_value_async(3))
+
+    # Assert
+    assert result == 3
+    assert fake_metrics.observe.call_args.kwargs == {'repository': 'FakeRepository', 'method': 'get_value_async'}
+
+
+@patch('app.metrics.metrics')
+def test_instrumented_should_not_time_private_methods(fake_metrics):
+    # Act
+    FakeRepository()._get_private_value(3)
+
+    # Assert
+    fake_metrics.observe.assert_not_called()
+
+
+@patch('app.metrics.metrics')
+def test_instrumented_should_time_calls_that_raise(fake_metrics):
+    # Arrange
+    @instrumented
+    class FailingRepository:
+        def get_value(self):
+            raise ValueError()
+
+    # Act
+    with pytest.raises(ValueError):
+        FailingRepository().get_value()
+
+    # Assert
+    fake_metrics.observe.assert_called_once()
+
+
+@patch('app.metrics.metrics')
+def test_instrumented_should_time_stream_methods_once_their_iterators_are_consumed(fake_metrics):
+    # Act
+    iterator = FakeRepository().stream_values([1, 2, 3])
+    observed_before_iterating = fake_metrics.observe.called
+    result = list(iterator)
+
+    # Assert
+    assert result == [1, 2, 3]
+    assert not observed_before_iterating
+    fake_metrics.observe.assert_called_once()
+    assert fake_metrics.observe.call_args.kwargs == {'repository': 'FakeRepository', 'method': 'stream_values'}
+
+
+@patch('app.metrics.metrics')
+def test_instrumented_should_time_stream_methods_and_close_iterators_abandoned_early(fake_metrics):
+    # Arrange
+    @instrumented
+    class StreamingRepository:
+        def stream_values(self):
+            yield from (1, 2, 3)
+
+    iterator = StreamingRepository().stream_values()
+
+    # Act
+    first = next(iterator)
+    iterator.close()
+
+    # Assert
+    assert first == 1
+    fake_metrics.observe.assert_called_once()
+
+
+def test_is_alive_should_be_true_for_this_process():
+    # Act / Assert
+    assert mod._is_alive(os.getpid())
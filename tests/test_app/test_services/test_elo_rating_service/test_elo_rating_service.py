@@ -0,0 +1,132 @@
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.data.models.game import Game
+from app.data.models.team_season import TeamSeason
+from app.services.elo_rating_service.elo_rating_service import (ELO_INITIAL_RATING, EloRatingService,
+                                                                calculate_elo_delta)
+
+
+@pytest.fixture()
+def test_service():
+    return EloRatingService(Mock(), Mock())
+
+
+def _team_season(team_name, elo_rating=None):
+    return TeamSeason(team_name=team_name, season_year=1, league_name="League", elo_rating=elo_rating)
+
+
+def _game(guest_score, host_score, week=1, id=1):
+    return Game(id=id, season_year=1, week=week, guest_name="Guest", guest_score=guest_score, host_name="Host",
+                host_score=host_score)
+
+
+def test_calculate_elo_delta_when_teams_are_even_and_host_wins_should_favor_host_less_than_guest_upset():
+    # Act
+    host_win = calculate_elo_delta(ELO_INITIAL_RATING, 10, ELO_INITIAL_RATING, 17)
+    guest_win = calculate_elo_delta(ELO_INITIAL_RATING, 17, ELO_INITIAL_RATING, 10)
+
+    # Assert
+    assert host_win > 0 > guest_win
+    assert abs(guest_win) > host_win
+
+
+def test_calculate_elo_delta_when_game_is_tie_should_lower_host_for_its_home_field_advantage():
+    # Act
+    result = calculate_elo_delta(ELO_INITIAL_RATING, 14, ELO_INITIAL_RATING, 14)
+
+    # Assert
+    assert result < 0
+
+
+def test_calculate_elo_delta_should_grow_with_margin_of_victory():
+    # Act and Assert
+    assert (calculate_elo_delta(ELO_INITIAL_RATING, 0, ELO_INITIAL_RATING, 35)
+            > calculate_elo_delta(ELO_INITIAL_RATING, 0, ELO_INITIAL_RATING, 3))
+
+
+def test_rate_game_should_move_ratings_by_recorded_delta(test_service):
+    # Arrange
+    guest_season = _team_season("Guest")
+    host_season = _team_season("Host", Decimal('1600'))
+    test_service.team_season_repository.get_team_season_by_team_name_and_season_year.side_effect = (
+        guest_season, host_season
+    )
+    game = _game(3, 24)
+
+    # Act
+    test_service.rate_game(game)
+
+    # Assert
+    assert game.elo_delta > 0
+    assert host_season.elo_rating == Decimal('1600') + game.elo_delta
+    assert guest_season.elo_rating == ELO_INITIAL_RATING - game.elo_delta
+
+
+def test_unrate_game_should_exactly_reverse_rate_game(test_service):
+    # Arrange
+    guest_season = _team_season("Guest", Decimal('1487.1234567890123'))
+    host_season = _team_season("Host", Decimal('1532.9876543210987'))
+    test_service.team_season_repository.get_team_season_by_team_name_and_season_year.side_effect = (
+        lambda team_name, season_year: guest_season if team_name == "Guest" else host_season
+    )
+    game = _game(27, 20)
+
+    # Act
+    test_service.rate_game(game)
+    test_service.unrate_game(game)
+
+    # Assert
+    assert guest_season.elo_rating == Decimal('1487.1234567890123')
+    assert host_season.elo_rating == Decimal('1532.9876543210987')
+
+
+def test_unrate_game_when_game_has_no_recorded_delta_should_do_nothing(test_service):
+    # Act
+    test_service.unrate_game(_game(0, 7))
+
+    # Assert
+    test_service.team_season_repository.get_team_season_by_team_name_and_season_year.assert_not_called()
+
+
+@patch('app.services.elo_rating_service.elo_rating_service.try_commit')
+def test_replay_season_should_rate_games_in_week_order_from_initial_ratings(fake_try_commit, test_service):
+    # Arrange
+    guest_season = _team_season("Guest", Decimal('1700'))
+    host_season = _team_season("Host", Decimal('1300'))
+    test_service.team_season_repository.get_team_seasons_by_season_year.return_value = [guest_season, host_season]
+    week_two = _game(10, 13, week=2, id=1)
+    week_one = _game(21, 7, week=1, id=2)
+    test_service.game_repository.get_games_by_season_year.return_value = [week_two, week_one]
+
+    # Act
+    result = test_service.replay_season(1)
+
+    # Assert
+    assert result == 2
+    assert week_one.elo_delta == calculate_elo_delta(ELO_INITIAL_RATING, 21, ELO_INITIAL_RATING, 7)
+    assert week_two.elo_delta == calculate_elo_delta(
+        ELO_INITIAL_RATING - week_one.elo_delta, 10, ELO_INITIAL_RATING + week_one.elo_delta, 13
+    )
+    assert host_season.elo_rating == ELO_INITIAL_RATING + week_one.elo_delta + week_two.elo_delta
+    assert guest_season.elo_rating + host_season.elo_rating == 2 * ELO_INITIAL_RATING
+    fake_try_commit.assert_called_once()
+
+
+@patch('app.services.elo_rating_service.elo_rating_service.try_commit')
+def test_replay_season_should_read_team_seasons_from_primary_engine(fake_try_commit, test_service):
+    # Arrange
+    from app.data import session_routing
+
+    primary_only = []
+    test_service.team_season_repository.get_team_seasons_by_season_year.side_effect = \
+        lambda season_year: primary_only.append(session_routing._primary_only.get()) or []
+    test_service.game_repository.get_games_by_season_year.return_value = []
+
+    # Act
+    test_service.replay_season(1)
+
+    # Assert
+    assert primary_only == [True]
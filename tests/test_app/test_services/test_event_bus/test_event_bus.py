@@ -0,0 +1,96 @@
+from unittest.mock import Mock
+
+import pytest
+
+from app.services.event_bus.event_bus import EventBus
+from app.services.event_bus.game_events import GameAdded, GameDeleted, GameEvent, GameUpdated, GameValues
+
+
+def _values(id=1, season_year=1920):
+    return GameValues(id=id, season_year=season_year, week=1, guest_name="Guest", guest_score=7, host_name="Host",
+                      host_score=14)
+
+
+@pytest.fixture()
+def test_bus():
+    return EventBus()
+
+
+def test_publish_outside_batch_should_deliver_event_at_once_to_matching_subscribers(test_bus):
+    # Arrange
+    added_handler = Mock()
+    deleted_handler = Mock()
+    test_bus.subscribe(GameAdded, added_handler)
+    test_bus.subscribe(GameDeleted, deleted_handler)
+    event = GameAdded(_values())
+
+    # Act
+    test_bus.publish(event)
+
+    # Assert
+    added_handler.assert_called_once_with([event])
+    deleted_handler.assert_not_called()
+
+
+def test_publish_within_batch_should_deliver_coalesced_events_when_outermost_batch_ends(test_bus):
+    # Arrange
+    handler = Mock()
+    test_bus.subscribe(GameEvent, handler)
+    events = [GameAdded(_values(1)), GameUpdated(_values(1), _values(1, 1921)), GameDeleted(_values(2))]
+
+    # Act
+    with test_bus.batch():
+        test_bus.publish(events[0])
+        with test_bus.batch():
+            test_bus.publish(events[1])
+        handler.assert_not_called()
+        test_bus.publish(events[2])
+
+    # Assert
+    handler.assert_called_once_with(events)
+
+
+def test_batch_when_block_raises_should_still_deliver_published_events(test_bus):
+    # Arrange
+    handler = Mock()
+    test_bus.subscribe(GameAdded, handler)
+    event = GameAdded(_values())
+
+    # Act
+    with pytest.raises(RuntimeError):
+        with test_bus.batch():
+            test_bus.publish(event)
+            raise RuntimeError()
+
+    # Assert
+    handler.assert_called_once_with([event])
+
+
+def test_publish_when_handler_fails_should_still_deliver_to_other_handlers(test_bus):
+    # Arrange
+    test_bus.subscribe(GameAdded, Mock(side_effect=RuntimeError()))
+    handler = Mock()
+    test_bus.subscribe((GameAdded, GameDeleted), handler)
+
+    # Act
+    test_bus.publish(GameAdded(_values()))
+
+    # Assert
+    handler.assert_called_once()
+
+
+def test_unsubscribe_should_stop_delivery(test_bus):
+    # Arrange
+    handler = test_bus.subscribe(GameAdded, Mock())
+
+    # Act
+    test_bus.unsubscribe(handler)
+    test_bus.publish(GameAdded(_values()))
+
+    # Assert
+    handler.assert_not_called()
+
+
+def test_game_updated_season_years_should_include_old_and_new_seasons():
+    # Act and Assert
+    assert GameUpdated(_values(season_year=1921), _values(season_year=1920)).season_years == (1920, 1921)
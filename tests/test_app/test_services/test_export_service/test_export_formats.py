@@ -0,0 +1,68 @@
+import gzip
+import json
+from decimal import Decimal
+
+from app.services.export_service import export_formats
+from app.services.export_service.export_formats import encode_chunks, iter_csv, iter_json
+
+
+def test_iter_csv_should_write_header_and_rows():
+    # Act
+    result = "".join(iter_csv(('team_name', 'wins'), [("Bears", 10), ("Packers", 9)]))
+
+    # Assert
+    assert result.splitlines() == ["team_name,wins", "Bears,10", "Packers,9"]
+
+
+def test_iter_csv_should_yield_chunks_as_rows_are_read(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(export_formats, 'CHUNK_SIZE', 10)
+    rows_read = []
+
+    def rows():
+        for index in range(3):
+            rows_read.append(index)
+            yield "Bears", index
+
+    chunks = iter_csv(('team_name', 'wins'), rows())
+
+    # Act
+    first_chunk = next(chunks)
+
+    # Assert
+    assert first_chunk == "team_name,wins\r\nBears,0\r\n"
+    assert rows_read == [0]
+
+
+def test_iter_json_should_write_array_of_objects_with_decimals_as_strings():
+    # Act
+    result = "".join(iter_json(('team_name', 'offensive_factor'), [("Bears", Decimal('1.05')), ("Packers", None)]))
+
+    # Assert
+    assert json.loads(result) == [
+        {'team_name': "Bears", 'offensive_factor': "1.05"}, {'team_name': "Packers", 'offensive_factor': None}
+    ]
+
+
+def test_iter_json_when_no_rows_should_write_empty_array():
+    # Act
+    result = "".join(iter_json(('team_name',), []))
+
+    # Assert
+    assert json.loads(result) == []
+
+
+def test_encode_chunks_should_encode_text_as_utf_8():
+    # Act
+    result = b"".join(encode_chunks(["Bears,", "Montréal"]))
+
+    # Assert
+    assert result == "Bears,Montréal".encode('utf-8')
+
+
+def test_encode_chunks_when_compressed_should_write_one_gzip_stream():
+    # Act
+    result = b"".join(encode_chunks(["team_name\r\n", "Bears\r\n" * 100], compress=True))
+
+    # Assert
+    assert gzip.decompress(result) == ("team_name\r\n" + "Bears\r\n" * 100).encode('utf-8')
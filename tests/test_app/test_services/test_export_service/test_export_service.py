@@ -0,0 +1,121 @@
+import csv
+import io
+import json
+
+import pytest
+
+from app.data.models.game import Game
+from app.data.models.season import Season
+from app.data.models.team_season import TeamSeason
+from app.data.repositories.game_repository import GameRepository
+from app.data.repositories.season_repository import SeasonRepository
+from app.data.repositories.team_season_repository import TeamSeasonRepository
+from app.data.sqla import sqla
+from app.services.export_service.export_service import (
+    ExportService, GAME_EXPORT_COLUMNS, RANKINGS_EXPORT_COLUMNS, STANDINGS_EXPORT_COLUMNS
+)
+
+
+@pytest.fixture()
+def test_service():
+    return ExportService(GameRepository(), TeamSeasonRepository(), SeasonRepository())
+
+
+@pytest.fixture()
+def export_app(create_sqlite_app):
+    app = create_sqlite_app(Season, Game, TeamSeason)
+    with app.app_context():
+        sqla.session.add_all([
+            Season(year=1920, num_of_weeks_scheduled=13, num_of_weeks_completed=13),
+            Season(year=1921, num_of_weeks_scheduled=13, num_of_weeks_completed=13),
+            TeamSeason(team_name="Bears", season_year=1920, league_name="APFA", offensive_average=21.5),
+            TeamSeason(team_name="Pros", season_year=1920, league_name="APFA"),
+            TeamSeason(team_name="Bears", season_year=1921, league_name="APFA"),
+            TeamSeason(team_name="Pros", season_year=1921, league_name="APFA"),
+            Game(season_year=1920, week=1, guest_name="Pros", guest_score=0, host_name="Bears", host_score=7,
+                 is_playoff=False),
+            Game(season_year=1921, week=2, guest_name="Bears", guest_score=3, host_name="Pros", host_score=10,
+                 is_playoff=False),
+            Game(season_year=1921, week=1, guest_name="Pros", guest_score=14, host_name="Bears", host_score=14,
+                 is_playoff=False),
+        ])
+        sqla.session.commit()
+    return app
+
+
+def _read_csv(chunks):
+    return list(csv.reader(io.StringIO(b"".join(chunks).decode('utf-8'))))
+
+
+def test_export_games_should_stream_games_of_season_range_in_order(export_app, test_service):
+    with export_app.app_context():
+        # Act
+        rows = _read_csv(test_service.export('games', 'csv', first_season_year=1921))
+
+    # Assert
+    assert rows[0] == list(GAME_EXPORT_COLUMNS)
+    assert [(row[1], row[2], row[3]) for row in rows[1:]] == [("1921", "1", "Pros"), ("1921", "2", "Bears")]
+
+
+def test_export_games_should_fetch_rows_in_batches(export_app, test_service, monkeypatch):
+    # Arrange
+    executed = []
+    original_execute = sqla.session.execute
+
+    def execute(statement, *args, **kwargs):
+        executed.append(statement.get_execution_options())
+        return original_execute(statement, *args, **kwargs)
+
+    with export_app.app_context():
+        monkeypatch.setattr(sqla.session, 'execute', execute)
+
+        # Act
+        list(test_service.export('games', 'json'))
+
+    # Assert
+    assert executed[0]['yield_per'] > 0
+
+
+def test_export_team_seasons_should_write_json(export_app, test_service):
+    with export_app.app_context():
+        # Act
+        result = json.loads(b"".join(test_service.export('team_seasons', 'json', 1920, 1920)))
+
+    # Assert
+    assert [(row['team_name'], row['season_year']) for row in result] == [("Bears", 1920), ("Pros", 1920)]
+
+
+def test_export_rankings_should_write_ranking_columns(export_app, test_service):
+    with export_app.app_context():
+        # Act
+        rows = _read_csv(test_service.export('rankings', 'csv', 1920, 1920))
+
+    # Assert
+    assert rows[0] == list(RANKINGS_EXPORT_COLUMNS)
+    assert rows[1][:3] == ["1920", "Bears", "APFA"]
+    assert float(rows[1][6]) == 21.5
+
+
+def test_export_standings_should_order_each_season_in_turn(export_app, test_service):
+    with export_app.app_context():
+        # Act
+        rows = _read_csv(test_service.export('standings', 'csv'))
+
+    # Assert
+    assert rows[0] == list(STANDINGS_EXPORT_COLUMNS)
+    assert [(row[0], row[1], row[5], row[6], row[7]) for row in rows[1:]] == [
+        ("1920", "Bears", "1", "0", "0"), ("1920", "Pros", "0", "1", "0"),
+        ("1921", "Pros", "1", "0", "1"), ("1921", "Bears", "0", "1", "1"),
+    ]
+
+
+def test_export_when_kind_unknown_should_raise_value_error(test_service):
+    # Act
+    with pytest.raises(ValueError):
+        test_service.export('players', 'csv')
+
+
+def test_export_when_format_unknown_should_raise_value_error(test_service):
+    # Act
+    with pytest.raises(ValueError):
+        test_service.export('games', 'xml')
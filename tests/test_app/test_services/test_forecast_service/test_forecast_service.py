@@ -0,0 +1,284 @@
+from types import SimpleNamespace
+from unittest.mock import Mock, call, patch
+
+import pytest
+
+from app.services.event_bus.game_events import GameAdded, GameDeleted, GameUpdated, GameValues
+from app.services.event_bus.season_events import RankingsUpdated
+from app.services.forecast_service.forecast_service import ForecastService, get_projected_standings
+from app.services.forecast_service.season_forecast import WeekForecast
+from app.services.game_predictor_service.game_prediction import GamePrediction, Matchup
+
+
+@pytest.fixture(autouse=True)
+def fake_data_versions():
+    with patch('app.services.forecast_service.forecast_service.data_versions') as fake_data_versions:
+        fake_data_versions.get.return_value = 0
+        fake_data_versions.committed_locally.return_value = True
+        yield fake_data_versions
+
+
+@pytest.fixture()
+def test_service():
+    service = ForecastService(Mock(), Mock(), Mock(), Mock())
+    service.game_predictor_service.predict_game_scores.side_effect = lambda matchups: [
+        GamePrediction(*matchup, 10.0, 20.0) for matchup in matchups
+    ]
+    return service
+
+
+def _game(week, guest_name, guest_score, host_name, host_score, is_playoff=False):
+    return SimpleNamespace(season_year=1920, week=week, guest_name=guest_name, guest_score=guest_score,
+                           host_name=host_name, host_score=host_score, is_playoff=is_playoff)
+
+
+def _scheduled_game(week, guest_name, host_name):
+    return SimpleNamespace(season_year=1920, week=week, guest_name=guest_name, host_name=host_name)
+
+
+def _game_values(week):
+    return GameValues(id=1, season_year=1920, week=week, guest_name="Pros", guest_score=0, host_name="Bears",
+                      host_score=7)
+
+
+def _arrange_season(test_service):
+    test_service.game_repository.get_game_rows_by_season_year.return_value = [
+        _game(1, "Pros", 0, "Bears", 7),
+    ]
+    test_service.scheduled_game_repository.get_scheduled_game_rows_by_season_year.return_value = [
+        _scheduled_game(1, "Pros", "Bears"),
+        _scheduled_game(2, "Bears", "Pros"),
+        _scheduled_game(3, "Cardinals", "Bears"),
+    ]
+
+
+def test_init_should_subscribe_to_game_and_rankings_events(test_service):
+    # Assert
+    assert test_service.event_bus.subscribe.call_args_list[0].args == (
+        (GameAdded, GameUpdated, GameDeleted), test_service.handle_game_events
+    )
+    assert test_service.event_bus.subscribe.call_args_list[1].args == (
+        RankingsUpdated, test_service.handle_rankings_events
+    )
+
+
+def test_get_season_forecast_when_season_year_is_none_should_raise_value_error(test_service):
+    # Act
+    with pytest.raises(ValueError):
+        test_service.get_season_forecast(None)
+
+
+def test_get_season_forecast_should_predict_all_unplayed_games_in_one_batch(test_service):
+    # Arrange
+    _arrange_season(test_service)
+
+    # Act
+    forecast = test_service.get_season_forecast(1920)
+
+    # Assert
+    test_service.game_predictor_service.predict_game_scores.assert_called_once_with([
+        Matchup("Bears", 1920, "Pros", 1920), Matchup("Cardinals", 1920, "Bears", 1920),
+    ])
+    assert list(forecast.weeks) == [1, 2, 3]
+    assert len(forecast.weeks[1].results) == 1
+    assert forecast.weeks[1].predictions == ()
+    assert [prediction.guest_name for prediction in forecast.predictions] == ["Bears", "Cardinals"]
+
+
+def test_get_season_forecast_should_add_results_and_predictions_into_standings(test_service):
+    # Arrange
+    _arrange_season(test_service)
+
+    # Act
+    forecast = test_service.get_season_forecast(1920)
+
+    # Assert
+    standings = {standing.team_name: standing for standing in forecast.standings}
+    bears = standings["Bears"]
+    assert (bears.wins, bears.projected_wins, bears.projected_losses) == (1, 1, 1)
+    assert (standings["Pros"].losses, standings["Pros"].projected_wins) == (1, 1)
+    assert (standings["Cardinals"].total_losses, standings["Cardinals"].projected_points_for) == (1, 10.0)
+    assert [standing.team_name for standing in forecast.standings] == ["Bears", "Pros", "Cardinals"]
+
+
+def test_get_season_forecast_when_cached_should_not_read_again(test_service):
+    # Arrange
+    _arrange_season(test_service)
+    first = test_service.get_season_forecast(1920)
+
+    # Act
+    second = test_service.get_season_forecast(1920)
+
+    # Assert
+    assert second is first
+    test_service.game_repository.get_game_rows_by_season_year.assert_called_once()
+    test_service.game_predictor_service.predict_game_scores.assert_called_once()
+
+
+@patch('app.services.forecast_service.forecast_service.forecast_cache_counters')
+def test_get_season_forecast_should_count_cached_forecasts_as_hits(fake_counters, test_service):
+    # Arrange
+    _arrange_season(test_service)
+
+    # Act
+    test_service.get_season_forecast(1920)
+    test_service.get_season_forecast(1920)
+
+    # Assert
+    assert fake_counters.method_calls == [call.miss(), call.hit()]
+
+
+def test_get_season_forecast_after_game_event_should_recompute_only_stale_week(test_service):
+    # Arrange
+    _arrange_season(test_service)
+    first = test_service.get_season_forecast(1920)
+    test_service.game_predictor_service.predict_game_scores.reset_mock()
+    test_service.game_repository.get_game_rows_by_season_year_and_week.return_value = [
+        _game(2, "Bears", 3, "Pros", 10),
+    ]
+    test_service.scheduled_game_repository.get_scheduled_game_rows_by_season_year_and_weeks.return_value = [
+        _scheduled_game(2, "Bears", "Pros"),
+    ]
+    test_service.handle_game_events([GameAdded(_game_values(2))])
+
+    # Act
+    forecast = test_service.get_season_forecast(1920)
+
+    # Assert
+    test_service.game_repository.get_game_rows_by_season_year.assert_called_once()
+    test_service.game_repository.get_game_rows_by_season_year_and_week.assert_called_once_with(1920, 2)
+    test_service.scheduled_game_repository.get_scheduled_game_rows_by_season_year_and_weeks.assert_called_once_with(
+        1920, [2]
+    )
+    test_service.game_predictor_service.predict_game_scores.assert_not_called()
+    assert forecast.weeks[1] is first.weeks[1]
+    assert forecast.weeks[3] is first.weeks[3]
+    assert forecast.weeks[2].predictions == ()
+    standings = {standing.team_name: standing for standing in forecast.standings}
+    assert (standings["Bears"].wins, standings["Bears"].losses, standings["Bears"].projected_wins) == (1, 1, 1)
+
+
+def test_get_season_forecast_when_other_process_changed_season_should_rebuild_forecast(
+        test_service, fake_data_versions
+):
+    # Arrange
+    _arrange_season(test_service)
+    first = test_service.get_season_forecast(1920)
+    fake_data_versions.get.return_value = 1
+    fake_data_versions.committed_locally.return_value = False
+
+    # Act
+    second = test_service.get_season_forecast(1920)
+
+    # Assert
+    assert second is not first
+    assert test_service.game_repository.get_game_rows_by_season_year.call_count == 2
+
+
+def test_get_season_forecast_when_this_process_changed_stale_weeks_should_not_rebuild_forecast(
+        test_service, fake_data_versions
+):
+    # Arrange
+    _arrange_season(test_service)
+    test_service.get_season_forecast(1920)
+    test_service.game_repository.get_game_rows_by_season_year_and_week.return_value = []
+    test_service.scheduled_game_repository.get_scheduled_game_rows_by_season_year_and_weeks.return_value = []
+    test_service.handle_game_events([GameDeleted(_game_values(1))])
+    fake_data_versions.get.return_value = 1
+
+    # Act
+    test_service.get_season_forecast(1920)
+
+    # Assert
+    fake_data_versions.committed_locally.assert_called_once_with(1920, 0, 1)
+    test_service.game_repository.get_game_rows_by_season_year.assert_called_once()
+    test_service.game_repository.get_game_rows_by_season_year_and_week.assert_called_once_with(1920, 1)
+
+
+def test_handle_game_events_when_season_not_forecast_should_not_mark_stale_weeks(test_service):
+    # Act
+    test_service.handle_game_events([GameDeleted(_game_values(2))])
+
+    # Assert
+    assert not test_service._stale_weeks
+
+
+def test_handle_game_events_when_game_updated_should_mark_old_and_new_weeks_stale(test_service):
+    # Arrange
+    _arrange_season(test_service)
+    test_service.get_season_forecast(1920)
+
+    # Act
+    test_service.handle_game_events([GameUpdated(_game_values(1), _game_values(3))])
+
+    # Assert
+    assert test_service._stale_weeks[1920] == {1, 3}
+
+
+def test_handle_rankings_events_should_drop_season_forecast(test_service):
+    # Arrange
+    _arrange_season(test_service)
+    first = test_service.get_season_forecast(1920)
+
+    # Act
+    test_service.handle_rankings_events([RankingsUpdated(1920)])
+    second = test_service.get_season_forecast(1920)
+
+    # Assert
+    assert second is not first
+    assert test_service.game_repository.get_game_rows_by_season_year.call_count == 2
+
+
+def test_import_schedule_should_import_games_and_drop_forecasts_of_their_seasons(test_service):
+    # Arrange
+    _arrange_season(test_service)
+    test_service.get_season_forecast(1920)
+    scheduled_games = [{'season_year': 1920, 'week': 4, 'guest_name': "Bears", 'host_name': "Cardinals"}]
+
+    # Act
+    result = test_service.import_schedule(scheduled_games)
+
+    # Assert
+    test_service.scheduled_game_repository.import_scheduled_games.assert_called_once_with(scheduled_games)
+    assert result is test_service.scheduled_game_repository.import_scheduled_games.return_value
+    assert 1920 not in test_service._forecasts
+
+
+def test_get_projected_standings_should_leave_out_predictions_without_scores():
+    # Arrange
+    weeks = [WeekForecast(1, predictions=(GamePrediction("Pros", 1920, "Bears", 1920, None, None),))]
+
+    # Act
+    result = get_projected_standings(weeks)
+
+    # Assert
+    assert result == []
+
+
+def test_get_projected_standings_when_game_tied_should_count_tie_for_both_teams():
+    # Arrange
+    weeks = [WeekForecast(1, results=(_game(1, "Pros", 7, "Bears", 7),))]
+
+    # Act
+    result = get_projected_standings(weeks)
+
+    # Assert
+    assert [(standing.team_name, standing.ties) for standing in result] == [("Bears", 1), ("Pros", 1)]
+
+
+def test_get_season_forecast_should_leave_playoff_games_out_of_results(test_service):
+    # Arrange
+    test_service.game_repository.get_game_rows_by_season_year.return_value = [
+        _game(14, "Pros", 0, "Bears", 7, is_playoff=True),
+    ]
+    test_service.scheduled_game_repository.get_scheduled_game_rows_by_season_year.return_value = [
+        _scheduled_game(14, "Pros", "Bears"),
+    ]
+
+    # Act
+    forecast = test_service.get_season_forecast(1920)
+
+    # Assert
+    test_service.game_predictor_service.predict_game_scores.assert_not_called()
+    assert forecast.weeks == {}
+    assert forecast.standings == []
@@ -0,0 +1,90 @@
+from unittest.mock import Mock
+
+import pytest
+
+from app.services.event_bus.event_bus import EventBus
+from app.services.event_bus.game_events import GameAdded, GameDeleted, GameUpdated, GameValues
+from app.services.franchise_summary_service.franchise_summary_service import (FranchiseSummaryService,
+                                                                              get_franchise_changes)
+
+
+@pytest.fixture()
+def test_service():
+    return FranchiseSummaryService(Mock(), Mock())
+
+
+def _game(guest_score, host_score, is_playoff=False, guest_name="Guest", host_name="Host"):
+    return GameValues(id=1, season_year=1920, week=1, guest_name=guest_name, guest_score=guest_score,
+                      host_name=host_name, host_score=host_score, is_playoff=is_playoff)
+
+
+def test_init_should_subscribe_to_game_events(test_service):
+    # Assert
+    test_service.event_bus.subscribe.assert_called_once_with(
+        (GameAdded, GameUpdated, GameDeleted), test_service.handle_game_events
+    )
+
+
+def test_get_franchise_changes_when_game_added_should_count_game_for_both_teams():
+    # Act
+    changes = get_franchise_changes([GameAdded(_game(7, 21))])
+
+    # Assert
+    assert changes == {
+        'Guest': {'games': 1, 'losses': 1, 'points_for': 7, 'points_against': 21},
+        'Host': {'games': 1, 'wins': 1, 'points_for': 21, 'points_against': 7},
+    }
+
+
+def test_get_franchise_changes_when_playoff_game_deleted_should_subtract_playoff_record():
+    # Act
+    changes = get_franchise_changes([GameDeleted(_game(10, 10, is_playoff=True))])
+
+    # Assert
+    assert changes['Guest'] == {
+        'games': -1, 'ties': -1, 'points_for': -10, 'points_against': -10, 'playoff_games': -1, 'playoff_ties': -1
+    }
+
+
+def test_get_franchise_changes_when_game_updated_should_net_old_and_new_values():
+    # Act
+    changes = get_franchise_changes([GameUpdated(_game(7, 21), _game(24, 21))])
+
+    # Assert
+    assert changes['Guest'] == {'games': 0, 'losses': -1, 'wins': 1, 'points_for': 17, 'points_against': 0}
+    assert changes['Host'] == {'games': 0, 'wins': -1, 'losses': 1, 'points_for': 0, 'points_against': 17}
+
+
+def test_get_franchise_changes_when_game_updated_with_new_team_should_include_old_and_new_teams():
+    # Act
+    changes = get_franchise_changes([GameUpdated(_game(7, 21), _game(7, 21, host_name="Other"))])
+
+    # Assert
+    assert changes['Host']['games'] == -1
+    assert changes['Other']['games'] == 1
+
+
+def test_handle_game_events_should_update_summaries_once_per_batch():
+    # Arrange
+    team_repository = Mock()
+    event_bus = EventBus()
+    FranchiseSummaryService(team_repository, event_bus)
+
+    # Act
+    with event_bus.batch():
+        event_bus.publish(GameAdded(_game(7, 21)))
+        event_bus.publish(GameAdded(_game(14, 3)))
+
+    # Assert
+    team_repository.update_franchise_summaries.assert_called_once()
+    changes = team_repository.update_franchise_summaries.call_args.args[0]
+    assert changes['Guest']['games'] == 2
+    assert changes['Guest']['wins'] == 1
+
+
+def test_rebuild_franchise_summaries_should_rebuild_in_repository(test_service):
+    # Act
+    result = test_service.rebuild_franchise_summaries()
+
+    # Assert
+    assert result is test_service.team_repository.rebuild_franchise_summaries.return_value
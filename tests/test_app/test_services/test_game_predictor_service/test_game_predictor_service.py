@@ -4,8 +4,8 @@ from app.data.models.team_season import TeamSeason
 from app.services.game_predictor_service.game_predictor_service import GamePredictorService
 
 
-@patch('app.services.game_predictor_service.game_predictor_service.TeamSeasonRepository')
-def test_predict_game_score_should_return_none_when_guest_season_is_none(fake_team_season_repository):
+@patch('app.services.game_predictor_service.game_predictor_service.SeasonSnapshotRepository')
+def test_predict_game_score_should_return_none_when_guest_season_is_none(fake_season_snapshot_repository):
     # Arrange
     guest_name = "Guest"
     guest_season_year = 1
@@ -15,23 +15,23 @@ def test_predict_game_score_should_return_none_when_guest_season_is_none(fake_te
     host_season_year = 1
     host_season = None
 
-    fake_team_season_repository.get_team_season_by_team_name_and_season_year.side_effect = (guest_season, host_season)
+    fake_season_snapshot_repository.get_team_season_by_team_name_and_season_year.side_effect = (guest_season, host_season)
 
     # Act
-    test_service = GamePredictorService(fake_team_season_repository)
+    test_service = GamePredictorService(fake_season_snapshot_repository)
     predicted_guest_score, predicted_host_score = test_service.predict_game_score(guest_name, guest_season_year,
                                                                                   host_name, host_season_year)
 
     # Assert
-    fake_team_season_repository.get_team_season_by_team_name_and_season_year.assert_any_call(guest_name, guest_season_year)
-    fake_team_season_repository.get_team_season_by_team_name_and_season_year.assert_any_call(host_name, host_season_year)
+    fake_season_snapshot_repository.get_team_season_by_team_name_and_season_year.assert_any_call(guest_name, guest_season_year)
+    fake_season_snapshot_repository.get_team_season_by_team_name_and_season_year.assert_any_call(host_name, host_season_year)
 
     assert predicted_guest_score is None
     assert predicted_host_score is None
 
 
-@patch('app.services.game_predictor_service.game_predictor_service.TeamSeasonRepository')
-def test_predict_game_score_should_return_none_when_host_season_is_none(fake_team_season_repository):
+@patch('app.services.game_predictor_service.game_predictor_service.SeasonSnapshotRepository')
+def test_predict_game_score_should_return_none_when_host_season_is_none(fake_season_snapshot_repository):
     # Arrange
     league_name = "NFL"
 
@@ -47,24 +47,24 @@ def test_predict_game_score_should_return_none_when_host_season_is_none(fake_tea
     host_season_year = 1
     host_season = None
 
-    fake_team_season_repository.get_team_season_by_team_name_and_season_year.side_effect = (guest_season, host_season)
+    fake_season_snapshot_repository.get_team_season_by_team_name_and_season_year.side_effect = (guest_season, host_season)
 
     # Act
-    test_service = GamePredictorService(fake_team_season_repository)
+    test_service = GamePredictorService(fake_season_snapshot_repository)
     predicted_guest_score, predicted_host_score = test_service.predict_game_score(guest_name, guest_season_year,
                                                                                   host_name, host_season_year)
 
     # Assert
-    fake_team_season_repository.get_team_season_by_team_name_and_season_year.assert_any_call(guest_name, guest_season_year)
-    fake_team_season_repository.get_team_season_by_team_name_and_season_year.assert_any_call(host_name, host_season_year)
+    fake_season_snapshot_repository.get_team_season_by_team_name_and_season_year.assert_any_call(guest_name, guest_season_year)
+    fake_season_snapshot_repository.get_team_season_by_team_name_and_season_year.assert_any_call(host_name, host_season_year)
 
     assert predicted_guest_score is None
     assert predicted_host_score is None
 
 
-@patch('app.services.game_predictor_service.game_predictor_service.TeamSeasonRepository')
+@patch('app.services.game_predictor_service.game_predictor_service.SeasonSnapshotRepository')
 def test_predict_game_score_should_return_correctly_calculated_prediction_when_guest_season_and_host_season_are_not_none(
-    fake_team_season_repository
+    fake_season_snapshot_repository
 ):
     # Arrange
     league_name = "NFL"
@@ -85,18 +85,85 @@ def test_predict_game_score_should_return_correctly_calculated_prediction_when_g
     host_season.defensive_average = 7.000
     host_season.defensive_factor = 8.000
 
-    fake_team_season_repository.get_team_season_by_team_name_and_season_year.side_effect = (guest_season, host_season)
+    fake_season_snapshot_repository.get_team_season_by_team_name_and_season_year.side_effect = (guest_season, host_season)
 
     # Act
-    test_service = GamePredictorService(fake_team_season_repository)
+    test_service = GamePredictorService(fake_season_snapshot_repository)
     predicted_guest_score, predicted_host_score = test_service.predict_game_score(guest_name, guest_season_year,
                                                                                   host_name, host_season_year)
 
     # Assert
-    fake_team_season_repository.get_team_season_by_team_name_and_season_year.assert_any_call(guest_name, guest_season_year)
-    fake_team_season_repository.get_team_season_by_team_name_and_season_year.assert_any_call(host_name, host_season_year)
+    fake_season_snapshot_repository.get_team_season_by_team_name_and_season_year.assert_any_call(guest_name, guest_season_year)
+    fake_season_snapshot_repository.get_team_season_by_team_name_and_season_year.assert_any_call(host_name, host_season_year)
 
     assert predicted_guest_score == round(((guest_season.offensive_factor * host_season.defensive_average
                                             + host_season.defensive_factor * guest_season.offensive_average) / 2), 1)
     assert predicted_host_score == round(((host_season.offensive_factor * guest_season.defensive_average
                                            + guest_season.defensive_factor * host_season.offensive_average) / 2), 1)
+
+
+def _build_snapshot(season_year, rankings):
+    from types import SimpleNamespace
+
+    from app.data.models.season_snapshot import SeasonSnapshot, TeamSeasonRecord
+
+    team_season_rows = []
+    for id, (team_name, values) in enumerate(rankings.items(), start=1):
+        row = {field: None for field in TeamSeasonRecord._fields}
+        row.update(id=id, team_name=team_name, season_year=season_year)
+        row.update(zip(('offensive_average', 'offensive_factor', 'defensive_average', 'defensive_factor'), values))
+        team_season_rows.append(SimpleNamespace(**row))
+    return SeasonSnapshot.build(season_year, 0, team_season_rows, [])
+
+
+def test_predict_game_scores_should_predict_every_matchup_with_one_snapshot_read_per_season():
+    # Arrange
+    from decimal import Decimal
+    from unittest.mock import Mock
+
+    from app.services.game_predictor_service.game_prediction import GamePrediction, Matchup
+
+    snapshots = {
+        1985: _build_snapshot(1985, {
+            "Bears": (Decimal('28.3'), Decimal('1.4'), Decimal('12.5'), Decimal('0.6')),
+            "Patriots": (Decimal('22.8'), Decimal('1.1'), Decimal('18.1'), Decimal('0.9')),
+            "Rams": (None, None, None, None),
+        }),
+        1986: _build_snapshot(1986, {
+            "Giants": (Decimal('23.1'), Decimal('1.1'), Decimal('14.8'), Decimal('0.7')),
+        }),
+    }
+    fake_repository = Mock()
+    fake_repository.get_season_snapshot.side_effect = snapshots.__getitem__
+    test_service = GamePredictorService(fake_repository)
+    matchups = [
+        Matchup("Patriots", 1985, "Bears", 1985),
+        Matchup("Bears", 1985, "Giants", 1986),
+        Matchup("Rams", 1985, "Bears", 1985),
+        Matchup("Jets", 1985, "Bears", 1985),
+    ]
+
+    # Act
+    predictions = test_service.predict_game_scores(matchups)
+
+    # Assert
+    assert sorted(call.args[0] for call in fake_repository.get_season_snapshot.call_args_list) == [1985, 1986]
+    assert predictions[0] == GamePrediction("Patriots", 1985, "Bears", 1985, 13.7, 25.4)
+    assert predictions[1] == GamePrediction("Bears", 1985, "Giants", 1986, 20.3, 13.8)
+    assert predictions[2] == GamePrediction("Rams", 1985, "Bears", 1985, None, None)
+    assert predictions[3] == GamePrediction("Jets", 1985, "Bears", 1985, None, None)
+
+
+def test_predict_game_scores_when_no_matchups_should_return_empty_list():
+    # Arrange
+    from unittest.mock import Mock
+
+    fake_repository = Mock()
+    test_service = GamePredictorService(fake_repository)
+
+    # Act
+    predictions = test_service.predict_game_scores([])
+
+    # Assert
+    assert predictions == []
+    fake_repository.get_season_snapshot.assert_not_called()
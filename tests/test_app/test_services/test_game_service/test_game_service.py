@@ -1,10 +1,11 @@
 import pytest
 
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
 from app.data.errors import EntityNotFoundError
 from app.data.models.game import Game
 from app.services.constants import Direction
+from app.services.event_bus.game_events import GameAdded, GameDeleted, GameUpdated
 from app.services.game_service.game_service import GameService
 from app.services.game_service.process_game_strategy.add_game_strategy import AddGameStrategy
 from app.services.game_service.process_game_strategy.process_game_strategy import ProcessGameStrategy
@@ -12,11 +13,20 @@ from app.services.game_service.process_game_strategy.subtract_game_strategy impo
 
 
 @pytest.fixture()
+@patch('app.services.game_service.game_service.LeagueSeasonRepository')
+@patch('app.services.game_service.game_service.EventBus')
+@patch('app.services.game_service.game_service.EloRatingService')
 @patch('app.services.game_service.game_service.ProcessGameStrategyFactory')
 @patch('app.services.game_service.game_service.TeamSeasonRepository')
 @patch('app.services.game_service.game_service.GameRepository')
-def test_service(fake_game_repository, fake_team_season_repository, fake_process_game_strategy_factory):
-    test_service = GameService(fake_game_repository, fake_team_season_repository, fake_process_game_strategy_factory)
+def test_service(
+        fake_game_repository, fake_team_season_repository, fake_process_game_strategy_factory,
+        fake_elo_rating_service, fake_event_bus, fake_league_season_repository
+):
+    test_service = GameService(fake_game_repository, fake_team_season_repository, fake_process_game_strategy_factory,
+                               fake_elo_rating_service, fake_event_bus, fake_league_season_repository)
+    # Games count toward league season totals only in the tests that give their teams team seasons.
+    fake_team_season_repository.get_team_season_by_team_name_and_season_year.return_value = None
     return test_service
 
 
@@ -178,3 +188,176 @@ def test_delete_game_when_game_with_passed_id_is_found_should_delete_game_from_r
     test_service.game_repository.delete_game.assert_any_call(id)
     test_service.process_game_strategy_factory.create_strategy.assert_any_call(Direction.DOWN)
     strategy.process_game.assert_called_once_with(old_game)
+
+
+@patch('app.services.game_service.game_service.Game')
+def test_add_game_should_rate_game_before_adding_it(fake_game, test_service):
+    # Arrange
+    test_service.team_season_repository.team_season_exists_with_team_name_and_season_year.return_value = True
+    calls = Mock()
+    test_service.elo_rating_service.rate_game.side_effect = lambda game: calls('rate_game')
+    test_service.game_repository.add_game.side_effect = lambda game: calls('add_game')
+
+    # Act
+    test_service.add_game(fake_game)
+
+    # Assert
+    test_service.elo_rating_service.rate_game.assert_called_once_with(fake_game)
+    assert [c.args[0] for c in calls.call_args_list] == ['rate_game', 'add_game']
+
+
+def test_update_game_should_reverse_selected_game_rating_then_rate_new_game_before_updating(test_service):
+    # Arrange
+    selected_game = Mock()
+    test_service.game_repository.get_game.return_value = selected_game
+    new_game = Mock()
+    old_game = Mock()
+    calls = Mock()
+    test_service.elo_rating_service.unrate_game.side_effect = lambda game: calls('unrate_game', game)
+    test_service.elo_rating_service.rate_game.side_effect = lambda game: calls('rate_game', game)
+    test_service.game_repository.update_game.side_effect = lambda game: calls('update_game', game)
+
+    # Act
+    test_service.update_game(new_game, old_game)
+
+    # Assert
+    assert [c.args for c in calls.call_args_list] == [
+        ('unrate_game', selected_game), ('rate_game', new_game), ('update_game', new_game)
+    ]
+
+
+def test_delete_game_should_reverse_game_rating(test_service):
+    # Arrange
+    old_game = Mock()
+    test_service.game_repository.get_game.return_value = old_game
+
+    # Act
+    test_service.delete_game(1)
+
+    # Assert
+    test_service.elo_rating_service.unrate_game.assert_called_once_with(old_game)
+
+
+@patch('app.services.game_service.game_service.Game')
+def test_add_game_should_publish_game_added_after_writes(fake_game, test_service):
+    # Arrange
+    test_service.team_season_repository.team_season_exists_with_team_name_and_season_year.return_value = True
+    fake_game.season_year = 1920
+
+    # Act
+    test_service.add_game(fake_game)
+
+    # Assert
+    event = test_service.event_bus.publish.call_args.args[0]
+    assert isinstance(event, GameAdded)
+    assert event.game.season_year == 1920
+
+
+def test_update_game_should_publish_old_and_new_values(test_service):
+    # Arrange
+    selected_game = Mock(season_year=1920, guest_score=7)
+    test_service.game_repository.get_game.return_value = selected_game
+    new_game = Mock(season_year=1920, guest_score=10)
+
+    # Act
+    test_service.update_game(new_game, Mock())
+
+    # Assert
+    event = test_service.event_bus.publish.call_args.args[0]
+    assert isinstance(event, GameUpdated)
+    assert (event.old_game.guest_score, event.new_game.guest_score) == (7, 10)
+
+
+def test_delete_game_should_publish_game_deleted_with_values_before_deletion(test_service):
+    # Arrange
+    test_service.game_repository.get_game.return_value = Mock(id=1, season_year=1920)
+
+    # Act
+    test_service.delete_game(1)
+
+    # Assert
+    event = test_service.event_bus.publish.call_args.args[0]
+    assert isinstance(event, GameDeleted)
+    assert event.game.id == 1
+
+
+def test_add_games_should_add_each_game_within_one_event_batch(test_service):
+    # Arrange
+    games = [Mock(), Mock()]
+    test_service.add_game = Mock()
+
+    # Act
+    test_service.add_games(games)
+
+    # Assert
+    test_service.event_bus.batch.assert_called_once()
+    assert [c.args[0] for c in test_service.add_game.call_args_list] == games
+
+
+def test_add_game_should_add_each_team_season_game_and_score_to_its_league_season_totals(test_service):
+    # Arrange
+    test_service.team_season_repository.team_season_exists_with_team_name_and_season_year.return_value = True
+    test_service.team_season_repository.get_team_season_by_team_name_and_season_year.side_effect = \
+        lambda team_name, season_year: None if team_name == "Guest" else Mock(league_name="APFA")
+    new_game = Game(season_year=1920, week=1, guest_name="Guest", guest_score=7, host_name="Host", host_score=21)
+
+    # Act
+    test_service.add_game(new_game)
+
+    # Assert
+    test_service.league_season_repository.increment_league_season_totals.assert_called_once_with(
+        1920, {"APFA": (1, 21)}
+    )
+
+
+def test_add_game_should_change_league_season_totals_before_game_write_commits(test_service):
+    # Arrange
+    calls = []
+    test_service.team_season_repository.team_season_exists_with_team_name_and_season_year.return_value = True
+    test_service.team_season_repository.get_team_season_by_team_name_and_season_year.return_value = \
+        Mock(league_name="APFA")
+    test_service.league_season_repository.increment_league_season_totals.side_effect = \
+        lambda *args: calls.append('increment_league_season_totals')
+    test_service.game_repository.add_game.side_effect = lambda game: calls.append('add_game')
+    new_game = Game(season_year=1920, week=1, guest_name="Guest", guest_score=7, host_name="Host", host_score=21)
+
+    # Act
+    test_service.add_game(new_game)
+
+    # Assert
+    assert calls == ['increment_league_season_totals', 'add_game']
+
+
+def test_update_game_should_subtract_selected_game_values_then_add_new_game_to_league_season_totals(test_service):
+    # Arrange
+    test_service.game_repository.get_game.return_value = Mock(
+        season_year=1920, guest_name="Guest", guest_score=7, host_name="Host", host_score=21
+    )
+    test_service.team_season_repository.get_team_season_by_team_name_and_season_year.return_value = \
+        Mock(league_name="APFA")
+    new_game = Mock(season_year=1920, guest_name="Guest", guest_score=10, host_name="Host", host_score=21)
+
+    # Act
+    test_service.update_game(new_game, Mock())
+
+    # Assert
+    assert test_service.league_season_repository.increment_league_season_totals.call_args_list == [
+        call(1920, {"APFA": (-2, -28)}), call(1920, {"APFA": (2, 31)})
+    ]
+
+
+def test_delete_game_should_subtract_game_from_league_season_totals(test_service):
+    # Arrange
+    test_service.game_repository.get_game.return_value = Mock(
+        season_year=1920, guest_name="Guest", guest_score=7, host_name="Host", host_score=21
+    )
+    test_service.team_season_repository.get_team_season_by_team_name_and_season_year.side_effect = \
+        lambda team_name, season_year: Mock(league_name="APFA" if team_name == "Guest" else "AFL")
+
+    # Act
+    test_service.delete_game(1)
+
+    # Assert
+    test_service.league_season_repository.increment_league_season_totals.assert_called_once_with(
+        1920, {"APFA": (-1, -7), "AFL": (-1, -21)}
+    )
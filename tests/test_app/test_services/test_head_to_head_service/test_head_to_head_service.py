@@ -0,0 +1,118 @@
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from app.services.event_bus.event_bus import EventBus
+from app.services.event_bus.game_events import GameAdded, GameDeleted, GameUpdated, GameValues
+from app.services.head_to_head_service.head_to_head_record import HeadToHeadRecord
+from app.services.head_to_head_service.head_to_head_service import HeadToHeadService, get_head_to_head_changes
+
+
+@pytest.fixture()
+def test_service():
+    return HeadToHeadService(Mock(), Mock(), Mock())
+
+
+def _game(guest_score, host_score, guest_name="Pros", host_name="Bears", season_year=1920):
+    return GameValues(id=1, season_year=season_year, week=1, guest_name=guest_name, guest_score=guest_score,
+                      host_name=host_name, host_score=host_score, is_playoff=False)
+
+
+def test_init_should_subscribe_to_game_events(test_service):
+    # Assert
+    test_service.event_bus.subscribe.assert_called_once_with(
+        (GameAdded, GameUpdated, GameDeleted), test_service.handle_game_events
+    )
+
+
+def test_get_series_record_when_team_name_is_none_should_raise_value_error(test_service):
+    # Act
+    with pytest.raises(ValueError):
+        test_service.get_series_record(None, "Bears")
+
+
+def test_get_series_record_when_team_is_second_of_pair_should_orient_record_to_team(test_service):
+    # Arrange
+    test_service.head_to_head_repository.get_head_to_head_summary.return_value = SimpleNamespace(
+        team_name="Bears", opponent_name="Pros", games=3, team_wins=2, opponent_wins=1, ties=0,
+        team_points=40, opponent_points=20, first_season_year=1920, last_season_year=1922
+    )
+
+    # Act
+    record = test_service.get_series_record("Pros", "Bears")
+
+    # Assert
+    test_service.head_to_head_repository.get_head_to_head_summary.assert_called_once_with("Pros", "Bears")
+    assert record == HeadToHeadRecord("Pros", "Bears", 3, 1, 2, 0, 20, 40, 1920, 1922)
+
+
+def test_get_series_record_when_teams_have_not_played_should_return_empty_record(test_service):
+    # Arrange
+    test_service.head_to_head_repository.get_head_to_head_summary.return_value = None
+
+    # Act
+    record = test_service.get_series_record("Pros", "Bears")
+
+    # Assert
+    assert record == HeadToHeadRecord("Pros", "Bears")
+
+
+def test_get_head_to_head_should_tally_games_in_season_range(test_service):
+    # Arrange
+    games = [_game(0, 7, season_year=1920), _game(14, 14, guest_name="Bears", host_name="Pros", season_year=1921)]
+    test_service.game_repository.get_game_rows_between_teams.return_value = games
+
+    # Act
+    head_to_head = test_service.get_head_to_head("Bears", "Pros", 1920, 1921)
+
+    # Assert
+    test_service.game_repository.get_game_rows_between_teams.assert_called_once_with("Bears", "Pros", 1920, 1921)
+    assert head_to_head.games == games
+    assert head_to_head.record == HeadToHeadRecord("Bears", "Pros", 2, 1, 0, 1, 21, 14, 1920, 1921)
+
+
+def test_get_head_to_head_changes_should_count_from_side_of_first_team_of_sorted_pair():
+    # Act
+    changes = get_head_to_head_changes([GameAdded(_game(3, 10))])
+
+    # Assert
+    assert changes == {
+        ("Bears", "Pros"): {'games': 1, 'team_points': 10, 'opponent_points': 3, 'team_wins': 1},
+    }
+
+
+def test_get_head_to_head_changes_when_game_updated_should_net_old_and_new_values():
+    # Act
+    changes = get_head_to_head_changes([GameUpdated(_game(3, 10), _game(10, 10))])
+
+    # Assert
+    assert changes[("Bears", "Pros")] == {
+        'games': 0, 'team_points': 0, 'opponent_points': 7, 'team_wins': -1, 'ties': 1
+    }
+
+
+def test_get_head_to_head_changes_when_game_deleted_should_subtract_game():
+    # Act
+    changes = get_head_to_head_changes([GameDeleted(_game(17, 10))])
+
+    # Assert
+    assert changes[("Bears", "Pros")] == {'games': -1, 'team_points': -10, 'opponent_points': -17, 'opponent_wins': -1}
+
+
+def test_handle_game_events_should_update_summaries_once_per_batch():
+    # Arrange
+    head_to_head_repository = Mock()
+    event_bus = EventBus()
+    HeadToHeadService(Mock(), head_to_head_repository, event_bus)
+
+    # Act
+    with event_bus.batch():
+        event_bus.publish(GameAdded(_game(7, 21)))
+        event_bus.publish(GameAdded(_game(14, 3, guest_name="Bears", host_name="Pros")))
+
+    # Assert
+    head_to_head_repository.update_head_to_head_summaries.assert_called_once()
+    changes = head_to_head_repository.update_head_to_head_summaries.call_args.args[0]
+    assert changes[("Bears", "Pros")]['games'] == 2
+    assert changes[("Bears", "Pros")]['team_wins'] == 2
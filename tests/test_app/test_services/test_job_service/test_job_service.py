@@ -0,0 +1,156 @@
+import threading
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.data.models.job import Job
+from app.data.repositories.job_repository import JobRepository
+from app.data.sqla import sqla
+from app.services.job_service.job_service import JobService, utcnow
+
+
+@pytest.fixture()
+def test_app(create_sqlite_app):
+    return create_sqlite_app(Job, JOB_WORKERS=2)
+
+
+@pytest.fixture()
+def test_service():
+    test_service = JobService(JobRepository())
+    yield test_service
+    test_service.shutdown()
+
+
+def test_enqueue_when_task_is_none_should_raise_value_error(test_app, test_service):
+    with test_app.app_context():
+        # Act and Assert
+        with pytest.raises(ValueError):
+            test_service.enqueue('kind', 'key', None)
+
+
+def test_enqueue_should_run_task_in_background_and_record_phases_and_result(test_app, test_service):
+    with test_app.app_context():
+        # Arrange
+        def task(progress):
+            progress.phase_completed('first', 0.5)
+            progress.phase_completed('second', 0.25)
+            return {'rows_touched': 4}
+
+        # Act
+        job = test_service.enqueue('kind', 'key', task, phase_count=2)
+        test_service.shutdown()
+
+        # Assert
+        sqla.session.expire_all()
+        job = test_service.get_job(job.id)
+        assert job.status == Job.SUCCEEDED
+        assert job.progress == 1.0
+        assert job.phase_durations == {'first': 0.5, 'second': 0.25}
+        assert job.result == {'rows_touched': 4}
+        assert job.started_at is not None
+        assert job.finished_at is not None
+
+
+def test_enqueue_when_task_raises_error_should_record_failure(test_app, test_service):
+    with test_app.app_context():
+        # Arrange
+        def task(progress):
+            raise RuntimeError('boom')
+
+        # Act
+        job = test_service.enqueue('kind', 'key', task)
+        test_service.shutdown()
+
+        # Assert
+        sqla.session.expire_all()
+        job = test_service.get_job(job.id)
+        assert job.status == Job.FAILED
+        assert job.error == 'boom'
+
+
+def test_enqueue_when_equivalent_job_is_running_should_return_running_job(test_app, test_service):
+    with test_app.app_context():
+        # Arrange
+        started = threading.Event()
+        release = threading.Event()
+
+        def task(progress):
+            started.set()
+            release.wait(5)
+
+        first_job = test_service.enqueue('kind', 'key', task)
+        started.wait(5)
+
+        # Act
+        second_job = test_service.enqueue('kind', 'key', task)
+        other_job = test_service.enqueue('kind', 'other key', lambda progress: None)
+        release.set()
+        test_service.shutdown()
+
+        # Assert
+        assert second_job.id == first_job.id
+        assert other_job.id != first_job.id
+
+
+def test_enqueue_when_equivalent_job_is_stale_should_fail_it_and_queue_new_job(test_app, test_service):
+    with test_app.app_context():
+        # Arrange
+        long_ago = utcnow() - timedelta(days=1)
+        stale_job = JobRepository().add_job(
+            Job(kind='kind', key='key', status=Job.RUNNING, phase_count=0, phases_completed=0,
+                created_at=long_ago, updated_at=long_ago)
+        )
+
+        # Act
+        new_job = test_service.enqueue('kind', 'key', lambda progress: None)
+        test_service.shutdown()
+
+        # Assert
+        assert new_job.id != stale_job.id
+        sqla.session.expire_all()
+        assert test_service.get_job(stale_job.id).status == Job.FAILED
+
+
+def test_enqueue_when_other_process_queued_equivalent_job_after_check_should_return_that_job(test_app, test_service):
+    with test_app.app_context():
+        # Arrange
+        now = utcnow()
+        other_job = JobRepository().add_job(
+            Job(kind='kind', key='key', status=Job.QUEUED, phase_count=0, phases_completed=0, created_at=now,
+                updated_at=now)
+        )
+        get_active_job = JobRepository.get_active_job_by_kind_and_key
+        checks = []
+
+        def get_active_job_after_first_check(self, kind, key):
+            checks.append(kind)
+            return None if len(checks) == 1 else get_active_job(self, kind, key)
+
+        # Act
+        with patch.object(JobRepository, 'get_active_job_by_kind_and_key', get_active_job_after_first_check):
+            job = test_service.enqueue('kind', 'key', lambda progress: None)
+
+        # Assert
+        assert job.id == other_job.id
+        assert Job.query.count() == 1
+
+
+def test_add_job_when_equivalent_job_is_active_should_raise_integrity_error(test_app):
+    with test_app.app_context():
+        # Arrange
+        now = utcnow()
+        test_repo = JobRepository()
+
+        def new_job(status):
+            return Job(kind='kind', key='key', status=status, phase_count=0, phases_completed=0, created_at=now,
+                       updated_at=now)
+
+        test_repo.add_job(new_job(Job.SUCCEEDED))
+        test_repo.add_job(new_job(Job.FAILED))
+        test_repo.add_job(new_job(Job.RUNNING))
+
+        # Act and Assert
+        with pytest.raises(IntegrityError):
+            test_repo.add_job(new_job(Job.QUEUED))
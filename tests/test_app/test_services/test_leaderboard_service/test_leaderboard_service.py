@@ -0,0 +1,171 @@
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import Mock, call, patch
+
+import pytest
+
+from app.services.leaderboard_service.leaderboard_entry import LeaderboardEntry
+from app.services.leaderboard_service.leaderboard_service import (
+    LEADERBOARD_METRICS, LeaderboardService, get_season_orderings
+)
+
+SEASONS = {
+    1970: {"Bears": ('1.5', 10), "Packers": ('2.5', 8), "Lions": (None, 6)},
+    1971: {"Bears": ('3.0', 7), "Packers": ('0.5', 9)},
+    1972: {"Bears": ('2.5', 11), "Vikings": ('1.0', 12)},
+}
+
+
+def _build_rows(season_year, values):
+    rows = []
+    for team_name, (offensive_index, wins) in values.items():
+        row = {metric: None for metric in LEADERBOARD_METRICS}
+        row.update(team_name=team_name, season_year=season_year, wins=wins,
+                   offensive_index=Decimal(offensive_index) if offensive_index else None)
+        rows.append(SimpleNamespace(**row))
+    return rows
+
+
+def _get_rows(season_years, column_names):
+    return [row for season_year in season_years for row in _build_rows(season_year, SEASONS[season_year])]
+
+
+@pytest.fixture()
+def fake_data_versions():
+    with patch('app.services.leaderboard_service.leaderboard_service.data_versions') as fake_data_versions:
+        fake_data_versions.get.return_value = 0
+        yield fake_data_versions
+
+
+@pytest.fixture()
+def test_service(fake_data_versions):
+    service = LeaderboardService(Mock(), Mock())
+    service.season_repository.get_season_records.return_value = [SimpleNamespace(year=year) for year in SEASONS]
+    service.team_season_repository.get_team_season_column_rows.side_effect = _get_rows
+    return service
+
+
+def test_get_leaders_should_merge_best_values_across_seasons(test_service):
+    # Act
+    result = test_service.get_leaders('offensive_index', limit=3)
+
+    # Assert
+    assert result == [
+        LeaderboardEntry(1, "Bears", 1971, Decimal('3.0')),
+        LeaderboardEntry(2, "Packers", 1970, Decimal('2.5')),
+        LeaderboardEntry(3, "Bears", 1972, Decimal('2.5')),
+    ]
+
+
+def test_get_leaders_when_ascending_should_return_lowest_values_and_skip_empty_values(test_service):
+    # Act
+    result = test_service.get_leaders('offensive_index', limit=10, ascending=True)
+
+    # Assert
+    assert [(entry.team_name, entry.season_year) for entry in result] == [
+        ("Packers", 1971), ("Vikings", 1972), ("Bears", 1970), ("Packers", 1970), ("Bears", 1972), ("Bears", 1971),
+    ]
+
+
+def test_get_leaders_should_only_read_seasons_in_range(test_service):
+    # Act
+    result = test_service.get_leaders('wins', first_season_year=1971, last_season_year=1971)
+
+    # Assert
+    assert result == [LeaderboardEntry(1, "Packers", 1971, 9), LeaderboardEntry(2, "Bears", 1971, 7)]
+    test_service.team_season_repository.get_team_season_column_rows.assert_called_once_with(
+        [1971], LEADERBOARD_METRICS
+    )
+
+
+def test_get_leaders_when_range_is_open_should_read_every_season_with_one_query(test_service):
+    # Act
+    result = test_service.get_leaders('wins', limit=1)
+
+    # Assert
+    assert result == [LeaderboardEntry(1, "Vikings", 1972, 12)]
+    test_service.team_season_repository.get_team_season_column_rows.assert_called_once_with(
+        [1970, 1971, 1972], LEADERBOARD_METRICS
+    )
+
+
+def test_get_leaders_when_metric_unknown_should_raise_value_error(test_service):
+    # Act
+    with pytest.raises(ValueError):
+        test_service.get_leaders('team_name')
+
+
+@pytest.mark.parametrize('limit', [0, 1001])
+def test_get_leaders_when_limit_out_of_range_should_raise_value_error(test_service, limit):
+    # Act
+    with pytest.raises(ValueError):
+        test_service.get_leaders('wins', limit=limit)
+
+
+def test_get_season_orderings_when_versions_unchanged_should_return_cached_orderings(test_service):
+    # Arrange
+    first = test_service.get_season_orderings([1970, 1971])
+
+    # Act
+    second = test_service.get_season_orderings([1970, 1971])
+
+    # Assert
+    assert second[1970] is first[1970]
+    assert second[1971] is first[1971]
+    test_service.team_season_repository.get_team_season_column_rows.assert_called_once()
+
+
+def test_get_season_orderings_when_version_changed_should_sort_only_changed_season_again(
+        test_service, fake_data_versions
+):
+    # Arrange
+    first = test_service.get_season_orderings([1970, 1971])
+    fake_data_versions.get.side_effect = lambda season_year: 1 if season_year == 1970 else 0
+    test_service.team_season_repository.get_team_season_column_rows.side_effect = None
+    test_service.team_season_repository.get_team_season_column_rows.return_value = _build_rows(
+        1970, {"Bears": ('9.0', 1)}
+    )
+
+    # Act
+    second = test_service.get_season_orderings([1970, 1971])
+
+    # Assert
+    assert second[1970] is not first[1970]
+    assert second[1970]['wins', False] == ((1, "Bears"),)
+    assert second[1971] is first[1971]
+    test_service.team_season_repository.get_team_season_column_rows.assert_called_with([1970], LEADERBOARD_METRICS)
+
+
+@patch('app.services.leaderboard_service.leaderboard_service.leaderboard_cache_counters')
+def test_get_season_orderings_should_count_each_season_as_hit_or_miss(fake_counters, test_service):
+    # Arrange
+    test_service.get_season_orderings([1970])
+
+    # Act
+    test_service.get_season_orderings([1970, 1971, 1972])
+    test_service.get_season_orderings([1970, 1971])
+
+    # Assert
+    assert fake_counters.method_calls == [
+        call.hit(0), call.miss(1), call.hit(1), call.miss(2), call.hit(2)
+    ]
+
+
+def test_get_season_orderings_should_order_equal_values_by_team_name():
+    # Arrange
+    rows = _build_rows(1970, {"Packers": ('1.0', 8), "Bears": ('1.0', 8)})
+
+    # Act
+    result = get_season_orderings([1970], rows)
+
+    # Assert
+    assert [team_name for _, team_name in result[1970]['wins', False]] == ["Bears", "Packers"]
+    assert [team_name for _, team_name in result[1970]['wins', True]] == ["Bears", "Packers"]
+
+
+def test_get_season_orderings_when_season_has_no_team_seasons_should_get_empty_orderings():
+    # Act
+    result = get_season_orderings([1970], [])
+
+    # Assert
+    assert result[1970]['wins', False] == ()
@@ -0,0 +1,131 @@
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from app.data.models.game import Game
+from app.data.models.team_season import TeamSeason
+from app.data.repositories.league_season_repository import LeagueSeasonRepository
+from app.data.repositories.season_snapshot_repository import SeasonSnapshotRepository
+from app.data.sqla import sqla
+from app.services.event_bus.event_bus import EventBus
+from app.services.event_bus.game_events import GameAdded, GameDeleted
+from app.services.season_archive_service.season_archive_service import SeasonArchiveService
+
+
+@pytest.fixture()
+def test_app(create_sqlite_app):
+    app = create_sqlite_app(TeamSeason, Game)
+    with app.app_context():
+        sqla.session.add_all([
+            TeamSeason(team_name="Chicago Bears", season_year=1963, league_name='NFL', games=1, wins=1,
+                       points_for=10, points_against=3),
+            TeamSeason(team_name="Green Bay Packers", season_year=1963, league_name='NFL', games=1, losses=1,
+                       points_for=3, points_against=10),
+            Game(season_year=1963, week=1, guest_name="Green Bay Packers", guest_score=3, host_name="Chicago Bears",
+                 host_score=10, is_playoff=False),
+        ])
+        sqla.session.commit()
+    return app
+
+
+@pytest.fixture()
+def test_service():
+    return SeasonArchiveService(SeasonSnapshotRepository(), Mock(LeagueSeasonRepository), EventBus())
+
+
+def test_export_season_then_import_season_with_replace_should_restore_rows(test_app, test_service, tmp_path):
+    with test_app.app_context():
+        # Arrange
+        path = str(tmp_path / '1963.pfsa')
+        test_service.export_season(1963, path)
+        TeamSeason.query.filter_by(team_name="Chicago Bears").first().wins = 0
+        sqla.session.commit()
+
+        # Act
+        snapshot = test_service.import_season(path, replace=True)
+
+        # Assert
+        assert snapshot.team_season_count == 2
+        assert TeamSeason.query.filter_by(season_year=1963).count() == 2
+        assert TeamSeason.query.filter_by(team_name="Chicago Bears").first().wins == 1
+        game = Game.query.filter_by(season_year=1963).one()
+        assert (game.winner_name, game.loser_name) == ("Chicago Bears", "Green Bay Packers")
+        assert test_service.season_snapshot_repository.get_season_snapshot(1963).get_team_season(
+            "Chicago Bears").wins == 1
+
+
+def test_import_season_when_season_has_rows_and_replace_is_false_should_raise_value_error(
+        test_app, test_service, tmp_path
+):
+    with test_app.app_context():
+        # Arrange
+        path = str(tmp_path / '1963.pfsa')
+        test_service.export_season(1963, path)
+
+        # Act and Assert
+        with pytest.raises(ValueError):
+            test_service.import_season(path)
+
+
+def test_load_season_snapshot_should_not_touch_data_store(test_app, test_service, tmp_path):
+    with test_app.app_context():
+        # Arrange
+        path = str(tmp_path / '1963.pfsa')
+        test_service.export_season(1963, path)
+        Game.query.delete()
+        sqla.session.commit()
+
+        # Act
+        snapshot = test_service.load_season_snapshot(path)
+
+        # Assert
+        assert snapshot.game_count == 1
+        assert Game.query.count() == 0
+
+
+def test_import_season_with_replace_should_change_league_season_totals_and_announce_games(
+        test_app, test_service, tmp_path
+):
+    with test_app.app_context():
+        # Arrange
+        path = str(tmp_path / '1963.pfsa')
+        test_service.export_season(1963, path)
+        old_game_id = Game.query.one().id
+        events = []
+        test_service.event_bus.subscribe((GameAdded, GameDeleted), events.extend)
+
+        # Act
+        test_service.import_season(path, replace=True)
+
+        # Assert
+        test_service.league_season_repository.increment_league_season_totals.assert_called_once_with(
+            1963, {'NFL': (0, 0)}
+        )
+        new_game_id = Game.query.one().id
+        assert [(type(event), event.game.id) for event in events] == [
+            (GameDeleted, old_game_id), (GameAdded, new_game_id)
+        ]
+
+
+def test_import_season_should_restore_ratings_and_game_columns(test_app, test_service, tmp_path):
+    with test_app.app_context():
+        # Arrange
+        team_season = TeamSeason.query.filter_by(team_name="Chicago Bears").one()
+        team_season.simple_rating = Decimal('3.5')
+        team_season.elo_rating = Decimal('1512.5')
+        game = Game.query.one()
+        game.notes = "Opener"
+        game.elo_delta = Decimal('12.5')
+        sqla.session.commit()
+        path = str(tmp_path / '1963.pfsa')
+        test_service.export_season(1963, path)
+
+        # Act
+        test_service.import_season(path, replace=True)
+
+        # Assert
+        team_season = TeamSeason.query.filter_by(team_name="Chicago Bears").one()
+        assert (team_season.simple_rating, team_season.elo_rating) == (Decimal('3.5'), Decimal('1512.5'))
+        game = Game.query.one()
+        assert (game.notes, game.elo_delta) == ("Opener", Decimal('12.5'))
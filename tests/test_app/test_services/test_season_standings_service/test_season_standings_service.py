@@ -0,0 +1,196 @@
+from types import SimpleNamespace
+from unittest.mock import Mock, call, patch
+
+import pytest
+
+from app.data.models.season_snapshot import GameRecord
+from app.services.season_standings_service.season_standings_service import (
+    SeasonStandingsService, TEAM_NAME_TIEBREAKER, break_tie, order_teams
+)
+from app.services.season_standings_service.tiebreaker_tables import TiebreakerTables
+
+
+def _team_season(team_name, division_name=None, conference_name=None):
+    return SimpleNamespace(team_name=team_name, league_name="NFL", conference_name=conference_name,
+                           division_name=division_name, expected_wins=None, expected_losses=None)
+
+
+def _game(guest_name, guest_score, host_name, host_score):
+    return GameRecord(1, 1920, 1, guest_name, guest_score, host_name, host_score, False)
+
+
+@pytest.fixture()
+def test_service():
+    return SeasonStandingsService(Mock())
+
+
+def _arrange_snapshot(test_service, team_seasons, games, version=1):
+    snapshot = test_service.season_snapshot_repository.get_season_snapshot.return_value
+    snapshot.season_year = 1920
+    snapshot.version = version
+    snapshot.get_team_seasons.return_value = team_seasons
+    snapshot.get_games.return_value = games
+    return snapshot
+
+
+def test_get_season_standings_when_season_year_is_none_should_raise_value_error(test_service):
+    # Act
+    with pytest.raises(ValueError):
+        test_service.get_season_standings(None)
+
+
+def test_get_season_standings_should_order_by_winning_percentage(test_service):
+    # Arrange
+    _arrange_snapshot(test_service, [_team_season("Bears"), _team_season("Packers")], [
+        _game("Packers", 0, "Bears", 7),
+    ])
+
+    # Act
+    result = test_service.get_season_standings(1920)
+
+    # Assert
+    assert [(standing.team_name, standing.wins, standing.losses) for standing in result] == [
+        ("Bears", 1, 0), ("Packers", 0, 1)
+    ]
+    assert result[0].avg_points_for == 7.0
+    assert result[0].tiebreaker is None
+
+
+def test_get_season_standings_when_version_unchanged_should_return_cached_standings(test_service):
+    # Arrange
+    snapshot = _arrange_snapshot(test_service, [_team_season("Bears")], [])
+    first = test_service.get_season_standings(1920)
+
+    # Act
+    second = test_service.get_season_standings(1920)
+
+    # Assert
+    assert second is first
+    snapshot.get_games.assert_called_once()
+
+
+def test_get_season_standings_when_version_changed_should_rebuild_standings(test_service):
+    # Arrange
+    snapshot = _arrange_snapshot(test_service, [_team_season("Bears")], [])
+    first = test_service.get_season_standings(1920)
+    snapshot.version = 2
+
+    # Act
+    second = test_service.get_season_standings(1920)
+
+    # Assert
+    assert second is not first
+    assert snapshot.get_games.call_count == 2
+
+
+@patch('app.services.season_standings_service.season_standings_service.tiebreaker_tables_cache_counters')
+@patch('app.services.season_standings_service.season_standings_service.standings_cache_counters')
+def test_get_season_standings_should_count_hits_and_misses_of_standings_and_tiebreaker_tables(
+        fake_standings_counters, fake_tables_counters, test_service
+):
+    # Arrange
+    _arrange_snapshot(test_service, [_team_season("Bears")], [])
+
+    # Act
+    test_service.get_season_standings(1920)
+    test_service.get_season_standings(1920)
+    test_service.get_season_standings(1920, group_by_division=True)
+
+    # Assert
+    assert fake_standings_counters.method_calls == [call.miss(), call.hit(), call.miss()]
+    assert fake_tables_counters.method_calls == [call.miss(), call.hit()]
+
+
+def test_get_season_standings_when_grouped_should_share_tiebreaker_tables(test_service):
+    # Arrange
+    snapshot = _arrange_snapshot(test_service, [
+        _team_season("Bears", "North"), _team_season("Cardinals", "East"), _team_season("Packers", "North"),
+    ], [_game("Packers", 0, "Bears", 7), _game("Cardinals", 7, "Bears", 0)])
+
+    # Act
+    overall = test_service.get_season_standings(1920)
+    grouped = test_service.get_season_standings(1920, group_by_division=True)
+
+    # Assert
+    snapshot.get_games.assert_called_once()
+    assert [standing.team_name for standing in overall] == ["Cardinals", "Bears", "Packers"]
+    assert [standing.team_name for standing in grouped] == ["Cardinals", "Bears", "Packers"]
+    assert [standing.division_name for standing in grouped] == ["East", "North", "North"]
+
+
+def test_order_teams_when_three_teams_even_should_restart_tiebreakers_for_remaining_teams():
+    # Arrange
+    tables = TiebreakerTables([], [
+        _game("Packers", 0, "Bears", 7), _game("Lions", 7, "Bears", 0), _game("Packers", 7, "Lions", 0),
+    ])
+
+    # Act
+    result = order_teams(tables, ["Bears", "Packers", "Lions"])
+
+    # Assert
+    assert result == [("Bears", TEAM_NAME_TIEBREAKER), ("Packers", "head-to-head"), ("Lions", None)]
+
+
+def test_order_teams_should_place_better_record_ahead_without_tiebreaker():
+    # Arrange
+    tables = TiebreakerTables([], [_game("Packers", 0, "Bears", 7), _game("Lions", 0, "Bears", 7)])
+
+    # Act
+    result = order_teams(tables, ["Lions", "Packers", "Bears"])
+
+    # Assert
+    assert result[0] == ("Bears", None)
+
+
+def test_break_tie_should_use_head_to_head_when_teams_played():
+    # Arrange
+    tables = TiebreakerTables([], [
+        _game("Packers", 7, "Bears", 0), _game("Bears", 7, "Lions", 0), _game("Lions", 7, "Packers", 0),
+    ])
+
+    # Act
+    result = break_tie(tables, ["Bears", "Packers"])
+
+    # Assert
+    assert result == [("Packers", "head-to-head"), ("Bears", None)]
+
+
+def test_break_tie_should_use_division_record_when_head_to_head_does_not_apply():
+    # Arrange
+    tables = TiebreakerTables(
+        [_team_season("Bears", "North"), _team_season("Packers", "North"), _team_season("Lions", "North"),
+         _team_season("Cardinals", "East")],
+        [_game("Lions", 0, "Packers", 7), _game("Cardinals", 7, "Packers", 0), _game("Lions", 7, "Bears", 0),
+         _game("Bears", 7, "Cardinals", 0)]
+    )
+
+    # Act
+    result = break_tie(tables, ["Bears", "Packers"])
+
+    # Assert
+    assert result == [("Packers", "division record"), ("Bears", None)]
+
+
+def test_break_tie_should_use_common_games_when_division_does_not_apply():
+    # Arrange
+    tables = TiebreakerTables([], [
+        _game("Lions", 0, "Packers", 7), _game("Lions", 7, "Bears", 7), _game("Cardinals", 7, "Packers", 0),
+        _game("Giants", 0, "Bears", 0),
+    ])
+
+    # Act
+    result = break_tie(tables, ["Bears", "Packers"])
+
+    # Assert
+    assert result == [("Packers", "common games"), ("Bears", None)]
+
+
+def test_break_tie_should_fall_back_to_team_name_when_every_tiebreaker_is_even():
+    # Arrange
+    tables = TiebreakerTables([], [_game("Packers", 7, "Bears", 7)])
+
+    # Act
+    result = break_tie(tables, ["Packers", "Bears"])
+
+    # Assert
+    assert result == [("Bears", TEAM_NAME_TIEBREAKER), ("Packers", None)]
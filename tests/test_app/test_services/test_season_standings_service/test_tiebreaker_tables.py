@@ -0,0 +1,98 @@
+from types import SimpleNamespace
+
+from app.data.models.season_snapshot import GameRecord
+from app.services.season_standings_service.tiebreaker_tables import TiebreakerTables, get_winning_percentage
+
+
+def _team_season(team_name, division_name=None):
+    return SimpleNamespace(team_name=team_name, division_name=division_name)
+
+
+def _game(guest_name, guest_score, host_name, host_score, is_playoff=False):
+    return GameRecord(1, 1920, 1, guest_name, guest_score, host_name, host_score, is_playoff)
+
+
+def test_get_winning_percentage_should_count_ties_as_half_win():
+    # Act
+    result = get_winning_percentage([1, 1, 2])
+
+    # Assert
+    assert result == 0.5
+
+
+def test_get_winning_percentage_when_no_games_should_return_zero():
+    # Act
+    result = get_winning_percentage([0, 0, 0])
+
+    # Assert
+    assert result == 0.0
+
+
+def test_init_should_fill_records_points_and_head_to_head_in_one_pass():
+    # Act
+    tables = TiebreakerTables(
+        [_team_season("Bears", "North"), _team_season("Packers", "North"), _team_season("Cardinals", "South")],
+        [_game("Packers", 0, "Bears", 7), _game("Bears", 3, "Cardinals", 3), _game("Cardinals", 7, "Packers", 14)]
+    )
+
+    # Assert
+    assert tables.records == {"Bears": [1, 0, 1], "Packers": [1, 1, 0], "Cardinals": [0, 1, 1]}
+    assert tables.points["Bears"] == [10, 3]
+    assert tables.head_to_head["Bears"] == {"Packers": [1, 0, 0], "Cardinals": [0, 0, 1]}
+    assert tables.division_records == {"Bears": [1, 0, 0], "Packers": [0, 1, 0], "Cardinals": [0, 0, 0]}
+    assert tables.defeated == {"Bears": ["Packers"], "Packers": ["Cardinals"]}
+
+
+def test_init_should_leave_out_playoff_games():
+    # Act
+    tables = TiebreakerTables([_team_season("Bears")], [_game("Packers", 0, "Bears", 7, is_playoff=True)])
+
+    # Assert
+    assert tables.records == {"Bears": [0, 0, 0]}
+    assert not tables.head_to_head
+
+
+def test_init_should_add_teams_without_team_season_from_games():
+    # Act
+    tables = TiebreakerTables([], [_game("Packers", 0, "Bears", 7)])
+
+    # Assert
+    assert tables.records == {"Packers": [0, 1, 0], "Bears": [1, 0, 0]}
+    assert tables.divisions == {"Packers": None, "Bears": None}
+
+
+def test_strengths_of_victory_should_be_combined_winning_percentage_of_defeated_opponents():
+    # Act
+    tables = TiebreakerTables([], [
+        _game("Packers", 0, "Bears", 7), _game("Lions", 0, "Bears", 7), _game("Lions", 0, "Packers", 7),
+    ])
+
+    # Assert
+    assert tables.strengths_of_victory == {"Packers": 0.0, "Bears": 0.25, "Lions": 0.0}
+
+
+def test_get_head_to_head_record_should_sum_records_against_opponents():
+    # Arrange
+    tables = TiebreakerTables([], [
+        _game("Packers", 0, "Bears", 7), _game("Bears", 0, "Packers", 7), _game("Lions", 0, "Bears", 7),
+    ])
+
+    # Act
+    result = tables.get_head_to_head_record("Bears", ["Packers", "Lions", "Cardinals"])
+
+    # Assert
+    assert result == [2, 1, 0]
+
+
+def test_get_common_opponents_should_exclude_teams_of_group():
+    # Arrange
+    tables = TiebreakerTables([], [
+        _game("Packers", 0, "Bears", 7), _game("Lions", 0, "Bears", 7), _game("Lions", 0, "Packers", 7),
+        _game("Cardinals", 0, "Bears", 7),
+    ])
+
+    # Act
+    result = tables.get_common_opponents(["Bears", "Packers"])
+
+    # Assert
+    assert result == ["Lions"]
@@ -0,0 +1,109 @@
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from app.data.models.season_snapshot import SeasonSnapshot, TeamSeasonRecord
+from app.services.simple_rating_service.simple_rating_service import SimpleRatingService, solve_simple_ratings
+
+
+def _build_snapshot(team_names, games):
+    team_season_rows = []
+    for id, team_name in enumerate(team_names, start=1):
+        row = {field: None for field in TeamSeasonRecord._fields}
+        row.update(id=id, team_name=team_name, season_year=1)
+        team_season_rows.append(SimpleNamespace(**row))
+    game_rows = [
+        SimpleNamespace(id=id, season_year=1, week=1, guest_name=guest_name, guest_score=guest_score,
+                        host_name=host_name, host_score=host_score, is_playoff=False, notes=None, elo_delta=None)
+        for id, (guest_name, guest_score, host_name, host_score) in enumerate(games, start=1)
+    ]
+    return SeasonSnapshot.build(1, 0, team_season_rows, game_rows)
+
+
+def test_solve_simple_ratings_should_adjust_margins_for_opponents_opponents():
+    # Arrange
+    snapshot = _build_snapshot(["A", "B", "C"], [("B", 0, "A", 10), ("C", 0, "B", 10), ("C", 0, "A", 20)])
+
+    # Act
+    ratings = solve_simple_ratings(snapshot)
+
+    # Assert
+    np.testing.assert_allclose(ratings, [10.0, 0.0, -10.0], atol=1e-9)
+
+
+def test_solve_simple_ratings_when_games_are_tied_should_rate_teams_equally():
+    # Arrange
+    snapshot = _build_snapshot(["A", "B"], [("A", 7, "B", 7), ("B", 3, "A", 3)])
+
+    # Act
+    ratings = solve_simple_ratings(snapshot)
+
+    # Assert
+    np.testing.assert_allclose(ratings, [0.0, 0.0], atol=1e-9)
+
+
+def test_solve_simple_ratings_when_leagues_are_disconnected_should_center_each_league_on_zero():
+    # Arrange
+    snapshot = _build_snapshot(
+        ["A", "B", "C", "D", "E"],
+        [("B", 0, "A", 10), ("D", 3, "C", 27), ("C", 17, "D", 14)]
+    )
+
+    # Act
+    ratings = solve_simple_ratings(snapshot)
+
+    # Assert
+    np.testing.assert_allclose(ratings, [5.0, -5.0, 6.75, -6.75, 0.0], atol=1e-9)
+
+
+def test_solve_simple_ratings_when_season_has_no_games_should_rate_every_team_zero():
+    # Act
+    ratings = solve_simple_ratings(_build_snapshot(["A", "B"], []))
+
+    # Assert
+    np.testing.assert_array_equal(ratings, [0.0, 0.0])
+
+
+def test_update_simple_ratings_should_save_rating_of_each_team_season_by_id():
+    # Arrange
+    season_snapshot_repository = Mock()
+    season_snapshot_repository.get_season_snapshot.return_value = _build_snapshot(
+        ["A", "B"], [("B", 0, "A", 10), ("Visitor", 3, "A", 0)]
+    )
+    team_season_repository = Mock()
+    team_season_repository.update_simple_ratings.return_value = 2
+    test_service = SimpleRatingService(season_snapshot_repository, team_season_repository)
+
+    # Act
+    result = test_service.update_simple_ratings(1)
+
+    # Assert
+    assert result == 2
+    season_year, simple_ratings = team_season_repository.update_simple_ratings.call_args.args
+    assert season_year == 1
+    assert set(simple_ratings) == {1, 2}
+    assert all(isinstance(rating, Decimal) for rating in simple_ratings.values())
+
+
+def test_update_simple_ratings_when_season_has_no_games_should_not_save_anything():
+    # Arrange
+    season_snapshot_repository = Mock()
+    season_snapshot_repository.get_season_snapshot.return_value = _build_snapshot(["A"], [])
+    team_season_repository = Mock()
+    test_service = SimpleRatingService(season_snapshot_repository, team_season_repository)
+
+    # Act
+    result = test_service.update_simple_ratings(1)
+
+    # Assert
+    assert result == 0
+    team_season_repository.update_simple_ratings.assert_not_called()
+
+
+def test_update_simple_ratings_when_season_year_is_none_should_raise_value_error():
+    # Act and Assert
+    with pytest.raises(ValueError):
+        SimpleRatingService(Mock(), Mock()).update_simple_ratings(None)
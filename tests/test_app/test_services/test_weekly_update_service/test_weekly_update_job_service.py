@@ -0,0 +1,48 @@
+from unittest.mock import Mock
+
+import pytest
+
+from app.services.job_service.job_service import JobProgress, JobService
+from app.services.weekly_update_service.weekly_update_job_service import WeeklyUpdateJobService, \
+    WEEKLY_UPDATE_JOB_KIND
+from app.services.weekly_update_service.weekly_update_report import WeeklyUpdateReport
+from app.services.weekly_update_service.weekly_update_service import WeeklyUpdateService
+
+
+@pytest.fixture()
+def test_service():
+    return WeeklyUpdateJobService(Mock(JobService), Mock(WeeklyUpdateService))
+
+
+def test_enqueue_weekly_update_when_league_name_is_none_should_raise_value_error(test_service):
+    # Act and Assert
+    with pytest.raises(ValueError):
+        test_service.enqueue_weekly_update(None, 1920)
+
+
+def test_enqueue_weekly_update_should_enqueue_job_keyed_by_league_season(test_service):
+    # Act
+    result = test_service.enqueue_weekly_update("NFL", 1920)
+
+    # Assert
+    args, kwargs = test_service.job_service.enqueue.call_args
+    assert args[:2] == (WEEKLY_UPDATE_JOB_KIND, "NFL:1920")
+    assert kwargs == {'phase_count': len(WeeklyUpdateService.PHASES)}
+    assert result is test_service.job_service.enqueue.return_value
+
+
+def test_enqueue_weekly_update_task_should_run_weekly_update_and_report_phases(test_service):
+    # Arrange
+    test_service.weekly_update_service.run_weekly_update.return_value = WeeklyUpdateReport("NFL", 1920, rows_touched=9)
+    test_service.enqueue_weekly_update("NFL", 1920)
+    task = test_service.job_service.enqueue.call_args.args[2]
+    progress = Mock(JobProgress)
+
+    # Act
+    result = task(progress)
+
+    # Assert
+    test_service.weekly_update_service.run_weekly_update.assert_called_once_with(
+        "NFL", 1920, on_phase_completed=progress.phase_completed
+    )
+    assert result == {'rows_touched': 9}
@@ -0,0 +1,117 @@
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.services.weekly_update_service.weekly_update_report import WeeklyUpdateReport
+from app.services.weekly_update_service.weekly_update_runner import WeeklyUpdateRunner
+from app.services.weekly_update_service.weekly_update_service import WeeklyUpdateService
+
+
+@pytest.fixture()
+def fake_app():
+    return MagicMock()
+
+
+@pytest.fixture()
+def fake_weekly_update_service():
+    fake_service = Mock(WeeklyUpdateService)
+    fake_service.run_weekly_update.side_effect = \
+        lambda league_name, season_year, **kwargs: WeeklyUpdateReport(league_name, season_year, rows_touched=3)
+    return fake_service
+
+
+def _operational_error():
+    return OperationalError('statement', 'params', Exception('deadlock'))
+
+
+def test_init_when_max_workers_is_less_than_one_should_raise_value_error(fake_app, fake_weekly_update_service):
+    # Act and Assert
+    with pytest.raises(ValueError):
+        WeeklyUpdateRunner(fake_app, fake_weekly_update_service, max_workers=0)
+
+
+def test_init_when_retries_is_negative_should_raise_value_error(fake_app, fake_weekly_update_service):
+    # Act and Assert
+    with pytest.raises(ValueError):
+        WeeklyUpdateRunner(fake_app, fake_weekly_update_service, retries=-1)
+
+
+@patch('app.services.weekly_update_service.weekly_update_runner.sqla')
+def test_run_should_update_every_league_season_in_order(fake_sqla, fake_app, fake_weekly_update_service):
+    # Arrange
+    test_runner = WeeklyUpdateRunner(fake_app, fake_weekly_update_service, max_workers=2)
+
+    # Act
+    reports = test_runner.run(["NFL", "AFL", "NFL"], [1961, 1960, 1961])
+
+    # Assert
+    assert [(report.league_name, report.season_year) for report in reports] == [
+        ("NFL", 1960), ("AFL", 1960), ("NFL", 1961), ("AFL", 1961),
+    ]
+    assert all(report.succeeded for report in reports)
+    assert all(report.attempts == 1 for report in reports)
+    assert all(report.rows_touched == 3 for report in reports)
+    assert fake_app.app_context.call_count == 2
+
+
+@patch('app.services.weekly_update_service.weekly_update_runner.sqla')
+def test_run_when_update_fails_with_database_error_should_retry(fake_sqla, fake_app, fake_weekly_update_service):
+    # Arrange
+    fake_weekly_update_service.run_weekly_update.side_effect = [
+        _operational_error(), WeeklyUpdateReport("NFL", 1960, rows_touched=5)
+    ]
+    test_runner = WeeklyUpdateRunner(fake_app, fake_weekly_update_service, retries=1)
+
+    # Act
+    reports = test_runner.run(["NFL"], [1960])
+
+    # Assert
+    assert len(reports) == 1
+    assert reports[0].succeeded
+    assert reports[0].attempts == 2
+    assert reports[0].rows_touched == 5
+    fake_sqla.session.rollback.assert_called_once()
+
+
+@patch('app.services.weekly_update_service.weekly_update_runner.sqla')
+def test_run_when_retries_are_exhausted_should_report_error(fake_sqla, fake_app, fake_weekly_update_service):
+    # Arrange
+    fake_weekly_update_service.run_weekly_update.side_effect = _operational_error()
+    test_runner = WeeklyUpdateRunner(fake_app, fake_weekly_update_service, retries=2)
+
+    # Act
+    reports = test_runner.run(["NFL"], [1960])
+
+    # Assert
+    assert not reports[0].succeeded
+    assert reports[0].attempts == 3
+    assert 'deadlock' in reports[0].error
+
+
+@patch('app.services.weekly_update_service.weekly_update_runner.sqla')
+def test_run_when_update_fails_with_other_error_should_not_retry(fake_sqla, fake_app, fake_weekly_update_service):
+    # Arrange
+    fake_weekly_update_service.run_weekly_update.side_effect = ValueError('league_name')
+    test_runner = WeeklyUpdateRunner(fake_app, fake_weekly_update_service, retries=2)
+
+    # Act
+    reports = test_runner.run(["NFL"], [1960])
+
+    # Assert
+    assert not reports[0].succeeded
+    assert reports[0].attempts == 1
+
+
+@patch('app.services.weekly_update_service.weekly_update_runner.sqla')
+def test_run_should_pass_verify_league_season_totals_to_each_update(fake_sqla, fake_app, fake_weekly_update_service):
+    # Arrange
+    test_runner = WeeklyUpdateRunner(fake_app, fake_weekly_update_service, verify_league_season_totals=True)
+
+    # Act
+    test_runner.run(["NFL"], [1960])
+
+    # Assert
+    fake_weekly_update_service.run_weekly_update.assert_called_once_with(
+        "NFL", 1960, verify_league_season_totals=True
+    )
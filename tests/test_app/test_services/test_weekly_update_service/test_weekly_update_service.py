@@ -12,10 +12,12 @@ from app.data.models.team_season import TeamSeason
 from app.data.models.team_season_schedule_averages import TeamSeasonScheduleAverages
 from app.data.models.team_season_schedule_totals import TeamSeasonScheduleTotals
 
+from app.services.event_bus.season_events import RankingsUpdated
 from app.services.weekly_update_service.weekly_update_service import WeeklyUpdateService
 
 
 @pytest.fixture()
+@patch('app.services.weekly_update_service.weekly_update_service.SimpleRatingService')
 @patch('app.services.weekly_update_service.weekly_update_service.TeamSeasonScheduleRepository')
 @patch('app.services.weekly_update_service.weekly_update_service.LeagueSeasonTotalsRepository')
 @patch('app.services.weekly_update_service.weekly_update_service.TeamSeasonRepository')
@@ -24,15 +26,18 @@ from app.services.weekly_update_service.weekly_update_service import WeeklyUpdat
 @patch('app.services.weekly_update_service.weekly_update_service.SeasonRepository')
 def test_service(
         fake_season_repository, fake_game_repository, fake_league_season_repository, fake_team_season_repository,
-        fake_league_season_totals_repository, fake_team_season_schedule_repository
+        fake_league_season_totals_repository, fake_team_season_schedule_repository, fake_simple_rating_service
 ):
+    fake_simple_rating_service.update_simple_ratings.return_value = 0
     test_service = WeeklyUpdateService(
         fake_season_repository,
         fake_game_repository,
         fake_league_season_repository,
         fake_team_season_repository,
         fake_league_season_totals_repository,
-        fake_team_season_schedule_repository
+        fake_team_season_schedule_repository,
+        fake_simple_rating_service,
+        Mock()
     )
     return test_service
 
@@ -52,7 +57,7 @@ def test_run_weekly_update_when_league_season_totals_is_none_and_games_is_none_s
     season_year = 1
 
     # Act
-    test_service.run_weekly_update(league_name, season_year)
+    test_service.run_weekly_update(league_name, season_year, verify_league_season_totals=True)
 
     # Assert
     test_service.league_season_totals_repository.get_league_season_totals.assert_any_call(league_name, season_year)
@@ -85,7 +90,7 @@ def test_run_weekly_update_when_league_season_totals_total_games_is_none_and_gam
     season_year = 1
 
     # Act
-    test_service.run_weekly_update(league_name, season_year)
+    test_service.run_weekly_update(league_name, season_year, verify_league_season_totals=True)
 
     # Assert
     test_service.league_season_totals_repository.get_league_season_totals.assert_any_call(league_name, season_year)
@@ -118,7 +123,7 @@ def test_run_weekly_update_when_league_season_totals_total_points_is_none_and_ga
     season_year = 1
 
     # Act
-    test_service.run_weekly_update(league_name, season_year)
+    test_service.run_weekly_update(league_name, season_year, verify_league_season_totals=True)
 
     # Assert
     test_service.league_season_totals_repository.get_league_season_totals.assert_any_call(league_name, season_year)
@@ -149,7 +154,7 @@ def test_run_weekly_update_when_league_season_is_none_and_games_is_none_should_n
     season_year = 1
 
     # Act
-    test_service.run_weekly_update(league_name, season_year)
+    test_service.run_weekly_update(league_name, season_year, verify_league_season_totals=True)
 
     # Assert
     test_service.league_season_totals_repository.get_league_season_totals.assert_any_call(league_name, season_year)
@@ -186,7 +191,7 @@ def test_run_weekly_update_when_league_season_totals_and_league_season_are_not_n
     season_year = 1
 
     # Act
-    test_service.run_weekly_update(league_name, season_year)
+    test_service.run_weekly_update(league_name, season_year, verify_league_season_totals=True)
 
     # Assert
     test_service.league_season_totals_repository.get_league_season_totals.assert_any_call(league_name, season_year)
@@ -223,7 +228,7 @@ def test_run_weekly_update_when_games_is_none_should_not_update_week_count(test_
     season_year = 1
 
     # Act
-    test_service.run_weekly_update(league_name, season_year)
+    test_service.run_weekly_update(league_name, season_year, verify_league_season_totals=True)
 
     # Assert
     test_service.league_season_totals_repository.get_league_season_totals.assert_any_call(league_name, season_year)
@@ -260,7 +265,7 @@ def test_run_weekly_update_when_games_is_empty_should_not_update_week_count(test
     season_year = 1
 
     # Act
-    test_service.run_weekly_update(league_name, season_year)
+    test_service.run_weekly_update(league_name, season_year, verify_league_season_totals=True)
 
     # Assert
     test_service.league_season_totals_repository.get_league_season_totals.assert_any_call(league_name, season_year)
@@ -301,7 +306,7 @@ def test_run_weekly_update_when_games_has_no_games_for_specified_year_should_not
     league_name = "L"
 
     # Act
-    test_service.run_weekly_update(league_name, season_year)
+    test_service.run_weekly_update(league_name, season_year, verify_league_season_totals=True)
 
     # Assert
     test_service.league_season_totals_repository.get_league_season_totals.assert_any_call(league_name, season_year)
@@ -349,7 +354,7 @@ def test_run_weekly_update_when_games_has_games_for_specified_year_and_season_fo
     league_name = "L"
 
     # Act
-    test_service.run_weekly_update(league_name, season_year)
+    test_service.run_weekly_update(league_name, season_year, verify_league_season_totals=True)
 
     # Assert
     test_service.league_season_totals_repository.get_league_season_totals.assert_any_call(league_name, season_year)
@@ -399,7 +404,7 @@ def test_run_weekly_update_when_games_has_games_for_specified_year_and_season_fo
     league_name = "L"
 
     # Act
-    test_service.run_weekly_update(league_name, season_year)
+    test_service.run_weekly_update(league_name, season_year, verify_league_season_totals=True)
 
     # Assert
     test_service.league_season_totals_repository.get_league_season_totals.assert_any_call(league_name, season_year)
@@ -445,7 +450,7 @@ def test_run_weekly_update_when_week_count_is_less_than_three_should_not_update_
     league_name = "L"
 
     # Act
-    test_service.run_weekly_update(league_name, season_year)
+    test_service.run_weekly_update(league_name, season_year, verify_league_season_totals=True)
 
     # Assert
     test_service.league_season_totals_repository.get_league_season_totals.assert_any_call(league_name, season_year)
@@ -492,7 +497,7 @@ def test_run_weekly_update_when_week_count_is_three_should_update_rankings(test_
     league_name = "L"
 
     # Act
-    test_service.run_weekly_update(league_name, season_year)
+    test_service.run_weekly_update(league_name, season_year, verify_league_season_totals=True)
 
     # Assert
     test_service.league_season_totals_repository.get_league_season_totals.assert_any_call(league_name, season_year)
@@ -539,7 +544,7 @@ def test_run_weekly_update_when_week_count_is_greater_than_three_should_update_r
     league_name = "L"
 
     # Act
-    test_service.run_weekly_update(league_name, season_year)
+    test_service.run_weekly_update(league_name, season_year, verify_league_season_totals=True)
 
     # Assert
     test_service.league_season_totals_repository.get_league_season_totals.assert_any_call(league_name, season_year)
@@ -588,7 +593,7 @@ def test_run_weekly_update_when_week_count_is_greater_than_three_and_team_season
     league_name = "L"
 
     # Act
-    test_service.run_weekly_update(league_name, season_year)
+    test_service.run_weekly_update(league_name, season_year, verify_league_season_totals=True)
 
     # Assert
     test_service.league_season_totals_repository.get_league_season_totals.assert_any_call(league_name, season_year)
@@ -636,7 +641,7 @@ def test_run_weekly_update_when_week_count_is_greater_than_three_and_team_season
     league_name = "L"
 
     # Act
-    test_service.run_weekly_update(league_name, season_year)
+    test_service.run_weekly_update(league_name, season_year, verify_league_season_totals=True)
 
     # Assert
     test_service.league_season_totals_repository.get_league_season_totals.assert_any_call(league_name, season_year)
@@ -689,7 +694,7 @@ def test_run_weekly_update_when_week_count_is_greater_than_three_and_team_season
     league_name = "L"
 
     # Act
-    test_service.run_weekly_update(league_name, season_year)
+    test_service.run_weekly_update(league_name, season_year, verify_league_season_totals=True)
 
     # Assert
     test_service.league_season_totals_repository.get_league_season_totals.assert_any_call(league_name, season_year)
@@ -746,7 +751,7 @@ def test_run_weekly_update_when_week_count_is_greater_than_three_and_team_season
     league_name = "L"
 
     # Act
-    test_service.run_weekly_update(league_name, season_year)
+    test_service.run_weekly_update(league_name, season_year, verify_league_season_totals=True)
 
     # Assert
     test_service.league_season_totals_repository.get_league_season_totals.assert_any_call(league_name, season_year)
@@ -805,7 +810,7 @@ def test_run_weekly_update_when_week_count_is_greater_than_three_and_team_season
     league_name = "L"
 
     # Act
-    test_service.run_weekly_update(league_name, season_year)
+    test_service.run_weekly_update(league_name, season_year, verify_league_season_totals=True)
 
     # Assert
     test_service.league_season_totals_repository.get_league_season_totals.assert_any_call(league_name, season_year)
@@ -868,7 +873,7 @@ def test_run_weekly_update_when_week_count_is_greater_than_three_and_team_season
     league_name = "L"
 
     # Act
-    test_service.run_weekly_update(league_name, season_year)
+    test_service.run_weekly_update(league_name, season_year, verify_league_season_totals=True)
 
     # Assert
     test_service.league_season_totals_repository.get_league_season_totals.assert_any_call(league_name, season_year)
@@ -931,7 +936,7 @@ def test_run_weekly_update_when_week_count_is_greater_than_three_and_team_season
     league_name = "L"
 
     # Act
-    test_service.run_weekly_update(league_name, season_year)
+    test_service.run_weekly_update(league_name, season_year, verify_league_season_totals=True)
 
     # Assert
     test_service.league_season_totals_repository.get_league_season_totals.assert_any_call(league_name, season_year)
@@ -997,7 +1002,7 @@ def test_run_weekly_update_when_week_count_is_greater_than_three_and_team_season
         = team_season_schedule_averages
 
     # Act
-    test_service.run_weekly_update(league_name, season_year)
+    test_service.run_weekly_update(league_name, season_year, verify_league_season_totals=True)
 
     # Assert
     test_service.league_season_totals_repository.get_league_season_totals.assert_any_call(league_name, season_year)
@@ -1063,7 +1068,7 @@ def test_run_weekly_update_when_week_count_is_greater_than_three_and_team_season
         = team_season_schedule_averages
 
     # Act
-    test_service.run_weekly_update(league_name, season_year)
+    test_service.run_weekly_update(league_name, season_year, verify_league_season_totals=True)
 
     # Assert
     test_service.league_season_totals_repository.get_league_season_totals.assert_any_call(league_name, season_year)
@@ -1129,7 +1134,7 @@ def test_run_weekly_update_when_week_count_is_greater_than_three_and_team_season
         = team_season_schedule_averages
 
     # Act
-    test_service.run_weekly_update(league_name, season_year)
+    test_service.run_weekly_update(league_name, season_year, verify_league_season_totals=True)
 
     # Assert
     test_service.league_season_totals_repository.get_league_season_totals.assert_any_call(league_name, season_year)
@@ -1158,3 +1163,189 @@ def test_run_weekly_update_when_week_count_is_greater_than_three_and_team_season
         league_season.average_points
     )
     test_service.team_season_repository.update_team_season.assert_any_call(fake_team_season)
+
+
+def test_run_weekly_update_when_nothing_is_updated_should_return_report_with_no_rows_touched(test_service):
+    # Arrange
+    test_service.league_season_totals_repository.get_league_season_totals.return_value = None
+    test_service.game_repository.get_games.return_value = []
+
+    league_name = "L"
+    season_year = 1
+
+    # Act
+    report = test_service.run_weekly_update(league_name, season_year, verify_league_season_totals=True)
+
+    # Assert
+    assert report.league_name == league_name
+    assert report.season_year == season_year
+    assert report.rows_touched == 0
+
+
+def test_run_weekly_update_when_league_season_and_season_are_updated_should_count_rows_touched(test_service):
+    # Arrange
+    league_season_totals = LeagueSeasonTotals(total_games=1, total_points=2)
+    test_service.league_season_totals_repository.get_league_season_totals.return_value = league_season_totals
+
+    fake_league_season = Mock()
+    test_service.league_season_repository.get_league_season_by_league_name_and_season_year.return_value = \
+        fake_league_season
+
+    season_year = 1
+    fake_game = Mock(season_year=season_year, week=1)
+    test_service.game_repository.get_games.return_value = [fake_game]
+    test_service.season_repository.get_season_by_year.return_value = Mock()
+
+    # Act
+    report = test_service.run_weekly_update("L", season_year, verify_league_season_totals=True)
+
+    # Assert
+    assert report.rows_touched == 2
+
+
+def test_run_weekly_update_should_report_each_phase_duration(test_service):
+    # Arrange
+    test_service.league_season_totals_repository.get_league_season_totals.return_value = None
+    test_service.game_repository.get_games.return_value = []
+    on_phase_completed = Mock()
+
+    # Act
+    report = test_service.run_weekly_update("L", 1, on_phase_completed=on_phase_completed)
+
+    # Assert
+    assert [c.args[0] for c in on_phase_completed.call_args_list] == list(WeeklyUpdateService.PHASES)
+    assert list(report.phase_durations) == list(WeeklyUpdateService.PHASES)
+    assert all(duration >= 0 for duration in report.phase_durations.values())
+
+
+def test_run_weekly_update_should_update_simple_ratings_of_season(test_service):
+    # Arrange
+    test_service.league_season_totals_repository.get_league_season_totals.return_value = None
+    test_service.game_repository.get_games.return_value = []
+    test_service.simple_rating_service.update_simple_ratings.return_value = 14
+
+    # Act
+    report = test_service.run_weekly_update("NFL", 1920)
+
+    # Assert
+    test_service.simple_rating_service.update_simple_ratings.assert_called_once_with(1920)
+    assert report.rows_touched == 14
+
+
+def test_run_weekly_update_when_not_verifying_league_season_totals_should_not_aggregate_them(test_service):
+    # Arrange
+    test_service.game_repository.get_games.return_value = []
+
+    # Act
+    report = test_service.run_weekly_update("NFL", 1920)
+
+    # Assert
+    test_service.league_season_totals_repository.get_league_season_totals.assert_not_called()
+    test_service.league_season_repository.update_league_season.assert_not_called()
+    assert not report.league_season_totals_verified
+
+
+def test_run_weekly_update_when_maintained_league_season_totals_match_should_not_update_league_season(test_service):
+    # Arrange
+    test_service.league_season_totals_repository.get_league_season_totals.return_value = \
+        LeagueSeasonTotals(total_games=10, total_points=150)
+    test_service.league_season_repository.get_league_season_by_league_name_and_season_year.return_value = \
+        Mock(total_games=10, total_points=150)
+    test_service.game_repository.get_games.return_value = []
+
+    # Act
+    report = test_service.run_weekly_update("NFL", 1920, verify_league_season_totals=True)
+
+    # Assert
+    test_service.league_season_repository.update_league_season.assert_not_called()
+    assert report.league_season_totals_verified
+    assert report.league_season_totals_mismatch is None
+
+
+def test_run_weekly_update_when_maintained_league_season_totals_differ_should_correct_and_report_them(test_service):
+    # Arrange
+    test_service.league_season_totals_repository.get_league_season_totals.return_value = \
+        LeagueSeasonTotals(total_games=12, total_points=170)
+    league_season = Mock(total_games=10, total_points=150)
+    test_service.league_season_repository.get_league_season_by_league_name_and_season_year.return_value = \
+        league_season
+    test_service.game_repository.get_games.return_value = []
+
+    # Act
+    report = test_service.run_weekly_update("NFL", 1920, verify_league_season_totals=True)
+
+    # Assert
+    league_season.update_games_and_points.assert_called_once_with(12, 170)
+    test_service.league_season_repository.update_league_season.assert_called_once_with(league_season)
+    assert report.league_season_totals_mismatch == (
+        "maintained 10 games and 150 points; aggregated 12 games and 170 points"
+    )
+
+
+def _arrange_rankings_inputs(test_service, team_seasons):
+    test_service.game_repository.get_games.return_value = [Mock(season_year=1920, week=3)]
+    test_service.team_season_repository.get_team_seasons_by_season_year.return_value = team_seasons
+    test_service.team_season_schedule_repository.get_team_season_schedule_totals.return_value = Mock(schedule_games=3)
+    test_service.team_season_schedule_repository.get_team_season_schedule_averages.return_value = Mock(
+        points_for=Decimal('20.5'), points_against=Decimal('21.25')
+    )
+    test_service.league_season_repository.get_league_season_by_league_name_and_season_year.return_value = Mock(
+        average_points=Decimal('20.75')
+    )
+
+
+@pytest.mark.parametrize('configured_mode, explicit_mode, expected_mode', [
+    (None, None, 'decimal'),
+    ('float', None, 'float'),
+    ('float', 'decimal', 'decimal'),
+])
+def test_run_weekly_update_should_update_rankings_in_selected_numeric_mode(
+        test_service, configured_mode, explicit_mode, expected_mode
+):
+    # Arrange
+    from flask import Flask
+
+    team_season = Mock()
+    _arrange_rankings_inputs(test_service, [team_season])
+    app = Flask(__name__)
+    if configured_mode is not None:
+        app.config['RANKINGS_NUMERIC_MODE'] = configured_mode
+
+    # Act
+    with app.app_context():
+        test_service.run_weekly_update("NFL", 1920, numeric_mode=explicit_mode)
+
+    # Assert
+    team_season.update_rankings.assert_called_once_with(
+        Decimal('20.5'), Decimal('21.25'), Decimal('20.75'), numeric_mode=expected_mode
+    )
+    test_service.team_season_repository.update_team_season.assert_called_once_with(team_season)
+    test_service.event_bus.publish.assert_called_once_with(RankingsUpdated(1920))
+
+
+def test_run_weekly_update_when_no_rankings_updated_should_not_publish_rankings_updated(test_service):
+    # Arrange
+    _arrange_rankings_inputs(test_service, [])
+
+    # Act
+    test_service.run_weekly_update("NFL", 1920)
+
+    # Assert
+    test_service.event_bus.publish.assert_not_called()
+
+
+def test_compare_numeric_modes_should_compare_rankings_without_changing_team_seasons(test_service):
+    # Arrange
+    team_season = TeamSeason(team_name="Chicago Bears", season_year=1920, league_name="APFA", games=13,
+                             points_for=281, points_against=130)
+    _arrange_rankings_inputs(test_service, [team_season])
+
+    # Act
+    comparison = test_service.compare_numeric_modes([1920])
+
+    # Assert
+    assert comparison.team_seasons_compared == 1
+    assert all(column.values_compared == 1 for column in comparison.columns.values())
+    assert comparison.max_divergence < Decimal('1E-13')
+    assert team_season.offensive_average is None
+    test_service.team_season_repository.update_team_season.assert_not_called()